@@ -38,6 +38,10 @@ def create_app(config=None):
         transactions,
         superlatives,
         udfa,
+        batch,
+        bootstrap,
+        events,
+        players,
     )
 
     app.register_blueprint(admin.admin, url_prefix='/v1')
@@ -52,6 +56,10 @@ def create_app(config=None):
     app.register_blueprint(transactions.transactions, url_prefix='/v1')
     app.register_blueprint(superlatives.superlatives, url_prefix='/v1')
     app.register_blueprint(udfa.udfa, url_prefix='/v1')
+    app.register_blueprint(batch.batch, url_prefix='/v1')
+    app.register_blueprint(bootstrap.bootstrap, url_prefix='/v1')
+    app.register_blueprint(events.events, url_prefix='/v1')
+    app.register_blueprint(players.players, url_prefix='/v1')
 
     # Validate required env vars
     if not os.environ.get('LEAGUE_ID'):
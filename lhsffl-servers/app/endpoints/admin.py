@@ -13,6 +13,8 @@ from app.models.teams import Teams
 from app import db
 from app.league_state_manager import get_current_year
 from app.logic.udfa import serialize_udfa_player, calculate_carryover, settle_bids
+from app.logic.bootstrap import refresh_bootstrap
+from app.memo import invalidate
 
 admin = Blueprint('admin', __name__)
 
@@ -40,6 +42,8 @@ def publish_article(article_id):
 
     article.published = True
     db.session.commit()
+    invalidate('articles')
+    refresh_bootstrap()
 
     return jsonify(success=True, article=article.serialize())
 
@@ -1,5 +1,7 @@
 from flask import Blueprint, jsonify, request
 from app.models.articles import Articles
+from app.logic.pagination import parse_page_args, InvalidCursor
+from app.logic.article_search import search_articles
 
 articles = Blueprint('articles', __name__)
 
@@ -12,7 +14,7 @@ def get_article(article_id):
 
 @articles.route('/articles/get_latest_articles', methods=['GET', 'OPTIONS'])
 def get_latest_articles():
-    articles = Articles.query.filter(Articles.published == True).order_by(Articles.creation_date.desc()).limit(5).all()
+    articles = Articles.get_latest()
     return jsonify(success=True, articles=[ article.serialize() for article in articles ])
 
 
@@ -35,5 +37,21 @@ def generate_power_ranking():
 
 @articles.route('/articles/get_news', methods=['GET', 'OPTIONS'])
 def get_news():
-    articles = Articles.query.filter(Articles.published == True).order_by(Articles.creation_date.desc()).all()
-    return jsonify(success=True, articles=[ article.serialize() for article in articles ])
\ No newline at end of file
+    """Published articles, newest first. Query params: limit, cursor (from the previous page's next_cursor)"""
+    try:
+        limit, cursor = parse_page_args(request.args)
+    except InvalidCursor:
+        return jsonify(success=False, error='Invalid cursor'), 400
+
+    articles, next_cursor = Articles.get_published_page(cursor=cursor, limit=limit)
+    return jsonify(success=True, articles=[ article.serialize() for article in articles ], next_cursor=next_cursor)
+
+
+@articles.route('/articles/search', methods=['GET', 'OPTIONS'])
+def search():
+    """Ranked full-text search over published articles. Query params: q, limit (default 10, max 50)"""
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify(success=False, error='Query parameter q is required'), 400
+    limit = min(max(request.args.get('limit', 10, type=int), 1), 50)
+    return jsonify(success=True, results=search_articles(query, limit=limit))
@@ -0,0 +1,65 @@
+import logging
+from urllib.parse import urlsplit
+from flask import Blueprint, current_app, jsonify, request
+from app import db
+
+logger = logging.getLogger(__name__)
+
+batch = Blueprint('batch', __name__)
+
+MAX_BATCH_SIZE = 20
+
+
+def _normalize(path):
+    """'/teams' or '/v1/teams?x=1' -> ('/v1/teams', 'x=1'); None for anything that isn't a local API path."""
+    parts = urlsplit(path or '')
+    if parts.scheme or parts.netloc or not parts.path.startswith('/'):
+        return None
+    api_path = parts.path if parts.path.startswith('/v1/') else '/v1' + parts.path
+    return api_path, parts.query
+
+
+def _dispatch(api_path, query_string):
+    """Run one GET through the normal routing/view stack, reusing this request's app context and DB session."""
+    headers = {'Authorization': request.headers['Authorization']} if 'Authorization' in request.headers else {}
+    with current_app.test_request_context(api_path, method='GET', query_string=query_string, headers=headers):
+        if request.endpoint == 'batch.get_batch':
+            return 400, {'success': False, 'error': 'Nested batch requests are not allowed'}
+        try:
+            response = current_app.full_dispatch_request()
+        except Exception:
+            logger.exception(f'Batch sub-request failed: {api_path}')
+            db.session.rollback()
+            return 500, {'success': False, 'error': 'Internal server error'}
+    body = response.get_json(silent=True)
+    if body is None and response.status_code >= 400:
+        body = {'success': False, 'error': response.status}
+    return response.status_code, body
+
+
+@batch.route('/batch', methods=['GET', 'OPTIONS'])
+def get_batch():
+    """
+    Run several read-only GETs in one round trip.
+    Query params: path (repeatable), each an API path relative to /v1, optionally
+    with its own (URL-encoded) query string. Identical paths are run once.
+    """
+    paths = request.args.getlist('path')
+    if not paths:
+        return jsonify(success=False, error='At least one path is required'), 400
+    if len(paths) > MAX_BATCH_SIZE:
+        return jsonify(success=False, error=f'At most {MAX_BATCH_SIZE} paths per batch'), 400
+
+    results = {}
+    responses = []
+    for path in paths:
+        target = _normalize(path)
+        if target is None:
+            status, body = 400, {'success': False, 'error': 'Invalid path'}
+        else:
+            if target not in results:
+                results[target] = _dispatch(*target)
+            status, body = results[target]
+        responses.append({'path': path, 'status': status, 'body': body})
+
+    return jsonify(success=True, responses=responses)
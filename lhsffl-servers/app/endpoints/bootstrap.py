@@ -0,0 +1,22 @@
+from flask import Blueprint, Response, request
+from app.logic.bootstrap import get_bootstrap
+
+bootstrap = Blueprint('bootstrap', __name__)
+
+
+@bootstrap.route('/bootstrap', methods=['GET', 'OPTIONS'])
+def get_bootstrap_document():
+    """
+    Landing-page data in one prebuilt document: standings, current matchups,
+    league state and the latest articles. Regenerated after each full sync and
+    article publish; served from memory (gzipped when the client accepts it).
+    """
+    document = get_bootstrap()
+    gzipped = 'gzip' in request.accept_encodings
+
+    response = Response(document.gzipped if gzipped else document.body, mimetype='application/json')
+    if gzipped:
+        response.headers['Content-Encoding'] = 'gzip'
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.set_etag(document.etag)
+    return response.make_conditional(request)
@@ -0,0 +1,50 @@
+import os
+import queue
+from flask import Blueprint, Response, jsonify, request
+from app.events import subscribe, unsubscribe, format_sse
+
+events = Blueprint('events', __name__)
+
+TOPICS = ('scores', 'sync', 'backfill')
+
+# Comment lines keep proxies (and the browser) from timing out an idle stream.
+KEEPALIVE_SECONDS = 15
+
+
+@events.route('/events/stream', methods=['GET', 'OPTIONS'])
+def stream_events():
+    """
+    Server-sent events: live matchup scores, sync step completion and backfill progress.
+    Query params: topics (comma-separated subset of scores, sync, backfill; default all).
+    Honors Last-Event-ID so a reconnecting EventSource gets the events it missed.
+
+    Each open stream holds a worker thread, so a worker serves at most
+    EVENT_STREAM_LIMIT (default 20) at once and answers 503 beyond that; an
+    EventSource does not retry a 503, and the pages fall back to polling.
+    """
+    topics = set(request.args.get('topics', ','.join(TOPICS)).split(','))
+    if not topics or not topics.issubset(TOPICS):
+        return jsonify(success=False, error=f'Invalid topics. Use: {", ".join(TOPICS)}'), 400
+
+    last_event_id = request.headers.get('Last-Event-ID', type=int)
+    q = subscribe(last_event_id, limit=int(os.environ.get('EVENT_STREAM_LIMIT', 20)))
+    if q is None:
+        return jsonify(success=False, error='Too many open event streams'), 503
+
+    def generate():
+        yield 'retry: 5000\n\n'
+        while True:
+            try:
+                message = q.get(timeout=KEEPALIVE_SECONDS)
+            except queue.Empty:
+                yield ': keepalive\n\n'
+                continue
+            if message.event in topics:
+                yield format_sse(message)
+
+    response = Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
+    })
+    response.call_on_close(lambda: unsubscribe(q))
+    return response
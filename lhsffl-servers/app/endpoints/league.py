@@ -1,5 +1,12 @@
 from flask import Blueprint, jsonify, request
+from app import db
 from app.logic.league import synchronize_teams, set_league_state, synchronize_matchups, synchronize_players
+from app.logic.record_book import get_record_book, TOP_K, KEEP
+from app.memo import invalidate
+from app.league_state_manager import get_current_year
+from app.models.players import Players
+from app.models.playoff_odds import PlayoffOdds
+from app.models.teams import Teams
 
 league = Blueprint('league', __name__)
 
@@ -10,6 +17,7 @@ def synchronize_teams_endpoint():
     This will update the players on each team in the database, along with the starter, bench, and taxi postions.
     '''
     synchronize_teams()
+    invalidate('teams')
     return jsonify(success=True, message='Teams synchronized')
 
 @league.route('/league/update_league_state', methods=['PUT', 'OPTIONS'])
@@ -19,12 +27,8 @@ def update_league_state():
     '''
     print('Updating league state')
     set_league_state()
-    
-    # Refresh the global league state manager after updating
-    from app.league_state_manager import refresh_league_state
-    refresh_league_state()
-    
-    return jsonify(success=True, message='League state set and global cache refreshed')
+    invalidate('league_state')
+    return jsonify(success=True, message='League state set')
 
 @league.route('/league/refresh_state', methods=['POST', 'OPTIONS'])
 def refresh_league_state_endpoint():
@@ -50,14 +54,17 @@ def get_league_state_status():
     Get current league state information from the global cache.
     '''
     try:
-        from app.league_state_manager import get_current_year, get_current_week, league_state_manager
+        from app.league_state_manager import league_state_manager
         
+        snapshot = league_state_manager.snapshot()
+        last_checked = league_state_manager.last_checked
         return jsonify(
             success=True,
-            current_year=get_current_year(),
-            current_week=get_current_week(),
-            last_updated=league_state_manager._last_updated.isoformat() if league_state_manager._last_updated else None,
-            cache_duration_minutes=league_state_manager._cache_duration.total_seconds() / 60
+            current_year=snapshot.year,
+            current_week=snapshot.week,
+            version=snapshot.version,
+            last_updated=last_checked.isoformat() if last_checked else None,
+            check_interval_seconds=league_state_manager.check_interval
         )
     except Exception as e:
         return jsonify(success=False, message=f'Failed to get league state: {str(e)}'), 500
@@ -70,6 +77,7 @@ def synchronize_matchups_endpoint():
     '''
     try:
         result = synchronize_matchups()
+        invalidate('matchups')
         return jsonify(success=True, message='Matchups synchronized', result=result)
     except Exception as e:
         return jsonify(success=False, message=f'Matchups sync failed: {str(e)}'), 500
@@ -83,6 +91,52 @@ def synchronize_players_endpoint():
     '''
     try:
         result = synchronize_players()
+        invalidate('players')
         return jsonify(success=True, message='Players synchronized', result=result)
     except Exception as e:
-        return jsonify(success=False, message=f'Players sync failed: {str(e)}'), 500
\ No newline at end of file
+        return jsonify(success=False, message=f'Players sync failed: {str(e)}'), 500
+
+@league.route('/league/playoff_odds', methods=['GET', 'OPTIONS'])
+def get_playoff_odds():
+    '''
+    Simulated playoff odds per team, as stored after the matchups sync.
+    Query params: year (default current), week (default the latest simulated week of that year).
+    '''
+    year = request.args.get('year', get_current_year(), type=int)
+    week = request.args.get('week', type=int)
+    if week is None:
+        rows = PlayoffOdds.get_latest(year)
+        if not rows:
+            return jsonify(success=False, error='No playoff odds for that season'), 404
+        week = rows[0].week
+    else:
+        rows = PlayoffOdds.get_week(year, week)
+        if not rows:
+            return jsonify(success=False, error='No playoff odds for that week'), 404
+
+    names = dict(db.session.query(Teams.sleeper_roster_id, Teams.team_name).all())
+    teams = [{**row.serialize(), 'team_name': names.get(row.sleeper_roster_id)} for row in rows]
+    return jsonify(success=True, year=year, week=week, teams=teams)
+
+@league.route('/league/records', methods=['GET', 'OPTIONS'])
+def get_league_records():
+    '''
+    The league record book: highest/lowest weekly score, biggest blowout, closest game,
+    best/worst season and best single-player week, each in rank order.
+    Query params: limit (entries per category, default 10).
+    '''
+    limit = min(max(request.args.get('limit', TOP_K, type=int), 1), KEEP)
+    book = get_record_book()
+
+    names = dict(db.session.query(Teams.sleeper_roster_id, Teams.team_name).all())
+    player_ids = {r['player_sleeper_id'] for entries in book.values() for r in entries[:limit] if r['player_sleeper_id']}
+    players = {p.sleeper_id: f'{p.first_name} {p.last_name}'
+               for p in Players.query.filter(Players.sleeper_id.in_(player_ids))} if player_ids else {}
+
+    records = {category: [{
+        **record,
+        'team_name': names.get(record['sleeper_roster_id']),
+        'opponent_team_name': names.get(record['opponent_sleeper_roster_id']),
+        'player_name': players.get(record['player_sleeper_id']),
+    } for record in entries[:limit]] for category, entries in book.items()}
+    return jsonify(success=True, records=records)
@@ -27,15 +27,7 @@ def get_current_matchup():
     current_year = get_current_year()
     current_week = get_current_week() or 1
 
-    # Single optimized query with proper indexing
-    current_matchups = Matchups.query \
-        .filter_by(week=current_week, year=current_year) \
-        .order_by(Matchups.sleeper_matchup_id) \
-        .all()
-
-    # Efficient deduplication using dict comprehension
-    unique_matchups = list({matchup.sleeper_matchup_id: matchup for matchup in current_matchups}.values())
-    
+    unique_matchups = Matchups.get_week(current_year, current_week)
     return jsonify(success=True, matchups=[matchup.serialize() for matchup in unique_matchups])
 
 
@@ -0,0 +1,35 @@
+from flask import Blueprint, jsonify, request
+from app.logic.player_search import search_players
+from app.logic.player_stats import get_player_stats
+
+players = Blueprint('players', __name__)
+
+MAX_SEARCH_RESULTS = 25
+
+
+@players.route('/players/search', methods=['GET', 'OPTIONS'])
+def search():
+    """Player name autocomplete over first/last name and NFL team. Query params: q, limit (default 10, max 25)"""
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify(success=False, error='Query parameter q is required'), 400
+    limit = min(max(request.args.get('limit', 10, type=int), 1), MAX_SEARCH_RESULTS)
+    return jsonify(success=True, players=search_players(query, limit=limit))
+
+
+@players.route('/players/<int:player_sleeper_id>/stats', methods=['GET', 'OPTIONS'])
+def get_stats(player_sleeper_id):
+    """Career rollup plus every season (newest first) with per-roster splits."""
+    stats = get_player_stats(player_sleeper_id)
+    if stats is None:
+        return jsonify(success=False, error='No stats for player'), 404
+    return jsonify(success=True, **stats)
+
+
+@players.route('/players/<int:player_sleeper_id>/stats/<int:year>', methods=['GET', 'OPTIONS'])
+def get_season_stats(player_sleeper_id, year):
+    """One season's rollup with per-roster splits, plus the career rollup."""
+    stats = get_player_stats(player_sleeper_id, year=year)
+    if stats is None:
+        return jsonify(success=False, error='No stats for player in that season'), 404
+    return jsonify(success=True, **stats)
@@ -1,8 +1,13 @@
-from flask import Blueprint, jsonify
-from sqlalchemy import func
+from flask import Blueprint, jsonify, request
 from app.models.teams import Teams
 from app.models.matchups import Matchups
-from app.models.team_records import TeamRecords
+from app.models.players import Players
+from app.logic.roster_snapshots import get_roster_snapshot
+from app.logic.head_to_head import get_head_to_head
+from app.logic.all_play import get_all_play
+from app.logic.all_time import get_all_time_cube, SEGMENTS
+from app.logic.lineup_efficiency import season_totals
+from app.models.lineup_efficiency import LineupEfficiency
 from app.models.schemas.users import UsersJSONSchema
 from app import db
 from app.league_state_manager import get_current_year, get_current_week
@@ -11,56 +16,147 @@ teams = Blueprint('teams', __name__)
 
 @teams.route('/teams/all_time', methods=['GET', 'OPTIONS'])
 def get_all_time_records():
-    """All-time aggregate records (W-L, PF, PA) per team across every season."""
-    # Group by all non-aggregated columns so ONLY_FULL_GROUP_BY (MySQL default)
-    # doesn't reject the query. outerjoin keeps teams that have no records yet.
-    rows = db.session.query(
-        Teams,
-        func.sum(TeamRecords.wins),
-        func.sum(TeamRecords.losses),
-        func.sum(TeamRecords.points_for),
-        func.sum(TeamRecords.points_against),
-    ).outerjoin(TeamRecords, Teams.team_id == TeamRecords.team_id) \
-     .group_by(Teams.team_id, Teams.team_name, Teams.championships, Teams.sleeper_roster_id) \
-     .order_by(
-        func.sum(TeamRecords.wins).desc(),
-        func.sum(TeamRecords.points_for).desc()
-     ).all()
+    """
+    All-time records (W-L-T, PF, PA, playoff finishes) per team, sliced from the
+    in-memory rollup cube. Query params: start_year, end_year (inclusive),
+    segment (regular | playoffs | all, default regular), opponent (team_id).
+    """
+    segment = request.args.get('segment', 'regular')
+    if segment not in SEGMENTS:
+        return jsonify(success=False, error=f"segment must be one of {', '.join(SEGMENTS)}"), 400
 
-    teams_data = []
-    for team, wins, losses, points_for, points_against in rows:
-        teams_data.append({
-            'team_id': team.team_id,
-            'team_name': team.team_name,
-            'championships': team.championships,
-            'owners': UsersJSONSchema(many=True).dump(team.owners),
-            'all_time_record': {
-                'wins': int(wins or 0),
-                'losses': int(losses or 0),
-                'points_for': float(points_for or 0),
-                'points_against': float(points_against or 0),
-            },
-        })
+    all_teams = Teams.query.all()
+    opponent = request.args.get('opponent', type=int)
+    if opponent is not None:
+        opponent_team = next((t for t in all_teams if t.team_id == opponent), None)
+        if opponent_team is None:
+            return jsonify(success=False, error="Opponent team not found"), 404
+        opponent = opponent_team.sleeper_roster_id
+
+    totals = get_all_time_cube().totals(start_year=request.args.get('start_year', type=int),
+                                        end_year=request.args.get('end_year', type=int),
+                                        segment=segment, opponent=opponent)
+    empty = {'games': 0, 'wins': 0, 'losses': 0, 'ties': 0, 'points_for': 0.0, 'points_against': 0.0,
+             'playoff_appearances': 0, 'championships': 0, 'runner_ups': 0}
+
+    teams_data = [{
+        'team_id': team.team_id,
+        'team_name': team.team_name,
+        'championships': team.championships,
+        'owners': UsersJSONSchema(many=True).dump(team.owners),
+        'all_time_record': totals.get(team.sleeper_roster_id, empty),
+    } for team in all_teams]
+    teams_data.sort(key=lambda t: (-t['all_time_record']['wins'], -t['all_time_record']['points_for']))
 
     return jsonify(success=True, teams=teams_data)
 
+@teams.route('/teams/head_to_head', methods=['GET', 'OPTIONS'])
+def get_head_to_head_matrix():
+    """
+    All-time head-to-head matrices over completed matchups. Row i is teams[i]'s
+    record against each column team: wins, losses, ties, points_for, points_against.
+    """
+    h2h = get_head_to_head()
+    teams_by_roster = {team.sleeper_roster_id: team for team in Teams.query.all()}
+    teams_data = [{
+        'sleeper_roster_id': roster_id,
+        'team_id': teams_by_roster[roster_id].team_id if roster_id in teams_by_roster else None,
+        'team_name': teams_by_roster[roster_id].team_name if roster_id in teams_by_roster else None,
+    } for roster_id in h2h.rosters]
+    return jsonify(success=True, teams=teams_data, **h2h.matrices())
+
+@teams.route('/teams/<int:team_id>/rivals', methods=['GET', 'OPTIONS'])
+def get_team_rivals(team_id):
+    """The team's all-time record against every opponent it has played, most games first."""
+    team = Teams.query.get(team_id)
+    if not team:
+        return jsonify(success=False, error="Team not found"), 404
+
+    rivals = get_head_to_head().rivals(team.sleeper_roster_id) or []
+    teams_by_roster = {t.sleeper_roster_id: t for t in Teams.query.all()}
+    for rival in rivals:
+        opponent = teams_by_roster.get(rival['opponent_sleeper_roster_id'])
+        rival['opponent_team_id'] = opponent.team_id if opponent else None
+        rival['opponent_team_name'] = opponent.team_name if opponent else None
+    return jsonify(success=True, team_id=team_id, rivals=rivals)
+
+@teams.route('/teams/all_play', methods=['GET', 'OPTIONS'])
+def get_all_play_records():
+    """
+    All-play record, expected wins and luck (actual minus expected wins) per team-season.
+    Query params: year (optional; default every season).
+    """
+    year = request.args.get('year', type=int)
+    teams_by_roster = {team.sleeper_roster_id: team for team in Teams.query.all()}
+    records = []
+    for record in get_all_play():
+        if year is not None and record['year'] != year:
+            continue
+        team = teams_by_roster.get(record['sleeper_roster_id'])
+        records.append({**record,
+                        'team_id': team.team_id if team else None,
+                        'team_name': team.team_name if team else None})
+    return jsonify(success=True, records=records)
+
+@teams.route('/teams/<int:team_id>/all_play', methods=['GET', 'OPTIONS'])
+def get_team_all_play(team_id):
+    """The team's all-play record, expected wins and luck for every season, newest first."""
+    team = Teams.query.get(team_id)
+    if not team:
+        return jsonify(success=False, error="Team not found"), 404
+    seasons = [record for record in get_all_play() if record['sleeper_roster_id'] == team.sleeper_roster_id]
+    return jsonify(success=True, team_id=team_id, seasons=sorted(seasons, key=lambda r: -r['year']))
+
+@teams.route('/teams/lineup_efficiency', methods=['GET', 'OPTIONS'])
+def get_lineup_efficiency():
+    """
+    Season lineup efficiency per team (started vs. optimal points), most efficient first.
+    Query params: year (default current).
+    """
+    year = request.args.get('year', get_current_year(), type=int)
+    by_roster = {}
+    for row in LineupEfficiency.query.filter_by(year=year):
+        by_roster.setdefault(row.sleeper_roster_id, []).append(row)
+
+    teams_by_roster = {team.sleeper_roster_id: team for team in Teams.query.all()}
+    teams_data = []
+    for roster_id, rows in by_roster.items():
+        team = teams_by_roster.get(roster_id)
+        teams_data.append({'sleeper_roster_id': roster_id,
+                           'team_id': team.team_id if team else None,
+                           'team_name': team.team_name if team else None,
+                           **season_totals(rows)})
+    teams_data.sort(key=lambda t: -t['efficiency'])
+    return jsonify(success=True, year=year, teams=teams_data)
+
+@teams.route('/teams/<int:team_id>/lineup_efficiency', methods=['GET', 'OPTIONS'])
+def get_team_lineup_efficiency(team_id):
+    """
+    The team's weekly started vs. optimal points with the season totals.
+    Query params: year (default current).
+    """
+    team = Teams.query.get(team_id)
+    if not team:
+        return jsonify(success=False, error="Team not found"), 404
+    year = request.args.get('year', get_current_year(), type=int)
+    rows = LineupEfficiency.query \
+        .filter_by(sleeper_roster_id=team.sleeper_roster_id, year=year) \
+        .order_by(LineupEfficiency.week) \
+        .all()
+    return jsonify(success=True, team_id=team_id, year=year, season=season_totals(rows),
+                   weeks=[row.serialize() for row in rows])
+
 @teams.route('/teams', methods=['GET', 'OPTIONS'])
 def get_teams():
-    current_year = get_current_year()
-    
-    teams = Teams.query \
-        .join(TeamRecords, Teams.team_id == TeamRecords.team_id) \
-        .filter(TeamRecords.year == current_year) \
-        .order_by(
-            TeamRecords.wins.desc(),
-            TeamRecords.points_for.desc()
-        ).all()
+    teams = Teams.get_standings(get_current_year())
 
     return jsonify(success=True, teams=[ team.serialize_list() for team in teams ])
 
 @teams.route('/teams/<int:team_id>', methods=['GET', 'OPTIONS'])
 def get_team(team_id):
-    team = Teams.query.get(team_id)
+    team = Teams.get_for_detail(team_id)
+    if not team:
+        return jsonify(success=False, error="Team not found"), 404
     return jsonify(success=True, team=team.serialize())
 
 @teams.route('/teams/<int:team_id>/matchups', methods=['GET', 'OPTIONS'])
@@ -129,4 +225,28 @@ def get_team_articles(team_id):
     articles = team.articles
     return jsonify(success=True, articles=[ article.serialize() for article in articles ])
 
+@teams.route('/teams/<int:team_id>/roster/<int:year>/<int:week>', methods=['GET', 'OPTIONS'])
+def get_team_roster_snapshot(team_id, year, week):
+    """The team's roster as it stood in a given week, from its weekly snapshot."""
+    team = Teams.query.get(team_id)
+    if not team:
+        return jsonify(success=False, error="Team not found"), 404
+    snapshot = get_roster_snapshot(year, week, team.sleeper_roster_id)
+    if not snapshot:
+        return jsonify(success=False, error="Roster snapshot not found"), 404
 
+    player_ids = snapshot.player_sleeper_ids
+    starters, taxi = set(snapshot.starter_sleeper_ids), set(snapshot.taxi_sleeper_ids)
+    players = {p.sleeper_id: p for p in Players.query.filter(Players.sleeper_id.in_(player_ids))} if player_ids else {}
+    roster = []
+    for player_id in player_ids:
+        player = players.get(player_id)
+        roster.append({
+            'sleeper_id': player_id,
+            'first_name': player.first_name if player else None,
+            'last_name': player.last_name if player else None,
+            'position': player.position if player else None,
+            'starter': player_id in starters,
+            'taxi': player_id in taxi,
+        })
+    return jsonify(success=True, snapshot=snapshot.serialize(), roster=roster)
@@ -1,21 +1,45 @@
+from datetime import datetime, timezone
 from flask import Blueprint, jsonify, request
 from app.models.transactions import Transactions
 from app.models.teams import Teams
-from app.logic.transaction_queries import get_trade_tree, get_full_trade_tree
+from app.logic.transaction_queries import (
+    get_trade_tree_payload, get_full_trade_tree_payload, get_player_ownership_payload,
+)
+from app.logic.pagination import parse_page_args, InvalidCursor
+from app.logic.trade_scores import get_trade_scores
+from app.logic.history import current_pick_owners
 
 transactions = Blueprint('transactions', __name__)
 
 
+def _utc_arg(name):
+    """ISO 8601 query arg as a naive UTC datetime (how transaction times are stored), or None."""
+    value = request.args.get(name)
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
 @transactions.route('/transactions', methods=['GET', 'OPTIONS'])
 def get_transactions():
-    """Get transactions with optional filters. Query params: year, week, type, roster_id"""
-    txns = Transactions.get_filtered(
+    """Get transactions with optional filters. Query params: year, week, type, roster_id, limit, cursor"""
+    try:
+        limit, cursor = parse_page_args(request.args)
+    except InvalidCursor:
+        return jsonify(success=False, error='Invalid cursor'), 400
+
+    txns, next_cursor = Transactions.get_filtered(
         year=request.args.get('year', type=int),
         week=request.args.get('week', type=int),
         txn_type=request.args.get('type'),
         roster_id=request.args.get('roster_id', type=int),
+        cursor=cursor,
+        limit=limit,
     )
-    return jsonify(success=True, transactions=[t.serialize() for t in txns])
+    return jsonify(success=True, transactions=[t.serialize() for t in txns], next_cursor=next_cursor)
 
 
 @transactions.route('/transactions/<int:transaction_id>', methods=['GET', 'OPTIONS'])
@@ -24,7 +48,8 @@ def get_transaction(transaction_id):
     txn = Transactions.query.get(transaction_id)
     if not txn:
         return jsonify(success=False, error='Transaction not found'), 404
-    return jsonify(success=True, transaction=txn.serialize())
+    scores = get_trade_scores([transaction_id]).get(transaction_id, {}) if txn.type == 'trade' else {}
+    return jsonify(success=True, transaction=txn.serialize(), trade_scores=scores)
 
 
 @transactions.route('/transactions/week/<int:week_number>', methods=['GET', 'OPTIONS'])
@@ -51,7 +76,8 @@ def get_team_trades(team_id):
     if not team:
         return jsonify(success=False, error='Team not found'), 404
     txns = Transactions.get_trades_for_team(team.sleeper_roster_id)
-    return jsonify(success=True, transactions=[t.serialize() for t in txns])
+    return jsonify(success=True, transactions=[t.serialize() for t in txns],
+                   trade_scores=get_trade_scores([t.transaction_id for t in txns]))
 
 
 @transactions.route('/transactions/trades/random', methods=['GET', 'OPTIONS'])
@@ -64,23 +90,43 @@ def get_random_trades():
 @transactions.route('/transactions/trade-tree/<int:player_sleeper_id>', methods=['GET', 'OPTIONS'])
 def get_trade_tree_endpoint(player_sleeper_id):
     """Get the trade tree for a player."""
-    player_info, txns = get_trade_tree(player_sleeper_id)
-    return jsonify(
-        success=True,
-        player=player_info,
-        trade_tree=[t.serialize() for t in txns]
-    )
+    payload = get_trade_tree_payload(player_sleeper_id)
+    scores = get_trade_scores([t['transaction_id'] for t in payload['trade_tree'] if t.get('type') == 'trade'])
+    return jsonify(success=True, trade_scores=scores, **payload)
 
 
 @transactions.route('/transactions/<int:transaction_id>/full_trade_tree', methods=['GET', 'OPTIONS'])
 def get_full_trade_tree_endpoint(transaction_id):
     """Get the full trade tree showing the ripple effect for each team involved."""
-    origin, teams_data, pick_metadata = get_full_trade_tree(transaction_id)
-    if origin is None:
+    payload = get_full_trade_tree_payload(transaction_id)
+    if payload is None:
         return jsonify(success=False, error='Transaction not found'), 404
-    return jsonify(
-        success=True,
-        origin=origin.serialize(),
-        teams=teams_data,
-        pick_metadata=pick_metadata
-    )
+    trades = [payload['origin']] + [t for team in payload['teams'].values() for t in team.get('transactions', [])]
+    scores = get_trade_scores({t['transaction_id'] for t in trades if t.get('type') == 'trade'})
+    return jsonify(success=True, trade_scores=scores, **payload)
+
+
+@transactions.route('/transactions/ownership/<int:player_sleeper_id>', methods=['GET', 'OPTIONS'])
+def get_player_ownership(player_sleeper_id):
+    """Which rosters held a player. Query params: at, or start and end (ISO 8601)."""
+    try:
+        at, start, end = _utc_arg('at'), _utc_arg('start'), _utc_arg('end')
+    except ValueError:
+        return jsonify(success=False, error='Invalid datetime format. Use ISO 8601.'), 400
+    payload = get_player_ownership_payload(player_sleeper_id, at=at, start=start, end=end)
+    return jsonify(success=True, **payload)
+
+
+@transactions.route('/transactions/pick_ownership', methods=['GET', 'OPTIONS'])
+def get_pick_ownership():
+    """
+    Who owns each future draft pick. Query params: season (repeatable; default the
+    current season and the next two), as_of (ISO 8601; default now).
+    """
+    try:
+        as_of = _utc_arg('as_of')
+    except ValueError:
+        return jsonify(success=False, error='Invalid datetime format. Use ISO 8601.'), 400
+    seasons = request.args.getlist('season', type=int) or None
+    return jsonify(success=True, as_of=as_of.isoformat() if as_of else None,
+                   picks=current_pick_owners(seasons=seasons, as_of=as_of))
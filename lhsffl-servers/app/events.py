@@ -0,0 +1,84 @@
+"""
+Process-local pub/sub feeding the server-sent events stream (/v1/events/stream).
+
+    publish('scores', {'year': 2024, 'week': 5, 'matchups': [...]})
+
+    for event in subscribe(last_event_id): ...   # in the streaming view
+
+Each subscriber gets a bounded queue; a client too slow to drain it loses its
+oldest events rather than holding up the publisher (the sync thread). The last
+HISTORY_SIZE events are kept so a reconnecting EventSource, which sends the id
+of the last event it saw, is replayed what it missed.
+
+Like app.memo this only reaches the current process: events published by the
+scheduler or a backfill thread go to clients connected to the same worker.
+"""
+
+import itertools
+import json
+import queue
+import threading
+from collections import deque, namedtuple
+from datetime import datetime
+
+HISTORY_SIZE = 100
+QUEUE_SIZE = 100
+
+Event = namedtuple('Event', 'id event data')
+
+_lock = threading.Lock()
+_ids = itertools.count(1)
+_history = deque(maxlen=HISTORY_SIZE)
+_subscribers = set()
+
+
+def publish(event, data):
+    """Send `data` (JSON-serializable) to every subscriber as an `event` message. Returns the event id."""
+    with _lock:
+        message = Event(next(_ids), event, {**data, 'published_at': datetime.utcnow().isoformat()})
+        _history.append(message)
+        subscribers = list(_subscribers)
+
+    for q in subscribers:
+        while True:
+            try:
+                q.put_nowait(message)
+                break
+            except queue.Full:
+                try:
+                    q.get_nowait()  # drop the oldest to make room
+                except queue.Empty:
+                    pass
+    return message.id
+
+
+def subscribe(last_event_id=None, limit=None):
+    """
+    A new subscriber queue, pre-filled with the events after `last_event_id` when
+    given; None when `limit` subscribers are already connected.
+    """
+    q = queue.Queue(maxsize=QUEUE_SIZE)
+    with _lock:
+        if limit is not None and len(_subscribers) >= limit:
+            return None
+        if last_event_id is not None:
+            for message in list(_history)[-QUEUE_SIZE:]:
+                if message.id > last_event_id:
+                    q.put_nowait(message)
+        _subscribers.add(q)
+    return q
+
+
+def unsubscribe(q):
+    with _lock:
+        _subscribers.discard(q)
+
+
+def subscriber_count():
+    with _lock:
+        return len(_subscribers)
+
+
+def format_sse(message):
+    """One event in text/event-stream framing."""
+    return f'id: {message.id}\nevent: {message.event}\ndata: {json.dumps(message.data, default=str)}\n\n'
@@ -1,24 +1,41 @@
 """
 Global League State Manager
 
-This module provides a singleton that stores the current league state
-to avoid repeated database queries across the application.
+This module provides a singleton that holds the current league state as an
+immutable LeagueStateSnapshot (year, week, version), so reading it never touches
+the database or a session.
+
+The version is the league_state_id of the current LeagueState row. set_league_state
+inserts a new row whenever the week or season changes, so a changed id means a new
+state. Each worker re-reads that one row at most every LEAGUE_STATE_CHECK_SECONDS
+(default 10); requests in between read the snapshot from memory. A change written
+by any process is therefore picked up by every worker within one check interval,
+and immediately by the process that made it (set_league_state refreshes it).
 """
 
+import os
 import threading
-from datetime import datetime, timedelta
+import time
+from collections import namedtuple
+from datetime import datetime
 from typing import Optional
 from app.models.league_state import LeagueState
 
 
+LeagueStateSnapshot = namedtuple('LeagueStateSnapshot', 'year week version')
+
+# Served when there is no current LeagueState row (e.g. a fresh database).
+DEFAULT_SNAPSHOT = LeagueStateSnapshot(year=2024, week=1, version=0)
+
+
 class LeagueStateManager:
     """
-    Singleton class to manage global league stat
+    Singleton class to manage global league state
     """
-    
+
     _instance = None
     _lock = threading.Lock()
-    
+
     def __new__(cls):
         if cls._instance is None:
             with cls._lock:
@@ -26,78 +43,114 @@ class LeagueStateManager:
                     cls._instance = super(LeagueStateManager, cls).__new__(cls)
                     cls._instance._initialized = False
         return cls._instance
-    
+
     def __init__(self):
         if not self._initialized:
-            self._current_league_state = None
-            self._last_updated = None
-            self._cache_duration = timedelta(minutes=5)
+            self._snapshot = None
+            self._next_check = 0.0
+            self._last_checked = None
+            self._check_interval = float(os.environ.get('LEAGUE_STATE_CHECK_SECONDS', 10))
             self._data_lock = threading.Lock()
             self._initialized = True
-    
+
     def initialize(self, app_context):
         """
         Initialize the league state on server startup
         """
         with app_context:
-            self._refresh_league_state()
-            print(f"League State Manager initialized: Year {self.current_year}, Week {self.current_week}")
-    
-    def _refresh_league_state(self):
+            self.refresh()
+
+    def _load(self) -> LeagueStateSnapshot:
+        """
+        Read the current LeagueState row into a snapshot
+        """
+        from app import db
+        row = (db.session.query(LeagueState.league_state_id, LeagueState.year, LeagueState.week)
+               .filter_by(current=True)
+               .order_by(LeagueState.league_state_id.desc())
+               .first())
+        if row is None:
+            return DEFAULT_SNAPSHOT
+        return LeagueStateSnapshot(year=row.year, week=row.week, version=row.league_state_id)
+
+    def _check(self, force: bool = False) -> LeagueStateSnapshot:
         """
-        Refresh league state from database
+        Re-read the version row if the check interval has passed. Only one thread
+        checks at a time; the others keep serving the snapshot they have.
         """
+        if not self._data_lock.acquire(blocking=force or self._snapshot is None):
+            return self._snapshot
         try:
-            from app import db
-            current_state = db.session.query(LeagueState).filter_by(current=True).first()
-            
-            with self._data_lock:
-                self._current_league_state = current_state
-                self._last_updated = datetime.now()
-                
-        except Exception as e:
-            print(f"Error refreshing league state: {e}")
-    
-    def _should_refresh(self) -> bool:
-        """
-        Check if cache should be refreshed
-        """
-        if self._last_updated is None:
-            return True
-        return datetime.now() - self._last_updated > self._cache_duration
-    
-    def get_current_league_state(self, force_refresh: bool = False) -> Optional[LeagueState]:
-        """
-        Get current league state, refreshing if needed
-        """
-        if force_refresh or self._should_refresh():
-            self._refresh_league_state()
-        
-        with self._data_lock:
-            return self._current_league_state
-    
+            if not force and self._snapshot is not None and time.monotonic() < self._next_check:
+                return self._snapshot
+            self._next_check = time.monotonic() + self._check_interval
+            try:
+                snapshot = self._load()
+            except Exception as e:
+                print(f"Error refreshing league state: {e}")
+                return self._snapshot or DEFAULT_SNAPSHOT
+
+            previous = self._snapshot
+            self._snapshot = snapshot
+            self._last_checked = datetime.now()
+            if previous is not None and previous.version != snapshot.version:
+                print(f"League state changed: Year {snapshot.year}, Week {snapshot.week} (version {snapshot.version})")
+            return snapshot
+        finally:
+            self._data_lock.release()
+
+    def snapshot(self) -> LeagueStateSnapshot:
+        """
+        The current league state; a DB read only when the check interval has passed
+        """
+        snapshot = self._snapshot
+        if snapshot is None or time.monotonic() >= self._next_check:
+            snapshot = self._check()
+        return snapshot
+
+    def get_current_league_state(self, force_refresh: bool = False) -> Optional[LeagueStateSnapshot]:
+        """
+        Get current league state snapshot, re-reading it now if force_refresh
+        """
+        return self._check(force=True) if force_refresh else self.snapshot()
+
     @property
     def current_year(self) -> int:
         """
         Get current league year
         """
-        state = self.get_current_league_state()
-        return state.year if state else 2024
-    
-    @property 
+        return self.snapshot().year
+
+    @property
     def current_week(self) -> int:
         """
         Get current league week
         """
-        state = self.get_current_league_state()
-        return state.week if state else 1
-    
+        return self.snapshot().week
+
+    @property
+    def last_checked(self) -> Optional[datetime]:
+        return self._last_checked
+
+    @property
+    def check_interval(self) -> float:
+        return self._check_interval
+
     def refresh(self):
         """
         Manually refresh league state
         """
-        self._refresh_league_state()
-        print(f"League state refreshed: Year {self.current_year}, Week {self.current_week}")
+        snapshot = self._check(force=True)
+        print(f"League state refreshed: Year {snapshot.year}, Week {snapshot.week}")
+
+    def reset(self):
+        """
+        Forget the snapshot; the next read loads it again
+        """
+        with self._data_lock:
+            self._snapshot = None
+            self._next_check = 0.0
+            self._last_checked = None
 
 
 # Global singleton instance
@@ -114,7 +167,7 @@ def get_current_week() -> int:
     return league_state_manager.current_week
 
 
-def get_current_league_state() -> Optional[LeagueState]:
+def get_current_league_state() -> Optional[LeagueStateSnapshot]:
     """Convenience function to get current league state"""
     return league_state_manager.get_current_league_state()
 
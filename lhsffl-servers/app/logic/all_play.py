@@ -0,0 +1,111 @@
+"""
+All-play records, expected wins and luck per team-season.
+
+All-play plays every team against every other team each week: a week's score
+that would have beaten 9 of 11 opponents is 9-2 in all-play. Expected wins is
+the sum of each week's all-play win share (9/11 for that week), i.e. the wins
+a team "should" have with a random schedule, and luck is actual wins minus
+expected wins.
+
+Completed Matchups are loaded into a (season, week, roster) score cube, NaN
+where a roster has no score. Comparing the cube against itself with
+broadcasting, cube[..., :, None] against cube[..., None, :], gives every
+pairwise result for every week in one pass; NaN compares false, so missing
+weeks drop out on their own.
+
+Results are cached by the matchup data generation (see head_to_head) and
+recomputed by SyncService.sync_matchups as soon as new scores land.
+"""
+import logging
+
+import numpy as np
+
+from app import db
+from app.memo import memoize
+from app.models.matchups import Matchups
+from app.logic.head_to_head import matchup_generation
+
+logger = logging.getLogger(__name__)
+
+
+def compute_all_play(years, weeks, roster_ids, points_for, points_against, opponent_ids):
+    """
+    Per team-season all-play and luck from parallel arrays of matchup rows
+    (one row per roster per week). Returns a list of dicts, by year then roster.
+    """
+    season_values, season = np.unique(years, return_inverse=True)
+    week_values, week = np.unique(weeks, return_inverse=True)
+    roster_values, roster = np.unique(roster_ids, return_inverse=True)
+    n_seasons, n_rosters = len(season_values), len(roster_values)
+
+    cube = np.full((n_seasons, len(week_values), n_rosters), np.nan)
+    cube[season, week, roster] = points_for
+    played = ~np.isnan(cube)
+
+    mine, theirs = cube[..., :, None], cube[..., None, :]
+    beats = (mine > theirs).sum(axis=-1)
+    loses = (mine < theirs).sum(axis=-1)
+    ties = (mine == theirs).sum(axis=-1) - played          # a score always ties itself
+    opponents = played.sum(axis=-1, keepdims=True) - 1
+    share = np.where(played & (opponents > 0), (beats + 0.5 * ties) / np.maximum(opponents, 1), 0.0)
+
+    # Actual results from the same rows; a row against itself is a bye, not a game
+    cells = season * n_rosters + roster
+    has_opponent = opponent_ids != roster_ids
+    actual = {
+        name: np.bincount(cells, weights=has_opponent & outcome,
+                          minlength=n_seasons * n_rosters).reshape(n_seasons, n_rosters)
+        for name, outcome in (('wins', points_for > points_against),
+                              ('losses', points_for < points_against),
+                              ('ties', points_for == points_against))
+    }
+
+    all_play_wins, all_play_losses, all_play_ties = beats.sum(axis=1), loses.sum(axis=1), ties.sum(axis=1)
+    expected_wins = share.sum(axis=1)
+    weeks_played = played.sum(axis=1)
+
+    results = []
+    for s, r in zip(*np.nonzero(weeks_played)):
+        all_play_games = all_play_wins[s, r] + all_play_losses[s, r] + all_play_ties[s, r]
+        results.append({
+            'year': int(season_values[s]),
+            'sleeper_roster_id': int(roster_values[r]),
+            'weeks': int(weeks_played[s, r]),
+            'wins': int(actual['wins'][s, r]),
+            'losses': int(actual['losses'][s, r]),
+            'ties': int(actual['ties'][s, r]),
+            'all_play_wins': int(all_play_wins[s, r]),
+            'all_play_losses': int(all_play_losses[s, r]),
+            'all_play_ties': int(all_play_ties[s, r]),
+            'all_play_pct': round(float((all_play_wins[s, r] + 0.5 * all_play_ties[s, r]) / all_play_games), 3)
+                            if all_play_games else None,
+            'expected_wins': round(float(expected_wins[s, r]), 2),
+            'luck': round(float(actual['wins'][s, r] + 0.5 * actual['ties'][s, r] - expected_wins[s, r]), 2),
+        })
+    return results
+
+
+@memoize(ttl=6 * 3600, maxsize=2, tags=('matchups',))
+def _all_play(generation):
+    rows = (db.session.query(Matchups.year, Matchups.week, Matchups.sleeper_roster_id,
+                             Matchups.points_for, Matchups.points_against, Matchups.opponent_sleeper_roster_id)
+            .filter(Matchups.completed == True)
+            .all())
+    if not rows:
+        return []
+    years, weeks, roster_ids, points_for, points_against, opponent_ids = (np.array(column) for column in zip(*rows))
+    return compute_all_play(years, weeks, roster_ids, points_for.astype(float), points_against.astype(float),
+                            opponent_ids)
+
+
+def get_all_play():
+    """Every team-season's all-play record, expected wins and luck. Do not mutate."""
+    return _all_play(matchup_generation())
+
+
+def refresh_all_play():
+    """get_all_play() for the matchups sync: a failed precompute must not fail the sync."""
+    try:
+        get_all_play()
+    except Exception as e:
+        logger.error(f'All-play precompute failed: {e}')
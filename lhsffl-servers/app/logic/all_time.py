@@ -0,0 +1,217 @@
+"""
+All-time records as a (roster, season, week) rollup cube.
+
+Every completed Matchups row fills one cell: points for and against, the
+result and the opponent. Each (roster, season) also carries its playoff finish
+from the PlayoffMatchups winners bracket (appearance and placement). Each season's
+playoffs start at its LeagueSeasons.playoff_week_start, stored from the Sleeper
+league settings by the playoffs backfill. totals() slices the cube by season
+range, regular season / playoffs and opponent with boolean masks, so any
+combination is answered from memory without another GROUP BY.
+
+Like the head-to-head matrices, the cube is cached by data generation: the
+matchup generation plus one over the brackets and playoff start weeks. A sync,
+score correction or backfill in any worker changes it; within a worker the
+'matchups' and 'playoffs' tags also drop it straight away.
+
+Environment:
+    PLAYOFF_WEEK_START  first playoff week of a season with no LeagueSeasons row
+                        (default 15, shared with the playoff odds)
+"""
+import logging
+import os
+
+import numpy as np
+from sqlalchemy import func
+
+from app import db
+from app.logic.head_to_head import matchup_generation
+from app.memo import memoize
+from app.models.league_seasons import LeagueSeasons
+from app.models.matchups import Matchups
+from app.models.playoff_matchups import PlayoffMatchups
+
+logger = logging.getLogger(__name__)
+
+SEGMENTS = ('regular', 'playoffs', 'all')
+
+WIN, LOSS, TIE = 1, -1, 0
+NO_OPPONENT = -1
+
+
+def _matchup_rows():
+    return (db.session.query(Matchups.year, Matchups.week, Matchups.sleeper_roster_id,
+                             Matchups.opponent_sleeper_roster_id, Matchups.points_for, Matchups.points_against)
+            .filter(Matchups.completed == True,
+                    Matchups.sleeper_roster_id != Matchups.opponent_sleeper_roster_id)
+            .all())
+
+
+def _bracket_rows():
+    return (db.session.query(PlayoffMatchups.year, PlayoffMatchups.round, PlayoffMatchups.sleeper_roster_id,
+                             PlayoffMatchups.opponent_sleeper_roster_id, PlayoffMatchups.winner_sleeper_roster_id,
+                             PlayoffMatchups.loser_sleeper_roster_id, PlayoffMatchups.placement)
+            .filter(PlayoffMatchups.bracket == 'winners')
+            .all())
+
+
+def playoff_finishes(rows):
+    """
+    {(year, roster): placement or None} for every roster in a winners bracket. The
+    placement game's winner takes the placement and its loser the next one; as in
+    recompute_championships(), a season with no placement-1 game crowns the
+    winner of its last round.
+    """
+    finishes = {}
+    last_round = {}     # year -> (round, winner) of its latest decided match
+    for year, round_, team1, team2, winner, loser, placement in rows:
+        for roster in (team1, team2, winner, loser):
+            if roster is not None:
+                finishes.setdefault((year, roster), None)
+        if winner is None:
+            continue
+        if placement:
+            finishes[(year, winner)] = placement
+            if loser is not None:
+                finishes[(year, loser)] = placement + 1
+        if (round_ or 0) >= last_round.get(year, (0, None))[0]:
+            last_round[year] = (round_ or 0, winner)
+
+    crowned = {year for (year, _), placement in finishes.items() if placement == 1}
+    for year, (_, winner) in last_round.items():
+        if year not in crowned:
+            finishes[(year, winner)] = 1
+    return finishes
+
+
+class AllTimeCube:
+    """Cell arrays are (roster, season, week); finishes are (roster, season); playoff_start is per season."""
+
+    def __init__(self, rosters, seasons, weeks, playoff_start, points_for, points_against, played, result,
+                 opponent, appeared, placement):
+        self.rosters = rosters
+        self.seasons = seasons
+        self.weeks = weeks
+        self.playoff_start = playoff_start
+        self.points_for = points_for
+        self.points_against = points_against
+        self.played = played
+        self.result = result
+        self.opponent = opponent
+        self.appeared = appeared
+        self.placement = placement
+
+    @classmethod
+    def build(cls):
+        rows = _matchup_rows()
+        finishes = playoff_finishes(_bracket_rows())
+
+        rosters = np.unique([r for row in rows for r in row[2:4]] + [roster for _, roster in finishes]).astype(int)
+        seasons = np.unique([row[0] for row in rows] + [year for year, _ in finishes]).astype(int)
+        weeks = np.arange(1, max((row[1] for row in rows), default=0) + 1)
+        shape = (len(rosters), len(seasons), len(weeks))
+        starts = LeagueSeasons.playoff_week_starts()
+        default_start = int(os.environ.get('PLAYOFF_WEEK_START', 15))
+        playoff_start = np.array([starts.get(int(season), default_start) for season in seasons], dtype=int)
+
+        cube = cls(rosters, seasons, weeks, playoff_start,
+                   np.zeros(shape), np.zeros(shape), np.zeros(shape, dtype=bool),
+                   np.zeros(shape, dtype=np.int8), np.full(shape, NO_OPPONENT, dtype=int),
+                   np.zeros(shape[:2], dtype=bool), np.zeros(shape[:2], dtype=int))
+        cube._fill(rows)
+        cube._fill_finishes(finishes)
+        logger.info(f'All-time cube built: {len(rows)} team-games, {len(rosters)} rosters, {len(seasons)} seasons')
+        return cube
+
+    def _index(self, axis, values):
+        """Positions of `values` on an axis, or None if any is missing."""
+        values = np.asarray(values, dtype=int)
+        positions = np.searchsorted(axis, values)
+        if len(values) and (positions.max() >= len(axis) or (axis[positions] != values).any()):
+            return None
+        return positions
+
+    def _fill(self, rows):
+        if not rows:
+            return
+        years, weeks, rosters, opponents, points_for, points_against = (np.array(c) for c in zip(*rows))
+        r, s, w = self._index(self.rosters, rosters), self._index(self.seasons, years), self._index(self.weeks, weeks)
+        o = self._index(self.rosters, opponents)
+        points_for, points_against = points_for.astype(float), points_against.astype(float)
+        self.points_for[r, s, w] = points_for
+        self.points_against[r, s, w] = points_against
+        self.played[r, s, w] = True
+        self.result[r, s, w] = np.sign(points_for - points_against).astype(np.int8)
+        self.opponent[r, s, w] = o
+
+    def _fill_finishes(self, finishes):
+        if not finishes:
+            return
+        (years, rosters), placements = zip(*finishes), list(finishes.values())
+        r, s = self._index(self.rosters, rosters), self._index(self.seasons, years)
+        self.appeared[r, s] = True
+        self.placement[r, s] = [p or 0 for p in placements]
+
+    def totals(self, start_year=None, end_year=None, segment='regular', opponent=None):
+        """
+        {sleeper_roster_id: record} over a slice: seasons in [start_year, end_year],
+        'regular' / 'playoffs' / 'all' weeks, and optionally games against one
+        opponent roster. Playoff appearances and titles count per season in range.
+        """
+        seasons = np.ones(len(self.seasons), dtype=bool)
+        if start_year is not None:
+            seasons &= self.seasons >= start_year
+        if end_year is not None:
+            seasons &= self.seasons <= end_year
+
+        weeks = np.ones((len(self.seasons), len(self.weeks)), dtype=bool)     # (season, week)
+        if segment == 'regular':
+            weeks = self.weeks[None, :] < self.playoff_start[:, None]
+        elif segment == 'playoffs':
+            weeks = self.weeks[None, :] >= self.playoff_start[:, None]
+
+        cells = self.played & seasons[None, :, None] & weeks[None, :, :]
+        if opponent is not None:
+            o = self._index(self.rosters, [opponent])
+            cells = cells & (self.opponent == o[0]) if o is not None else np.zeros_like(cells)
+
+        def total(values):
+            return np.where(cells, values, 0).sum(axis=(1, 2))
+
+        wins, losses, ties = total(self.result == WIN), total(self.result == LOSS), total(self.result == TIE)
+        points_for, points_against = total(self.points_for), total(self.points_against)
+        appearances = (self.appeared & seasons).sum(axis=1)
+        titles = ((self.placement == 1) & seasons).sum(axis=1)
+        runner_ups = ((self.placement == 2) & seasons).sum(axis=1)
+
+        return {int(roster): {
+            'games': int(wins[i] + losses[i] + ties[i]),
+            'wins': int(wins[i]),
+            'losses': int(losses[i]),
+            'ties': int(ties[i]),
+            'points_for': round(float(points_for[i]), 2),
+            'points_against': round(float(points_against[i]), 2),
+            'playoff_appearances': int(appearances[i]),
+            'championships': int(titles[i]),
+            'runner_ups': int(runner_ups[i]),
+        } for i, roster in enumerate(self.rosters)}
+
+
+def _playoff_generation():
+    """Changes whenever a bracket match is decided or a season's playoff start week changes."""
+    decided = (db.session.query(func.count(PlayoffMatchups.playoff_matchup_id))
+               .filter(PlayoffMatchups.winner_sleeper_roster_id.isnot(None))
+               .scalar())
+    seasons, starts = db.session.query(func.count(LeagueSeasons.year),
+                                       func.coalesce(func.sum(LeagueSeasons.playoff_week_start), 0)).one()
+    return int(decided), int(seasons), int(starts)
+
+
+@memoize(ttl=6 * 3600, maxsize=2, tags=('matchups', 'playoffs'))
+def _all_time_cube(generation):
+    return AllTimeCube.build()
+
+
+def get_all_time_cube():
+    """The AllTimeCube over every completed matchup and winners bracket. Do not mutate."""
+    return _all_time_cube((matchup_generation(), _playoff_generation()))
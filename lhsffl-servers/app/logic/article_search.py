@@ -0,0 +1,142 @@
+"""
+Full-text search over published articles.
+
+An in-memory inverted index (term -> {article_id: weighted term frequency}) ranked
+with BM25. Title terms count TITLE_WEIGHT times, so a match in the headline beats
+one buried in the body.
+
+The index is memoized under the 'articles' tag and built from the DB on first
+search; it is never modified afterwards. Publishing through
+/admin/articles/<id>/publish calls invalidate('articles'), so the next search in
+that worker rebuilds it; other workers pick changes up when their copy expires.
+"""
+import math
+import re
+from collections import Counter, defaultdict
+
+from app.memo import memoize
+from app.models.articles import Articles
+
+TITLE_WEIGHT = 3
+
+# BM25 parameters (the usual defaults)
+K1 = 1.2
+B = 0.75
+
+SNIPPET_WORDS = 30
+
+STOPWORDS = frozenset(
+    'a an and are as at be but by for from has have he his in is it its of on or '
+    'our she that the their them they this to was were will with'.split()
+)
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+_MARKUP = re.compile(r'[#*_>`|]+|\[|\]\([^)]*\)')
+
+
+def _normalize(token):
+    token = token.split("'", 1)[0]  # "mahomes's" / "team's" -> stem before the apostrophe
+    if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+        token = token[:-1]  # crude plural folding: "trades" matches "trade"
+    return token
+
+
+def tokenize(text):
+    """Lowercased, stopword-free index terms of `text`, in order."""
+    return [_normalize(t) for t in _TOKEN.findall((text or '').lower()) if t not in STOPWORDS]
+
+
+def _plain(text):
+    return ' '.join(_MARKUP.sub(' ', text or '').split())
+
+
+class ArticleIndex:
+
+    def __init__(self):
+        self.postings = defaultdict(dict)   # term -> {article_id: weighted tf}
+        self.lengths = {}                   # article_id -> weighted document length
+        self.docs = {}                      # article_id -> (article fields for results, plain content)
+        self.total_length = 0
+
+    @classmethod
+    def build(cls):
+        index = cls()
+        for article in Articles.query.filter(Articles.published == True):
+            index.add(article)
+        return index
+
+    def add(self, article):
+        """Index one article; only called while building."""
+        content = _plain(article.content)
+        terms = Counter(tokenize(content))
+        for term in tokenize(article.title):
+            terms[term] += TITLE_WEIGHT
+
+        for term, tf in terms.items():
+            self.postings[term][article.article_id] = tf
+        length = sum(terms.values())
+        self.lengths[article.article_id] = length
+        self.total_length += length
+        self.docs[article.article_id] = ({
+            'article_id': article.article_id,
+            'title': article.title,
+            'article_type': article.article_type,
+            'thumbnail': article.thumbnail,
+            'creation_date': article.creation_date.isoformat() if article.creation_date else None,
+        }, content)
+
+    def search(self, query, limit=10):
+        """Top `limit` articles for `query` as result dicts with a score and snippet, best first."""
+        terms = set(tokenize(query))
+        n = len(self.lengths)
+        if not terms or not n:
+            return []
+        avgdl = self.total_length / n
+
+        scores = defaultdict(float)
+        for term in terms:
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            idf = math.log(1 + (n - len(docs) + 0.5) / (len(docs) + 0.5))
+            for article_id, tf in docs.items():
+                norm = K1 * (1 - B + B * self.lengths[article_id] / avgdl)
+                scores[article_id] += idf * tf * (K1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], -item[0]))[:limit]
+        return [{**self.docs[article_id][0], 'score': round(score, 4),
+                 'snippet': _snippet(self.docs[article_id][1], terms)}
+                for article_id, score in ranked]
+
+
+def _snippet(text, terms):
+    """The SNIPPET_WORDS-word window of `text` containing the most query terms."""
+    words = text.split()
+    if len(words) <= SNIPPET_WORDS:
+        return text
+    hits = [1 if _normalize(w.lower().strip('.,;:!?"()')) in terms else 0 for w in words]
+    window = sum(hits[:SNIPPET_WORDS])
+    best, best_start = window, 0
+    for start in range(1, len(words) - SNIPPET_WORDS + 1):
+        window += hits[start + SNIPPET_WORDS - 1] - hits[start - 1]
+        if window > best:
+            best, best_start = window, start
+    if best:
+        # Recenter on the matches rather than leaving them at the window's edge.
+        matched = [i for i in range(best_start, best_start + SNIPPET_WORDS) if hits[i]]
+        middle = (matched[0] + matched[-1]) // 2
+        best_start = min(max(middle - SNIPPET_WORDS // 2, 0), len(words) - SNIPPET_WORDS)
+    snippet = ' '.join(words[best_start:best_start + SNIPPET_WORDS])
+    prefix = '… ' if best_start > 0 else ''
+    suffix = ' …' if best_start + SNIPPET_WORDS < len(words) else ''
+    return f'{prefix}{snippet}{suffix}'
+
+
+@memoize(ttl=900, maxsize=1, stale_ttl=300, tags=('articles',))
+def get_article_index():
+    """The ArticleIndex over every published article. Do not mutate."""
+    return ArticleIndex.build()
+
+
+def search_articles(query, limit=10):
+    return get_article_index().search(query, limit=limit)
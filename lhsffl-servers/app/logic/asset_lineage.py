@@ -0,0 +1,174 @@
+"""
+Asset lineage: which later transaction moved each acquired asset on.
+
+Every complete transaction contributes
+  * acquisitions  – players added to a roster (any transaction type) and picks a
+                    roster received in a trade; each becomes an open AssetLineage edge
+  * releases      – players a roster dropped and picks it traded away; each closes the
+                    roster's open edges for that asset that were acquired strictly earlier
+
+The edges are the read path for full trade trees: a trade's ripple tree is a walk
+from the origin's edges to the transactions that released them, and from there to
+the edges those transactions opened (TimelineIndex.full_trade_tree_payload()).
+
+The transaction sync calls apply_lineage() with the IDs it just created, before
+committing. Transactions are linked in (created_at, transaction_id) order, so one
+that arrives out of order relative to already-linked history (a backfill) needs
+rebuild_asset_lineage(); the backfills run it when they finish.
+"""
+import logging
+from collections import defaultdict, namedtuple
+
+from app import db
+from app.memo import invalidate
+from app.models.asset_lineage import AssetLineage
+from app.models.transactions import Transactions
+from app.models.transaction_players import TransactionPlayers
+from app.models.transaction_draft_picks import TransactionDraftPicks
+
+logger = logging.getLogger(__name__)
+
+# Plain-tuple view of a transaction, enough to link lineage.
+#   player_moves: [(player_sleeper_id, sleeper_roster_id, action)]
+#   pick_moves:   [(season, round, original_roster_id, owner_id, previous_owner_id)]
+LineageTxn = namedtuple('LineageTxn', 'transaction_id created_at type player_moves pick_moves')
+
+
+def _releases(txn):
+    """(roster, asset) pairs the transaction takes away from a roster."""
+    for player_id, roster_id, action in txn.player_moves:
+        if action == 'drop':
+            yield roster_id, ('player', player_id)
+    for season, rnd, original, _owner, previous_owner in txn.pick_moves:
+        if previous_owner is not None:
+            yield previous_owner, ('pick', season, rnd, original)
+
+
+def _acquisitions(txn):
+    """(roster, asset) pairs the transaction hands to a roster."""
+    for player_id, roster_id, action in txn.player_moves:
+        if action == 'add':
+            yield roster_id, ('player', player_id)
+    if txn.type == 'trade':
+        for season, rnd, original, owner, _previous in txn.pick_moves:
+            if owner is not None:
+                yield owner, ('pick', season, rnd, original)
+
+
+def _new_edge(txn, roster_id, asset):
+    edge = AssetLineage(
+        acquired_transaction_id=txn.transaction_id,
+        acquired_at=txn.created_at,
+        sleeper_roster_id=roster_id,
+        asset_type=asset[0],
+    )
+    if asset[0] == 'player':
+        edge.player_sleeper_id = asset[1]
+    else:
+        _, edge.pick_season, edge.pick_round, edge.pick_roster_id = asset
+    return edge
+
+
+def link_lineage(transactions, open_edges, new_edge=_new_edge):
+    """
+    Core linker; touches no session.
+
+    Args:
+        transactions  LineageTxn tuples sorted by (created_at, transaction_id).
+        open_edges    {(roster_id, asset): [edge, ...]} of currently unreleased
+                      edges. Updated in place as edges are released and opened.
+        new_edge      new_edge(txn, roster_id, asset) -> edge. Defaults to an unsaved
+                      AssetLineage; anything with acquired_at and a writable
+                      released_transaction_id works.
+
+    Returns the newly created edges.
+    """
+    created = []
+    for txn in transactions:
+        for roster_id, asset in set(_releases(txn)):
+            still_open = []
+            for edge in open_edges.get((roster_id, asset), ()):
+                if edge.acquired_at < txn.created_at:
+                    edge.released_transaction_id = txn.transaction_id
+                else:
+                    still_open.append(edge)
+            if still_open:
+                open_edges[(roster_id, asset)] = still_open
+            else:
+                open_edges.pop((roster_id, asset), None)
+
+        for roster_id, asset in set(_acquisitions(txn)):
+            edge = new_edge(txn, roster_id, asset)
+            open_edges.setdefault((roster_id, asset), []).append(edge)
+            created.append(edge)
+    return created
+
+
+def _load_lineage_txns(transaction_ids=None):
+    """Complete, timestamped transactions as sorted LineageTxn tuples (all of them when ids is None)."""
+    def scoped(query):
+        query = query.filter(Transactions.status == 'complete', Transactions.created_at.isnot(None))
+        if transaction_ids is not None:
+            query = query.filter(Transactions.transaction_id.in_(transaction_ids))
+        return query
+
+    headers = scoped(db.session.query(Transactions.transaction_id, Transactions.created_at, Transactions.type)).all()
+
+    player_moves = defaultdict(list)
+    for txn_id, player_id, roster_id, action in scoped(
+        db.session.query(TransactionPlayers.transaction_id, TransactionPlayers.player_sleeper_id,
+                         TransactionPlayers.sleeper_roster_id, TransactionPlayers.action)
+        .join(Transactions, Transactions.transaction_id == TransactionPlayers.transaction_id)
+    ):
+        player_moves[txn_id].append((player_id, roster_id, action))
+
+    pick_moves = defaultdict(list)
+    for txn_id, season, rnd, original, owner, previous in scoped(
+        db.session.query(TransactionDraftPicks.transaction_id, TransactionDraftPicks.season,
+                         TransactionDraftPicks.round, TransactionDraftPicks.roster_id,
+                         TransactionDraftPicks.owner_id, TransactionDraftPicks.previous_owner_id)
+        .join(Transactions, Transactions.transaction_id == TransactionDraftPicks.transaction_id)
+    ):
+        pick_moves[txn_id].append((season, rnd, original, owner, previous))
+
+    txns = [
+        LineageTxn(txn_id, created_at, txn_type, player_moves[txn_id], pick_moves[txn_id])
+        for txn_id, created_at, txn_type in headers
+    ]
+    txns.sort(key=lambda t: (t.created_at, t.transaction_id))
+    return txns
+
+
+def apply_lineage(transaction_ids):
+    """
+    Link newly ingested transactions into the lineage graph.
+    Call before committing the ingest; the caller commits.
+    """
+    if not transaction_ids:
+        return
+    txns = _load_lineage_txns(list(transaction_ids))
+    if not txns:
+        return
+
+    rosters = {roster_id for txn in txns for roster_id, _ in _releases(txn)}
+    open_edges = defaultdict(list)
+    if rosters:
+        for edge in AssetLineage.query.filter(
+            AssetLineage.sleeper_roster_id.in_(rosters),
+            AssetLineage.released_transaction_id.is_(None),
+        ):
+            open_edges[(edge.sleeper_roster_id, edge.asset)].append(edge)
+
+    db.session.add_all(link_lineage(txns, open_edges))
+
+
+def rebuild_asset_lineage():
+    """Relink the whole transaction history from scratch and commit."""
+    AssetLineage.query.delete()
+    edges = link_lineage(_load_lineage_txns(), {})
+    db.session.add_all(edges)
+    db.session.commit()
+    invalidate('asset_lineage')
+    logger.info(f'Asset lineage rebuilt: {len(edges)} edges')
+    return {'success': True, 'edges': len(edges)}
+
@@ -0,0 +1,130 @@
+"""
+Prebuilt landing-page ("bootstrap") document.
+
+Standings, the current week's matchups, playoff odds, league state and the latest
+articles only change when a sync runs or an article is published, so instead of
+rebuilding them per visit they are rendered once into a JSON document:
+
+  * regenerate_bootstrap() – build it, keep the bytes (plain and gzipped) in memory,
+                             and write both to BOOTSTRAP_PATH so other workers and
+                             restarts pick it up without touching the DB
+  * get_bootstrap()        – the current document; reloads from disk when another
+                             process wrote a newer one, builds it only if none exists
+
+Called at the end of SyncService.full_sync and when an article is published.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime
+
+from flask import current_app
+
+from app.models.teams import Teams
+from app.models.matchups import Matchups
+from app.models.articles import Articles
+from app.models.playoff_odds import PlayoffOdds
+from app.league_state_manager import get_current_year, get_current_week
+
+logger = logging.getLogger(__name__)
+
+BootstrapDocument = namedtuple('BootstrapDocument', 'path body gzipped etag mtime')
+
+_lock = threading.Lock()
+_document = None
+
+
+def _path():
+    return current_app.config.get('BOOTSTRAP_PATH') or os.path.join(current_app.instance_path, 'bootstrap.json')
+
+
+def _pack(path, body, mtime):
+    return BootstrapDocument(
+        path=path,
+        body=body,
+        gzipped=gzip.compress(body, mtime=0),
+        etag=hashlib.sha256(body).hexdigest()[:32],
+        mtime=mtime,
+    )
+
+
+def _write(path, data):
+    tmp = f'{path}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def build_bootstrap():
+    """Everything the landing page needs, as a dict."""
+    year = get_current_year()
+    week = get_current_week()
+    return {
+        'generated_at': datetime.utcnow().isoformat(),
+        'league_state': {'current_year': year, 'current_week': week},
+        'teams': [team.serialize_list() for team in Teams.get_standings(year)],
+        'matchups': [matchup.serialize() for matchup in Matchups.get_week(year, week or 1)],
+        'articles': [article.serialize() for article in Articles.get_latest()],
+        'playoff_odds': [odds.serialize() for odds in PlayoffOdds.get_latest(year)],
+    }
+
+
+def regenerate_bootstrap():
+    """Rebuild the document, store it in memory and on disk, and return it."""
+    global _document
+    path = _path()
+    body = json.dumps({'success': True, **build_bootstrap()}, separators=(',', ':'), default=str).encode()
+    document = _pack(path, body, time.time())
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        _write(f'{path}.gz', document.gzipped)
+        _write(path, body)
+        document = document._replace(mtime=os.stat(path).st_mtime)
+    except OSError as e:
+        logger.warning(f'Could not write bootstrap document to {path}: {e}')
+
+    with _lock:
+        _document = document
+    logger.info(f'Bootstrap document regenerated ({len(body)} bytes)')
+    return document
+
+
+def refresh_bootstrap():
+    """regenerate_bootstrap() for hooks: a stale landing page must not fail a sync or a publish."""
+    try:
+        regenerate_bootstrap()
+    except Exception as e:
+        logger.error(f'Bootstrap regeneration failed: {e}')
+
+
+def get_bootstrap():
+    """The current document, without DB queries unless none has been built yet."""
+    global _document
+    path = _path()
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        mtime = None
+
+    document = _document
+    if document is not None and document.path == path and (mtime is None or mtime <= document.mtime):
+        return document
+
+    if mtime is not None:
+        try:
+            with open(path, 'rb') as f:
+                loaded = _pack(path, f.read(), mtime)
+        except OSError as e:
+            logger.warning(f'Could not read bootstrap document from {path}: {e}')
+        else:
+            with _lock:
+                _document = loaded
+            return loaded
+
+    return regenerate_bootstrap()
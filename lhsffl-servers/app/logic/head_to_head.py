@@ -0,0 +1,121 @@
+"""
+All-time head-to-head records between every pair of rosters.
+
+Every completed Matchups row is loaded once into NumPy arrays (roster,
+opponent, points for, points against), and the roster x roster matrices of
+wins, losses, ties, points for and points against are built in one vectorized
+pass: each row's (roster, opponent) cell is a flat index, and np.bincount sums
+every matrix at once. Matchups are stored once per side, so row i of each
+matrix is roster i's record against every column opponent.
+
+The matrices are cached by the matchup data generation, a single aggregate
+query over completed Matchups (count and point total). A sync or score
+correction changes the generation in every worker, not only the one that ran
+it; within a worker the 'matchups' tag also drops it straight away.
+"""
+import numpy as np
+from sqlalchemy import func
+
+from app import db
+from app.memo import memoize
+from app.models.matchups import Matchups
+
+
+class HeadToHead:
+
+    def __init__(self, rosters, wins, losses, ties, points_for, points_against):
+        self.rosters = rosters              # sleeper_roster_ids, in matrix order
+        self.wins = wins
+        self.losses = losses
+        self.ties = ties
+        self.points_for = points_for
+        self.points_against = points_against
+        self.games = wins + losses + ties
+        self._position = {roster: i for i, roster in enumerate(rosters)}
+
+    @classmethod
+    def from_arrays(cls, roster_ids, opponent_ids, points_for, points_against):
+        rosters = np.union1d(roster_ids, opponent_ids)
+        n = len(rosters)
+        cells = np.searchsorted(rosters, roster_ids) * n + np.searchsorted(rosters, opponent_ids)
+
+        def matrix(weights=None):
+            return np.bincount(cells, weights=weights, minlength=n * n).reshape(n, n)
+
+        return cls(
+            rosters=rosters.tolist(),
+            wins=matrix(points_for > points_against).astype(int),
+            losses=matrix(points_for < points_against).astype(int),
+            ties=matrix(points_for == points_against).astype(int),
+            points_for=matrix(points_for).round(2),
+            points_against=matrix(points_against).round(2),
+        )
+
+    @classmethod
+    def build(cls):
+        rows = (db.session.query(Matchups.sleeper_roster_id, Matchups.opponent_sleeper_roster_id,
+                                 Matchups.points_for, Matchups.points_against)
+                .filter(Matchups.completed == True,
+                        Matchups.opponent_sleeper_roster_id != Matchups.sleeper_roster_id)
+                .all())
+        if not rows:
+            return cls([], *(np.zeros((0, 0)) for _ in range(5)))
+        roster_ids, opponent_ids, points_for, points_against = (np.array(column) for column in zip(*rows))
+        return cls.from_arrays(roster_ids, opponent_ids,
+                               points_for.astype(float), points_against.astype(float))
+
+    def record(self, i, j):
+        games = int(self.games[i, j])
+        return {
+            'games': games,
+            'wins': int(self.wins[i, j]),
+            'losses': int(self.losses[i, j]),
+            'ties': int(self.ties[i, j]),
+            'points_for': float(self.points_for[i, j]),
+            'points_against': float(self.points_against[i, j]),
+            'win_pct': round((self.wins[i, j] + 0.5 * self.ties[i, j]) / games, 3) if games else None,
+        }
+
+    def rivals(self, sleeper_roster_id):
+        """
+        One record per opponent `sleeper_roster_id` has played, most games first;
+        ties broken by the closest average margin. None for an unknown roster.
+        """
+        i = self._position.get(sleeper_roster_id)
+        if i is None:
+            return None
+        opponents = np.flatnonzero(self.games[i])
+        margin = (self.points_for[i, opponents] - self.points_against[i, opponents]) / self.games[i, opponents]
+        order = np.lexsort((np.abs(margin), -self.games[i, opponents]))
+        return [{'opponent_sleeper_roster_id': self.rosters[j],
+                 'average_margin': round(float(margin[k]), 2),
+                 **self.record(i, j)}
+                for k, j in ((k, int(opponents[k])) for k in order)]
+
+    def matrices(self):
+        """The full matrices as nested lists, rows and columns in `rosters` order."""
+        return {
+            'wins': self.wins.tolist(),
+            'losses': self.losses.tolist(),
+            'ties': self.ties.tolist(),
+            'points_for': self.points_for.tolist(),
+            'points_against': self.points_against.tolist(),
+        }
+
+
+def matchup_generation():
+    """Changes whenever a completed matchup is added or its score changes."""
+    count, total = (db.session.query(func.count(Matchups.matchup_id),
+                                     func.coalesce(func.sum(Matchups.points_for), 0))
+                    .filter(Matchups.completed == True)
+                    .one())
+    return int(count), round(float(total), 2)
+
+
+@memoize(ttl=6 * 3600, maxsize=2, tags=('matchups',))
+def _head_to_head(generation):
+    return HeadToHead.build()
+
+
+def get_head_to_head():
+    return _head_to_head(matchup_generation())
@@ -2,13 +2,16 @@
 Historical data backfills from the Sleeper API.
 
 Covers the data the live weekly sync never reaches:
-  * Playoff brackets (winners + losers)        -> PlayoffMatchups
-  * Per-player weekly league-scored points     -> PlayerWeeklyStats
-  * Matchup rows for every season/week         -> Matchups (the live sync only UPDATEs)
-
-Plus derivation helpers that need no new storage:
+  * Playoff brackets (winners + losers)        -> PlayoffMatchups (+ each season's playoff
+                                                  start week -> LeagueSeasons)
+  * Per-player weekly league-scored points     -> PlayerWeeklyStats (+ season/career rollups,
+                                                  LineupEfficiency, TradeScores, LeagueRecords)
+  * Matchup rows for every season/week         -> Matchups (+ LeagueRecords; the live sync
+                                                  only UPDATEs)
+
+Plus derivation helpers over data already synced:
   * recompute_championships()  -> Teams.championships from PlayoffMatchups
-  * current_pick_owners()      -> future draft-pick ownership from TransactionDraftPicks
+  * current_pick_owners()      -> future draft-pick ownership from the PickOwnership ledger
 
 All writes use MySQL `INSERT ... ON DUPLICATE KEY UPDATE` against the natural-key
 UNIQUE constraints, so every backfill is idempotent and safe to re-run (the database
@@ -21,11 +24,16 @@ import requests
 from sqlalchemy import text
 
 from app import db
+from app.memo import memoize, invalidate
 from app.league_history import LEAGUE_HISTORY, league_id_for
 from app.models.teams import Teams
 from app.models.draft_picks import DraftPicks
-from app.models.transactions import Transactions
-from app.models.transaction_draft_picks import TransactionDraftPicks
+from app.models.league_seasons import LeagueSeasons
+from app.logic.pick_ownership import traded_pick_owners
+from app.logic.player_stats import refresh_player_stats, rebuild_player_stats
+from app.logic.lineup_efficiency import refresh_lineup_efficiency, rebuild_lineup_efficiency
+from app.logic.trade_scores import refresh_trade_scores, rebuild_trade_scores
+from app.logic.record_book import refresh_player_records, rebuild_record_book
 
 logger = logging.getLogger(__name__)
 
@@ -99,8 +107,21 @@ def _backfill_bracket(year, league_id, bracket):
     return added
 
 
+def _backfill_league_season(year, league_id):
+    """Fetch a season's league settings and store its playoff start week."""
+    resp = requests.get(f'{SLEEPER_BASE}/league/{league_id}')
+    resp.raise_for_status()
+    settings = (resp.json() or {}).get('settings') or {}
+    time.sleep(RATE_LIMIT_SECONDS)
+
+    season = db.session.get(LeagueSeasons, year) or LeagueSeasons(year=year)
+    season.sleeper_league_id = str(league_id)
+    season.playoff_week_start = settings.get('playoff_week_start')
+    db.session.add(season)
+
+
 def backfill_playoffs(year=None):
-    """Backfill winners + losers brackets for all (or one) season, then recompute rings."""
+    """Backfill winners + losers brackets and playoff start weeks for all (or one) season, then recompute rings."""
     seasons = _seasons(year)
     total = 0
     started = time.time()
@@ -109,9 +130,11 @@ def backfill_playoffs(year=None):
     for season_idx, season in enumerate(seasons, start=1):
         league_id = league_id_for(season)
         try:
+            _backfill_league_season(season, league_id)
             winners = _backfill_bracket(season, league_id, 'winners')
             losers = _backfill_bracket(season, league_id, 'losers')
             db.session.commit()
+            invalidate('playoffs')
             total += winners + losers
             logger.info(f'[playoffs] ({season_idx}/{len(seasons)}) season {season} — '
                         f'winners +{winners}, losers +{losers} (total {total})')
@@ -309,13 +332,20 @@ def _backfill_weeks(year, label, upsert_week):
 def backfill_matchups(year=None):
     """Create/upsert Matchups rows for all (or one) season — independent of player stats."""
     total = _backfill_weeks(year, 'matchups', _upsert_week_matchups)
-    return {'success': True, 'matchups_upserted': total}
+    records = rebuild_record_book()
+    return {'success': True, 'matchups_upserted': total, 'records': records['records']}
 
 
 def backfill_player_stats(year=None):
     """Upsert per-player weekly stats for all (or one) season — independent of matchups."""
     total = _backfill_weeks(year, 'player stats', _upsert_week_player_stats)
-    return {'success': True, 'player_weeks_upserted': total}
+    rollups = rebuild_player_stats()
+    lineups = rebuild_lineup_efficiency()
+    trades = rebuild_trade_scores()
+    records = rebuild_record_book()
+    return {'success': True, 'player_weeks_upserted': total, 'player_season_rows': rollups['season_rows'],
+            'lineup_weeks': lineups['roster_weeks'], 'trade_score_sides': trades['sides'],
+            'records': records['records']}
 
 
 def sync_current_week_player_stats():
@@ -334,12 +364,16 @@ def sync_current_week_player_stats():
     entries = resp.json() or []
 
     s_added = _upsert_week_player_stats(year, week, entries)
+    refresh_player_stats(year, [int(pid) for entry in entries for pid in (entry.get('players_points') or {})])
+    refresh_lineup_efficiency(year, week)
+    refresh_trade_scores()
+    refresh_player_records(year, week)
     db.session.commit()
     return {'success': True, 'year': year, 'week': week, 'player_weeks_upserted': s_added}
 
 
 # ---------------------------------------------------------------------------
-# Draft-pick ownership (derived; no storage)
+# Draft-pick ownership (PickOwnership ledger)
 # ---------------------------------------------------------------------------
 
 def _rookie_draft_rounds():
@@ -351,10 +385,12 @@ def _rookie_draft_rounds():
     return latest.round if latest else 4  # sensible dynasty default
 
 
-def current_pick_owners(seasons=None):
+@memoize(ttl=3600, maxsize=32, stale_ttl=300, tags=('transactions', 'draft_picks', 'teams', 'league_state'))
+def current_pick_owners(seasons=None, as_of=None):
     """
-    Derive who currently owns each future draft pick — the same "defaults + overlay"
-    model Sleeper uses. Untraded picks resolve to their originating roster.
+    Who owns each future draft pick — the same "defaults + overlay" model Sleeper
+    uses. Untraded picks resolve to their originating roster; traded ones come from
+    the PickOwnership ledger, or its history when `as_of` (a datetime) is given.
 
     Returns a list of dicts: {season, round, original_roster_id, current_owner_roster_id}.
     """
@@ -374,16 +410,10 @@ def current_pick_owners(seasons=None):
             for roster_id in roster_ids:
                 ownership[(season, rnd, roster_id)] = roster_id
 
-    # 2. Overlay: latest traded move per (season, round, original roster) wins.
-    moves = (db.session.query(TransactionDraftPicks, Transactions.created_at)
-             .join(Transactions, TransactionDraftPicks.transaction_id == Transactions.transaction_id)
-             .filter(TransactionDraftPicks.season.in_(seasons))
-             .order_by(Transactions.created_at.asc())
-             .all())
-    for pick, _created in moves:  # ascending order -> last write wins
-        key = (pick.season, pick.round, pick.roster_id)
-        if key in ownership and pick.owner_id is not None:
-            ownership[key] = pick.owner_id
+    # 2. Overlay: the ledger's owner for every traded pick.
+    for key, owner in traded_pick_owners(seasons, as_of=as_of).items():
+        if key in ownership:
+            ownership[key] = owner
 
     return [
         {
@@ -6,6 +6,9 @@ from app.models.players import Players
 from app.models.league_state import LeagueState
 from app.models.team_records import TeamRecords
 from app.models.matchups import Matchups
+from app.logic.roster_snapshots import record_roster_snapshot, sleeper_ids
+from app.logic.record_book import refresh_matchup_records
+from app.events import publish
 from app import db
 
 
@@ -289,6 +292,7 @@ def synchronize_matchups():
             matchup_groups[matchup_id].append(matchup)
         
         updated_count = 0
+        changed = []  # rows whose score moved, for the live 'scores' event
         
         # Process each matchup pair
         for matchup_id, teams in matchup_groups.items():
@@ -306,8 +310,10 @@ def synchronize_matchups():
             ).first()
             
             if team1_matchup:
-                team1_matchup.points_for = float(team1.get('points', 0))
-                team1_matchup.points_against = float(team2.get('points', 0))
+                score = (float(team1.get('points', 0)), float(team2.get('points', 0)))
+                if score != (team1_matchup.points_for, team1_matchup.points_against):
+                    changed.append(team1_matchup)
+                team1_matchup.points_for, team1_matchup.points_against = score
                 updated_count += 1
                 print(f"Updated matchup for roster {team1['roster_id']}: {team1_matchup.points_for} vs {team1_matchup.points_against}")
             else:
@@ -321,17 +327,33 @@ def synchronize_matchups():
             ).first()
             
             if team2_matchup:
-                team2_matchup.points_for = float(team2.get('points', 0))
-                team2_matchup.points_against = float(team1.get('points', 0))
+                score = (float(team2.get('points', 0)), float(team1.get('points', 0)))
+                if score != (team2_matchup.points_for, team2_matchup.points_against):
+                    changed.append(team2_matchup)
+                team2_matchup.points_for, team2_matchup.points_against = score
                 updated_count += 1
                 print(f"Updated matchup for roster {team2['roster_id']}: {team2_matchup.points_for} vs {team2_matchup.points_against}")
             else:
                 print(f"Warning: No matchup record found for roster {team2['roster_id']} in week {league_state.week}")
         
+        refresh_matchup_records(league_state.year, league_state.week)
+
         # Commit all changes
         db.session.commit()
         
         print(f"Successfully updated {updated_count} matchup records for week {league_state.week}")
+
+        if changed:
+            publish('scores', {
+                'year': league_state.year,
+                'week': league_state.week,
+                'matchups': [{
+                    'sleeper_matchup_id': m.sleeper_matchup_id,
+                    'sleeper_roster_id': m.sleeper_roster_id,
+                    'points_for': m.points_for,
+                    'points_against': m.points_against,
+                } for m in changed],
+            })
         
         return {
             'success': True,
@@ -381,6 +403,10 @@ def set_league_state():
             )
             db.session.add(new_league_state)
             db.session.commit()
+
+            # Switch this process now; other workers see the new version on their next check.
+            from app.league_state_manager import refresh_league_state
+            refresh_league_state()
     except requests.RequestException as e:
         db.session.rollback()
         raise
@@ -447,6 +473,12 @@ def synchronize_teams():
             starter_ids = roster.get('starters', [])
             taxi_ids = roster.get('taxi', [])
 
+            # Snapshot this week's roster; the Players updates below only keep the latest one
+            record_roster_snapshot(
+                current_year, current_league_state.week, roster['roster_id'],
+                sleeper_ids(all_player_ids), sleeper_ids(starter_ids), sleeper_ids(taxi_ids),
+            )
+
             if all_player_ids:
                 all_player_ids_int = [int(pid) for pid in all_player_ids if pid]
                 players_updated = Players.query.filter(Players.sleeper_id.in_(all_player_ids_int)).update(
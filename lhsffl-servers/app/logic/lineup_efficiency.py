@@ -0,0 +1,185 @@
+"""
+Lineup efficiency: the points each roster actually started vs. its best possible lineup.
+
+The optimal lineup for a roster-week fills the league's starting slots
+(LINEUP_SLOTS) from every player that scored for that roster that week in
+PlayerWeeklyStats. Fixed slots take the top scorers at their position, then flex
+slots are filled from the best players left, most restrictive flex first
+(FLEX before SUPER_FLEX). Because each flex's eligible positions contain the
+previous one's, this greedy fill is optimal.
+
+All roster-weeks are solved in one batched pass: the rows are sorted by
+(roster-week, points desc), and each slot type takes the players whose rank
+among the still-unused eligible players of their roster-week is below the
+slot count. Ranks come from a cumulative sum, so there is no per-roster loop.
+Flex slots that don't nest (WRRB_FLEX with REC_FLEX) have no greedy order; with
+those, each roster-week's flex slots are filled exactly by trying every split of
+them among the positions.
+
+Results are stored in LineupEfficiency. sync_current_week_player_stats
+refreshes the current week; the player-stats backfill rebuilds every season.
+
+Environment:
+    LINEUP_SLOTS  comma-separated starting slots, Sleeper names
+                  (default QB,RB,RB,WR,WR,WR,TE,FLEX,K)
+"""
+import itertools
+import logging
+import os
+from collections import Counter, defaultdict
+
+import numpy as np
+
+from app import db
+from app.models.lineup_efficiency import LineupEfficiency
+from app.models.player_weekly_stats import PlayerWeeklyStats
+from app.models.players import Players
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SLOTS = 'QB,RB,RB,WR,WR,WR,TE,FLEX,K'
+
+# Sleeper flex slot -> eligible positions
+FLEX_SLOTS = {
+    'WRRB_FLEX': ('RB', 'WR'),
+    'REC_FLEX': ('WR', 'TE'),
+    'FLEX': ('RB', 'WR', 'TE'),
+    'SUPER_FLEX': ('QB', 'RB', 'WR', 'TE'),
+}
+
+
+def lineup_slots():
+    """(fixed {position: count}, [(eligible positions, count)] most restrictive first)."""
+    counts = Counter(s.strip().upper() for s in os.environ.get('LINEUP_SLOTS', DEFAULT_SLOTS).split(',') if s.strip())
+    fixed = {slot: n for slot, n in counts.items() if slot not in FLEX_SLOTS}
+    flex = sorted(((FLEX_SLOTS[slot], n) for slot, n in counts.items() if slot in FLEX_SLOTS),
+                  key=lambda f: len(f[0]))
+    return fixed, flex
+
+
+def _nested(flex):
+    """True when each flex's eligible positions contain the previous one's."""
+    return all(set(a) <= set(b) for (a, _), (b, _) in zip(flex, flex[1:]))
+
+
+def _best_flex(available, flex):
+    """
+    Rows for the best fill of `flex` from `available` ({position: row indices, best
+    first}): every count per position the slots can hold, by Hall's condition.
+    """
+    positions = sorted(available)
+    total = sum(n for _, n in flex)
+    subsets = [(subset, sum(n for eligible, n in flex if set(eligible) & set(subset)))
+               for r in range(1, len(positions) + 1) for subset in itertools.combinations(positions, r)]
+    best, best_rows = -1.0, []
+    for take in itertools.product(*(range(min(total, len(available[p][0])) + 1) for p in positions)):
+        counts = dict(zip(positions, take))
+        if sum(take) > total or any(sum(counts[p] for p in subset) > capacity for subset, capacity in subsets):
+            continue
+        value = sum(sum(available[p][1][:counts[p]]) for p in positions)
+        if value > best:
+            best, best_rows = value, [row for p in positions for row in available[p][0][:counts[p]]]
+    return best_rows
+
+
+def _rank_within(groups, mask):
+    """For rows sorted by group, each masked row's 0-based rank among its group's masked rows."""
+    first = np.r_[True, groups[1:] != groups[:-1]]
+    group_start = np.maximum.accumulate(np.where(first, np.arange(len(groups)), 0))
+    running = np.cumsum(mask)
+    return running - (running - mask)[group_start] - 1
+
+
+def optimal_lineups(groups, positions, points, slots=None):
+    """
+    Boolean mask of the rows in each group's optimal lineup. Rows must be sorted by
+    group, then points descending.
+    """
+    fixed, flex = slots or lineup_slots()
+    chosen = np.zeros(len(groups), dtype=bool)
+    for position, count in fixed.items():
+        eligible = positions == position
+        chosen |= eligible & (_rank_within(groups, eligible) < count)
+    if _nested(flex):
+        for eligible_positions, count in flex:
+            eligible = np.isin(positions, eligible_positions) & ~chosen
+            chosen |= eligible & (_rank_within(groups, eligible) < count)
+        return chosen
+
+    available = defaultdict(lambda: defaultdict(lambda: ([], [])))     # group -> position -> (rows, points)
+    for row in np.flatnonzero(np.isin(positions, [p for eligible, _ in flex for p in eligible]) & ~chosen):
+        rows, row_points = available[groups[row]][positions[row]]
+        rows.append(row)
+        row_points.append(points[row])
+    for by_position in available.values():
+        chosen[_best_flex(by_position, flex)] = True
+    return chosen
+
+
+def compute_lineup_efficiency(rows):
+    """
+    rows: (year, week, sleeper_roster_id, points, is_starter, position) tuples.
+    Returns one unsaved LineupEfficiency per roster-week.
+    """
+    if not rows:
+        return []
+    years, weeks, rosters, points, starters, positions = zip(*rows)
+    points = np.array(points, dtype=float)
+    starters = np.array(starters, dtype=bool)
+    positions = np.array([position or '' for position in positions])
+
+    keys, groups = np.unique(np.array([years, weeks, rosters], dtype=int).T, axis=0, return_inverse=True)
+    groups = groups.ravel()
+    order = np.lexsort((-points, groups))
+    groups, points, starters, positions = groups[order], points[order], starters[order], positions[order]
+
+    chosen = optimal_lineups(groups, positions, points)
+    actual = np.bincount(groups, weights=points * starters, minlength=len(keys))
+    optimal = np.bincount(groups, weights=points * chosen, minlength=len(keys))
+    # A started player at a position the slots don't know can push actual above "optimal"
+    optimal = np.maximum(optimal, actual)
+
+    return [LineupEfficiency(year=int(year), week=int(week), sleeper_roster_id=int(roster),
+                             actual_points=round(float(a), 2), optimal_points=round(float(o), 2),
+                             points_left=round(float(o - a), 2),
+                             efficiency=round(float(a / o), 4) if o > 0 else 1.0)
+            for (year, week, roster), a, o in zip(keys, actual, optimal)]
+
+
+def _weekly_rows():
+    return (db.session.query(PlayerWeeklyStats.year, PlayerWeeklyStats.week, PlayerWeeklyStats.sleeper_roster_id,
+                             PlayerWeeklyStats.points, PlayerWeeklyStats.is_starter, Players.position)
+            .outerjoin(Players, Players.sleeper_id == PlayerWeeklyStats.player_sleeper_id))
+
+
+def refresh_lineup_efficiency(year, week):
+    """Recompute one week's rows after its PlayerWeeklyStats are written; the caller commits."""
+    db.session.flush()
+    rows = _weekly_rows().filter(PlayerWeeklyStats.year == year, PlayerWeeklyStats.week == week).all()
+    LineupEfficiency.query.filter_by(year=year, week=week).delete(synchronize_session=False)
+    results = compute_lineup_efficiency(rows)
+    db.session.add_all(results)
+    return len(results)
+
+
+def rebuild_lineup_efficiency():
+    """Recompute every roster-week in one pass and commit."""
+    results = compute_lineup_efficiency(_weekly_rows().all())
+    LineupEfficiency.query.delete()
+    db.session.add_all(results)
+    db.session.commit()
+    logger.info(f'Lineup efficiency rebuilt: {len(results)} roster-weeks')
+    return {'success': True, 'roster_weeks': len(results)}
+
+
+def season_totals(rows):
+    """Sum LineupEfficiency rows into one season summary."""
+    actual = sum(r.actual_points for r in rows)
+    optimal = sum(r.optimal_points for r in rows)
+    return {
+        'weeks': len(rows),
+        'actual_points': round(actual, 2),
+        'optimal_points': round(optimal, 2),
+        'points_left': round(optimal - actual, 2),
+        'efficiency': round(actual / optimal, 4) if optimal > 0 else 1.0,
+    }
@@ -0,0 +1,85 @@
+"""
+Keyset (cursor) pagination for date-ordered listings.
+
+Listings are ordered newest-first on (sort_column DESC, id_column DESC). Instead
+of OFFSET, each page returns an opaque cursor encoding the last row's
+(sort value, id); the next page resumes strictly after that pair, so every page
+is an index range scan whose cost doesn't depend on how deep into the history
+the caller is. Both sort columns are backed by a composite index on
+(<filter column>, sort_column, id_column).
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from sqlalchemy import and_, or_
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(sort_value, row_id):
+    """Pack (sort value, id) into a URL-safe token."""
+    payload = [sort_value.isoformat() if sort_value is not None else None, row_id]
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b'=').decode()
+
+
+def decode_cursor(token):
+    """Inverse of encode_cursor. Raises InvalidCursor on anything malformed."""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(row_id, int) or isinstance(row_id, bool):
+            raise InvalidCursor('Invalid cursor')
+        if sort_value is not None:
+            sort_value = datetime.fromisoformat(sort_value)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise InvalidCursor('Invalid cursor')
+    return sort_value, row_id
+
+
+def parse_page_args(args):
+    """
+    Read ``limit`` and ``cursor`` from request args.
+    Returns (limit, cursor) with cursor decoded; raises InvalidCursor on a bad token.
+    """
+    limit = args.get('limit', DEFAULT_PAGE_SIZE, type=int)
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    token = args.get('cursor')
+    return limit, decode_cursor(token) if token else None
+
+
+def keyset_page(query, sort_column, id_column, cursor=None, limit=DEFAULT_PAGE_SIZE):
+    """
+    Fetch one page of ``query`` ordered by (sort_column DESC, id_column DESC).
+
+    NULL sort values sort last (MySQL and SQLite both treat NULL as smallest),
+    so a cursor sitting on a NULL row only walks the remaining NULL rows by id.
+
+    Returns (rows, next_cursor) where next_cursor is None on the last page.
+    """
+    if cursor is not None:
+        sort_value, last_id = cursor
+        if sort_value is None:
+            query = query.filter(sort_column.is_(None), id_column < last_id)
+        else:
+            query = query.filter(or_(
+                sort_column < sort_value,
+                and_(sort_column == sort_value, id_column < last_id),
+                sort_column.is_(None),
+            ))
+
+    rows = query.order_by(sort_column.desc(), id_column.desc()).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
@@ -0,0 +1,132 @@
+"""
+Draft-pick ownership ledger.
+
+Every completed pick move is recorded in PickOwnershipHistory, and PickOwnership
+holds the latest owner per (season, round, original_roster_id). Picks with no row
+were never traded and still belong to their original roster, so
+
+  * current owner  – one PickOwnership row (or the default)
+  * owner as of T  – the latest PickOwnershipHistory row at or before T, an index seek
+
+Ingest paths call apply_pick_trades() with the IDs they just created, before
+committing. A move only replaces the current owner if it is newer than the move
+already recorded, so transactions ingested out of order still converge.
+rebuild_pick_ownership() recreates both tables from TransactionDraftPicks.
+"""
+import logging
+
+from app import db
+from app.models.transactions import Transactions
+from app.models.transaction_draft_picks import TransactionDraftPicks
+from app.models.pick_ownership import PickOwnership
+from app.models.pick_ownership_history import PickOwnershipHistory
+
+logger = logging.getLogger(__name__)
+
+
+def _load_pick_moves(transaction_ids=None):
+    """Pick moves of complete, timestamped transactions in (created_at, transaction_id) order."""
+    query = (db.session.query(TransactionDraftPicks.transaction_id, TransactionDraftPicks.season,
+                              TransactionDraftPicks.round, TransactionDraftPicks.roster_id,
+                              TransactionDraftPicks.owner_id, TransactionDraftPicks.previous_owner_id,
+                              Transactions.created_at)
+             .join(Transactions, Transactions.transaction_id == TransactionDraftPicks.transaction_id)
+             .filter(Transactions.status == 'complete',
+                     Transactions.created_at.isnot(None),
+                     TransactionDraftPicks.owner_id.isnot(None)))
+    if transaction_ids is not None:
+        query = query.filter(TransactionDraftPicks.transaction_id.in_(transaction_ids))
+    return sorted(query.all(), key=lambda m: (m.created_at, m.transaction_id))
+
+
+def _record_moves(moves, current):
+    """
+    Append history rows for `moves` and advance the current owners.
+    `current` is {(season, round, original_roster_id): PickOwnership}, updated in place.
+    """
+    for move in moves:
+        key = (move.season, move.round, move.roster_id)
+        db.session.add(PickOwnershipHistory(
+            season=move.season,
+            round=move.round,
+            original_roster_id=move.roster_id,
+            owner_roster_id=move.owner_id,
+            previous_owner_roster_id=move.previous_owner_id,
+            transaction_id=move.transaction_id,
+            changed_at=move.created_at,
+        ))
+
+        row = current.get(key)
+        if row is None:
+            row = PickOwnership(season=move.season, round=move.round, original_roster_id=move.roster_id)
+            db.session.add(row)
+            current[key] = row
+        elif (row.changed_at, row.transaction_id) > (move.created_at, move.transaction_id):
+            continue  # an older trade arriving late: history only
+        row.owner_roster_id = move.owner_id
+        row.transaction_id = move.transaction_id
+        row.changed_at = move.created_at
+
+
+def apply_pick_trades(transaction_ids):
+    """
+    Record the pick moves of newly ingested transactions.
+    Call before committing the ingest; the caller commits.
+    """
+    if not transaction_ids:
+        return
+    moves = _load_pick_moves(list(transaction_ids))
+    if not moves:
+        return
+
+    current = {}
+    for row in PickOwnership.query.filter(PickOwnership.season.in_({m.season for m in moves})):
+        current[(row.season, row.round, row.original_roster_id)] = row
+    _record_moves(moves, current)
+
+
+def rebuild_pick_ownership():
+    """Recreate the ledger from every completed pick move and commit."""
+    PickOwnershipHistory.query.delete()
+    PickOwnership.query.delete()
+    moves = _load_pick_moves()
+    current = {}
+    _record_moves(moves, current)
+    db.session.commit()
+    logger.info(f'Pick ownership rebuilt: {len(moves)} moves, {len(current)} traded picks')
+    return {'success': True, 'moves': len(moves), 'traded_picks': len(current)}
+
+
+def pick_owner(season, round_, original_roster_id, as_of=None):
+    """Roster that owns a pick now, or at datetime `as_of`."""
+    if as_of is None:
+        row = PickOwnership.query.filter_by(
+            season=season, round=round_, original_roster_id=original_roster_id,
+        ).first()
+    else:
+        row = (PickOwnershipHistory.query
+               .filter_by(season=season, round=round_, original_roster_id=original_roster_id)
+               .filter(PickOwnershipHistory.changed_at <= as_of)
+               .order_by(PickOwnershipHistory.changed_at.desc(), PickOwnershipHistory.transaction_id.desc())
+               .first())
+    return row.owner_roster_id if row else original_roster_id
+
+
+def traded_pick_owners(seasons, as_of=None):
+    """
+    {(season, round, original_roster_id): owner_roster_id} for every traded pick in
+    `seasons`, now or at datetime `as_of`. Untraded picks are absent.
+    """
+    if as_of is None:
+        return {
+            (row.season, row.round, row.original_roster_id): row.owner_roster_id
+            for row in PickOwnership.query.filter(PickOwnership.season.in_(seasons))
+        }
+
+    owners = {}
+    for row in (PickOwnershipHistory.query
+                .filter(PickOwnershipHistory.season.in_(seasons),
+                        PickOwnershipHistory.changed_at <= as_of)
+                .order_by(PickOwnershipHistory.changed_at.asc(), PickOwnershipHistory.transaction_id.asc())):
+        owners[(row.season, row.round, row.original_roster_id)] = row.owner_roster_id  # last write wins
+    return owners
@@ -0,0 +1,108 @@
+"""
+Player ownership intervals: which roster held each player when.
+
+The adds and drops of complete, timestamped transactions are replayed per player
+in (created_at, transaction_id) order into PlayerOwnership rows. An add opens the
+roster's hold and the roster's next drop closes it; a drop with no recorded add
+closes a hold that predates the recorded history (started_at NULL). TimelineIndex
+loads the rows for owner_at() / owners_between().
+
+Ingest paths call apply_player_ownership() with the IDs they just created, before
+committing. Only the players those transactions moved are replayed, from their
+own history, so transactions ingested out of order (backfills) still converge.
+rebuild_player_ownership() recreates the table from TransactionPlayers.
+"""
+import logging
+from collections import defaultdict
+
+from app import db
+from app.memo import invalidate
+from app.models.transactions import Transactions
+from app.models.transaction_players import TransactionPlayers
+from app.models.player_ownership import PlayerOwnership
+
+logger = logging.getLogger(__name__)
+
+
+def _load_player_moves(player_sleeper_ids=None):
+    """
+    {player_sleeper_id: [(transaction_id, created_at, sleeper_roster_id, action)]}
+    for complete, timestamped transactions in (created_at, transaction_id) order.
+    """
+    query = (db.session.query(TransactionPlayers.transaction_id, Transactions.created_at,
+                              TransactionPlayers.player_sleeper_id, TransactionPlayers.sleeper_roster_id,
+                              TransactionPlayers.action, TransactionPlayers.transaction_player_id)
+             .join(Transactions, Transactions.transaction_id == TransactionPlayers.transaction_id)
+             .filter(Transactions.status == 'complete',
+                     Transactions.created_at.isnot(None)))
+    if player_sleeper_ids is not None:
+        query = query.filter(TransactionPlayers.player_sleeper_id.in_(player_sleeper_ids))
+
+    moves = defaultdict(list)
+    for row in sorted(query.all(), key=lambda m: (m.created_at, m.transaction_id, m.transaction_player_id)):
+        moves[row.player_sleeper_id].append((row.transaction_id, row.created_at, row.sleeper_roster_id, row.action))
+    return moves
+
+
+def _replay(player_sleeper_id, moves):
+    """PlayerOwnership rows for one player's moves, oldest first."""
+    held = {}  # sleeper_roster_id -> open PlayerOwnership
+    rows = []
+    i = 0
+    while i < len(moves):
+        txn_id, created_at = moves[i][0], moves[i][1]
+        j = i
+        while j < len(moves) and moves[j][0] == txn_id:
+            j += 1
+        txn_moves = moves[i:j]
+        i = j
+
+        # Drops first, so a player moving between rosters in one trade closes before reopening.
+        for _, _, roster_id, action in txn_moves:
+            if action == 'drop':
+                row = held.pop(roster_id, None)
+                if row is None:
+                    row = PlayerOwnership(player_sleeper_id=player_sleeper_id, sleeper_roster_id=roster_id)
+                    rows.append(row)
+                row.ended_at = created_at
+                row.released_transaction_id = txn_id
+        for _, _, roster_id, action in txn_moves:
+            if action == 'add' and roster_id not in held:
+                row = PlayerOwnership(
+                    player_sleeper_id=player_sleeper_id, sleeper_roster_id=roster_id,
+                    started_at=created_at, acquired_transaction_id=txn_id,
+                )
+                rows.append(row)
+                held[roster_id] = row
+    return rows
+
+
+def apply_player_ownership(transaction_ids):
+    """
+    Replay the intervals of every player the newly ingested transactions moved.
+    Call before committing the ingest; the caller commits.
+    """
+    if not transaction_ids:
+        return
+    players = {pid for (pid,) in db.session.query(TransactionPlayers.player_sleeper_id)
+               .filter(TransactionPlayers.transaction_id.in_(list(transaction_ids)))}
+    if not players:
+        return
+
+    PlayerOwnership.query.filter(PlayerOwnership.player_sleeper_id.in_(players)).delete(synchronize_session=False)
+    for player_id, moves in _load_player_moves(players).items():
+        db.session.add_all(_replay(player_id, moves))
+
+
+def rebuild_player_ownership():
+    """Recreate every player's intervals from scratch and commit."""
+    PlayerOwnership.query.delete()
+    intervals = 0
+    for player_id, moves in _load_player_moves().items():
+        rows = _replay(player_id, moves)
+        db.session.add_all(rows)
+        intervals += len(rows)
+    db.session.commit()
+    invalidate('player_ownership')
+    logger.info(f'Player ownership rebuilt: {intervals} intervals')
+    return {'success': True, 'intervals': intervals}
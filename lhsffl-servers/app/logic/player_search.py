@@ -0,0 +1,145 @@
+"""
+Player name autocomplete.
+
+PlayerIndex keeps one sorted array of (token, entry) pairs over every player's
+first name, last name and NFL team. Each query token is a prefix lookup: two
+bisects give the matching slice, so there is no LIKE '%...%' scan. A player
+matches when every query token matches one of its tokens ("pat mah", "kc
+kelce"). A token with no prefix match falls back to one-typo matching against
+keys that share its first letter ("mahomse" still finds Mahomes).
+
+Ranking prefers exact tokens over prefixes, last names over first names over
+teams, and players on a league roster over free agents.
+
+The index is memoized under the 'players' tag, so the players sync drops it.
+SyncService.sync_players then rebuilds it straight away.
+"""
+import heapq
+import logging
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import namedtuple
+
+from app import db
+from app.memo import memoize
+from app.models.players import Players
+
+logger = logging.getLogger(__name__)
+
+PlayerEntry = namedtuple('PlayerEntry', 'sleeper_id first_name last_name position nfl_team team_id')
+
+# Field weights and match-kind scores
+FIELD_WEIGHTS = {'last': 1.0, 'first': 0.9, 'team': 0.6}
+EXACT, PREFIX, TYPO = 3.0, 2.0, 1.0
+ROSTERED_BONUS = 0.5
+
+_NON_WORD = re.compile(r'[^a-z0-9 ]+')
+
+
+def normalize(text):
+    """'Ja'Marr St. Brown' -> ['jamarr', 'st', 'brown']: lowercase ASCII tokens."""
+    ascii_text = unicodedata.normalize('NFKD', text or '').encode('ascii', 'ignore').decode().lower()
+    return _NON_WORD.sub('', ascii_text.replace('-', ' ').replace('.', ' ')).split()
+
+
+def _within_one_edit(a, b):
+    """True when a and b differ by at most one insertion, deletion, substitution or adjacent swap."""
+    if abs(len(a) - len(b)) > 1:
+        return False
+    i = 0
+    while i < min(len(a), len(b)) and a[i] == b[i]:
+        i += 1
+    return (a[i + 1:] == b[i + 1:]                                     # substitution
+            or a[i + 1:] == b[i:] or a[i:] == b[i + 1:]                # deletion / insertion
+            or (a[i + 1:i + 2] == b[i:i + 1] and a[i:i + 1] == b[i + 1:i + 2] and a[i + 2:] == b[i + 2:]))
+
+
+class PlayerIndex:
+
+    def __init__(self, entries):
+        self.entries = entries
+        keys = []
+        for i, entry in enumerate(entries):
+            names = {'first': normalize(entry.first_name), 'last': normalize(entry.last_name),
+                     'team': normalize(entry.nfl_team)}
+            # "St. Brown" is typed as "stbrown" as often as "st brown".
+            if len(names['last']) > 1:
+                names['last'].append(''.join(names['last']))
+            for field, tokens in names.items():
+                for token in tokens:
+                    keys.append((token, i, field))
+        keys.sort()
+        self.keys = keys
+        self.tokens = [key[0] for key in keys]
+
+    @classmethod
+    def build(cls):
+        rows = (db.session.query(Players.sleeper_id, Players.first_name, Players.last_name,
+                                 Players.position, Players.nfl_team, Players.team_id)
+                .order_by(Players.last_name, Players.first_name)
+                .all())
+        return cls([PlayerEntry(*row) for row in rows])
+
+    def _token_scores(self, token):
+        """{entry index: best score} for one query token."""
+        scores = {}
+
+        def offer(i, score):
+            if score > scores.get(i, 0):
+                scores[i] = score
+
+        lo = bisect_left(self.tokens, token)
+        hi = bisect_left(self.tokens, token + '\x7f')
+        for key, i, field in self.keys[lo:hi]:
+            if field == 'team' and key != token:
+                continue  # teams match whole ("kc"), not as prefixes
+            offer(i, (EXACT if key == token else PREFIX) * FIELD_WEIGHTS[field])
+
+        if not scores and len(token) >= 4:
+            lo = bisect_left(self.tokens, token[0])
+            hi = bisect_left(self.tokens, token[0] + '\x7f')
+            for key, i, field in self.keys[lo:hi]:
+                if field != 'team' and _within_one_edit(token, key[:len(token)]):
+                    offer(i, TYPO * FIELD_WEIGHTS[field])
+        return scores
+
+    def search(self, query, limit=10):
+        """Top `limit` PlayerEntry matches for `query`, best first."""
+        tokens = normalize(query)
+        if not tokens:
+            return []
+
+        totals = None
+        for token in sorted(set(tokens), key=len, reverse=True):  # most selective first
+            scores = self._token_scores(token)
+            if totals is None:
+                totals = scores
+            else:
+                totals = {i: total + scores[i] for i, total in totals.items() if i in scores}
+            if not totals:
+                return []
+
+        def rank(i):
+            entry = self.entries[i]
+            score = totals[i] + (ROSTERED_BONUS if entry.team_id is not None else 0)
+            return -score, entry.last_name, entry.first_name, i
+
+        return [self.entries[i] for i in heapq.nsmallest(limit, totals, key=rank)]
+
+
+@memoize(ttl=6 * 3600, maxsize=1, stale_ttl=300, tags=('players',))
+def get_player_index():
+    return PlayerIndex.build()
+
+
+def refresh_player_index():
+    """get_player_index() for the players sync: a failed rebuild must not fail the sync."""
+    try:
+        get_player_index()
+    except Exception as e:
+        logger.error(f'Player index rebuild failed: {e}')
+
+
+def search_players(query, limit=10):
+    return [entry._asdict() for entry in get_player_index().search(query, limit=limit)]
@@ -0,0 +1,155 @@
+"""
+Player season and career rollups of PlayerWeeklyStats.
+
+  PlayerSeasonStats  – per (player, season, roster): games, starts, total and
+                       starter-only points, sum of squares, best week
+  PlayerCareerStats  – the same across every season and roster
+
+Both store sums rather than averages, so mean and std dev are derived on read
+and season rows combine into career totals exactly.
+
+refresh_player_stats(year, player_ids) recomputes only the given players' rows
+for one season, and then their career rows. The live player-stats sync calls it
+for the week it just wrote. rebuild_player_stats() recreates both tables and runs
+after the historical backfill.
+"""
+import logging
+from collections import defaultdict
+
+from app import db
+from app.models.player_weekly_stats import PlayerWeeklyStats
+from app.models.player_season_stats import PlayerSeasonStats
+from app.models.player_career_stats import PlayerCareerStats
+
+logger = logging.getLogger(__name__)
+
+
+def _season_rows(weekly_rows):
+    """PlayerWeeklyStats rows -> {(player, year, roster): PlayerSeasonStats}, unsaved."""
+    seasons = {}
+    for row in weekly_rows:
+        key = (row.player_sleeper_id, row.year, row.sleeper_roster_id)
+        stats = seasons.get(key)
+        if stats is None:
+            stats = seasons[key] = PlayerSeasonStats(
+                player_sleeper_id=row.player_sleeper_id, year=row.year, sleeper_roster_id=row.sleeper_roster_id,
+                games=0, starts=0, total_points=0.0, starter_points=0.0, sum_squares=0.0,
+                best_points=0.0, best_week=None,
+            )
+        points = row.points or 0.0
+        stats.games += 1
+        stats.total_points += points
+        stats.sum_squares += points * points
+        if row.is_starter:
+            stats.starts += 1
+            stats.starter_points += points
+        if stats.best_week is None or points > stats.best_points:
+            stats.best_points, stats.best_week = points, row.week
+    return seasons
+
+
+def _career_row(player_sleeper_id, season_rows):
+    career = PlayerCareerStats(
+        player_sleeper_id=player_sleeper_id, games=0, starts=0, total_points=0.0, starter_points=0.0,
+        sum_squares=0.0, best_points=0.0, best_year=None, best_week=None,
+    )
+    years = sorted({s.year for s in season_rows})
+    career.seasons, career.first_year, career.last_year = len(years), years[0], years[-1]
+    for s in season_rows:
+        career.games += s.games
+        career.starts += s.starts
+        career.total_points += s.total_points
+        career.starter_points += s.starter_points
+        career.sum_squares += s.sum_squares
+        if s.best_week is not None and (career.best_week is None or s.best_points > career.best_points):
+            career.best_points, career.best_year, career.best_week = s.best_points, s.year, s.best_week
+    return career
+
+
+def _weekly_columns():
+    return db.session.query(PlayerWeeklyStats.player_sleeper_id, PlayerWeeklyStats.year,
+                            PlayerWeeklyStats.week, PlayerWeeklyStats.sleeper_roster_id,
+                            PlayerWeeklyStats.points, PlayerWeeklyStats.is_starter)
+
+
+def refresh_player_stats(year, player_ids):
+    """
+    Recompute `player_ids`' season rows for `year` and their career rows.
+    Call after writing their PlayerWeeklyStats; the caller commits.
+    """
+    player_ids = list(set(player_ids))
+    if not player_ids:
+        return 0
+    db.session.flush()
+
+    weekly = _weekly_columns().filter(PlayerWeeklyStats.year == year,
+                                      PlayerWeeklyStats.player_sleeper_id.in_(player_ids))
+    PlayerSeasonStats.query.filter(PlayerSeasonStats.year == year,
+                                   PlayerSeasonStats.player_sleeper_id.in_(player_ids)) \
+        .delete(synchronize_session=False)
+    db.session.add_all(_season_rows(weekly).values())
+    db.session.flush()
+
+    by_player = defaultdict(list)
+    for season in PlayerSeasonStats.query.filter(PlayerSeasonStats.player_sleeper_id.in_(player_ids)):
+        by_player[season.player_sleeper_id].append(season)
+    PlayerCareerStats.query.filter(PlayerCareerStats.player_sleeper_id.in_(player_ids)) \
+        .delete(synchronize_session=False)
+    db.session.add_all(_career_row(pid, rows) for pid, rows in by_player.items())
+    return len(player_ids)
+
+
+def rebuild_player_stats():
+    """Recreate both rollup tables from every PlayerWeeklyStats row and commit."""
+    PlayerCareerStats.query.delete()
+    PlayerSeasonStats.query.delete()
+
+    seasons = _season_rows(_weekly_columns().yield_per(5000))
+    by_player = defaultdict(list)
+    for stats in seasons.values():
+        by_player[stats.player_sleeper_id].append(stats)
+
+    db.session.add_all(seasons.values())
+    db.session.add_all(_career_row(pid, rows) for pid, rows in by_player.items())
+    db.session.commit()
+    logger.info(f'Player stats rebuilt: {len(seasons)} season rows, {len(by_player)} players')
+    return {'success': True, 'season_rows': len(seasons), 'players': len(by_player)}
+
+
+def _season_summary(year, rows):
+    """Season totals across a player's rosters, with the per-roster rows as splits."""
+    combined = _career_row(rows[0].player_sleeper_id, rows)
+    return {
+        'year': year,
+        'games': combined.games,
+        'starts': combined.starts,
+        'total_points': round(combined.total_points, 2),
+        'starter_points': round(combined.starter_points, 2),
+        'mean_points': combined.mean_points,
+        'std_dev_points': combined.std_dev_points,
+        'best_points': combined.best_points,
+        'best_week': combined.best_week,
+        'rosters': [r.serialize() for r in sorted(rows, key=lambda r: -r.games)],
+    }
+
+
+def get_player_stats(player_sleeper_id, year=None):
+    """
+    {'career': ..., 'seasons': [...]} for one player, newest season first; only
+    `year` when given. None when the player has no stats (for that year).
+    """
+    query = PlayerSeasonStats.query.filter_by(player_sleeper_id=player_sleeper_id)
+    if year is not None:
+        query = query.filter_by(year=year)
+    by_year = defaultdict(list)
+    for row in query:
+        by_year[row.year].append(row)
+    if not by_year:
+        return None
+
+    career = db.session.get(PlayerCareerStats, player_sleeper_id)
+    return {
+        'player_sleeper_id': player_sleeper_id,
+        'career': career.serialize() if career else None,
+        'seasons': [_season_summary(y, by_year[y]) for y in sorted(by_year, reverse=True)],
+    }
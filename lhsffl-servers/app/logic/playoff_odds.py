@@ -0,0 +1,183 @@
+"""
+Monte Carlo playoff odds.
+
+Each simulated season starts from the current TeamRecords (wins and points
+for) and plays out the remaining regular-season Matchups. Every remaining game
+draws both teams' scores from a normal distribution fitted to that team's
+completed matchups this season, shrunk toward the league-wide distribution
+while the sample is small. Teams are then seeded by wins, with points for as
+the tiebreaker, and the top PLAYOFF_TEAMS make the playoffs.
+
+The simulation is vectorized: a chunk of n seasons is one (n, games) score
+draw per side, and wins and points are accumulated onto the rosters with a
+matrix product against a one-hot (games, rosters) schedule. Chunks can be spread
+over a process pool (PLAYOFF_ODDS_WORKERS); each gets its own child of one
+SeedSequence, so a given seed gives the same odds however the work is split.
+
+refresh_playoff_odds() stores the current week's odds in PlayoffOdds after each
+matchups sync; /league/playoff_odds only reads that table.
+
+Environment:
+    PLAYOFF_TEAMS             playoff spots (default 6)
+    PLAYOFF_WEEK_START        first playoff week; later games aren't simulated (default 15)
+    PLAYOFF_ODDS_SIMULATIONS  simulated seasons (default 100000)
+    PLAYOFF_ODDS_WORKERS      processes to spread chunks over (default 1: in-process)
+"""
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+
+from app import db
+from app.models.matchups import Matchups
+from app.models.playoff_odds import PlayoffOdds
+from app.models.team_records import TeamRecords
+from app.models.teams import Teams
+from app.league_state_manager import league_state_manager
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 20000
+
+# Games of league-average scoring a team's own mean and spread are shrunk toward
+PRIOR_GAMES = 3
+
+# Used when there are no completed matchups at all yet
+DEFAULT_MEAN, DEFAULT_STD = 110.0, 25.0
+
+
+def _setting(name, default):
+    return int(os.environ.get(name, default))
+
+
+def simulate_chunk(seed, simulations, wins, points, mean, std, home, away):
+    """
+    Play `simulations` seasons. Returns (seed_counts, total_wins): seed_counts[r, k]
+    is how often roster index r finished as seed k + 1; total_wins[r] sums r's wins.
+    """
+    rng = np.random.default_rng(seed)
+    n_rosters = len(wins)
+    home_onehot = np.eye(n_rosters)[home]
+    away_onehot = np.eye(n_rosters)[away]
+
+    home_scores = rng.normal(mean[home], std[home], size=(simulations, len(home)))
+    away_scores = rng.normal(mean[away], std[away], size=(simulations, len(away)))
+    home_wins = (home_scores > away_scores).astype(float)
+
+    season_wins = wins + home_wins @ home_onehot + (1 - home_wins) @ away_onehot
+    season_points = points + home_scores @ home_onehot + away_scores @ away_onehot
+
+    # Wins first, points for breaks ties (a season's points stay far below 1e6)
+    order = np.argsort(-(season_wins + season_points / 1e6), axis=1, kind='stable')
+    seeds = np.empty_like(order)
+    np.put_along_axis(seeds, order, np.arange(n_rosters)[None, :], axis=1)
+    seed_counts = np.bincount((np.arange(n_rosters)[None, :] * n_rosters + seeds).ravel(),
+                              minlength=n_rosters * n_rosters).reshape(n_rosters, n_rosters)
+    return seed_counts, season_wins.sum(axis=0)
+
+
+def _scoring(year, rosters):
+    """Per-roster (mean, std) of points for, shrunk toward the league's."""
+    rows = (db.session.query(Matchups.sleeper_roster_id, Matchups.points_for)
+            .filter(Matchups.year == year, Matchups.completed == True)
+            .all())
+    if not rows:
+        return np.full(len(rosters), DEFAULT_MEAN), np.full(len(rosters), DEFAULT_STD)
+
+    roster_ids, scores = np.array([r[0] for r in rows]), np.array([r[1] for r in rows], dtype=float)
+    league_mean = scores.mean()
+    league_var = scores.var() if len(scores) > 1 else DEFAULT_STD ** 2
+
+    known = np.isin(roster_ids, rosters)
+    index, scores = np.searchsorted(rosters, roster_ids[known]), scores[known]
+    games = np.bincount(index, minlength=len(rosters))
+    totals = np.bincount(index, weights=scores, minlength=len(rosters))
+    squares = np.bincount(index, weights=scores * scores, minlength=len(rosters))
+
+    mean = (totals + PRIOR_GAMES * league_mean) / (games + PRIOR_GAMES)
+    own_var = np.where(games > 1, squares / np.maximum(games, 1) - (totals / np.maximum(games, 1)) ** 2, league_var)
+    var = (games * own_var + PRIOR_GAMES * league_var) / (games + PRIOR_GAMES)
+    return mean, np.sqrt(np.maximum(var, 1.0))
+
+
+def simulate_playoff_odds(year, simulations=None, seed=None, workers=None):
+    """
+    Simulated odds for `year` from its TeamRecords and remaining Matchups, as
+    one dict per roster (best odds first). Empty when there are no TeamRecords.
+    """
+    simulations = simulations or _setting('PLAYOFF_ODDS_SIMULATIONS', 100000)
+    workers = workers or _setting('PLAYOFF_ODDS_WORKERS', 1)
+    playoff_teams = _setting('PLAYOFF_TEAMS', 6)
+    playoff_week_start = _setting('PLAYOFF_WEEK_START', 15)
+
+    records = (db.session.query(Teams.sleeper_roster_id, TeamRecords.wins, TeamRecords.points_for)
+               .join(TeamRecords, Teams.team_id == TeamRecords.team_id)
+               .filter(TeamRecords.year == year)
+               .all())
+    if not records:
+        return []
+    rosters = np.array(sorted(r[0] for r in records))
+    wins = np.zeros(len(rosters))
+    points = np.zeros(len(rosters))
+    for roster_id, record_wins, record_points in records:
+        i = np.searchsorted(rosters, roster_id)
+        wins[i], points[i] = record_wins, record_points
+
+    # Each matchup is stored once per side; keep the side with the lower roster id
+    remaining = (db.session.query(Matchups.sleeper_roster_id, Matchups.opponent_sleeper_roster_id)
+                 .filter(Matchups.year == year, Matchups.completed == False,
+                         Matchups.week < playoff_week_start,
+                         Matchups.sleeper_roster_id < Matchups.opponent_sleeper_roster_id,
+                         Matchups.sleeper_roster_id.in_(rosters.tolist()),
+                         Matchups.opponent_sleeper_roster_id.in_(rosters.tolist()))
+                 .all())
+    home = np.searchsorted(rosters, np.array([r[0] for r in remaining], dtype=int))
+    away = np.searchsorted(rosters, np.array([r[1] for r in remaining], dtype=int))
+    mean, std = _scoring(year, rosters)
+
+    sizes = [CHUNK_SIZE] * (simulations // CHUNK_SIZE) + ([simulations % CHUNK_SIZE] if simulations % CHUNK_SIZE else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [(s, n, wins, points, mean, std, home, away) for s, n in zip(seeds, sizes)]
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            results = list(pool.map(simulate_chunk, *zip(*jobs)))
+    else:
+        results = [simulate_chunk(*job) for job in jobs]
+
+    seed_counts = sum(r[0] for r in results)
+    total_wins = sum(r[1] for r in results)
+    odds = []
+    for i, roster_id in enumerate(rosters.tolist()):
+        odds.append({
+            'sleeper_roster_id': roster_id,
+            'simulations': simulations,
+            'playoff_odds': round(float(seed_counts[i, :playoff_teams].sum() / simulations), 4),
+            'top_seed_odds': round(float(seed_counts[i, 0] / simulations), 4),
+            'projected_wins': round(float(total_wins[i] / simulations), 2),
+            'average_seed': round(float((seed_counts[i] * np.arange(1, len(rosters) + 1)).sum() / simulations), 2),
+        })
+    odds.sort(key=lambda o: (-o['playoff_odds'], o['average_seed']))
+    return odds
+
+
+def refresh_playoff_odds(seed=None):
+    """
+    Simulate the current season and store it as this week's PlayoffOdds. Runs as
+    a sync hook, so a failure is logged and returned rather than raised.
+    """
+    snapshot = league_state_manager.snapshot()
+    try:
+        odds = simulate_playoff_odds(snapshot.year, seed=seed)
+        computed_at = datetime.utcnow()
+        PlayoffOdds.query.filter_by(year=snapshot.year, week=snapshot.week).delete()
+        db.session.add_all(PlayoffOdds(year=snapshot.year, week=snapshot.week, computed_at=computed_at, **o)
+                           for o in odds)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f'Playoff odds refresh failed: {e}')
+        return {'success': False, 'error': str(e)}
+    logger.info(f'Playoff odds stored for {snapshot.year} week {snapshot.week} ({len(odds)} teams)')
+    return {'success': True, 'rows': len(odds)}
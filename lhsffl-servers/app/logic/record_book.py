@@ -0,0 +1,201 @@
+"""
+The league record book: highest and lowest weekly scores, biggest blowouts,
+closest games, best and worst seasons, and best single-player weeks.
+
+Each category is stored in LeagueRecords as its top KEEP entries, in rank order.
+Syncs update the book incrementally instead of rescanning Matchups and
+PlayerWeeklyStats:
+
+  * refresh_matchup_records(year, week) after a week's Matchups are written
+    (game categories for that week, season categories for that year);
+  * refresh_player_records(year, week) after a week's PlayerWeeklyStats.
+
+A refresh replaces the category's entries from the synced scope with that
+scope's current top entries. Everything not stored ranks below the worst stored
+entry from outside the scope, so new entries are only kept down to that cutoff
+and the stored list stays an exact top-N. KEEP is larger than the TOP_K served,
+so a score correction rarely shrinks a list below TOP_K; when one does, that
+category is recollected from the source tables. rebuild_record_book()
+recollects every category (one ORDER BY ... LIMIT query per category) and runs
+after the backfills.
+"""
+import logging
+from collections import defaultdict
+from functools import partial
+
+from sqlalchemy import and_, case, func, or_
+
+from app import db
+from app.memo import memoize, invalidate
+from app.models.league_records import LeagueRecords
+from app.models.matchups import Matchups
+from app.models.player_weekly_stats import PlayerWeeklyStats
+
+logger = logging.getLogger(__name__)
+
+TOP_K = 10      # entries served per category
+KEEP = 25       # entries stored per category, so corrections rarely force a recollect
+
+# Seasons with fewer completed games don't qualify (keeps a 1-0 September out of "best season")
+MIN_SEASON_GAMES = 10
+
+_FIELDS = ('value', 'year', 'week', 'sleeper_roster_id', 'opponent_sleeper_roster_id', 'player_sleeper_id',
+           'points_for', 'points_against', 'wins', 'losses', 'ties')
+
+
+def _entry(**fields):
+    return {name: fields.get(name) for name in _FIELDS}
+
+
+def _game_entries(category, year=None, week=None):
+    """Top KEEP single-game entries for a game category, optionally within one season/week."""
+    margin = Matchups.points_for - Matchups.points_against
+    query = (db.session.query(Matchups.year, Matchups.week, Matchups.sleeper_roster_id,
+                              Matchups.opponent_sleeper_roster_id, Matchups.points_for, Matchups.points_against)
+             .filter(Matchups.completed == True,
+                     Matchups.sleeper_roster_id != Matchups.opponent_sleeper_roster_id))
+    if year is not None:
+        query = query.filter(Matchups.year == year)
+    if week is not None:
+        query = query.filter(Matchups.week == week)
+
+    if category == 'highest_score':
+        query = query.order_by(Matchups.points_for.desc())
+    elif category == 'lowest_score':
+        query = query.order_by(Matchups.points_for)
+    elif category == 'biggest_blowout':
+        query = query.filter(margin > 0).order_by(margin.desc())
+    else:   # closest_game: the winner's row, or the lower roster's for a tie
+        query = query.filter(or_(margin > 0, and_(margin == 0, Matchups.sleeper_roster_id <
+                                                  Matchups.opponent_sleeper_roster_id))).order_by(margin)
+
+    by_score = category in ('highest_score', 'lowest_score')
+    return [_entry(value=round(pf if by_score else pf - pa, 2), year=y, week=w, sleeper_roster_id=roster,
+                   opponent_sleeper_roster_id=opponent, points_for=pf, points_against=pa)
+            for y, w, roster, opponent, pf, pa in query.limit(KEEP)]
+
+
+def _season_entries(year=None, week=None):
+    """Every qualifying team-season (optionally one year), valued by win percentage."""
+    query = (db.session.query(Matchups.year, Matchups.sleeper_roster_id, func.count(),
+                              func.sum(case((Matchups.points_for > Matchups.points_against, 1), else_=0)),
+                              func.sum(case((Matchups.points_for < Matchups.points_against, 1), else_=0)),
+                              func.sum(Matchups.points_for), func.sum(Matchups.points_against))
+             .filter(Matchups.completed == True,
+                     Matchups.sleeper_roster_id != Matchups.opponent_sleeper_roster_id))
+    if year is not None:
+        query = query.filter(Matchups.year == year)
+    query = (query.group_by(Matchups.year, Matchups.sleeper_roster_id)
+             .having(func.count() >= MIN_SEASON_GAMES))
+
+    entries = []
+    for y, roster, games, wins, losses, pf, pa in query:
+        wins, losses = int(wins or 0), int(losses or 0)
+        ties = games - wins - losses
+        entries.append(_entry(value=round((wins + 0.5 * ties) / games, 3), year=y, sleeper_roster_id=roster,
+                              points_for=round(float(pf or 0), 2), points_against=round(float(pa or 0), 2),
+                              wins=wins, losses=losses, ties=ties))
+    return entries
+
+
+def _player_entries(year=None, week=None):
+    """Top KEEP single-player weeks, optionally within one season/week."""
+    query = db.session.query(PlayerWeeklyStats.year, PlayerWeeklyStats.week, PlayerWeeklyStats.sleeper_roster_id,
+                             PlayerWeeklyStats.player_sleeper_id, PlayerWeeklyStats.points)
+    if year is not None:
+        query = query.filter(PlayerWeeklyStats.year == year)
+    if week is not None:
+        query = query.filter(PlayerWeeklyStats.week == week)
+    return [_entry(value=round(points, 2), year=y, week=w, sleeper_roster_id=roster, player_sleeper_id=player)
+            for y, w, roster, player, points in query.order_by(PlayerWeeklyStats.points.desc()).limit(KEEP)]
+
+
+# category -> (direction: -1 ranks the highest value first, +1 the lowest; entry source)
+CATEGORIES = {
+    'highest_score': (-1, partial(_game_entries, 'highest_score')),
+    'lowest_score': (1, partial(_game_entries, 'lowest_score')),
+    'biggest_blowout': (-1, partial(_game_entries, 'biggest_blowout')),
+    'closest_game': (1, partial(_game_entries, 'closest_game')),
+    'best_season': (-1, _season_entries),
+    'worst_season': (1, _season_entries),
+    'best_player_week': (-1, _player_entries),
+}
+
+SEASON_CATEGORIES = ('best_season', 'worst_season')
+MATCHUP_CATEGORIES = ('highest_score', 'lowest_score', 'biggest_blowout', 'closest_game') + SEASON_CATEGORIES
+PLAYER_CATEGORIES = ('best_player_week',)
+
+
+def _sort_key(category):
+    """Total order for a category: value, then season points, then identity so ties are stable."""
+    sign = CATEGORIES[category][0]
+    return lambda e: (sign * e['value'], sign * (e['points_for'] or 0) if category in SEASON_CATEGORIES else 0,
+                      e['year'], e['week'] or 0, e['sleeper_roster_id'], e['player_sleeper_id'] or 0)
+
+
+def _collect(category):
+    """The category's top KEEP entries, straight from the source tables."""
+    return sorted(CATEGORIES[category][1](), key=_sort_key(category))[:KEEP]
+
+
+def _write(category, entries):
+    LeagueRecords.query.filter_by(category=category).delete(synchronize_session=False)
+    db.session.add_all(LeagueRecords(category=category, rank=rank, **entry)
+                       for rank, entry in enumerate(entries, start=1))
+
+
+def _refresh(categories, year, week):
+    db.session.flush()
+    stored = defaultdict(list)
+    columns = [getattr(LeagueRecords, name) for name in _FIELDS]
+    for category, *values in (db.session.query(LeagueRecords.category, *columns)
+                              .filter(LeagueRecords.category.in_(categories))
+                              .order_by(LeagueRecords.category, LeagueRecords.rank)):
+        stored[category].append(dict(zip(_FIELDS, values)))
+
+    for category in categories:
+        scope_week = None if category in SEASON_CATEGORIES else week
+        others = [e for e in stored[category]
+                  if e['year'] != year or (scope_week is not None and e['week'] != scope_week)]
+        entries = []
+        if others:
+            key = _sort_key(category)
+            cutoff = key(others[-1])
+            candidates = [e for e in CATEGORIES[category][1](year, scope_week) if key(e) <= cutoff]
+            entries = sorted(others + candidates, key=key)[:KEEP]
+        if len(entries) < TOP_K:
+            entries = _collect(category)
+        _write(category, entries)
+
+
+def refresh_matchup_records(year, week):
+    """Update the game and season records after a week's Matchups are written; the caller commits."""
+    _refresh(MATCHUP_CATEGORIES, year, week)
+
+
+def refresh_player_records(year, week):
+    """Update the player records after a week's PlayerWeeklyStats are written; the caller commits."""
+    _refresh(PLAYER_CATEGORIES, year, week)
+
+
+def rebuild_record_book():
+    """Recollect every category from Matchups and PlayerWeeklyStats and commit."""
+    total = 0
+    for category in CATEGORIES:
+        entries = _collect(category)
+        _write(category, entries)
+        total += len(entries)
+    db.session.commit()
+    invalidate('records')
+    logger.info(f'Record book rebuilt: {total} entries')
+    return {'success': True, 'records': total}
+
+
+@memoize(ttl=3600, maxsize=1, stale_ttl=300, tags=('records', 'matchups', 'player_stats'))
+def get_record_book():
+    """{category: [record dicts in rank order]} for every category. Do not mutate."""
+    book = {category: [] for category in CATEGORIES}
+    for record in LeagueRecords.query.order_by(LeagueRecords.category, LeagueRecords.rank):
+        if record.category in book:
+            book[record.category].append(record.serialize())
+    return book
@@ -0,0 +1,90 @@
+"""
+Weekly roster snapshots.
+
+synchronize_teams() overwrites Players.team_id / starter / taxi in place, so it
+also records each roster into RosterSnapshots for the league's current week
+(re-syncing within a week overwrites that week's row). Weeks before snapshots
+existed are rebuilt from PlayerWeeklyStats by backfill_roster_snapshots(); those
+carry starters but no taxi squad, and never replace a row the live sync wrote.
+
+A historical roster is then a single-row read: get_roster_snapshot().
+"""
+import logging
+from itertools import groupby
+
+from app import db
+from app.models.roster_snapshots import RosterSnapshots
+from app.models.player_weekly_stats import PlayerWeeklyStats
+
+logger = logging.getLogger(__name__)
+
+
+def sleeper_ids(values):
+    """Int Sleeper player IDs from a roster list, skipping empty slots ('0' / None)."""
+    ids = []
+    for value in values or ():
+        value = str(value) if value is not None else ''
+        if value.isdigit() and int(value) != 0:
+            ids.append(int(value))
+    return ids
+
+
+def record_roster_snapshot(year, week, sleeper_roster_id, player_ids, starter_ids=(), taxi_ids=(),
+                           source='sync', existing=None):
+    """
+    Upsert the (year, week, roster) snapshot; the caller commits. A 'backfill'
+    never replaces a 'sync' snapshot. `existing` lets bulk callers pass the row
+    they already loaded (or False when they know there is none).
+    Returns the snapshot, or None if it was left alone.
+    """
+    if existing is None:
+        existing = RosterSnapshots.query.filter_by(
+            year=year, week=week, sleeper_roster_id=sleeper_roster_id,
+        ).first()
+    if existing and source == 'backfill' and existing.source == 'sync':
+        return None
+
+    snapshot = existing or RosterSnapshots(year=year, week=week, sleeper_roster_id=sleeper_roster_id)
+    # Starters/taxi may name players missing from the main list; keep them.
+    ordered = list(dict.fromkeys([*player_ids, *starter_ids, *taxi_ids]))
+    snapshot.set_roster(ordered, starter_ids, taxi_ids)
+    snapshot.source = source
+    if not existing:
+        db.session.add(snapshot)
+    return snapshot
+
+
+def backfill_roster_snapshots(year=None):
+    """Rebuild snapshots for every week PlayerWeeklyStats covers (or one season) and commit."""
+    stats = db.session.query(
+        PlayerWeeklyStats.year, PlayerWeeklyStats.week, PlayerWeeklyStats.sleeper_roster_id,
+        PlayerWeeklyStats.player_sleeper_id, PlayerWeeklyStats.is_starter,
+    )
+    existing_query = RosterSnapshots.query
+    if year is not None:
+        stats = stats.filter(PlayerWeeklyStats.year == int(year))
+        existing_query = existing_query.filter(RosterSnapshots.year == int(year))
+
+    existing = {(s.year, s.week, s.sleeper_roster_id): s for s in existing_query}
+    written = 0
+    rows = stats.order_by(PlayerWeeklyStats.year, PlayerWeeklyStats.week,
+                          PlayerWeeklyStats.sleeper_roster_id, PlayerWeeklyStats.player_sleeper_id)
+    for key, group in groupby(rows, key=lambda r: (r.year, r.week, r.sleeper_roster_id)):
+        group = list(group)
+        snapshot = record_roster_snapshot(
+            *key,
+            player_ids=[r.player_sleeper_id for r in group],
+            starter_ids=[r.player_sleeper_id for r in group if r.is_starter],
+            source='backfill',
+            existing=existing.get(key, False),
+        )
+        if snapshot is not None:
+            written += 1
+
+    db.session.commit()
+    logger.info(f'Roster snapshots backfilled: {written}')
+    return {'success': True, 'snapshots_written': written}
+
+
+def get_roster_snapshot(year, week, sleeper_roster_id):
+    return RosterSnapshots.query.filter_by(year=year, week=week, sleeper_roster_id=sleeper_roster_id).first()
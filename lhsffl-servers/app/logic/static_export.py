@@ -0,0 +1,196 @@
+"""
+Static JSON export of the public read endpoints, for hosting on a CDN.
+
+Every public GET route in the registered blueprints is rendered for every value
+of its URL variables (team, article, transaction, player, week, season/week, season),
+through the normal view stack, and written under the export directory as
+
+  v1/<path>.<hash>.json      (plus a .json.gz copy)
+  manifest.json              {"version", "generated_at", "files": {"/v1/<path>": {...}}}
+
+File names are content-addressed, so they can be cached forever; manifest.json is
+the only file that changes on every export. Re-exports render everything again but
+only write files whose content changed, so syncing the directory to a bucket
+uploads just those. Files referenced by neither the new nor the previous manifest
+are deleted; clients still holding the previous manifest keep working.
+
+Live or per-user routes (current matchups, league state, UDFA, admin, auth) and
+routes with side effects (article generation) are never exported.
+"""
+import gzip
+import hashlib
+import itertools
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from app import db
+from app.models.teams import Teams
+from app.models.articles import Articles
+from app.models.matchups import Matchups
+from app.models.player_weekly_stats import PlayerWeeklyStats
+from app.models.transactions import Transactions
+from app.models.transaction_players import TransactionPlayers
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = 'manifest.json'
+
+EXCLUDED_BLUEPRINTS = {'admin', 'auth', 'batch', 'bootstrap', 'events', 'sync', 'test', 'udfa', 'users'}
+
+EXCLUDED_ENDPOINTS = {
+    'articles.generate_power_ranking',
+    'matchups.get_matchup_articles',
+    'matchups.get_current_matchup',
+    'matchups.get_current_matchups_fast',
+    'league.get_league_state_status',
+    'transactions.get_random_trades',
+}
+
+
+def _distinct(column, *criteria):
+    return [value for (value,) in db.session.query(column).filter(*criteria).distinct().order_by(column)]
+
+
+def _arg_values():
+    """Values to substitute for each URL variable; a tuple key is a set of variables filled together."""
+    return {
+        'team_id': _distinct(Teams.team_id),
+        'article_id': _distinct(Articles.article_id, Articles.published == True),
+        'transaction_id': _distinct(Transactions.transaction_id),
+        'player_sleeper_id': _distinct(TransactionPlayers.player_sleeper_id),
+        'week_number': _distinct(Matchups.week),
+        ('year', 'week'): [tuple(row) for row in db.session.query(Matchups.year, Matchups.week)
+                           .distinct().order_by(Matchups.year, Matchups.week)],
+        'year': _distinct(PlayerWeeklyStats.year),
+    }
+
+
+def _is_public(rule):
+    if 'GET' not in rule.methods or rule.endpoint == 'static':
+        return False
+    blueprint = rule.endpoint.split('.', 1)[0]
+    return blueprint not in EXCLUDED_BLUEPRINTS and rule.endpoint not in EXCLUDED_ENDPOINTS
+
+
+def export_paths(app):
+    """Every concrete /v1 path to export, in URL-map order."""
+    values = _arg_values()
+    adapter = app.url_map.bind('localhost')
+    paths = []
+
+    for rule in app.url_map.iter_rules():
+        if not _is_public(rule):
+            continue
+
+        remaining = set(rule.arguments)
+        groups = []
+        for key, options in values.items():
+            names = key if isinstance(key, tuple) else (key,)
+            if remaining.issuperset(names):
+                rows = options if isinstance(key, tuple) else [(option,) for option in options]
+                groups.append([dict(zip(names, row)) for row in rows])
+                remaining -= set(names)
+        if remaining:
+            logger.warning(f'Static export: no values for {sorted(remaining)} in {rule.rule}, skipped')
+            continue
+
+        for combo in itertools.product(*groups):
+            args = {k: v for part in combo for k, v in part.items()}
+            paths.append(adapter.build(rule.endpoint, args))
+
+    return paths
+
+
+def _render(app, path):
+    """(path, canonical JSON bytes) for a 200 response, else (path, None). Runs on a worker thread."""
+    with app.app_context():
+        try:
+            response = app.test_client().get(path)
+        except Exception:
+            logger.exception(f'Static export: {path} failed, skipped')
+            db.session.rollback()
+            return path, None
+    if response.status_code != 200:
+        logger.info(f'Static export: {path} returned {response.status_code}, skipped')
+        return path, None
+    body = json.dumps(response.get_json(), sort_keys=True, separators=(',', ':')).encode()
+    return path, body
+
+
+def _write(out_dir, relpath, data):
+    target = os.path.join(out_dir, relpath)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp = f'{target}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, target)
+
+
+def _load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'version': 0, 'files': {}}
+
+
+def _prune(out_dir, keep):
+    """Delete exported files under v1/ that aren't in `keep` (relative paths, without .gz)."""
+    removed = 0
+    for root, _, names in os.walk(os.path.join(out_dir, 'v1')):
+        for name in names:
+            path = os.path.join(root, name)
+            relpath = os.path.relpath(path, out_dir).replace(os.sep, '/')
+            if relpath.removesuffix('.gz') not in keep:
+                os.remove(path)
+                removed += 1
+    return removed
+
+
+def export_static(app, out_dir, workers=8):
+    """Render every public path into `out_dir` and write a new manifest."""
+    previous = _load_manifest(out_dir)
+    with app.app_context():
+        paths = export_paths(app)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        rendered = list(pool.map(lambda path: _render(app, path), paths))
+
+    files = {}
+    written = 0
+    for path, body in rendered:
+        if body is None:
+            continue
+        digest = hashlib.sha256(body).hexdigest()
+        relpath = f'{path.lstrip("/")}.{digest[:12]}.json'
+        files[path] = {'file': relpath, 'sha256': digest, 'bytes': len(body)}
+        if not os.path.exists(os.path.join(out_dir, relpath)):
+            _write(out_dir, f'{relpath}.gz', gzip.compress(body, mtime=0))
+            _write(out_dir, relpath, body)
+            written += 1
+
+    manifest = {
+        'version': previous.get('version', 0) + 1,
+        'generated_at': datetime.utcnow().isoformat(),
+        'files': files,
+    }
+    _write(out_dir, MANIFEST, json.dumps(manifest, sort_keys=True, indent=1).encode())
+
+    keep = {entry['file'] for entry in files.values()}
+    keep |= {entry['file'] for entry in previous.get('files', {}).values()}
+    pruned = _prune(out_dir, keep)
+
+    logger.info(f'Static export v{manifest["version"]}: {len(files)} files, {written} written, '
+                f'{len(paths) - len(files)} skipped, {pruned} pruned')
+    return {
+        'success': True,
+        'version': manifest['version'],
+        'files': len(files),
+        'written': written,
+        'unchanged': len(files) - written,
+        'skipped': len(paths) - len(files),
+        'pruned': pruned,
+    }
@@ -1,7 +1,7 @@
-import time
-from functools import wraps
-from sqlalchemy.sql.expression import func
+from collections import Counter, defaultdict
+from itertools import combinations
 from app import db
+from app.memo import memoize
 from app.models.transactions import Transactions
 from app.models.transaction_players import TransactionPlayers
 from app.models.transaction_rosters import TransactionRosters
@@ -9,23 +9,10 @@ from app.models.transaction_draft_picks import TransactionDraftPicks
 from app.models.draft_picks import DraftPicks
 from app.models.teams import Teams
 from app.models.players import Players
-
-
-def timed_cache(seconds=3600):
-    """Simple time-based cache decorator. No external dependencies."""
-    def decorator(func):
-        cache = {}
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            now = time.time()
-            if 'result' in cache and now - cache['time'] < seconds:
-                return cache['result']
-            result = func(*args, **kwargs)
-            cache['result'] = result
-            cache['time'] = now
-            return result
-        return wrapper
-    return decorator
+from app.models.player_transaction_totals import PlayerTransactionTotals
+from app.models.player_roster_adds import PlayerRosterAdds
+from app.models.team_transaction_totals import TeamTransactionTotals
+from app.models.trade_partners import TradePartners
 
 
 def _build_player_lookup(sleeper_ids):
@@ -62,7 +49,186 @@ def _player_info(player, sleeper_id):
     }
 
 
-@timed_cache(seconds=3600)
+# ---------------------------------------------------------------------------
+# Materialized totals
+#
+# Player and team superlatives are served from four aggregate tables
+# (PlayerTransactionTotals, PlayerRosterAdds, TeamTransactionTotals,
+# TradePartners). Ingest paths call apply_transactions() with the IDs they just
+# created, before committing, so the totals move in the same DB transaction as
+# the rows they summarize. Transactions are immutable once ingested, which keeps
+# every counter a plain sum of per-transaction deltas.
+# ---------------------------------------------------------------------------
+
+def _transaction_deltas(transaction_ids=None):
+    """
+    Counter deltas contributed by complete transactions — every one of them when
+    transaction_ids is None (full rebuild), otherwise just the given IDs.
+    """
+    def scoped(query):
+        query = query.filter(Transactions.status == 'complete')
+        if transaction_ids is not None:
+            query = query.filter(Transactions.transaction_id.in_(transaction_ids))
+        return query
+
+    player_rows = scoped(
+        db.session.query(
+            Transactions.transaction_id, Transactions.type,
+            TransactionPlayers.player_sleeper_id, TransactionPlayers.sleeper_roster_id,
+            TransactionPlayers.action,
+        ).join(TransactionPlayers, TransactionPlayers.transaction_id == Transactions.transaction_id)
+    ).all()
+
+    trade_roster_rows = scoped(
+        db.session.query(Transactions.transaction_id, TransactionRosters.sleeper_roster_id)
+        .join(TransactionRosters, TransactionRosters.transaction_id == Transactions.transaction_id)
+        .filter(Transactions.type == 'trade')
+    ).all()
+
+    pick_rows = scoped(
+        db.session.query(TransactionDraftPicks.previous_owner_id)
+        .join(Transactions, Transactions.transaction_id == TransactionDraftPicks.transaction_id)
+        .filter(Transactions.type == 'trade', TransactionDraftPicks.previous_owner_id.isnot(None))
+    ).all()
+
+    player_trades = Counter()
+    player_drops = Counter()
+    roster_adds = Counter()
+    pickups = Counter()
+    traded_pairs = set()
+    for txn_id, txn_type, player_id, roster_id, action in player_rows:
+        if txn_type == 'trade':
+            traded_pairs.add((txn_id, player_id))
+        if action == 'drop':
+            player_drops[player_id] += 1
+        else:
+            roster_adds[(player_id, roster_id)] += 1
+            if txn_type in ('waiver', 'free_agent'):
+                pickups[roster_id] += 1
+    for _, player_id in traded_pairs:
+        player_trades[player_id] += 1
+
+    team_trades = Counter()
+    txn_rosters = defaultdict(set)
+    for txn_id, roster_id in trade_roster_rows:
+        if roster_id not in txn_rosters[txn_id]:
+            team_trades[roster_id] += 1
+            txn_rosters[txn_id].add(roster_id)
+
+    partners = Counter()
+    for rosters in txn_rosters.values():
+        for pair in combinations(sorted(rosters), 2):
+            partners[pair] += 1
+
+    picks_traded = Counter(previous_owner_id for (previous_owner_id,) in pick_rows)
+
+    return {
+        'player_trades': player_trades,
+        'player_drops': player_drops,
+        'roster_adds': roster_adds,
+        'team_trades': team_trades,
+        'pickups': pickups,
+        'picks_traded': picks_traded,
+        'partners': partners,
+    }
+
+
+def _apply_deltas(deltas):
+    """Add a _transaction_deltas() result onto the totals tables (no commit)."""
+    # PlayerRosterAdds first: a brand-new (player, roster) row bumps team_count.
+    roster_adds = deltas['roster_adds']
+    new_teams = Counter()
+    if roster_adds:
+        player_ids = {player_id for player_id, _ in roster_adds}
+        existing = {
+            (row.player_sleeper_id, row.sleeper_roster_id): row
+            for row in PlayerRosterAdds.query.filter(PlayerRosterAdds.player_sleeper_id.in_(player_ids))
+        }
+        for (player_id, roster_id), n in roster_adds.items():
+            row = existing.get((player_id, roster_id))
+            if row is None:
+                row = PlayerRosterAdds(player_sleeper_id=player_id, sleeper_roster_id=roster_id, times_added=0)
+                db.session.add(row)
+                new_teams[player_id] += 1
+            row.times_added += n
+
+    player_ids = set(deltas['player_trades']) | set(deltas['player_drops']) | set(new_teams)
+    if player_ids:
+        players = {
+            row.player_sleeper_id: row
+            for row in PlayerTransactionTotals.query.filter(PlayerTransactionTotals.player_sleeper_id.in_(player_ids))
+        }
+        for player_id in player_ids:
+            row = players.get(player_id)
+            if row is None:
+                row = PlayerTransactionTotals(player_sleeper_id=player_id, trade_count=0, team_count=0, drop_count=0)
+                db.session.add(row)
+            row.trade_count += deltas['player_trades'][player_id]
+            row.drop_count += deltas['player_drops'][player_id]
+            row.team_count += new_teams[player_id]
+
+    roster_ids = set(deltas['team_trades']) | set(deltas['pickups']) | set(deltas['picks_traded'])
+    if roster_ids:
+        teams = {
+            row.sleeper_roster_id: row
+            for row in TeamTransactionTotals.query.filter(TeamTransactionTotals.sleeper_roster_id.in_(roster_ids))
+        }
+        for roster_id in roster_ids:
+            row = teams.get(roster_id)
+            if row is None:
+                row = TeamTransactionTotals(sleeper_roster_id=roster_id, trade_count=0, pickup_count=0, picks_traded=0)
+                db.session.add(row)
+            row.trade_count += deltas['team_trades'][roster_id]
+            row.pickup_count += deltas['pickups'][roster_id]
+            row.picks_traded += deltas['picks_traded'][roster_id]
+
+    partners = deltas['partners']
+    if partners:
+        existing = {(row.roster_id_1, row.roster_id_2): row for row in TradePartners.query.all()}
+        for (r1, r2), n in partners.items():
+            row = existing.get((r1, r2))
+            if row is None:
+                row = TradePartners(roster_id_1=r1, roster_id_2=r2, trade_count=0)
+                db.session.add(row)
+            row.trade_count += n
+
+
+def apply_transactions(transaction_ids):
+    """
+    Fold newly ingested transactions into the superlative totals.
+    Call before committing the ingest so both land atomically; the caller commits.
+    """
+    if not transaction_ids:
+        return
+    _apply_deltas(_transaction_deltas(list(transaction_ids)))
+
+
+def rebuild_superlative_totals():
+    """Recompute every superlative total from scratch and commit."""
+    for model in (PlayerRosterAdds, PlayerTransactionTotals, TeamTransactionTotals, TradePartners):
+        model.query.delete()
+    _apply_deltas(_transaction_deltas())
+    db.session.commit()
+    return {
+        'success': True,
+        'players': PlayerTransactionTotals.query.count(),
+        'teams': TeamTransactionTotals.query.count(),
+    }
+
+
+def _team_name(teams_lookup, roster_id):
+    return teams_lookup[roster_id].team_name if roster_id in teams_lookup else f'Roster {roster_id}'
+
+
+def _top_players(column, limit=10):
+    return PlayerTransactionTotals.query \
+        .filter(column > 0) \
+        .order_by(column.desc(), PlayerTransactionTotals.player_sleeper_id) \
+        .limit(limit) \
+        .all()
+
+
+@memoize(ttl=3600, stale_ttl=300, tags=('transactions', 'players', 'teams'))
 def get_player_superlatives():
     """
     Player superlatives:
@@ -71,107 +237,47 @@ def get_player_superlatives():
     - most_dropped: players dropped the most times
     - boomerang: players added to the same team multiple times
     """
-
-    # Most traded players
-    most_traded = db.session.query(
-        TransactionPlayers.player_sleeper_id,
-        func.count(func.distinct(TransactionPlayers.transaction_id)).label('trade_count')
-    ) \
-        .join(Transactions) \
-        .filter(Transactions.type == 'trade', Transactions.status == 'complete') \
-        .group_by(TransactionPlayers.player_sleeper_id) \
-        .order_by(func.count(func.distinct(TransactionPlayers.transaction_id)).desc()) \
-        .limit(10) \
-        .all()
-
-    # Most teams rostered
-    most_teams = db.session.query(
-        TransactionPlayers.player_sleeper_id,
-        func.count(func.distinct(TransactionPlayers.sleeper_roster_id)).label('team_count')
-    ) \
-        .join(Transactions) \
-        .filter(TransactionPlayers.action == 'add', Transactions.status == 'complete') \
-        .group_by(TransactionPlayers.player_sleeper_id) \
-        .order_by(func.count(func.distinct(TransactionPlayers.sleeper_roster_id)).desc()) \
-        .limit(10) \
-        .all()
-
-    # Most dropped players
-    most_dropped = db.session.query(
-        TransactionPlayers.player_sleeper_id,
-        func.count().label('drop_count')
-    ) \
-        .join(Transactions) \
-        .filter(TransactionPlayers.action == 'drop', Transactions.status == 'complete') \
-        .group_by(TransactionPlayers.player_sleeper_id) \
-        .order_by(func.count().desc()) \
-        .limit(10) \
-        .all()
+    most_traded = _top_players(PlayerTransactionTotals.trade_count)
+    most_teams = _top_players(PlayerTransactionTotals.team_count)
+    most_dropped = _top_players(PlayerTransactionTotals.drop_count)
 
     # Boomerang players - added to the same team multiple times
-    boomerang_raw = db.session.query(
-        TransactionPlayers.player_sleeper_id,
-        TransactionPlayers.sleeper_roster_id,
-        func.count().label('times_added')
-    ) \
-        .join(Transactions) \
-        .filter(TransactionPlayers.action == 'add', Transactions.status == 'complete') \
-        .group_by(TransactionPlayers.player_sleeper_id, TransactionPlayers.sleeper_roster_id) \
-        .having(func.count() >= 2) \
-        .order_by(func.count().desc()) \
+    boomerang = PlayerRosterAdds.query \
+        .filter(PlayerRosterAdds.times_added >= 2) \
+        .order_by(PlayerRosterAdds.times_added.desc(), PlayerRosterAdds.player_sleeper_id) \
         .limit(10) \
         .all()
 
     # Batch-load all players referenced across all queries
-    all_player_ids = set()
-    for pid, _ in most_traded:
-        all_player_ids.add(pid)
-    for pid, _ in most_teams:
-        all_player_ids.add(pid)
-    for pid, _ in most_dropped:
-        all_player_ids.add(pid)
-    for pid, _, _ in boomerang_raw:
-        all_player_ids.add(pid)
+    all_player_ids = {row.player_sleeper_id for row in most_traded + most_teams + most_dropped + boomerang}
     players_lookup = _build_player_lookup(list(all_player_ids))
-
-    # Batch-load teams for boomerang
-    boomerang_roster_ids = [rid for _, rid, _ in boomerang_raw]
-    teams_lookup = _build_team_lookup(boomerang_roster_ids)
-
-    most_traded_result = [
-        {**_player_info(players_lookup.get(pid), pid), 'trade_count': count}
-        for pid, count in most_traded
-    ]
-
-    most_teams_result = [
-        {**_player_info(players_lookup.get(pid), pid), 'team_count': count}
-        for pid, count in most_teams
-    ]
-
-    most_dropped_result = [
-        {**_player_info(players_lookup.get(pid), pid), 'drop_count': count}
-        for pid, count in most_dropped
-    ]
-
-    boomerang_result = []
-    for pid, roster_id, times_added in boomerang_raw:
-        player = players_lookup.get(pid)
-        team = teams_lookup.get(roster_id)
-        boomerang_result.append({
-            **_player_info(player, pid),
-            'team_name': team.team_name if team else f'Roster {roster_id}',
-            'times_added': times_added,
-        })
+    teams_lookup = _build_team_lookup([row.sleeper_roster_id for row in boomerang])
 
     return {
-        'most_traded': most_traded_result,
-        'most_teams': most_teams_result,
-        'most_dropped': most_dropped_result,
-        'boomerang': boomerang_result,
+        'most_traded': [
+            {**_player_info(players_lookup.get(row.player_sleeper_id), row.player_sleeper_id), 'trade_count': row.trade_count}
+            for row in most_traded
+        ],
+        'most_teams': [
+            {**_player_info(players_lookup.get(row.player_sleeper_id), row.player_sleeper_id), 'team_count': row.team_count}
+            for row in most_teams
+        ],
+        'most_dropped': [
+            {**_player_info(players_lookup.get(row.player_sleeper_id), row.player_sleeper_id), 'drop_count': row.drop_count}
+            for row in most_dropped
+        ],
+        'boomerang': [
+            {
+                **_player_info(players_lookup.get(row.player_sleeper_id), row.player_sleeper_id),
+                'team_name': _team_name(teams_lookup, row.sleeper_roster_id),
+                'times_added': row.times_added,
+            }
+            for row in boomerang
+        ],
     }
 
 
-@timed_cache(seconds=3600)
+@memoize(ttl=3600, stale_ttl=300, tags=('transactions', 'teams'))
 def get_team_superlatives():
     """
     Team superlatives:
@@ -180,127 +286,52 @@ def get_team_superlatives():
     - waiver_warriors: teams with the most waiver/FA pickups
     - draft_capital_movers: teams that have traded the most draft picks
     """
-
-    # Most active traders
-    most_trades = db.session.query(
-        TransactionRosters.sleeper_roster_id,
-        func.count(func.distinct(TransactionRosters.transaction_id)).label('trade_count')
-    ) \
-        .join(Transactions) \
-        .filter(Transactions.type == 'trade', Transactions.status == 'complete') \
-        .group_by(TransactionRosters.sleeper_roster_id) \
-        .order_by(func.count(func.distinct(TransactionRosters.transaction_id)).desc()) \
-        .all()
-
-    # Frequent trade partners
-    trade_pairs = db.session.query(
-        Transactions.transaction_id,
-        TransactionRosters.sleeper_roster_id
-    ) \
-        .join(TransactionRosters) \
-        .filter(Transactions.type == 'trade', Transactions.status == 'complete') \
-        .all()
-
-    txn_rosters = {}
-    for txn_id, roster_id in trade_pairs:
-        txn_rosters.setdefault(txn_id, []).append(roster_id)
-
-    pair_counts = {}
-    for txn_id, rosters in txn_rosters.items():
-        if len(rosters) >= 2:
-            rosters_sorted = sorted(rosters)
-            for i in range(len(rosters_sorted)):
-                for j in range(i + 1, len(rosters_sorted)):
-                    pair = (rosters_sorted[i], rosters_sorted[j])
-                    pair_counts[pair] = pair_counts.get(pair, 0) + 1
-
-    sorted_pairs = sorted(pair_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-
-    # Waiver wire warriors
-    waiver_warriors = db.session.query(
-        TransactionPlayers.sleeper_roster_id,
-        func.count().label('pickup_count')
-    ) \
-        .join(Transactions) \
-        .filter(
-            TransactionPlayers.action == 'add',
-            Transactions.type.in_(['waiver', 'free_agent']),
-            Transactions.status == 'complete',
-        ) \
-        .group_by(TransactionPlayers.sleeper_roster_id) \
-        .order_by(func.count().desc()) \
-        .all()
-
-    # Draft capital movers
-    draft_movers = db.session.query(
-        TransactionDraftPicks.previous_owner_id,
-        func.count().label('picks_traded')
-    ) \
-        .join(Transactions) \
-        .filter(Transactions.type == 'trade', Transactions.status == 'complete') \
-        .filter(TransactionDraftPicks.previous_owner_id.isnot(None)) \
-        .group_by(TransactionDraftPicks.previous_owner_id) \
-        .order_by(func.count().desc()) \
+    def ranked(column):
+        return TeamTransactionTotals.query \
+            .filter(column > 0) \
+            .order_by(column.desc(), TeamTransactionTotals.sleeper_roster_id) \
+            .all()
+
+    most_trades = ranked(TeamTransactionTotals.trade_count)
+    waiver_warriors = ranked(TeamTransactionTotals.pickup_count)
+    draft_movers = ranked(TeamTransactionTotals.picks_traded)
+    partners = TradePartners.query \
+        .order_by(TradePartners.trade_count.desc(), TradePartners.roster_id_1, TradePartners.roster_id_2) \
+        .limit(10) \
         .all()
 
     # Batch-load all teams referenced
-    all_roster_ids = set()
-    for rid, _ in most_trades:
-        all_roster_ids.add(rid)
-    for (r1, r2), _ in sorted_pairs:
-        all_roster_ids.add(r1)
-        all_roster_ids.add(r2)
-    for rid, _ in waiver_warriors:
-        all_roster_ids.add(rid)
-    for rid, _ in draft_movers:
-        all_roster_ids.add(rid)
+    all_roster_ids = {row.sleeper_roster_id for row in most_trades + waiver_warriors + draft_movers}
+    for row in partners:
+        all_roster_ids.update((row.roster_id_1, row.roster_id_2))
     teams_lookup = _build_team_lookup(list(all_roster_ids))
 
-    most_trades_result = [
-        {
-            'sleeper_roster_id': rid,
-            'team_name': teams_lookup[rid].team_name if rid in teams_lookup else f'Roster {rid}',
-            'trade_count': count,
-        }
-        for rid, count in most_trades
-    ]
-
-    trade_partners_result = [
-        {
-            'team_1': teams_lookup[r1].team_name if r1 in teams_lookup else f'Roster {r1}',
-            'team_2': teams_lookup[r2].team_name if r2 in teams_lookup else f'Roster {r2}',
-            'trade_count': count,
-        }
-        for (r1, r2), count in sorted_pairs
-    ]
-
-    waiver_warriors_result = [
-        {
-            'sleeper_roster_id': rid,
-            'team_name': teams_lookup[rid].team_name if rid in teams_lookup else f'Roster {rid}',
-            'pickup_count': count,
-        }
-        for rid, count in waiver_warriors
-    ]
-
-    draft_movers_result = [
-        {
-            'sleeper_roster_id': rid,
-            'team_name': teams_lookup[rid].team_name if rid in teams_lookup else f'Roster {rid}',
-            'picks_traded': count,
-        }
-        for rid, count in draft_movers
-    ]
-
     return {
-        'most_trades': most_trades_result,
-        'frequent_trade_partners': trade_partners_result,
-        'waiver_warriors': waiver_warriors_result,
-        'draft_capital_movers': draft_movers_result,
+        'most_trades': [
+            {'sleeper_roster_id': row.sleeper_roster_id, 'team_name': _team_name(teams_lookup, row.sleeper_roster_id),
+             'trade_count': row.trade_count}
+            for row in most_trades
+        ],
+        'frequent_trade_partners': [
+            {'team_1': _team_name(teams_lookup, row.roster_id_1), 'team_2': _team_name(teams_lookup, row.roster_id_2),
+             'trade_count': row.trade_count}
+            for row in partners
+        ],
+        'waiver_warriors': [
+            {'sleeper_roster_id': row.sleeper_roster_id, 'team_name': _team_name(teams_lookup, row.sleeper_roster_id),
+             'pickup_count': row.pickup_count}
+            for row in waiver_warriors
+        ],
+        'draft_capital_movers': [
+            {'sleeper_roster_id': row.sleeper_roster_id, 'team_name': _team_name(teams_lookup, row.sleeper_roster_id),
+             'picks_traded': row.picks_traded}
+            for row in draft_movers
+        ],
     }
 
 
-@timed_cache(seconds=3600)
+# Startup/rookie draft results joined against who is rostered where right now.
+@memoize(ttl=3600, stale_ttl=300, tags=('draft_picks', 'players', 'teams'))
 def get_draft_superlatives():
     """
     Draft superlatives:
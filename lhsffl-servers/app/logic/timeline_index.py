@@ -0,0 +1,407 @@
+"""
+Process-wide, in-memory index of the league's transaction history.
+
+The transaction tables are small (a few thousand rows per league), so rather
+than query Transactions / TransactionPlayers / TransactionDraftPicks /
+TransactionRosters on every trade-tree request, the whole history is loaded
+once into plain tuples:
+
+  * transactions    {transaction_id: TimelineTxn} — namedtuples that mirror the
+                    ORM attributes, so TransactionsJSONSchema dumps them exactly
+                    like the models
+  * roster timeline {sleeper_roster_id: (transaction_id, ...)} — complete
+                    transactions per roster in (created_at, transaction_id) order
+  * player moves    {player_sleeper_id: (transaction_id, ...)} — every transaction
+                    that added or dropped the player, any status
+  * pick moves      {(season, round, original_roster_id): (transaction_id, ...)}
+  * lineage edges   the persisted AssetLineage graph, {acquired_transaction_id:
+                    ((sleeper_roster_id, released_transaction_id), ...)}
+  * ownership       the persisted PlayerOwnership intervals, {player_sleeper_id:
+                    (OwnershipInterval, ...)} sorted by start for bisect lookups
+                    (owner_at(), owners_between())
+
+plus the team, player and rookie-draft lookups the trees embed. With that,
+trade_tree() and full_trade_tree() answer without touching the database.
+
+The index is built lazily by get_timeline_index() and cached with the 'transactions',
+'players', 'teams', 'draft_picks', 'asset_lineage' and 'player_ownership' tags, so each
+sync that touches any of them drops it and the next request rebuilds it from scratch
+(one query per table).
+"""
+import bisect
+import logging
+from collections import defaultdict, namedtuple
+from datetime import datetime
+
+from app import db
+from app.memo import memoize
+from app.models.asset_lineage import AssetLineage
+from app.models.player_ownership import PlayerOwnership
+from app.models.transactions import Transactions
+from app.models.transaction_players import TransactionPlayers
+from app.models.transaction_rosters import TransactionRosters
+from app.models.transaction_draft_picks import TransactionDraftPicks
+from app.models.transaction_waiver_budget import TransactionWaiverBudget
+from app.models.schemas.transactions import TransactionsJSONSchema
+from app.models.teams import Teams
+from app.models.players import Players
+from app.models.draft_picks import DraftPicks
+
+logger = logging.getLogger(__name__)
+
+TimelineTeam = namedtuple('TimelineTeam', 'team_id team_name sleeper_roster_id')
+TimelinePlayer = namedtuple('TimelinePlayer', 'player_id first_name last_name position nfl_team sleeper_id')
+TimelinePlayerMove = namedtuple(
+    'TimelinePlayerMove',
+    'transaction_player_id transaction_id player_sleeper_id sleeper_roster_id action team player',
+)
+TimelineRosterMove = namedtuple(
+    'TimelineRosterMove', 'transaction_roster_id transaction_id sleeper_roster_id is_consenter team',
+)
+TimelinePickMove = namedtuple(
+    'TimelinePickMove',
+    'transaction_draft_pick_id transaction_id season round roster_id owner_id previous_owner_id',
+)
+TimelineBudgetMove = namedtuple(
+    'TimelineBudgetMove', 'transaction_waiver_budget_id transaction_id sleeper_roster_id amount',
+)
+TimelineTxn = namedtuple(
+    'TimelineTxn',
+    'transaction_id sleeper_transaction_id year week type status creator_sleeper_user_id '
+    'sleeper_league_id waiver_priority created_at status_updated_at '
+    'player_moves roster_moves draft_pick_moves waiver_budget_moves',
+)
+# Rookie draft result for a pick: (pick_no, player_sleeper_id)
+TimelineDraftResult = namedtuple('TimelineDraftResult', 'pick_no player_sleeper_id')
+# A roster's hold on a player over [start, end). start is None when the player was
+# already there before the recorded history (a drop with no recorded add); end is
+# None while the roster still holds the player.
+OwnershipInterval = namedtuple(
+    'OwnershipInterval', 'sleeper_roster_id start end acquired_transaction_id released_transaction_id',
+)
+
+_TXN_COLUMNS = TimelineTxn._fields[:11]
+
+
+def _chronological(txn):
+    # NULL created_at sorts first, as it does in an ascending SQL ORDER BY.
+    return (txn.created_at or datetime.min, txn.transaction_id)
+
+
+class TimelineIndex:
+    """Immutable snapshot of the transaction history; build with TimelineIndex.load()."""
+
+    def __init__(self, transactions, teams, players, draft_results, edges, ownership):
+        self.transactions = transactions
+        self.teams = teams
+        self.players = players
+        self.draft_results = draft_results
+        self.edges = edges
+        self.ownership = ownership
+
+        roster_timeline = defaultdict(list)
+        player_moves = defaultdict(list)
+        pick_moves = defaultdict(list)
+        for txn in sorted(transactions.values(), key=_chronological):
+            for move in txn.player_moves:
+                player_moves[move.player_sleeper_id].append(txn.transaction_id)
+            for move in txn.draft_pick_moves:
+                pick_moves[(move.season, move.round, move.roster_id)].append(txn.transaction_id)
+            if txn.status == 'complete':
+                for move in txn.roster_moves:
+                    roster_timeline[move.sleeper_roster_id].append(txn.transaction_id)
+
+        self.roster_timeline = {rid: tuple(ids) for rid, ids in roster_timeline.items()}
+        self.player_moves = {pid: tuple(dict.fromkeys(ids)) for pid, ids in player_moves.items()}
+        self.pick_moves = {key: tuple(dict.fromkeys(ids)) for key, ids in pick_moves.items()}
+        # Parallel sort keys for bisecting a roster's timeline by date.
+        self._roster_keys = {
+            rid: [_chronological(transactions[txn_id]) for txn_id in ids]
+            for rid, ids in self.roster_timeline.items()
+        }
+
+        self._ownership_starts = {
+            pid: [interval.start or datetime.min for interval in intervals]
+            for pid, intervals in self.ownership.items()
+        }
+        self._serialized = {}
+
+    @classmethod
+    def load(cls):
+        """Read everything the index needs, one query per table."""
+        teams = {}
+        for team_id, team_name, roster_id in db.session.query(
+            Teams.team_id, Teams.team_name, Teams.sleeper_roster_id
+        ).order_by(Teams.team_id):
+            teams.setdefault(roster_id, TimelineTeam(team_id, team_name, roster_id))
+
+        players = {}
+        for row in db.session.query(
+            Players.player_id, Players.first_name, Players.last_name,
+            Players.position, Players.nfl_team, Players.sleeper_id,
+        ).order_by(Players.player_id):
+            players.setdefault(row.sleeper_id, TimelinePlayer(*row))
+
+        draft_results = defaultdict(list)
+        for season, rnd, original, pick_no, player_id in db.session.query(
+            DraftPicks.season, DraftPicks.round, DraftPicks.original_roster_id,
+            DraftPicks.pick_no, DraftPicks.player_sleeper_id,
+        ).filter(DraftPicks.type == 'rookie').order_by(DraftPicks.draft_pick_id):
+            draft_results[(season, rnd, original)].append(TimelineDraftResult(pick_no, player_id))
+
+        player_moves = defaultdict(list)
+        for row in db.session.query(
+            TransactionPlayers.transaction_player_id, TransactionPlayers.transaction_id,
+            TransactionPlayers.player_sleeper_id, TransactionPlayers.sleeper_roster_id,
+            TransactionPlayers.action,
+        ).order_by(TransactionPlayers.transaction_player_id):
+            player_moves[row.transaction_id].append(TimelinePlayerMove(
+                *row, teams.get(row.sleeper_roster_id), players.get(row.player_sleeper_id),
+            ))
+
+        roster_moves = defaultdict(list)
+        for row in db.session.query(
+            TransactionRosters.transaction_roster_id, TransactionRosters.transaction_id,
+            TransactionRosters.sleeper_roster_id, TransactionRosters.is_consenter,
+        ).order_by(TransactionRosters.transaction_roster_id):
+            roster_moves[row.transaction_id].append(TimelineRosterMove(*row, teams.get(row.sleeper_roster_id)))
+
+        pick_moves = defaultdict(list)
+        for row in db.session.query(
+            TransactionDraftPicks.transaction_draft_pick_id, TransactionDraftPicks.transaction_id,
+            TransactionDraftPicks.season, TransactionDraftPicks.round, TransactionDraftPicks.roster_id,
+            TransactionDraftPicks.owner_id, TransactionDraftPicks.previous_owner_id,
+        ).order_by(TransactionDraftPicks.transaction_draft_pick_id):
+            pick_moves[row.transaction_id].append(TimelinePickMove(*row))
+
+        budget_moves = defaultdict(list)
+        for row in db.session.query(
+            TransactionWaiverBudget.transaction_waiver_budget_id, TransactionWaiverBudget.transaction_id,
+            TransactionWaiverBudget.sleeper_roster_id, TransactionWaiverBudget.amount,
+        ).order_by(TransactionWaiverBudget.transaction_waiver_budget_id):
+            budget_moves[row.transaction_id].append(TimelineBudgetMove(*row))
+
+        transactions = {}
+        for row in db.session.query(*(getattr(Transactions, name) for name in _TXN_COLUMNS)):
+            txn_id = row.transaction_id
+            transactions[txn_id] = TimelineTxn(
+                *row,
+                tuple(player_moves[txn_id]), tuple(roster_moves[txn_id]),
+                tuple(pick_moves[txn_id]), tuple(budget_moves[txn_id]),
+            )
+
+        edges = defaultdict(list)
+        for acquired, roster_id, released in db.session.query(
+            AssetLineage.acquired_transaction_id, AssetLineage.sleeper_roster_id,
+            AssetLineage.released_transaction_id,
+        ).filter(AssetLineage.released_transaction_id.isnot(None)):
+            edges[acquired].append((roster_id, released))
+
+        ownership = defaultdict(list)
+        for row in db.session.query(
+            PlayerOwnership.player_sleeper_id, PlayerOwnership.sleeper_roster_id, PlayerOwnership.started_at,
+            PlayerOwnership.ended_at, PlayerOwnership.acquired_transaction_id, PlayerOwnership.released_transaction_id,
+        ):
+            ownership[row.player_sleeper_id].append(OwnershipInterval(*row[1:]))
+        ownership = {
+            player_id: tuple(sorted(spans, key=lambda i: (i.start or datetime.min, i.acquired_transaction_id or 0)))
+            for player_id, spans in ownership.items()
+        }
+
+        index = cls(
+            transactions, teams, players, dict(draft_results),
+            {k: tuple(v) for k, v in edges.items()}, ownership,
+        )
+        logger.info(f'Timeline index built: {len(transactions)} transactions')
+        return index
+
+    def owner_at(self, player_sleeper_id, when):
+        """Roster holding the player at datetime `when`, or None."""
+        intervals = self.ownership.get(player_sleeper_id, ())
+        if not intervals:
+            return None
+        candidates = intervals[:bisect.bisect_right(self._ownership_starts[player_sleeper_id], when)]
+        for interval in reversed(candidates):
+            if interval.end is None or interval.end > when:
+                return interval.sleeper_roster_id
+        return None
+
+    def owners_between(self, player_sleeper_id, start=None, end=None):
+        """OwnershipIntervals overlapping [start, end), oldest first; either bound may be open (None)."""
+        intervals = self.ownership.get(player_sleeper_id, ())
+        if end is not None and intervals:
+            intervals = intervals[:bisect.bisect_left(self._ownership_starts[player_sleeper_id], end)]
+        if start is None:
+            return list(intervals)
+        return [i for i in intervals if i.end is None or i.end > start]
+
+    def serialize(self, transaction_id):
+        """Transactions.serialize() for an indexed transaction, computed once."""
+        payload = self._serialized.get(transaction_id)
+        if payload is None:
+            payload = TransactionsJSONSchema().dump(self.transactions[transaction_id])
+            self._serialized[transaction_id] = payload
+        return payload
+
+    def roster_transactions(self, sleeper_roster_id, after=None):
+        """Complete transactions involving a roster, oldest first; only those created strictly after `after` if given."""
+        ids = self.roster_timeline.get(sleeper_roster_id, ())
+        if after is not None:
+            ids = ids[bisect.bisect_right(self._roster_keys[sleeper_roster_id], (after, float('inf'))):]
+        return [self.transactions[txn_id] for txn_id in ids]
+
+    def _player_summary(self, sleeper_id):
+        player = self.players.get(sleeper_id)
+        return {
+            'sleeper_id': sleeper_id,
+            'first_name': player.first_name if player else 'Unknown',
+            'last_name': player.last_name if player else f'(ID: {sleeper_id})',
+            'position': player.position if player else None,
+        }
+
+    def _drafted_player(self, player_sleeper_id):
+        player = self.players.get(player_sleeper_id) if player_sleeper_id else None
+        if player is None:
+            return None
+        return {
+            'sleeper_id': player.sleeper_id,
+            'first_name': player.first_name,
+            'last_name': player.last_name,
+            'position': player.position,
+        }
+
+    def trade_tree(self, player_sleeper_id):
+        """
+        A player's trade tree as (player_info, [TimelineTxn]): every complete
+        transaction that added or dropped the player, oldest first.
+        """
+        txn_ids = self.player_moves.get(player_sleeper_id)
+        if not txn_ids:
+            return None, []
+
+        txns = sorted(
+            (self.transactions[i] for i in txn_ids if self.transactions[i].status == 'complete'),
+            key=_chronological,
+        )
+        player = self.players.get(player_sleeper_id)
+        player_info = None
+        if player:
+            player_info = {
+                'player_id': player.player_id,
+                'first_name': player.first_name,
+                'last_name': player.last_name,
+                'sleeper_id': player.sleeper_id,
+                'position': player.position,
+            }
+        return player_info, txns
+
+    def trade_tree_payload(self, player_sleeper_id):
+        player_info, txns = self.trade_tree(player_sleeper_id)
+        return {'player': player_info, 'trade_tree': [self.serialize(t.transaction_id) for t in txns]}
+
+    def full_trade_tree_payload(self, transaction_id):
+        """
+        A trade's ripple tree: for each roster in the origin, what it acquired and the
+        later transactions that moved those assets (or their proceeds) on, following
+        the lineage edges. None if the transaction isn't indexed.
+        """
+        origin = self.transactions.get(transaction_id)
+        if origin is None:
+            return None
+
+        payload = {'origin': self.serialize(transaction_id), 'teams': {}, 'pick_metadata': {}}
+        if not origin.player_moves and not origin.draft_pick_moves:
+            return payload
+
+        teams_data = payload['teams']
+        for move in origin.roster_moves:
+            rid = move.sleeper_roster_id
+            team = self.teams.get(rid)
+            teams_data[rid] = {
+                'team_id': team.team_id if team else None,
+                'team_name': team.team_name if team else f'Roster {rid}',
+                'sleeper_roster_id': rid,
+                'acquired_players': [],
+                'acquired_picks': [],
+                'transactions': [],
+            }
+
+        for move in origin.player_moves:
+            if move.action == 'add' and move.sleeper_roster_id in teams_data:
+                teams_data[move.sleeper_roster_id]['acquired_players'].append(
+                    self._player_summary(move.player_sleeper_id)
+                )
+
+        for pick in origin.draft_pick_moves:
+            if pick.owner_id in teams_data:
+                result = self._draft_result(pick.season, pick.round, pick.roster_id)
+                teams_data[pick.owner_id]['acquired_picks'].append({
+                    'season': pick.season,
+                    'round': pick.round,
+                    'original_owner_id': pick.roster_id,
+                    'pick_no': result.pick_no if result else None,
+                    'drafted_player': self._drafted_player(result.player_sleeper_id) if result else None,
+                })
+
+        if not teams_data:
+            return payload
+
+        branches = self._lineage_branches(origin, list(teams_data))
+        later_txns = {txn_id for ids in branches.values() for txn_id in ids}
+
+        for rid, ids in branches.items():
+            txns = sorted((self.transactions[i] for i in ids), key=_chronological)
+            teams_data[rid]['transactions'] = [self.serialize(t.transaction_id) for t in txns]
+
+        relevant_picks = {(p.season, p.round, p.roster_id) for p in origin.draft_pick_moves}
+        for txn_id in later_txns:
+            for p in self.transactions[txn_id].draft_pick_moves:
+                if p.owner_id in teams_data or p.previous_owner_id in teams_data:
+                    relevant_picks.add((p.season, p.round, p.roster_id))
+
+        for season, rnd, original in relevant_picks:
+            result = self._draft_result(season, rnd, original)
+            if result is None:
+                continue
+            payload['pick_metadata'][f'{season}:{rnd}:{original}'] = {
+                'season': season,
+                'round': rnd,
+                'roster_id': original,
+                'pick_no': result.pick_no,
+                'drafted_player': self._drafted_player(result.player_sleeper_id),
+            }
+        return payload
+
+    def _draft_result(self, season, rnd, original_roster_id):
+        """The rookie-draft result for a pick; a duplicated draft row resolves to the last one."""
+        results = self.draft_results.get((season, rnd, original_roster_id))
+        return results[-1] if results else None
+
+    def _lineage_branches(self, origin, roster_ids):
+        """
+        Walk the lineage edges out of the origin: {roster_id: set(transaction_id)} of
+        the later transactions that released an asset the roster acquired in the
+        origin, or in any transaction reached that way.
+        """
+        frontier = {(origin.transaction_id, rid) for rid in roster_ids}
+        seen = set(frontier)
+        branches = {rid: set() for rid in roster_ids}
+        while frontier:
+            next_frontier = set()
+            for txn_id, rid in frontier:
+                for edge_roster_id, released in self.edges.get(txn_id, ()):
+                    if edge_roster_id != rid:
+                        continue
+                    branches[rid].add(released)
+                    node = (released, rid)
+                    if node not in seen:
+                        seen.add(node)
+                        next_frontier.add(node)
+            frontier = next_frontier
+        return branches
+
+
+@memoize(ttl=3600, maxsize=1, stale_ttl=300, tags=('transactions', 'players', 'teams', 'draft_picks', 'asset_lineage', 'player_ownership'))
+def get_timeline_index():
+    """The current TimelineIndex, rebuilt after any sync that changes what it holds."""
+    return TimelineIndex.load()
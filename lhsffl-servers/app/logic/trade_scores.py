@@ -0,0 +1,239 @@
+"""
+Trade outcome scores: who won the trade.
+
+Each side of a completed trade is credited with the PlayerWeeklyStats points its
+acquired assets scored while on its roster:
+
+  * an acquired player counts from the trade's week until that roster next drops
+    him (inclusive: a player traded away after his week-8 game scored week 8 for
+    the roster that had him, which PlayerWeeklyStats already records);
+  * an acquired pick resolves through DraftPicks to the player drafted with it,
+    credited from that draft until the roster drops him. Only the latest trade
+    that moved the pick to the drafting roster is credited: a pick flipped away
+    earns that trade nothing, and one traded back earns only the trade back.
+
+Only weeks PlayerWeeklyStats attributes to the acquiring roster count, so weeks a
+player spent elsewhere drop out on their own.
+
+Scores are stored per side in TradeScores. rebuild_trade_scores() scores every
+trade in one bulk pass (a handful of queries, however many trades). Each week
+refresh_trade_scores() re-scores only the sides still accruing (an asset still
+on the roster, a pick not yet drafted) and trades that have never been scored.
+The endpoints read an in-memory copy of the table.
+"""
+import logging
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import datetime
+
+from app import db
+from app.memo import memoize, invalidate
+from app.models.draft_picks import DraftPicks
+from app.models.player_weekly_stats import PlayerWeeklyStats
+from app.models.trade_scores import TradeScores
+from app.models.transaction_draft_picks import TransactionDraftPicks
+from app.models.transaction_players import TransactionPlayers
+from app.models.transaction_rosters import TransactionRosters
+from app.models.transactions import Transactions
+
+logger = logging.getLogger(__name__)
+
+# Sorts before every week of a season: a rookie is on the roster from the draft on.
+_PRESEASON = 0
+
+
+def _moment(year, week, created_at):
+    """Sort key putting transactions in order; created_at breaks ties within a week."""
+    return year, week, created_at or datetime.min
+
+
+class _Stints:
+    """Weekly points per (player, roster) with prefix sums, and each (player, roster)'s drops."""
+
+    def __init__(self, player_ids):
+        self.weeks = defaultdict(list)      # (player, roster) -> [(year, week)]
+        self.totals = defaultdict(list)     # (player, roster) -> running (points, starter points)
+        self.drops = defaultdict(list)      # (player, roster) -> sorted drop moments
+        if not player_ids:
+            return
+
+        rows = (db.session.query(PlayerWeeklyStats.player_sleeper_id, PlayerWeeklyStats.sleeper_roster_id,
+                                 PlayerWeeklyStats.year, PlayerWeeklyStats.week,
+                                 PlayerWeeklyStats.points, PlayerWeeklyStats.is_starter)
+                .filter(PlayerWeeklyStats.player_sleeper_id.in_(player_ids))
+                .order_by(PlayerWeeklyStats.year, PlayerWeeklyStats.week))
+        for player, roster, year, week, points, starter in rows:
+            key = (player, roster)
+            points = points or 0.0
+            previous = self.totals[key][-1] if self.totals[key] else (0.0, 0.0)
+            self.weeks[key].append((year, week))
+            self.totals[key].append((previous[0] + points, previous[1] + (points if starter else 0.0)))
+
+        drops = (db.session.query(TransactionPlayers.player_sleeper_id, TransactionPlayers.sleeper_roster_id,
+                                  Transactions.year, Transactions.week, Transactions.created_at)
+                 .join(Transactions, Transactions.transaction_id == TransactionPlayers.transaction_id)
+                 .filter(TransactionPlayers.action == 'drop', Transactions.status == 'complete',
+                         TransactionPlayers.player_sleeper_id.in_(player_ids)))
+        for player, roster, year, week, created_at in drops:
+            self.drops[(player, roster)].append(_moment(year, week, created_at))
+        for moments in self.drops.values():
+            moments.sort()
+
+    def credit(self, player, roster, since):
+        """
+        (points, starter_points, weeks, still_on_roster) for `player` on `roster`
+        from the moment `since` until the roster next dropped him.
+        """
+        key = (player, roster)
+        drops = self.drops.get(key, [])
+        i = bisect_right(drops, since)
+        until = drops[i][:2] if i < len(drops) else None
+
+        weeks = self.weeks.get(key, [])
+        lo = bisect_left(weeks, since[:2])
+        hi = bisect_right(weeks, until) if until else len(weeks)
+        if hi <= lo:
+            return 0.0, 0.0, 0, until is None
+        totals = self.totals[key]
+        before = totals[lo - 1] if lo else (0.0, 0.0)
+        return totals[hi - 1][0] - before[0], totals[hi - 1][1] - before[1], hi - lo, until is None
+
+
+def _score(transaction_ids=None):
+    """Unsaved TradeScores for every side of the given (default: all) completed trades."""
+    trades = Transactions.query.filter(Transactions.type == 'trade', Transactions.status == 'complete')
+    if transaction_ids is not None:
+        if not transaction_ids:
+            return []
+        trades = trades.filter(Transactions.transaction_id.in_(transaction_ids))
+    trades = {t.transaction_id: _moment(t.year, t.week, t.created_at) for t in trades}
+    if not trades:
+        return []
+    ids = list(trades)
+
+    sides = defaultdict(set)
+    for transaction_id, roster in (db.session.query(TransactionRosters.transaction_id,
+                                                    TransactionRosters.sleeper_roster_id)
+                                   .filter(TransactionRosters.transaction_id.in_(ids))):
+        sides[transaction_id].add(roster)
+
+    players = defaultdict(list)     # (transaction, roster) -> acquired player ids
+    for transaction_id, player, roster in (db.session.query(TransactionPlayers.transaction_id,
+                                                            TransactionPlayers.player_sleeper_id,
+                                                            TransactionPlayers.sleeper_roster_id)
+                                           .filter(TransactionPlayers.transaction_id.in_(ids),
+                                                   TransactionPlayers.action == 'add')):
+        players[(transaction_id, roster)].append(player)
+        sides[transaction_id].add(roster)
+
+    picks = defaultdict(list)       # (transaction, roster) -> acquired (season, round, original roster)
+    for transaction_id, season, round_, original, owner in (
+            db.session.query(TransactionDraftPicks.transaction_id, TransactionDraftPicks.season,
+                             TransactionDraftPicks.round, TransactionDraftPicks.roster_id,
+                             TransactionDraftPicks.owner_id)
+            .filter(TransactionDraftPicks.transaction_id.in_(ids))):
+        if owner is not None:
+            picks[(transaction_id, owner)].append((season, round_, original))
+            sides[transaction_id].add(owner)
+
+    drafted = {}                    # (season, round, original roster) -> (drafting roster, player)
+    last_moves = {}                 # (season, round, original roster, owner) -> (moment, latest trade to owner)
+    if picks:
+        seasons = {pick[0] for side_picks in picks.values() for pick in side_picks}
+        for season, round_, original, drafting, player in (
+                db.session.query(DraftPicks.season, DraftPicks.round, DraftPicks.original_roster_id,
+                                 DraftPicks.drafting_roster_id, DraftPicks.player_sleeper_id)
+                .filter(DraftPicks.type == 'rookie', DraftPicks.season.in_(seasons))
+                .order_by(DraftPicks.draft_pick_id)):
+            drafted[(season, round_, original)] = (drafting, player)  # a duplicated row resolves to the last
+
+        # Every completed trade moving these picks, not just the ones being scored
+        for transaction_id, season, round_, original, owner, year, week, created_at in (
+                db.session.query(TransactionDraftPicks.transaction_id, TransactionDraftPicks.season,
+                                 TransactionDraftPicks.round, TransactionDraftPicks.roster_id,
+                                 TransactionDraftPicks.owner_id, Transactions.year, Transactions.week,
+                                 Transactions.created_at)
+                .join(Transactions, Transactions.transaction_id == TransactionDraftPicks.transaction_id)
+                .filter(Transactions.type == 'trade', Transactions.status == 'complete',
+                        TransactionDraftPicks.season.in_(seasons))):
+            key = (season, round_, original, owner)
+            last_moves[key] = max(last_moves.get(key, ()), (_moment(year, week, created_at), transaction_id))
+
+    player_ids = {p for side_players in players.values() for p in side_players}
+    player_ids |= {player for _, player in drafted.values() if player}
+    stints = _Stints(list(player_ids))
+
+    scores = []
+    for transaction_id, rosters in sides.items():
+        since = trades[transaction_id]
+        for roster in rosters:
+            score = TradeScores(transaction_id=transaction_id, sleeper_roster_id=roster,
+                                points=0.0, starter_points=0.0, weeks=0,
+                                players=len(players[(transaction_id, roster)]),
+                                picks=len(picks[(transaction_id, roster)]), active=False)
+            credits = [stints.credit(player, roster, since) for player in players[(transaction_id, roster)]]
+            for pick in picks[(transaction_id, roster)]:
+                result = drafted.get(pick)
+                if result is None:
+                    score.active = True         # not drafted yet
+                elif result[0] == roster and result[1] and \
+                        last_moves.get((*pick, roster), (None, None))[1] == transaction_id:
+                    credits.append(stints.credit(result[1], roster, (pick[0], _PRESEASON, datetime.min)))
+            for points, starter_points, weeks, on_roster in credits:
+                score.points += points
+                score.starter_points += starter_points
+                score.weeks += weeks
+                score.active = score.active or on_roster
+            score.points = round(score.points, 2)
+            score.starter_points = round(score.starter_points, 2)
+            scores.append(score)
+    return scores
+
+
+def rebuild_trade_scores():
+    """Score every historical trade and commit."""
+    scores = _score()
+    TradeScores.query.delete()
+    db.session.add_all(scores)
+    db.session.commit()
+    invalidate('trade_scores')
+    logger.info(f'Trade scores rebuilt: {len(scores)} sides')
+    return {'success': True, 'sides': len(scores)}
+
+
+def refresh_trade_scores():
+    """
+    Re-score trades with a side still accruing, plus trades not scored yet.
+    Call after the week's PlayerWeeklyStats are written; the caller commits.
+    """
+    db.session.flush()
+    active = {t for (t,) in db.session.query(TradeScores.transaction_id).filter(TradeScores.active == True).distinct()}
+    unscored = {t for (t,) in (db.session.query(Transactions.transaction_id)
+                               .outerjoin(TradeScores, TradeScores.transaction_id == Transactions.transaction_id)
+                               .filter(Transactions.type == 'trade', Transactions.status == 'complete',
+                                       TradeScores.trade_score_id.is_(None)))}
+    transaction_ids = list(active | unscored)
+    if not transaction_ids:
+        return 0
+    scores = _score(transaction_ids)
+    TradeScores.query.filter(TradeScores.transaction_id.in_(transaction_ids)).delete(synchronize_session=False)
+    db.session.add_all(scores)
+    return len(transaction_ids)
+
+
+@memoize(ttl=3600, maxsize=1, stale_ttl=300, tags=('trade_scores', 'player_stats', 'transactions'))
+def _trade_score_map():
+    scores = defaultdict(dict)
+    for score in TradeScores.query:
+        scores[score.transaction_id][score.sleeper_roster_id] = score.serialize()
+    return dict(scores)
+
+
+def get_trade_scores(transaction_ids):
+    """
+    {transaction_id: {sleeper_roster_id: score dict}} for the given trades that
+    have been scored. Served from memory, so the warm trade-tree endpoints stay
+    free of SQL; the player-stats and transactions syncs drop the copy.
+    """
+    scores = _trade_score_map() if transaction_ids else {}
+    return {t: scores[t] for t in transaction_ids if t in scores}
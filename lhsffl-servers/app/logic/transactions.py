@@ -9,6 +9,10 @@ from app.models.transaction_players import TransactionPlayers
 from app.models.transaction_rosters import TransactionRosters
 from app.models.transaction_draft_picks import TransactionDraftPicks
 from app.models.transaction_waiver_budget import TransactionWaiverBudget
+from app.logic.superlatives import apply_transactions
+from app.logic.asset_lineage import apply_lineage, rebuild_asset_lineage
+from app.logic.pick_ownership import apply_pick_trades
+from app.logic.player_ownership import apply_player_ownership
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +27,26 @@ def _epoch_ms_to_datetime(epoch_ms):
     return datetime.fromtimestamp(int(epoch_ms) / 1000, tz=timezone.utc)
 
 
+def _apply_derived(transaction_ids):
+    """Fold freshly ingested transactions into the tables derived from them (caller commits)."""
+    apply_transactions(transaction_ids)
+    apply_lineage(transaction_ids)
+    apply_pick_trades(transaction_ids)
+    apply_player_ownership(transaction_ids)
+
+
+def _relink_lineage():
+    """
+    Backfilled transactions can predate ones already linked, which apply_lineage()
+    can't splice in, so relink the whole graph once a backfill finishes.
+    """
+    try:
+        rebuild_asset_lineage()
+    except Exception as e:
+        logger.error(f'Asset lineage rebuild failed: {e}')
+        db.session.rollback()
+
+
 def _process_transaction(txn_data, year, week, league_id):
     """
     Process a single transaction dict from the Sleeper API.
@@ -149,12 +173,14 @@ def synchronize_transactions():
         response.raise_for_status()
         txn_list = response.json() or []
 
-        added_count = 0
+        added_ids = []
         for txn_data in txn_list:
             result = _process_transaction(txn_data, year, week, league_id)
             if result:
-                added_count += 1
+                added_ids.append(result.transaction_id)
+        added_count = len(added_ids)
 
+        _apply_derived(added_ids)
         db.session.commit()
         logger.info(f'Transaction sync complete: {added_count} new transactions for week {week}')
         return {'success': True, 'added_count': added_count, 'week': week, 'year': year}
@@ -189,12 +215,14 @@ def backfill_all_transactions():
                 response.raise_for_status()
                 txn_list = response.json() or []
 
-                week_added = 0
+                week_ids = []
                 for txn_data in txn_list:
                     result = _process_transaction(txn_data, year, week, league_id)
                     if result:
-                        week_added += 1
+                        week_ids.append(result.transaction_id)
+                week_added = len(week_ids)
 
+                _apply_derived(week_ids)
                 db.session.commit()
                 total_added += week_added
 
@@ -213,6 +241,7 @@ def backfill_all_transactions():
                 db.session.rollback()
                 continue
 
+    _relink_lineage()
     logger.info(f'Backfill complete: {total_added} total transactions added')
     return {'success': True, 'total_added': total_added}
 
@@ -233,12 +262,14 @@ def backfill_week_zero():
             response.raise_for_status()
             txn_list = response.json() or []
 
-            week_added = 0
+            week_ids = []
             for txn_data in txn_list:
                 result = _process_transaction(txn_data, year, 0, league_id)
                 if result:
-                    week_added += 1
+                    week_ids.append(result.transaction_id)
+            week_added = len(week_ids)
 
+            _apply_derived(week_ids)
             db.session.commit()
             total_added += week_added
 
@@ -258,5 +289,6 @@ def backfill_week_zero():
             db.session.rollback()
             continue
 
+    _relink_lineage()
     logger.info(f'Week 0 backfill complete: {total_added} total transactions added')
     return {'success': True, 'total_added': total_added}
@@ -0,0 +1,180 @@
+"""
+Process-local memoization for derived, read-heavy data.
+
+    @memoize(ttl=3600, tags=('transactions',))
+    def expensive(arg): ...
+
+    invalidate('transactions')   # after a sync step touches that data
+
+Each decorated function keeps its own LRU of results keyed by its arguments.
+Entries are fresh for `ttl` seconds; for a further `stale_ttl` seconds an
+expired entry is still served while exactly one caller recomputes it
+(stale-while-revalidate). With no usable entry, concurrent callers for the same
+key wait on a single computation instead of all running it (single-flight).
+
+Invalidation is by tag. SyncService fires the tag matching each sync item
+(see SyncService.record_sync_status), so results derived from that data are
+dropped as soon as it changes. Invalidation only reaches the current process;
+the TTL bounds staleness in any other worker.
+"""
+
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from functools import wraps
+
+# tag -> memoized functions that depend on it
+_registry = defaultdict(list)
+_registry_lock = threading.Lock()
+
+
+def _freeze(value):
+    """Make list/dict/set arguments usable as part of a cache key."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+
+class _Entry:
+    __slots__ = ('value', 'fresh_until', 'stale_until')
+
+    def __init__(self, value, fresh_until, stale_until):
+        self.value = value
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+class _Flight:
+    """Single-flight lock for one key, shared by the callers currently waiting on it."""
+    __slots__ = ('lock', 'users')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.users = 0
+
+
+class Memo:
+    """The cache behind one @memoize-decorated function."""
+
+    def __init__(self, fn, ttl, maxsize, stale_ttl):
+        self.fn = fn
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.stale_ttl = stale_ttl
+        self._entries = OrderedDict()
+        self._flights = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        key = _freeze((args, kwargs))
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now < entry.fresh_until:
+                self._entries.move_to_end(key)
+                return entry.value
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+            flight.users += 1
+
+        try:
+            if entry is not None and now < entry.stale_until:
+                # Stale: one caller refreshes, everyone else keeps the old value meanwhile.
+                if not flight.lock.acquire(blocking=False):
+                    return entry.value
+                try:
+                    return self._compute(key, args, kwargs)
+                finally:
+                    flight.lock.release()
+
+            with flight.lock:
+                # Whoever held the flight before us may have just filled the entry.
+                with self._lock:
+                    entry = self._entries.get(key)
+                    if entry is not None and time.monotonic() < entry.fresh_until:
+                        self._entries.move_to_end(key)
+                        return entry.value
+                return self._compute(key, args, kwargs)
+        finally:
+            # The last caller out drops the flight, whether the computation was kept,
+            # discarded by an invalidation, or raised.
+            with self._lock:
+                flight.users -= 1
+                if not flight.users and self._flights.get(key) is flight:
+                    del self._flights[key]
+
+    def _compute(self, key, args, kwargs):
+        with self._lock:
+            generation = self._generation
+        value = self.fn(*args, **kwargs)
+        now = time.monotonic()
+        with self._lock:
+            # An invalidation that landed mid-computation means the value may
+            # predate the change: hand it to this caller but don't keep it.
+            if generation == self._generation:
+                self._entries[key] = _Entry(value, now + self.ttl, now + self.ttl + self.stale_ttl)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def memoize(ttl, maxsize=128, stale_ttl=0, tags=()):
+    """
+    Decorator: cache results per argument tuple.
+
+    Args:
+        ttl        Seconds an entry is served without recomputing.
+        maxsize    Entries kept before the least recently used is evicted.
+        stale_ttl  Extra seconds an expired entry may be served while one caller refreshes it.
+        tags       Names passed to invalidate() that should drop this cache.
+
+    Cached values are shared between callers and must not be mutated.
+    The decorated function gains .invalidate() and .memo attributes.
+    """
+    def decorator(fn):
+        memo = Memo(fn, ttl, maxsize, stale_ttl)
+        with _registry_lock:
+            for tag in tags:
+                _registry[tag].append(memo)
+            _registry[None].append(memo)
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            return memo(*args, **kwargs)
+
+        wrapper.invalidate = memo.clear
+        wrapper.memo = memo
+        return wrapper
+    return decorator
+
+
+def invalidate(*tags):
+    """Drop every cache registered under any of the given tags."""
+    with _registry_lock:
+        memos = {id(m): m for tag in tags for m in _registry.get(tag, ())}
+    for memo in memos.values():
+        memo.clear()
+
+
+def invalidate_all():
+    """Drop every memoized cache in the process."""
+    with _registry_lock:
+        memos = list(_registry[None])
+    for memo in memos:
+        memo.clear()
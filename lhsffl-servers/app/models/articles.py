@@ -9,11 +9,15 @@ from app.models.schemas.articles import ArticlesJSONSchema
 from app.models.article_teams import ArticleTeams
 from app.models.teams import Teams
 from app.models.league_state import LeagueState
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, selectinload
+from app.logic.pagination import keyset_page, DEFAULT_PAGE_SIZE
 
 
 class Articles(db.Model):
     __tablename__ = 'Articles'
+    __table_args__ = (
+        db.Index('ix_articles_published_created', 'published', 'creation_date', 'article_id'),
+    )
 
     article_id = db.Column(db.Integer(), nullable=False, primary_key=True)
 
@@ -36,6 +40,19 @@ class Articles(db.Model):
     def serialize(self):
         return ArticlesJSONSchema().dump(self)
 
+    @classmethod
+    def get_latest(cls, limit=5):
+        """The newest published articles."""
+        return cls.query.filter(cls.published == True).order_by(cls.creation_date.desc()).limit(limit).all()
+
+    @classmethod
+    def get_published_page(cls, cursor=None, limit=DEFAULT_PAGE_SIZE):
+        """One newest-first page of published articles. Returns (articles, next_cursor)."""
+        query = cls.query.filter(cls.published == True).options(
+            selectinload(cls.article_teams).selectinload(ArticleTeams.team)
+        )
+        return keyset_page(query, cls.creation_date, cls.article_id, cursor=cursor, limit=limit)
+
     @staticmethod
     def generate_pregame_report(matchup):
         '''
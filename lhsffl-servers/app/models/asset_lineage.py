@@ -0,0 +1,47 @@
+from app import db
+from app.models.schemas.asset_lineage import AssetLineageJSONSchema
+
+
+class AssetLineage(db.Model):
+    """
+    One edge per asset acquisition: roster `sleeper_roster_id` acquired the asset
+    (a player, or a pick identified by season/round/original roster) in
+    `acquired_transaction_id`, and gave it up again in `released_transaction_id`
+    (NULL while still held). Maintained by app.logic.asset_lineage.
+    """
+    __tablename__ = 'AssetLineage'
+    __table_args__ = (
+        db.Index('ix_asset_lineage_acquired', 'acquired_transaction_id'),
+        db.Index('ix_asset_lineage_open', 'sleeper_roster_id', 'released_transaction_id'),
+    )
+
+    asset_lineage_id = db.Column(db.Integer(), primary_key=True, autoincrement=True)
+
+    acquired_transaction_id = db.Column(db.Integer(), db.ForeignKey('Transactions.transaction_id'), nullable=False)
+
+    # Denormalized Transactions.created_at of the acquisition, for ordering releases
+    acquired_at = db.Column(db.DateTime(), nullable=False)
+
+    sleeper_roster_id = db.Column(db.Integer(), nullable=False)
+
+    asset_type = db.Column(db.Enum('player', 'pick'), nullable=False)
+
+    player_sleeper_id = db.Column(db.Integer(), nullable=True)
+
+    pick_season = db.Column(db.Integer(), nullable=True)
+
+    pick_round = db.Column(db.Integer(), nullable=True)
+
+    pick_roster_id = db.Column(db.Integer(), nullable=True)
+
+    released_transaction_id = db.Column(db.Integer(), db.ForeignKey('Transactions.transaction_id'), nullable=True)
+
+    @property
+    def asset(self):
+        """Hashable asset identity: ('player', id) or ('pick', season, round, original roster)."""
+        if self.asset_type == 'player':
+            return ('player', self.player_sleeper_id)
+        return ('pick', self.pick_season, self.pick_round, self.pick_roster_id)
+
+    def serialize(self):
+        return AssetLineageJSONSchema().dump(self)
@@ -0,0 +1,49 @@
+from app import db
+from app.models.schemas.league_records import LeagueRecordsJSONSchema
+
+
+class LeagueRecords(db.Model):
+    """
+    One ranked entry of the league record book (highest score, biggest blowout,
+    best season, ...). Each category keeps its top entries, maintained by
+    app.logic.record_book as matchups and player stats are synced.
+    """
+    __tablename__ = 'LeagueRecords'
+    __table_args__ = (
+        db.UniqueConstraint('category', 'rank', name='uq_league_record_rank'),
+    )
+
+    league_record_id = db.Column(db.Integer(), primary_key=True, autoincrement=True)
+
+    category = db.Column(db.String(32), nullable=False)
+
+    # 1-based position within the category
+    rank = db.Column(db.Integer(), nullable=False)
+
+    # What the category ranks by: points, margin or win percentage
+    value = db.Column(db.Float(), nullable=False)
+
+    year = db.Column(db.Integer(), nullable=False)
+
+    # Null for season records
+    week = db.Column(db.Integer(), nullable=True)
+
+    sleeper_roster_id = db.Column(db.Integer(), nullable=False)
+
+    opponent_sleeper_roster_id = db.Column(db.Integer(), nullable=True)
+
+    player_sleeper_id = db.Column(db.Integer(), nullable=True)
+
+    points_for = db.Column(db.Float(), nullable=True)
+
+    points_against = db.Column(db.Float(), nullable=True)
+
+    # Season records only
+    wins = db.Column(db.Integer(), nullable=True)
+
+    losses = db.Column(db.Integer(), nullable=True)
+
+    ties = db.Column(db.Integer(), nullable=True)
+
+    def serialize(self):
+        return LeagueRecordsJSONSchema().dump(self)
@@ -0,0 +1,22 @@
+from app import db
+
+
+class LeagueSeasons(db.Model):
+    """
+    One season's Sleeper league and the league settings derived tables depend on.
+    Written by the playoffs backfill (app.logic.history).
+    """
+    __tablename__ = 'LeagueSeasons'
+
+    year = db.Column(db.Integer(), primary_key=True, autoincrement=False)
+
+    sleeper_league_id = db.Column(db.String(32), nullable=False)
+
+    # First playoff week (Sleeper settings.playoff_week_start)
+    playoff_week_start = db.Column(db.Integer(), nullable=True)
+
+    @classmethod
+    def playoff_week_starts(cls):
+        """{year: first playoff week} for every season whose league reported one."""
+        return {year: week for year, week in db.session.query(cls.year, cls.playoff_week_start)
+                if week is not None}
@@ -0,0 +1,35 @@
+from app import db
+from app.models.schemas.lineup_efficiency import LineupEfficiencyJSONSchema
+
+
+class LineupEfficiency(db.Model):
+    """
+    One roster-week's started points against its best possible lineup from the
+    same players. Derived from PlayerWeeklyStats by app.logic.lineup_efficiency.
+    """
+    __tablename__ = 'LineupEfficiency'
+    __table_args__ = (
+        db.UniqueConstraint('year', 'week', 'sleeper_roster_id', name='uq_lineup_efficiency_week'),
+        db.Index('idx_lineup_efficiency_roster_year', 'sleeper_roster_id', 'year'),
+    )
+
+    lineup_efficiency_id = db.Column(db.Integer(), primary_key=True, autoincrement=True)
+
+    year = db.Column(db.Integer(), nullable=False)
+
+    week = db.Column(db.Integer(), nullable=False)
+
+    sleeper_roster_id = db.Column(db.Integer(), nullable=False)
+
+    actual_points = db.Column(db.Float(), nullable=False, default=0)
+
+    optimal_points = db.Column(db.Float(), nullable=False, default=0)
+
+    # optimal_points - actual_points: what was left on the bench
+    points_left = db.Column(db.Float(), nullable=False, default=0)
+
+    # actual_points / optimal_points (1.0 for a perfect lineup)
+    efficiency = db.Column(db.Float(), nullable=False, default=1)
+
+    def serialize(self):
+        return LineupEfficiencyJSONSchema().dump(self)
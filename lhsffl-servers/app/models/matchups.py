@@ -32,3 +32,12 @@ class Matchups(db.Model):
 
     def serialize(self):
         return MatchupsJSONSchema().dump(self)
+
+    @classmethod
+    def get_week(cls, year, week):
+        """One row per Sleeper matchup in a week (each matchup is stored once per side)."""
+        rows = cls.query \
+            .filter_by(week=week, year=year) \
+            .order_by(cls.sleeper_matchup_id) \
+            .all()
+        return list({matchup.sleeper_matchup_id: matchup for matchup in rows}.values())
@@ -0,0 +1,32 @@
+from app import db
+from app.models.schemas.pick_ownership import PickOwnershipJSONSchema
+
+
+class PickOwnership(db.Model):
+    """
+    Current owner of each traded draft pick, identified by (season, round,
+    original_roster_id). Picks that were never traded have no row and belong to
+    their original roster. Maintained by app.logic.pick_ownership.
+    """
+    __tablename__ = 'PickOwnership'
+    __table_args__ = (
+        db.UniqueConstraint('season', 'round', 'original_roster_id', name='uq_pick_ownership_pick'),
+    )
+
+    pick_ownership_id = db.Column(db.Integer(), primary_key=True, autoincrement=True)
+
+    season = db.Column(db.Integer(), nullable=False)
+
+    round = db.Column(db.Integer(), nullable=False)
+
+    original_roster_id = db.Column(db.Integer(), nullable=False)
+
+    owner_roster_id = db.Column(db.Integer(), nullable=False)
+
+    # The trade that last moved the pick, and its Transactions.created_at
+    transaction_id = db.Column(db.Integer(), db.ForeignKey('Transactions.transaction_id'), nullable=False)
+
+    changed_at = db.Column(db.DateTime(), nullable=False)
+
+    def serialize(self):
+        return PickOwnershipJSONSchema().dump(self)
@@ -0,0 +1,35 @@
+from app import db
+from app.models.schemas.pick_ownership_history import PickOwnershipHistoryJSONSchema
+
+
+class PickOwnershipHistory(db.Model):
+    """
+    One row per completed pick move: the pick changed hands from
+    `previous_owner_roster_id` to `owner_roster_id` at `changed_at`. The owner as
+    of any moment is the latest row at or before it (see app.logic.pick_ownership).
+    """
+    __tablename__ = 'PickOwnershipHistory'
+    __table_args__ = (
+        db.UniqueConstraint('transaction_id', 'season', 'round', 'original_roster_id',
+                            name='uq_pick_ownership_history_move'),
+        db.Index('ix_pick_ownership_history_pick', 'season', 'round', 'original_roster_id', 'changed_at'),
+    )
+
+    pick_ownership_history_id = db.Column(db.Integer(), primary_key=True, autoincrement=True)
+
+    season = db.Column(db.Integer(), nullable=False)
+
+    round = db.Column(db.Integer(), nullable=False)
+
+    original_roster_id = db.Column(db.Integer(), nullable=False)
+
+    owner_roster_id = db.Column(db.Integer(), nullable=False)
+
+    previous_owner_roster_id = db.Column(db.Integer(), nullable=True)
+
+    transaction_id = db.Column(db.Integer(), db.ForeignKey('Transactions.transaction_id'), nullable=False)
+
+    changed_at = db.Column(db.DateTime(), nullable=False)
+
+    def serialize(self):
+        return PickOwnershipHistoryJSONSchema().dump(self)
@@ -0,0 +1,38 @@
+from app import db
+from app.models.player_season_stats import PointsRollupMixin
+from app.models.schemas.player_career_stats import PlayerCareerStatsJSONSchema
+
+
+class PlayerCareerStats(PointsRollupMixin, db.Model):
+    """
+    One player's weekly league-scored points rolled up across every season and
+    roster. Derived from PlayerSeasonStats by app.logic.player_stats.
+    """
+    __tablename__ = 'PlayerCareerStats'
+
+    player_sleeper_id = db.Column(db.Integer(), primary_key=True, autoincrement=False)
+
+    seasons = db.Column(db.Integer(), nullable=False, default=0)
+
+    first_year = db.Column(db.Integer(), nullable=True)
+
+    last_year = db.Column(db.Integer(), nullable=True)
+
+    games = db.Column(db.Integer(), nullable=False, default=0)
+
+    starts = db.Column(db.Integer(), nullable=False, default=0)
+
+    total_points = db.Column(db.Float(), nullable=False, default=0)
+
+    starter_points = db.Column(db.Float(), nullable=False, default=0)
+
+    sum_squares = db.Column(db.Float(), nullable=False, default=0)
+
+    best_points = db.Column(db.Float(), nullable=False, default=0)
+
+    best_year = db.Column(db.Integer(), nullable=True)
+
+    best_week = db.Column(db.Integer(), nullable=True)
+
+    def serialize(self):
+        return PlayerCareerStatsJSONSchema().dump(self)
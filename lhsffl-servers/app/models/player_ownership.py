@@ -0,0 +1,29 @@
+from app import db
+
+
+class PlayerOwnership(db.Model):
+    """
+    One roster's hold on a player over [started_at, ended_at). started_at is NULL
+    when the player was already there before the recorded history (a drop with no
+    recorded add); ended_at is NULL while the roster still holds the player.
+    Maintained by app.logic.player_ownership.
+    """
+    __tablename__ = 'PlayerOwnership'
+    __table_args__ = (
+        db.Index('ix_player_ownership_player', 'player_sleeper_id', 'started_at'),
+    )
+
+    player_ownership_id = db.Column(db.Integer(), primary_key=True, autoincrement=True)
+
+    player_sleeper_id = db.Column(db.Integer(), nullable=False)
+
+    sleeper_roster_id = db.Column(db.Integer(), nullable=False)
+
+    started_at = db.Column(db.DateTime(), nullable=True)
+
+    ended_at = db.Column(db.DateTime(), nullable=True)
+
+    # The transactions that added and dropped the player (NULL where started_at / ended_at are)
+    acquired_transaction_id = db.Column(db.Integer(), db.ForeignKey('Transactions.transaction_id'), nullable=True)
+
+    released_transaction_id = db.Column(db.Integer(), db.ForeignKey('Transactions.transaction_id'), nullable=True)
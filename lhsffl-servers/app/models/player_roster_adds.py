@@ -0,0 +1,22 @@
+from app import db
+from app.models.schemas.player_roster_adds import PlayerRosterAddsJSONSchema
+
+
+class PlayerRosterAdds(db.Model):
+    """How many times each roster has added each player, across every complete transaction."""
+    __tablename__ = 'PlayerRosterAdds'
+    __table_args__ = (
+        db.UniqueConstraint('player_sleeper_id', 'sleeper_roster_id', name='uq_player_roster_add'),
+        db.Index('ix_player_roster_adds_times', 'times_added'),
+    )
+
+    player_roster_add_id = db.Column(db.Integer(), primary_key=True, autoincrement=True)
+
+    player_sleeper_id = db.Column(db.Integer(), nullable=False)
+
+    sleeper_roster_id = db.Column(db.Integer(), nullable=False)
+
+    times_added = db.Column(db.Integer(), nullable=False, default=0)
+
+    def serialize(self):
+        return PlayerRosterAddsJSONSchema().dump(self)
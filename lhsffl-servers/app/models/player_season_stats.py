@@ -0,0 +1,58 @@
+import math
+
+from app import db
+from app.models.schemas.player_season_stats import PlayerSeasonStatsJSONSchema
+
+
+class PointsRollupMixin:
+    """Mean / standard deviation of weekly points from the stored count, sum and sum of squares."""
+
+    @property
+    def mean_points(self):
+        return round(self.total_points / self.games, 2) if self.games else 0.0
+
+    @property
+    def std_dev_points(self):
+        if not self.games:
+            return 0.0
+        mean = self.total_points / self.games
+        return round(math.sqrt(max(self.sum_squares / self.games - mean * mean, 0.0)), 2)
+
+
+class PlayerSeasonStats(PointsRollupMixin, db.Model):
+    """
+    One player's weekly league-scored points rolled up per season and roster
+    (a player traded mid-season has one row per roster). Derived from
+    PlayerWeeklyStats by app.logic.player_stats.
+    """
+    __tablename__ = 'PlayerSeasonStats'
+    __table_args__ = (
+        db.UniqueConstraint('player_sleeper_id', 'year', 'sleeper_roster_id', name='uq_player_season_roster'),
+    )
+
+    player_season_stat_id = db.Column(db.Integer(), primary_key=True, autoincrement=True)
+
+    player_sleeper_id = db.Column(db.Integer(), nullable=False)
+
+    year = db.Column(db.Integer(), nullable=False)
+
+    sleeper_roster_id = db.Column(db.Integer(), nullable=False)
+
+    # Weeks with a score on this roster, and how many of them in the starting lineup
+    games = db.Column(db.Integer(), nullable=False, default=0)
+
+    starts = db.Column(db.Integer(), nullable=False, default=0)
+
+    total_points = db.Column(db.Float(), nullable=False, default=0)
+
+    starter_points = db.Column(db.Float(), nullable=False, default=0)
+
+    # Sum of squared weekly points, so std dev can be derived (and combined across rows)
+    sum_squares = db.Column(db.Float(), nullable=False, default=0)
+
+    best_points = db.Column(db.Float(), nullable=False, default=0)
+
+    best_week = db.Column(db.Integer(), nullable=True)
+
+    def serialize(self):
+        return PlayerSeasonStatsJSONSchema().dump(self)
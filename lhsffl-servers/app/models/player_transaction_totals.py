@@ -0,0 +1,25 @@
+from app import db
+from app.models.schemas.player_transaction_totals import PlayerTransactionTotalsJSONSchema
+
+
+class PlayerTransactionTotals(db.Model):
+    """Per-player transaction counters, maintained as transactions are ingested."""
+    __tablename__ = 'PlayerTransactionTotals'
+    __table_args__ = (
+        db.Index('ix_player_txn_totals_trades', 'trade_count'),
+        db.Index('ix_player_txn_totals_teams', 'team_count'),
+        db.Index('ix_player_txn_totals_drops', 'drop_count'),
+    )
+
+    player_sleeper_id = db.Column(db.Integer(), primary_key=True, autoincrement=False)
+
+    # Distinct complete trades the player moved in
+    trade_count = db.Column(db.Integer(), nullable=False, default=0)
+
+    # Distinct rosters that have added the player (rows in PlayerRosterAdds)
+    team_count = db.Column(db.Integer(), nullable=False, default=0)
+
+    drop_count = db.Column(db.Integer(), nullable=False, default=0)
+
+    def serialize(self):
+        return PlayerTransactionTotalsJSONSchema().dump(self)
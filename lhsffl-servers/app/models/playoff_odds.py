@@ -0,0 +1,51 @@
+from datetime import datetime
+from app import db
+from app.models.schemas.playoff_odds import PlayoffOddsJSONSchema
+
+
+class PlayoffOdds(db.Model):
+    """
+    One roster's simulated playoff odds as of a given week. Written after each
+    matchups sync by app.logic.playoff_odds.
+    """
+    __tablename__ = 'PlayoffOdds'
+    __table_args__ = (
+        db.UniqueConstraint('year', 'week', 'sleeper_roster_id', name='uq_playoff_odds_week'),
+    )
+
+    playoff_odds_id = db.Column(db.Integer(), primary_key=True, autoincrement=True)
+
+    year = db.Column(db.Integer(), nullable=False)
+
+    week = db.Column(db.Integer(), nullable=False)
+
+    sleeper_roster_id = db.Column(db.Integer(), nullable=False)
+
+    simulations = db.Column(db.Integer(), nullable=False)
+
+    # Share of simulated seasons finishing in a playoff spot / as the top seed
+    playoff_odds = db.Column(db.Float(), nullable=False, default=0)
+
+    top_seed_odds = db.Column(db.Float(), nullable=False, default=0)
+
+    projected_wins = db.Column(db.Float(), nullable=False, default=0)
+
+    average_seed = db.Column(db.Float(), nullable=False, default=0)
+
+    computed_at = db.Column(db.DateTime(), nullable=False, default=datetime.utcnow)
+
+    @classmethod
+    def get_week(cls, year, week):
+        """A week's odds, most likely playoff teams first."""
+        return cls.query.filter_by(year=year, week=week) \
+            .order_by(cls.playoff_odds.desc(), cls.average_seed) \
+            .all()
+
+    @classmethod
+    def get_latest(cls, year):
+        """The odds from the latest simulated week of a season (empty if none)."""
+        latest = cls.query.filter_by(year=year).order_by(cls.week.desc()).first()
+        return cls.get_week(year, latest.week) if latest else []
+
+    def serialize(self):
+        return PlayoffOddsJSONSchema().dump(self)
@@ -0,0 +1,72 @@
+import struct
+from datetime import datetime
+from app import db
+from app.models.schemas.roster_snapshots import RosterSnapshotsJSONSchema
+
+
+class RosterSnapshots(db.Model):
+    """
+    One roster as it stood in a given week. `player_ids` packs the players'
+    Sleeper IDs as big-endian uint32s; `starter_mask` and `taxi_mask` are
+    little-endian bitmasks over that array (bit i flags player i).
+    Written by app.logic.roster_snapshots.
+    """
+    __tablename__ = 'RosterSnapshots'
+    __table_args__ = (
+        db.UniqueConstraint('year', 'week', 'sleeper_roster_id', name='uq_roster_snapshot_week'),
+    )
+
+    roster_snapshot_id = db.Column(db.Integer(), primary_key=True, autoincrement=True)
+
+    year = db.Column(db.Integer(), nullable=False)
+
+    week = db.Column(db.Integer(), nullable=False)
+
+    sleeper_roster_id = db.Column(db.Integer(), nullable=False)
+
+    player_ids = db.Column(db.LargeBinary(), nullable=False, default=b'')
+
+    starter_mask = db.Column(db.LargeBinary(), nullable=False, default=b'')
+
+    taxi_mask = db.Column(db.LargeBinary(), nullable=False, default=b'')
+
+    # 'sync' rows come from the live roster sync; 'backfill' rows were rebuilt from PlayerWeeklyStats
+    source = db.Column(db.Enum('sync', 'backfill'), nullable=False, default='sync')
+
+    captured_at = db.Column(db.DateTime(), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def set_roster(self, player_ids, starter_ids=(), taxi_ids=()):
+        """Pack a roster: ordered player IDs plus the subsets that started / sit on taxi."""
+        player_ids = list(player_ids)
+        starters, taxi = set(starter_ids), set(taxi_ids)
+        self.player_ids = struct.pack(f'>{len(player_ids)}I', *player_ids)
+        self.starter_mask = self._mask(player_ids, starters)
+        self.taxi_mask = self._mask(player_ids, taxi)
+
+    @staticmethod
+    def _mask(player_ids, members):
+        bits = 0
+        for i, player_id in enumerate(player_ids):
+            if player_id in members:
+                bits |= 1 << i
+        return bits.to_bytes((len(player_ids) + 7) // 8, 'little')
+
+    def _flagged(self, mask):
+        bits = int.from_bytes(mask or b'', 'little')
+        return [player_id for i, player_id in enumerate(self.player_sleeper_ids) if bits >> i & 1]
+
+    @property
+    def player_sleeper_ids(self):
+        blob = self.player_ids or b''
+        return list(struct.unpack(f'>{len(blob) // 4}I', blob))
+
+    @property
+    def starter_sleeper_ids(self):
+        return self._flagged(self.starter_mask)
+
+    @property
+    def taxi_sleeper_ids(self):
+        return self._flagged(self.taxi_mask)
+
+    def serialize(self):
+        return RosterSnapshotsJSONSchema().dump(self)
@@ -0,0 +1,14 @@
+from marshmallow import Schema, fields
+
+
+class AssetLineageJSONSchema(Schema):
+    asset_lineage_id = fields.Int()
+    acquired_transaction_id = fields.Int()
+    acquired_at = fields.DateTime()
+    sleeper_roster_id = fields.Int()
+    asset_type = fields.Str()
+    player_sleeper_id = fields.Int(allow_none=True)
+    pick_season = fields.Int(allow_none=True)
+    pick_round = fields.Int(allow_none=True)
+    pick_roster_id = fields.Int(allow_none=True)
+    released_transaction_id = fields.Int(allow_none=True)
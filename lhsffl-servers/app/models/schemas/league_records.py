@@ -0,0 +1,16 @@
+from marshmallow import Schema, fields
+
+
+class LeagueRecordsJSONSchema(Schema):
+    rank = fields.Int()
+    value = fields.Float()
+    year = fields.Int()
+    week = fields.Int(allow_none=True)
+    sleeper_roster_id = fields.Int()
+    opponent_sleeper_roster_id = fields.Int(allow_none=True)
+    player_sleeper_id = fields.Int(allow_none=True)
+    points_for = fields.Float(allow_none=True)
+    points_against = fields.Float(allow_none=True)
+    wins = fields.Int(allow_none=True)
+    losses = fields.Int(allow_none=True)
+    ties = fields.Int(allow_none=True)
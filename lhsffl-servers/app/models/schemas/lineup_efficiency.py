@@ -0,0 +1,11 @@
+from marshmallow import Schema, fields
+
+
+class LineupEfficiencyJSONSchema(Schema):
+    year = fields.Int()
+    week = fields.Int()
+    sleeper_roster_id = fields.Int()
+    actual_points = fields.Float()
+    optimal_points = fields.Float()
+    points_left = fields.Float()
+    efficiency = fields.Float()
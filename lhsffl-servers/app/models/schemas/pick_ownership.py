@@ -0,0 +1,11 @@
+from marshmallow import Schema, fields
+
+
+class PickOwnershipJSONSchema(Schema):
+    pick_ownership_id = fields.Int()
+    season = fields.Int()
+    round = fields.Int()
+    original_roster_id = fields.Int()
+    owner_roster_id = fields.Int()
+    transaction_id = fields.Int()
+    changed_at = fields.DateTime()
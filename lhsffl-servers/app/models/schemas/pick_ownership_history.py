@@ -0,0 +1,12 @@
+from marshmallow import Schema, fields
+
+
+class PickOwnershipHistoryJSONSchema(Schema):
+    pick_ownership_history_id = fields.Int()
+    season = fields.Int()
+    round = fields.Int()
+    original_roster_id = fields.Int()
+    owner_roster_id = fields.Int()
+    previous_owner_roster_id = fields.Int(allow_none=True)
+    transaction_id = fields.Int()
+    changed_at = fields.DateTime()
@@ -0,0 +1,17 @@
+from marshmallow import Schema, fields
+
+
+class PlayerCareerStatsJSONSchema(Schema):
+    player_sleeper_id = fields.Int()
+    seasons = fields.Int()
+    first_year = fields.Int()
+    last_year = fields.Int()
+    games = fields.Int()
+    starts = fields.Int()
+    total_points = fields.Float()
+    starter_points = fields.Float()
+    mean_points = fields.Float()
+    std_dev_points = fields.Float()
+    best_points = fields.Float()
+    best_year = fields.Int()
+    best_week = fields.Int()
@@ -0,0 +1,8 @@
+from marshmallow import Schema, fields
+
+
+class PlayerRosterAddsJSONSchema(Schema):
+    player_roster_add_id = fields.Int()
+    player_sleeper_id = fields.Int()
+    sleeper_roster_id = fields.Int()
+    times_added = fields.Int()
@@ -0,0 +1,15 @@
+from marshmallow import Schema, fields
+
+
+class PlayerSeasonStatsJSONSchema(Schema):
+    player_sleeper_id = fields.Int()
+    year = fields.Int()
+    sleeper_roster_id = fields.Int()
+    games = fields.Int()
+    starts = fields.Int()
+    total_points = fields.Float()
+    starter_points = fields.Float()
+    mean_points = fields.Float()
+    std_dev_points = fields.Float()
+    best_points = fields.Float()
+    best_week = fields.Int()
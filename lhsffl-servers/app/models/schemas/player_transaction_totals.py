@@ -0,0 +1,8 @@
+from marshmallow import Schema, fields
+
+
+class PlayerTransactionTotalsJSONSchema(Schema):
+    player_sleeper_id = fields.Int()
+    trade_count = fields.Int()
+    team_count = fields.Int()
+    drop_count = fields.Int()
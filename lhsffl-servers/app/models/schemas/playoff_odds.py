@@ -0,0 +1,13 @@
+from marshmallow import Schema, fields
+
+
+class PlayoffOddsJSONSchema(Schema):
+    year = fields.Int()
+    week = fields.Int()
+    sleeper_roster_id = fields.Int()
+    simulations = fields.Int()
+    playoff_odds = fields.Float()
+    top_seed_odds = fields.Float()
+    projected_wins = fields.Float()
+    average_seed = fields.Float()
+    computed_at = fields.DateTime()
@@ -0,0 +1,13 @@
+from marshmallow import Schema, fields
+
+
+class RosterSnapshotsJSONSchema(Schema):
+    roster_snapshot_id = fields.Int()
+    year = fields.Int()
+    week = fields.Int()
+    sleeper_roster_id = fields.Int()
+    player_sleeper_ids = fields.List(fields.Int())
+    starter_sleeper_ids = fields.List(fields.Int())
+    taxi_sleeper_ids = fields.List(fields.Int())
+    source = fields.Str()
+    captured_at = fields.DateTime()
@@ -0,0 +1,8 @@
+from marshmallow import Schema, fields
+
+
+class TeamTransactionTotalsJSONSchema(Schema):
+    sleeper_roster_id = fields.Int()
+    trade_count = fields.Int()
+    pickup_count = fields.Int()
+    picks_traded = fields.Int()
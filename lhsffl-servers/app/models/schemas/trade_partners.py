@@ -0,0 +1,8 @@
+from marshmallow import Schema, fields
+
+
+class TradePartnersJSONSchema(Schema):
+    trade_partner_id = fields.Int()
+    roster_id_1 = fields.Int()
+    roster_id_2 = fields.Int()
+    trade_count = fields.Int()
@@ -0,0 +1,12 @@
+from marshmallow import Schema, fields
+
+
+class TradeScoresJSONSchema(Schema):
+    transaction_id = fields.Int()
+    sleeper_roster_id = fields.Int()
+    points = fields.Float()
+    starter_points = fields.Float()
+    weeks = fields.Int()
+    players = fields.Int()
+    picks = fields.Int()
+    active = fields.Bool()
@@ -0,0 +1,21 @@
+from app import db
+from app.models.schemas.team_transaction_totals import TeamTransactionTotalsJSONSchema
+
+
+class TeamTransactionTotals(db.Model):
+    """Per-roster transaction counters, maintained as transactions are ingested."""
+    __tablename__ = 'TeamTransactionTotals'
+
+    sleeper_roster_id = db.Column(db.Integer(), primary_key=True, autoincrement=False)
+
+    # Distinct complete trades the roster was part of
+    trade_count = db.Column(db.Integer(), nullable=False, default=0)
+
+    # Players added through waivers or free agency
+    pickup_count = db.Column(db.Integer(), nullable=False, default=0)
+
+    # Draft picks traded away (previous_owner_id on a traded pick)
+    picks_traded = db.Column(db.Integer(), nullable=False, default=0)
+
+    def serialize(self):
+        return TeamTransactionTotalsJSONSchema().dump(self)
@@ -5,7 +5,7 @@ from app.models.team_records import TeamRecords
 from app.models.league_state import LeagueState
 from app.models.schemas.teams import TeamsJSONSchema
 
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, selectinload
 from sqlalchemy.ext.associationproxy import association_proxy
 from functools import cached_property
 
@@ -42,6 +42,52 @@ class Teams(db.Model):
 
     def serialize(self):
         return TeamsJSONSchema().dump(self)
+
+    @classmethod
+    def get_standings(cls, year):
+        """Teams with a record for `year`, best record first (wins, then points for)."""
+        return cls.query \
+            .join(TeamRecords, cls.team_id == TeamRecords.team_id) \
+            .filter(TeamRecords.year == year) \
+            .order_by(
+                TeamRecords.wins.desc(),
+                TeamRecords.points_for.desc()
+            ).all()
+
+    @classmethod
+    def get_for_detail(cls, team_id):
+        """
+        Load a team with everything TeamsJSONSchema touches, in a fixed number of
+        queries regardless of roster, owner or article counts.
+
+        Relationships are selectin-loaded; the two cached_property lookups
+        (current_team_record, articles) are fetched up front and seeded into the
+        instance so serialize() never lazy-loads.
+        """
+        from app.models.users import Users
+        from app.models.articles import Articles
+        from app.models.article_teams import ArticleTeams
+        from app.league_state_manager import get_current_year
+
+        team = cls.query.options(
+            selectinload(cls.players),
+            selectinload(cls.team_owners)
+                .selectinload(TeamOwners.user)
+                .selectinload(Users.owner_groups),
+        ).filter_by(team_id=team_id).first()
+        if team is None:
+            return None
+
+        team.__dict__['current_team_record'] = db.session.query(TeamRecords) \
+            .filter_by(year=get_current_year(), team_id=team_id).first()
+
+        team.__dict__['articles'] = db.session.query(Articles) \
+            .filter(Articles.article_teams.any(team_id=team_id), Articles.published == True) \
+            .options(selectinload(Articles.article_teams).selectinload(ArticleTeams.team)) \
+            .order_by(Articles.creation_date.desc()) \
+            .all()
+
+        return team
     
     def serialize_list(self):
         """Lightweight serialization for team listings"""
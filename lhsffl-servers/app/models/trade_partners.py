@@ -0,0 +1,22 @@
+from app import db
+from app.models.schemas.trade_partners import TradePartnersJSONSchema
+
+
+class TradePartners(db.Model):
+    """Trade count per pair of rosters. The pair is stored ordered: roster_id_1 < roster_id_2."""
+    __tablename__ = 'TradePartners'
+    __table_args__ = (
+        db.UniqueConstraint('roster_id_1', 'roster_id_2', name='uq_trade_partners_pair'),
+        db.Index('ix_trade_partners_count', 'trade_count'),
+    )
+
+    trade_partner_id = db.Column(db.Integer(), primary_key=True, autoincrement=True)
+
+    roster_id_1 = db.Column(db.Integer(), nullable=False)
+
+    roster_id_2 = db.Column(db.Integer(), nullable=False)
+
+    trade_count = db.Column(db.Integer(), nullable=False, default=0)
+
+    def serialize(self):
+        return TradePartnersJSONSchema().dump(self)
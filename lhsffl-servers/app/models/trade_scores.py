@@ -0,0 +1,38 @@
+from app import db
+from app.models.schemas.trade_scores import TradeScoresJSONSchema
+
+
+class TradeScores(db.Model):
+    """
+    What one side of a trade got out of it: the PlayerWeeklyStats points its
+    acquired players (and the players drafted with its acquired picks) scored
+    while on its roster. Written by app.logic.trade_scores.
+    """
+    __tablename__ = 'TradeScores'
+    __table_args__ = (
+        db.UniqueConstraint('transaction_id', 'sleeper_roster_id', name='uq_trade_score_side'),
+        db.Index('idx_trade_scores_active', 'active'),
+    )
+
+    trade_score_id = db.Column(db.Integer(), primary_key=True, autoincrement=True)
+
+    transaction_id = db.Column(db.Integer(), db.ForeignKey('Transactions.transaction_id'), nullable=False)
+
+    sleeper_roster_id = db.Column(db.Integer(), nullable=False)
+
+    points = db.Column(db.Float(), nullable=False, default=0)
+
+    starter_points = db.Column(db.Float(), nullable=False, default=0)
+
+    # Player-weeks that produced the points
+    weeks = db.Column(db.Integer(), nullable=False, default=0)
+
+    players = db.Column(db.Integer(), nullable=False, default=0)
+
+    picks = db.Column(db.Integer(), nullable=False, default=0)
+
+    # Still accruing: an acquired player is on the roster, or a pick is undrafted
+    active = db.Column(db.Boolean(), nullable=False, default=False)
+
+    def serialize(self):
+        return TradeScoresJSONSchema().dump(self)
@@ -5,10 +5,15 @@ from app import db
 from app.models.schemas.transactions import TransactionsJSONSchema
 from app.models.transaction_rosters import TransactionRosters
 from app.league_state_manager import get_current_year
+from app.logic.pagination import keyset_page, DEFAULT_PAGE_SIZE
+from app.memo import memoize
 
 
 class Transactions(db.Model):
     __tablename__ = 'Transactions'
+    __table_args__ = (
+        db.Index('ix_transactions_status_created', 'status', 'created_at', 'transaction_id'),
+    )
 
     transaction_id = db.Column(db.Integer(), primary_key=True, autoincrement=True)
 
@@ -54,7 +59,9 @@ class Transactions(db.Model):
         )
 
     @classmethod
-    def get_filtered(cls, year=None, week=None, txn_type=None, roster_id=None):
+    def get_filtered(cls, year=None, week=None, txn_type=None, roster_id=None,
+                     cursor=None, limit=DEFAULT_PAGE_SIZE):
+        """One newest-first page of complete transactions. Returns (transactions, next_cursor)."""
         query = cls.query
         if year:
             query = query.filter_by(year=year)
@@ -67,8 +74,10 @@ class Transactions(db.Model):
                 TransactionRosters.sleeper_roster_id == roster_id
             )
         query = query.filter(cls.status == 'complete')
-        query = query.order_by(cls.created_at.desc())
-        return cls._with_eager_loads(query).all()
+        return keyset_page(
+            cls._with_eager_loads(query), cls.created_at, cls.transaction_id,
+            cursor=cursor, limit=limit,
+        )
 
     @classmethod
     def get_by_week(cls, week_number):
@@ -97,19 +106,25 @@ class Transactions(db.Model):
             .order_by(cls.created_at.desc())
         ).all()
 
+    @classmethod
+    def complete_trade_ids(cls):
+        """All complete trade IDs, cached until the next transaction sync."""
+        return _complete_trade_ids()
+
     @classmethod
     def get_random_trades(cls, limit=5):
-        base = cls.query.filter_by(type='trade', status='complete')
-        total = base.count()
-        if total == 0:
+        trade_ids = cls.complete_trade_ids()
+        if not trade_ids:
             return []
-        if total <= limit:
-            return cls._with_eager_loads(base).all()
-
-        indices = random.sample(range(total), limit)
-        results = []
-        for idx in sorted(indices):
-            row = cls._with_eager_loads(base).offset(idx).limit(1).first()
-            if row:
-                results.append(row)
-        return results
+
+        sampled = random.sample(trade_ids, min(limit, len(trade_ids)))
+        rows = cls._with_eager_loads(cls.query.filter(cls.transaction_id.in_(sampled))).all()
+        # A trade removed since the ID list was cached simply drops out of the sample.
+        by_id = {row.transaction_id: row for row in rows}
+        return [by_id[txn_id] for txn_id in sampled if txn_id in by_id]
+
+
+@memoize(ttl=600, maxsize=1, tags=('transactions',))
+def _complete_trade_ids():
+    rows = db.session.query(Transactions.transaction_id).filter_by(type='trade', status='complete').all()
+    return tuple(row.transaction_id for row in rows)
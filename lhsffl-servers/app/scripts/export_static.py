@@ -0,0 +1,45 @@
+"""
+Export every public read endpoint as static JSON (see app/logic/static_export.py)
+for hosting on a CDN. Re-running only rewrites files whose content changed.
+
+Environment:
+    STATIC_EXPORT_DIR      output directory (default: ./static_export)
+    STATIC_EXPORT_WORKERS  parallel renders (default: 8)
+
+Run from the lhsffl-servers directory:
+    venv/bin/python -m app.scripts.export_static
+"""
+import sys
+import os
+import logging
+
+# Add parent directory to path so we can import app
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Load environment variables from .flaskenv (python-dotenv handles spaces in exports)
+from dotenv import load_dotenv
+flaskenv_path = os.path.join(os.path.dirname(__file__), '..', '..', '.flaskenv')
+load_dotenv(flaskenv_path)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    from app import create_app
+    from config import DevConfig
+    from app.logic.static_export import export_static
+
+    app = create_app(DevConfig)
+
+    out_dir = os.environ.get('STATIC_EXPORT_DIR', 'static_export')
+    workers = int(os.environ.get('STATIC_EXPORT_WORKERS', 8))
+    result = export_static(app, out_dir, workers=workers)
+    logger.info(f'Export result: {result}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""
+Rebuild the draft-pick ownership ledger (PickOwnership + PickOwnershipHistory)
+from every completed pick move.
+
+The transaction sync and backfills record new pick trades on their own; run this
+once after creating the tables, or whenever transactions were edited by hand.
+
+Run from the lhsffl-servers directory:
+    venv/bin/python -m app.scripts.rebuild_pick_ownership
+"""
+import sys
+import os
+import logging
+
+# Add parent directory to path so we can import app
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Load environment variables from .flaskenv (python-dotenv handles spaces in exports)
+from dotenv import load_dotenv
+flaskenv_path = os.path.join(os.path.dirname(__file__), '..', '..', '.flaskenv')
+load_dotenv(flaskenv_path)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    from app import create_app
+    from config import DevConfig
+
+    app = create_app(DevConfig)
+
+    with app.app_context():
+        from app.logic.pick_ownership import rebuild_pick_ownership
+        result = rebuild_pick_ownership()
+        logger.info(f'Rebuild result: {result}')
+
+
+if __name__ == '__main__':
+    main()
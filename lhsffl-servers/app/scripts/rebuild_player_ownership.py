@@ -0,0 +1,43 @@
+"""
+Rebuild the player ownership intervals (PlayerOwnership)
+from every completed add and drop.
+
+The transaction sync and backfills extend the intervals on their own; run this
+once after creating the table, or whenever transactions were edited by hand.
+
+Run from the lhsffl-servers directory:
+    venv/bin/python -m app.scripts.rebuild_player_ownership
+"""
+import sys
+import os
+import logging
+
+# Add parent directory to path so we can import app
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Load environment variables from .flaskenv (python-dotenv handles spaces in exports)
+from dotenv import load_dotenv
+flaskenv_path = os.path.join(os.path.dirname(__file__), '..', '..', '.flaskenv')
+load_dotenv(flaskenv_path)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    from app import create_app
+    from config import DevConfig
+
+    app = create_app(DevConfig)
+
+    with app.app_context():
+        from app.logic.player_ownership import rebuild_player_ownership
+        result = rebuild_player_ownership()
+        logger.info(f'Rebuild result: {result}')
+
+
+if __name__ == '__main__':
+    main()
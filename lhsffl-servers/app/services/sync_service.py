@@ -3,8 +3,14 @@ import threading
 from datetime import datetime
 from app import db
 from app.models.sync_status import SyncStatus
+from app.memo import invalidate
+from app.events import publish
 from app.logic.league import synchronize_teams, set_league_state, synchronize_matchups, synchronize_players
 from app.logic.transactions import synchronize_transactions
+from app.logic.bootstrap import refresh_bootstrap
+from app.logic.player_search import refresh_player_index
+from app.logic.all_play import refresh_all_play
+from app.logic.playoff_odds import refresh_playoff_odds
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -36,7 +42,12 @@ class SyncService:
     def record_sync_status(sync_item, success=True, error=None):
         """
         Record sync operation in SyncStatus table.
+        Also drops memoized data derived from sync_item — even a failed sync
+        may have committed part of its work — and announces the step on the
+        'sync' event stream.
         """
+        invalidate(sync_item)
+        publish('sync', {'item': sync_item, 'success': success})
         try:
             sync_status = SyncStatus(
                 sync_item=sync_item,
@@ -87,11 +98,14 @@ class SyncService:
         try:
             result = synchronize_matchups()
             SyncService.record_sync_status(SyncService.SYNC_ITEMS['MATCHUPS'], success=True)
-            return {'success': True, 'message': 'Matchups synchronized', 'result': result}
         except Exception as e:
             SyncService.record_sync_status(SyncService.SYNC_ITEMS['MATCHUPS'], success=False, error=str(e))
             return {'success': False, 'message': f'Matchups sync failed: {str(e)}'}
 
+        refresh_all_play()  # precompute all-play and luck for the new scores
+        refresh_playoff_odds()
+        return {'success': True, 'message': 'Matchups synchronized', 'result': result}
+
     @staticmethod
     def sync_players():
         """
@@ -101,11 +115,13 @@ class SyncService:
         try:
             result = synchronize_players()
             SyncService.record_sync_status(SyncService.SYNC_ITEMS['PLAYERS'], success=True)
-            return {'success': True, 'message': 'Players synchronized', 'result': result}
         except Exception as e:
             SyncService.record_sync_status(SyncService.SYNC_ITEMS['PLAYERS'], success=False, error=str(e))
             return {'success': False, 'message': f'Players sync failed: {str(e)}'}
 
+        refresh_player_index()  # rebuild the autocomplete index now rather than on the next search
+        return {'success': True, 'message': 'Players synchronized', 'result': result}
+
     @staticmethod
     def sync_transactions():
         """
@@ -189,6 +205,8 @@ class SyncService:
             if not player_stats_result['success']:
                 sync_results['overall_success'] = False
 
+            refresh_bootstrap()
+
             return sync_results
             
         except Exception as e:
@@ -245,10 +263,15 @@ class SyncService:
         }
         order = ['playoffs', 'matchups', 'player_stats', 'draft_picks', 'transactions'] if dataset == 'all' else [dataset]
 
+        def progress(status, **extra):
+            publish('backfill', {'dataset': dataset, 'year': year, 'status': status, 'steps': len(order), **extra})
+
         with app.app_context():
+            progress('started')
             try:
-                for key in order:
+                for step, key in enumerate(order, start=1):
                     fn, accepts_year, item = runners[key]
+                    progress('running', step=step, current=key)
                     try:
                         logger.info(f'Backfill starting: {key} (year={year})')
                         fn(year) if accepts_year else fn()
@@ -260,3 +283,4 @@ class SyncService:
             finally:
                 with _backfill_lock:
                     _backfill_state.update(running=False, dataset=None, started_at=None)
+                progress('finished')
@@ -7,6 +7,8 @@ class Config(object):
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(minutes=15)
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=30)
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Where the prebuilt /v1/bootstrap document is written (defaults to the instance folder)
+    BOOTSTRAP_PATH = os.environ.get('BOOTSTRAP_PATH')
 
 class ProdConfig(Config):
     DEBUG = False
@@ -0,0 +1,23 @@
+-- [user-031] 2026-10-19: Asset-lineage graph behind /transactions/<id>/full_trade_tree.
+-- One edge per asset acquisition (player added, or pick received in a trade), closed by the
+-- transaction in which the same roster later gave the asset up. Maintained on ingest by
+-- app.logic.asset_lineage.apply_lineage. Seed once after creating the table with:
+--     venv/bin/python -m app.scripts.rebuild_asset_lineage
+
+CREATE TABLE AssetLineage (
+    asset_lineage_id INT unsigned NOT NULL AUTO_INCREMENT,
+    acquired_transaction_id INT unsigned NOT NULL,
+    acquired_at DATETIME NOT NULL,
+    sleeper_roster_id INT NOT NULL,
+    asset_type ENUM('player', 'pick') NOT NULL,
+    player_sleeper_id INT DEFAULT NULL,
+    pick_season INT DEFAULT NULL,
+    pick_round INT DEFAULT NULL,
+    pick_roster_id INT DEFAULT NULL,
+    released_transaction_id INT unsigned DEFAULT NULL,
+    PRIMARY KEY (asset_lineage_id),
+    FOREIGN KEY (acquired_transaction_id) REFERENCES Transactions(transaction_id),
+    FOREIGN KEY (released_transaction_id) REFERENCES Transactions(transaction_id),
+    INDEX ix_asset_lineage_acquired (acquired_transaction_id),
+    INDEX ix_asset_lineage_open (sleeper_roster_id, released_transaction_id)
+);
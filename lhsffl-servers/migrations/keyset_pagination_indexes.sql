@@ -0,0 +1,8 @@
+-- [user-027] 2026-10-19: Composite indexes backing keyset pagination on the news feed
+-- and the transaction listing. Both endpoints page newest-first on (date, id) behind a
+-- fixed filter, so each index leads with the filter column and ends with the id
+-- tiebreaker — every page is a single backward range scan regardless of history depth.
+
+CREATE INDEX ix_articles_published_created ON Articles (published, creation_date, article_id);
+
+CREATE INDEX ix_transactions_status_created ON Transactions (status, created_at, transaction_id);
@@ -0,0 +1,23 @@
+-- [user-049] 2026-10-19: League record book (highest/lowest score, blowouts, closest games,
+-- best/worst seasons, best player weeks), the top 25 entries per category. The matchups and
+-- player-stats syncs keep it current; seed it by running either backfill from the admin page,
+-- or from a shell: app.logic.record_book.rebuild_record_book().
+
+CREATE TABLE LeagueRecords (
+    league_record_id INT unsigned NOT NULL AUTO_INCREMENT,
+    category VARCHAR(32) NOT NULL,
+    `rank` INT NOT NULL,
+    value FLOAT NOT NULL,
+    year INT NOT NULL,
+    week INT NULL,
+    sleeper_roster_id INT NOT NULL,
+    opponent_sleeper_roster_id INT NULL,
+    player_sleeper_id INT NULL,
+    points_for FLOAT NULL,
+    points_against FLOAT NULL,
+    wins INT NULL,
+    losses INT NULL,
+    ties INT NULL,
+    PRIMARY KEY (league_record_id),
+    UNIQUE KEY uq_league_record_rank (category, `rank`)
+);
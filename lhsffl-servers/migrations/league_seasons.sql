@@ -0,0 +1,11 @@
+-- [user-050] 2026-10-19: Per-season Sleeper league settings. playoff_week_start splits each
+-- season's regular season from its playoffs in the all-time records (app.logic.all_time);
+-- seasons without a row use PLAYOFF_WEEK_START. Written by the playoffs backfill: seed it by
+-- running that backfill from the admin page, or from a shell: app.logic.history.backfill_playoffs().
+
+CREATE TABLE LeagueSeasons (
+    year INT NOT NULL,
+    sleeper_league_id VARCHAR(32) NOT NULL,
+    playoff_week_start INT NULL,
+    PRIMARY KEY (year)
+);
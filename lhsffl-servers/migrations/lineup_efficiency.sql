@@ -0,0 +1,18 @@
+-- [user-047] 2026-10-19: Per roster-week lineup efficiency (started vs. optimal points), derived
+-- from PlayerWeeklyStats. The player-stats sync refreshes the current week; seed past seasons by
+-- running the player_stats backfill from the admin page, or from a shell:
+-- app.logic.lineup_efficiency.rebuild_lineup_efficiency(). Slots come from LINEUP_SLOTS.
+
+CREATE TABLE LineupEfficiency (
+    lineup_efficiency_id INT unsigned NOT NULL AUTO_INCREMENT,
+    year INT NOT NULL,
+    week INT NOT NULL,
+    sleeper_roster_id INT NOT NULL,
+    actual_points FLOAT NOT NULL DEFAULT 0,
+    optimal_points FLOAT NOT NULL DEFAULT 0,
+    points_left FLOAT NOT NULL DEFAULT 0,
+    efficiency FLOAT NOT NULL DEFAULT 1,
+    PRIMARY KEY (lineup_efficiency_id),
+    UNIQUE KEY uq_lineup_efficiency_week (year, week, sleeper_roster_id),
+    KEY idx_lineup_efficiency_roster_year (sleeper_roster_id, year)
+);
@@ -0,0 +1,33 @@
+-- [user-033] 2026-10-19: Draft-pick ownership ledger behind history.current_pick_owners.
+-- PickOwnership holds the current owner of every traded pick; PickOwnershipHistory keeps
+-- each completed move so ownership as of any date is one index seek. Maintained on ingest
+-- by app.logic.pick_ownership.apply_pick_trades. Seed once after creating the tables with:
+--     venv/bin/python -m app.scripts.rebuild_pick_ownership
+
+CREATE TABLE PickOwnership (
+    pick_ownership_id INT unsigned NOT NULL AUTO_INCREMENT,
+    season INT NOT NULL,
+    round INT NOT NULL,
+    original_roster_id INT NOT NULL,
+    owner_roster_id INT NOT NULL,
+    transaction_id INT unsigned NOT NULL,
+    changed_at DATETIME NOT NULL,
+    PRIMARY KEY (pick_ownership_id),
+    UNIQUE KEY uq_pick_ownership_pick (season, round, original_roster_id),
+    FOREIGN KEY (transaction_id) REFERENCES Transactions(transaction_id)
+);
+
+CREATE TABLE PickOwnershipHistory (
+    pick_ownership_history_id INT unsigned NOT NULL AUTO_INCREMENT,
+    season INT NOT NULL,
+    round INT NOT NULL,
+    original_roster_id INT NOT NULL,
+    owner_roster_id INT NOT NULL,
+    previous_owner_roster_id INT DEFAULT NULL,
+    transaction_id INT unsigned NOT NULL,
+    changed_at DATETIME NOT NULL,
+    PRIMARY KEY (pick_ownership_history_id),
+    UNIQUE KEY uq_pick_ownership_history_move (transaction_id, season, round, original_roster_id),
+    INDEX ix_pick_ownership_history_pick (season, round, original_roster_id, changed_at),
+    FOREIGN KEY (transaction_id) REFERENCES Transactions(transaction_id)
+);
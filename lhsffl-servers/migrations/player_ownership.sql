@@ -0,0 +1,20 @@
+-- [user-034] 2026-10-19: Player ownership intervals behind TimelineIndex.owner_at / owners_between.
+-- One row per roster's hold on a player; started_at is NULL for a hold that predates the
+-- recorded history, ended_at is NULL while the player is still rostered. Maintained on
+-- ingest by app.logic.player_ownership.apply_player_ownership. Seed once after creating
+-- the table with:
+--     venv/bin/python -m app.scripts.rebuild_player_ownership
+
+CREATE TABLE PlayerOwnership (
+    player_ownership_id INT unsigned NOT NULL AUTO_INCREMENT,
+    player_sleeper_id INT NOT NULL,
+    sleeper_roster_id INT NOT NULL,
+    started_at DATETIME NULL,
+    ended_at DATETIME NULL,
+    acquired_transaction_id INT unsigned NULL,
+    released_transaction_id INT unsigned NULL,
+    PRIMARY KEY (player_ownership_id),
+    INDEX ix_player_ownership_player (player_sleeper_id, started_at),
+    FOREIGN KEY (acquired_transaction_id) REFERENCES Transactions(transaction_id),
+    FOREIGN KEY (released_transaction_id) REFERENCES Transactions(transaction_id)
+);
@@ -0,0 +1,37 @@
+-- [user-043] 2026-10-19: Season and career rollups of PlayerWeeklyStats, served by
+-- /v1/players/<id>/stats. Maintained by the live player-stats sync
+-- (app.logic.player_stats.refresh_player_stats) and rebuilt by backfill_player_stats.
+-- Seed once after creating the tables by running the player_stats backfill from the
+-- admin page, or from a shell: app.logic.player_stats.rebuild_player_stats().
+
+CREATE TABLE PlayerSeasonStats (
+    player_season_stat_id INT unsigned NOT NULL AUTO_INCREMENT,
+    player_sleeper_id INT NOT NULL,
+    year INT NOT NULL,
+    sleeper_roster_id INT NOT NULL,
+    games INT NOT NULL DEFAULT 0,
+    starts INT NOT NULL DEFAULT 0,
+    total_points FLOAT NOT NULL DEFAULT 0,
+    starter_points FLOAT NOT NULL DEFAULT 0,
+    sum_squares FLOAT NOT NULL DEFAULT 0,
+    best_points FLOAT NOT NULL DEFAULT 0,
+    best_week INT DEFAULT NULL,
+    PRIMARY KEY (player_season_stat_id),
+    UNIQUE KEY uq_player_season_roster (player_sleeper_id, year, sleeper_roster_id)
+);
+
+CREATE TABLE PlayerCareerStats (
+    player_sleeper_id INT NOT NULL,
+    seasons INT NOT NULL DEFAULT 0,
+    first_year INT DEFAULT NULL,
+    last_year INT DEFAULT NULL,
+    games INT NOT NULL DEFAULT 0,
+    starts INT NOT NULL DEFAULT 0,
+    total_points FLOAT NOT NULL DEFAULT 0,
+    starter_points FLOAT NOT NULL DEFAULT 0,
+    sum_squares FLOAT NOT NULL DEFAULT 0,
+    best_points FLOAT NOT NULL DEFAULT 0,
+    best_year INT DEFAULT NULL,
+    best_week INT DEFAULT NULL,
+    PRIMARY KEY (player_sleeper_id)
+);
@@ -0,0 +1,19 @@
+-- [user-046] 2026-10-19: Monte Carlo playoff odds, one row per roster per week. Written by
+-- SyncService.sync_matchups (app.logic.playoff_odds.refresh_playoff_odds) and served by
+-- /v1/league/playoff_odds. Tuned with PLAYOFF_TEAMS, PLAYOFF_WEEK_START,
+-- PLAYOFF_ODDS_SIMULATIONS and PLAYOFF_ODDS_WORKERS.
+
+CREATE TABLE PlayoffOdds (
+    playoff_odds_id INT unsigned NOT NULL AUTO_INCREMENT,
+    year INT NOT NULL,
+    week INT NOT NULL,
+    sleeper_roster_id INT NOT NULL,
+    simulations INT NOT NULL,
+    playoff_odds FLOAT NOT NULL DEFAULT 0,
+    top_seed_odds FLOAT NOT NULL DEFAULT 0,
+    projected_wins FLOAT NOT NULL DEFAULT 0,
+    average_seed FLOAT NOT NULL DEFAULT 0,
+    computed_at DATETIME NOT NULL,
+    PRIMARY KEY (playoff_odds_id),
+    UNIQUE KEY uq_playoff_odds_week (year, week, sleeper_roster_id)
+);
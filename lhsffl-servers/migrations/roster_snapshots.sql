@@ -0,0 +1,18 @@
+-- [user-035] 2026-10-19: Weekly roster snapshots. synchronize_teams records each roster for the
+-- current week; earlier weeks are rebuilt from PlayerWeeklyStats with:
+--     venv/bin/python -m app.scripts.backfill_roster_snapshots
+-- player_ids packs Sleeper IDs as big-endian uint32s; the masks flag starters / taxi by index.
+
+CREATE TABLE RosterSnapshots (
+    roster_snapshot_id INT unsigned NOT NULL AUTO_INCREMENT,
+    year INT NOT NULL,
+    week INT NOT NULL,
+    sleeper_roster_id INT NOT NULL,
+    player_ids BLOB NOT NULL,
+    starter_mask BLOB NOT NULL,
+    taxi_mask BLOB NOT NULL,
+    source ENUM('sync', 'backfill') NOT NULL DEFAULT 'sync',
+    captured_at DATETIME NOT NULL,
+    PRIMARY KEY (roster_snapshot_id),
+    UNIQUE KEY uq_roster_snapshot_week (year, week, sleeper_roster_id)
+);
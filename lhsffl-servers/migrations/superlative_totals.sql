@@ -0,0 +1,45 @@
+-- [user-029] 2026-10-19: Materialized aggregates behind /superlatives/players and /superlatives/teams.
+-- Maintained incrementally by the transaction sync and backfills (app.logic.superlatives.apply_transactions)
+-- in the same DB transaction as the ingest. After creating the tables, seed them once with:
+--     venv/bin/python -m app.scripts.rebuild_superlatives
+
+CREATE TABLE PlayerTransactionTotals (
+    player_sleeper_id INT NOT NULL,
+    trade_count INT NOT NULL DEFAULT 0,
+    team_count INT NOT NULL DEFAULT 0,
+    drop_count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (player_sleeper_id),
+    INDEX ix_player_txn_totals_trades (trade_count),
+    INDEX ix_player_txn_totals_teams (team_count),
+    INDEX ix_player_txn_totals_drops (drop_count)
+);
+
+-- One row per (player, roster) that ever added the player; backs most_teams and boomerang.
+CREATE TABLE PlayerRosterAdds (
+    player_roster_add_id INT unsigned NOT NULL AUTO_INCREMENT,
+    player_sleeper_id INT NOT NULL,
+    sleeper_roster_id INT NOT NULL,
+    times_added INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (player_roster_add_id),
+    UNIQUE KEY uq_player_roster_add (player_sleeper_id, sleeper_roster_id),
+    INDEX ix_player_roster_adds_times (times_added)
+);
+
+CREATE TABLE TeamTransactionTotals (
+    sleeper_roster_id INT NOT NULL,
+    trade_count INT NOT NULL DEFAULT 0,
+    pickup_count INT NOT NULL DEFAULT 0,
+    picks_traded INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (sleeper_roster_id)
+);
+
+-- Pairs are stored ordered (roster_id_1 < roster_id_2).
+CREATE TABLE TradePartners (
+    trade_partner_id INT unsigned NOT NULL AUTO_INCREMENT,
+    roster_id_1 INT NOT NULL,
+    roster_id_2 INT NOT NULL,
+    trade_count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (trade_partner_id),
+    UNIQUE KEY uq_trade_partners_pair (roster_id_1, roster_id_2),
+    INDEX ix_trade_partners_count (trade_count)
+);
@@ -0,0 +1,20 @@
+-- [user-048] 2026-10-19: Per-side trade outcome scores (points the acquired assets produced on the
+-- acquiring roster). The player-stats sync refreshes active and newly synced trades each week;
+-- seed every historical trade by running the player_stats backfill from the admin page, or from
+-- a shell: app.logic.trade_scores.rebuild_trade_scores().
+
+CREATE TABLE TradeScores (
+    trade_score_id INT unsigned NOT NULL AUTO_INCREMENT,
+    transaction_id INT unsigned NOT NULL,
+    sleeper_roster_id INT NOT NULL,
+    points FLOAT NOT NULL DEFAULT 0,
+    starter_points FLOAT NOT NULL DEFAULT 0,
+    weeks INT NOT NULL DEFAULT 0,
+    players INT NOT NULL DEFAULT 0,
+    picks INT NOT NULL DEFAULT 0,
+    active BOOLEAN NOT NULL DEFAULT FALSE,
+    PRIMARY KEY (trade_score_id),
+    UNIQUE KEY uq_trade_score_side (transaction_id, sleeper_roster_id),
+    KEY idx_trade_scores_active (active),
+    FOREIGN KEY (transaction_id) REFERENCES Transactions(transaction_id)
+);
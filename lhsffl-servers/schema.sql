@@ -78,7 +78,8 @@ CREATE TABLE Articles (
     thumbnail VARCHAR(128) NOT NULL,
     creation_date DATETIME DEFAULT CURRENT_TIMESTAMP,
     published BOOLEAN DEFAULT FALSE,
-    PRIMARY KEY (article_id)
+    PRIMARY KEY (article_id),
+    INDEX ix_articles_published_created (published, creation_date, article_id)
 )
 
 CREATE TABLE ArticleTeams (
@@ -142,7 +143,8 @@ CREATE TABLE Transactions (
     waiver_priority INT DEFAULT NULL,
     created_at DATETIME DEFAULT NULL,
     status_updated_at DATETIME DEFAULT NULL,
-    PRIMARY KEY (transaction_id)
+    PRIMARY KEY (transaction_id),
+    INDEX ix_transactions_status_created (status, created_at, transaction_id)
 )
 
 CREATE TABLE TransactionPlayers (
@@ -269,4 +271,220 @@ CREATE TABLE PlayerWeeklyStats (
     UNIQUE KEY uq_player_week (year, week, sleeper_roster_id, player_sleeper_id),
     INDEX idx_player_weekly_player (player_sleeper_id),
     INDEX idx_player_weekly_roster_year_week (sleeper_roster_id, year, week)
+)
+
+CREATE TABLE PlayerTransactionTotals (
+    player_sleeper_id INT NOT NULL,
+    trade_count INT NOT NULL DEFAULT 0,
+    team_count INT NOT NULL DEFAULT 0,
+    drop_count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (player_sleeper_id),
+    INDEX ix_player_txn_totals_trades (trade_count),
+    INDEX ix_player_txn_totals_teams (team_count),
+    INDEX ix_player_txn_totals_drops (drop_count)
+)
+
+CREATE TABLE PlayerRosterAdds (
+    player_roster_add_id INT unsigned NOT NULL AUTO_INCREMENT,
+    player_sleeper_id INT NOT NULL,
+    sleeper_roster_id INT NOT NULL,
+    times_added INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (player_roster_add_id),
+    UNIQUE KEY uq_player_roster_add (player_sleeper_id, sleeper_roster_id),
+    INDEX ix_player_roster_adds_times (times_added)
+)
+
+CREATE TABLE TeamTransactionTotals (
+    sleeper_roster_id INT NOT NULL,
+    trade_count INT NOT NULL DEFAULT 0,
+    pickup_count INT NOT NULL DEFAULT 0,
+    picks_traded INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (sleeper_roster_id)
+)
+
+CREATE TABLE TradePartners (
+    trade_partner_id INT unsigned NOT NULL AUTO_INCREMENT,
+    roster_id_1 INT NOT NULL,
+    roster_id_2 INT NOT NULL,
+    trade_count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (trade_partner_id),
+    UNIQUE KEY uq_trade_partners_pair (roster_id_1, roster_id_2),
+    INDEX ix_trade_partners_count (trade_count)
+)
+
+CREATE TABLE AssetLineage (
+    asset_lineage_id INT unsigned NOT NULL AUTO_INCREMENT,
+    acquired_transaction_id INT unsigned NOT NULL,
+    acquired_at DATETIME NOT NULL,
+    sleeper_roster_id INT NOT NULL,
+    asset_type ENUM('player', 'pick') NOT NULL,
+    player_sleeper_id INT DEFAULT NULL,
+    pick_season INT DEFAULT NULL,
+    pick_round INT DEFAULT NULL,
+    pick_roster_id INT DEFAULT NULL,
+    released_transaction_id INT unsigned DEFAULT NULL,
+    PRIMARY KEY (asset_lineage_id),
+    FOREIGN KEY (acquired_transaction_id) REFERENCES Transactions(transaction_id),
+    FOREIGN KEY (released_transaction_id) REFERENCES Transactions(transaction_id),
+    INDEX ix_asset_lineage_acquired (acquired_transaction_id),
+    INDEX ix_asset_lineage_open (sleeper_roster_id, released_transaction_id)
+)
+
+CREATE TABLE PickOwnership (
+    pick_ownership_id INT unsigned NOT NULL AUTO_INCREMENT,
+    season INT NOT NULL,
+    round INT NOT NULL,
+    original_roster_id INT NOT NULL,
+    owner_roster_id INT NOT NULL,
+    transaction_id INT unsigned NOT NULL,
+    changed_at DATETIME NOT NULL,
+    PRIMARY KEY (pick_ownership_id),
+    UNIQUE KEY uq_pick_ownership_pick (season, round, original_roster_id),
+    FOREIGN KEY (transaction_id) REFERENCES Transactions(transaction_id)
+)
+
+CREATE TABLE PickOwnershipHistory (
+    pick_ownership_history_id INT unsigned NOT NULL AUTO_INCREMENT,
+    season INT NOT NULL,
+    round INT NOT NULL,
+    original_roster_id INT NOT NULL,
+    owner_roster_id INT NOT NULL,
+    previous_owner_roster_id INT DEFAULT NULL,
+    transaction_id INT unsigned NOT NULL,
+    changed_at DATETIME NOT NULL,
+    PRIMARY KEY (pick_ownership_history_id),
+    UNIQUE KEY uq_pick_ownership_history_move (transaction_id, season, round, original_roster_id),
+    INDEX ix_pick_ownership_history_pick (season, round, original_roster_id, changed_at),
+    FOREIGN KEY (transaction_id) REFERENCES Transactions(transaction_id)
+)
+
+CREATE TABLE RosterSnapshots (
+    roster_snapshot_id INT unsigned NOT NULL AUTO_INCREMENT,
+    year INT NOT NULL,
+    week INT NOT NULL,
+    sleeper_roster_id INT NOT NULL,
+    player_ids BLOB NOT NULL,
+    starter_mask BLOB NOT NULL,
+    taxi_mask BLOB NOT NULL,
+    source ENUM('sync', 'backfill') NOT NULL DEFAULT 'sync',
+    captured_at DATETIME NOT NULL,
+    PRIMARY KEY (roster_snapshot_id),
+    UNIQUE KEY uq_roster_snapshot_week (year, week, sleeper_roster_id)
+)
+
+CREATE TABLE PlayerSeasonStats (
+    player_season_stat_id INT unsigned NOT NULL AUTO_INCREMENT,
+    player_sleeper_id INT NOT NULL,
+    year INT NOT NULL,
+    sleeper_roster_id INT NOT NULL,
+    games INT NOT NULL DEFAULT 0,
+    starts INT NOT NULL DEFAULT 0,
+    total_points FLOAT NOT NULL DEFAULT 0,
+    starter_points FLOAT NOT NULL DEFAULT 0,
+    sum_squares FLOAT NOT NULL DEFAULT 0,
+    best_points FLOAT NOT NULL DEFAULT 0,
+    best_week INT DEFAULT NULL,
+    PRIMARY KEY (player_season_stat_id),
+    UNIQUE KEY uq_player_season_roster (player_sleeper_id, year, sleeper_roster_id)
+)
+
+CREATE TABLE PlayerCareerStats (
+    player_sleeper_id INT NOT NULL,
+    seasons INT NOT NULL DEFAULT 0,
+    first_year INT DEFAULT NULL,
+    last_year INT DEFAULT NULL,
+    games INT NOT NULL DEFAULT 0,
+    starts INT NOT NULL DEFAULT 0,
+    total_points FLOAT NOT NULL DEFAULT 0,
+    starter_points FLOAT NOT NULL DEFAULT 0,
+    sum_squares FLOAT NOT NULL DEFAULT 0,
+    best_points FLOAT NOT NULL DEFAULT 0,
+    best_year INT DEFAULT NULL,
+    best_week INT DEFAULT NULL,
+    PRIMARY KEY (player_sleeper_id)
+)
+
+CREATE TABLE PlayoffOdds (
+    playoff_odds_id INT unsigned NOT NULL AUTO_INCREMENT,
+    year INT NOT NULL,
+    week INT NOT NULL,
+    sleeper_roster_id INT NOT NULL,
+    simulations INT NOT NULL,
+    playoff_odds FLOAT NOT NULL DEFAULT 0,
+    top_seed_odds FLOAT NOT NULL DEFAULT 0,
+    projected_wins FLOAT NOT NULL DEFAULT 0,
+    average_seed FLOAT NOT NULL DEFAULT 0,
+    computed_at DATETIME NOT NULL,
+    PRIMARY KEY (playoff_odds_id),
+    UNIQUE KEY uq_playoff_odds_week (year, week, sleeper_roster_id)
+)
+
+CREATE TABLE LineupEfficiency (
+    lineup_efficiency_id INT unsigned NOT NULL AUTO_INCREMENT,
+    year INT NOT NULL,
+    week INT NOT NULL,
+    sleeper_roster_id INT NOT NULL,
+    actual_points FLOAT NOT NULL DEFAULT 0,
+    optimal_points FLOAT NOT NULL DEFAULT 0,
+    points_left FLOAT NOT NULL DEFAULT 0,
+    efficiency FLOAT NOT NULL DEFAULT 1,
+    PRIMARY KEY (lineup_efficiency_id),
+    UNIQUE KEY uq_lineup_efficiency_week (year, week, sleeper_roster_id),
+    KEY idx_lineup_efficiency_roster_year (sleeper_roster_id, year)
+)
+
+CREATE TABLE TradeScores (
+    trade_score_id INT unsigned NOT NULL AUTO_INCREMENT,
+    transaction_id INT unsigned NOT NULL,
+    sleeper_roster_id INT NOT NULL,
+    points FLOAT NOT NULL DEFAULT 0,
+    starter_points FLOAT NOT NULL DEFAULT 0,
+    weeks INT NOT NULL DEFAULT 0,
+    players INT NOT NULL DEFAULT 0,
+    picks INT NOT NULL DEFAULT 0,
+    active BOOLEAN NOT NULL DEFAULT FALSE,
+    PRIMARY KEY (trade_score_id),
+    UNIQUE KEY uq_trade_score_side (transaction_id, sleeper_roster_id),
+    KEY idx_trade_scores_active (active),
+    FOREIGN KEY (transaction_id) REFERENCES Transactions(transaction_id)
+)
+
+CREATE TABLE LeagueRecords (
+    league_record_id INT unsigned NOT NULL AUTO_INCREMENT,
+    category VARCHAR(32) NOT NULL,
+    `rank` INT NOT NULL,
+    value FLOAT NOT NULL,
+    year INT NOT NULL,
+    week INT NULL,
+    sleeper_roster_id INT NOT NULL,
+    opponent_sleeper_roster_id INT NULL,
+    player_sleeper_id INT NULL,
+    points_for FLOAT NULL,
+    points_against FLOAT NULL,
+    wins INT NULL,
+    losses INT NULL,
+    ties INT NULL,
+    PRIMARY KEY (league_record_id),
+    UNIQUE KEY uq_league_record_rank (category, `rank`)
+)
+
+CREATE TABLE LeagueSeasons (
+    year INT NOT NULL,
+    sleeper_league_id VARCHAR(32) NOT NULL,
+    playoff_week_start INT NULL,
+    PRIMARY KEY (year)
+)
+
+CREATE TABLE PlayerOwnership (
+    player_ownership_id INT unsigned NOT NULL AUTO_INCREMENT,
+    player_sleeper_id INT NOT NULL,
+    sleeper_roster_id INT NOT NULL,
+    started_at DATETIME NULL,
+    ended_at DATETIME NULL,
+    acquired_transaction_id INT unsigned NULL,
+    released_transaction_id INT unsigned NULL,
+    PRIMARY KEY (player_ownership_id),
+    INDEX ix_player_ownership_player (player_sleeper_id, started_at),
+    FOREIGN KEY (acquired_transaction_id) REFERENCES Transactions(transaction_id),
+    FOREIGN KEY (released_transaction_id) REFERENCES Transactions(transaction_id)
 )
\ No newline at end of file
@@ -27,6 +27,7 @@ import os
 import re
 import inspect
 import importlib
+from contextlib import contextmanager
 from itertools import count
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -73,18 +74,50 @@ def app():
 @pytest.fixture(scope='function')
 def db(app):
     from app import db as _db
+    from app.memo import invalidate_all
+    from app.league_state_manager import league_state_manager
     with app.app_context():
         _db.create_all()
+        # Process-level caches outlive the per-test database.
+        invalidate_all()
+        league_state_manager.reset()
         yield _db
         _db.session.remove()
         _db.drop_all()
 
 
+@pytest.fixture(autouse=True)
+def bootstrap_file(app, tmp_path):
+    """Point BOOTSTRAP_PATH at the test's tmp dir, so regenerating the bootstrap never writes into instance/."""
+    path = tmp_path / 'bootstrap.json'
+    app.config['BOOTSTRAP_PATH'] = str(path)
+    yield path
+    app.config.pop('BOOTSTRAP_PATH', None)
+
+
 @pytest.fixture(scope='function')
 def client(app, db):
     return app.test_client()
 
 
+@contextmanager
+def count_queries(db):
+    """Yield a list that collects every SQL statement executed inside the block."""
+    from sqlalchemy import event
+
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.engine
+    event.listen(engine, 'before_cursor_execute', _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', _record)
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # 2. Low-level row helpers
 # ═══════════════════════════════════════════════════════════════════════════
@@ -209,6 +242,25 @@ def make_draft_pick(db, season, round_, original_roster_id, pick_no, player_slee
     return dp
 
 
+def make_matchup(db, year, week, roster, opponent, pf, pa, completed=True, matchup_id=None):
+    """Both sides of one matchup, as the sync stores them."""
+    from app.models.matchups import Matchups
+    sides = [Matchups(year=year, week=week, sleeper_matchup_id=matchup_id or min(roster, opponent),
+                      sleeper_roster_id=side, opponent_sleeper_roster_id=other,
+                      points_for=points_for, points_against=points_against, completed=completed)
+             for side, other, points_for, points_against in ((roster, opponent, pf, pa), (opponent, roster, pa, pf))]
+    db.session.add_all(sides)
+    return sides
+
+
+def make_weekly_stat(db, year, week, roster, player, points, is_starter=True):
+    from app.models.player_weekly_stats import PlayerWeeklyStats
+    s = PlayerWeeklyStats(year=year, week=week, sleeper_roster_id=roster,
+                          player_sleeper_id=player, points=points, is_starter=is_starter)
+    db.session.add(s)
+    return s
+
+
 def make_league_state(db, year=2024, week=5):
     from app.models.league_state import LeagueState
     ls = LeagueState(league_state_id=1, year=year, week=week, current=True)
@@ -337,6 +389,9 @@ def with_trade(
                       'owner_id': 1, 'previous_owner_id': 2}]
         year, week, status, created_at  Columns on the Transactions row.
 
+    The trade is linked into the asset lineage as the transaction sync would, so
+    stack decorators in chronological order.
+
     Example:
         @with_trade(roster_ids=[1, 2],
                     adds={1: [101], 2: [102]},
@@ -354,6 +409,8 @@ def with_trade(
             from app.models.transaction_rosters import TransactionRosters
             from app.models.transaction_players import TransactionPlayers
             from app.models.transaction_draft_picks import TransactionDraftPicks
+            from app.logic.asset_lineage import apply_lineage
+            from app.logic.player_ownership import apply_player_ownership
 
             db = kwargs['db']
             at = created_at or datetime(2024, 9, 1)
@@ -395,6 +452,8 @@ def with_trade(
                     transaction_id=txn.transaction_id, **pick,
                 ))
 
+            apply_lineage([txn.transaction_id])
+            apply_player_ownership([txn.transaction_id])
             db.session.commit()
             kwargs[name] = txn
             return fn(*args, **kwargs)
@@ -429,6 +488,8 @@ def with_waiver(
         drop       player_sleeper_id to drop to make room (optional).
         year, week, status, created_at  Columns on the Transactions row.
 
+    Linked into the asset lineage like with_trade().
+
     Example:
         @with_waiver(roster_id=1, add=101, drop=102)
         def test_foo(self, client, db, league, waiver): ...
@@ -440,6 +501,8 @@ def with_waiver(
             from app.models.transactions import Transactions
             from app.models.transaction_rosters import TransactionRosters
             from app.models.transaction_players import TransactionPlayers
+            from app.logic.asset_lineage import apply_lineage
+            from app.logic.player_ownership import apply_player_ownership
 
             db  = kwargs['db']
             at  = created_at or datetime(2024, 9, 1)
@@ -474,6 +537,8 @@ def with_waiver(
                     action='drop',
                 ))
 
+            apply_lineage([txn.transaction_id])
+            apply_player_ownership([txn.transaction_id])
             db.session.commit()
             kwargs[name] = txn
             return fn(*args, **kwargs)
@@ -0,0 +1,131 @@
+"""
+Tests for /v1/articles endpoints.
+
+Coverage:
+  GET /v1/articles/get_news   – published news feed, keyset-paginated
+  GET /v1/articles/search     – BM25-ranked search over published articles,
+                                kept current by the admin publish endpoint
+"""
+
+from datetime import datetime, timedelta
+
+from flask_jwt_extended import create_access_token
+
+from tests.conftest import make_user
+
+
+def _seed_articles(db, n, published=True, creation_date=None):
+    from app.models.articles import Articles
+    articles = []
+    for i in range(n):
+        article = Articles(title=f'Article {i}', content='...', thumbnail='', published=published,
+                           creation_date=creation_date or datetime(2024, 9, 1) + timedelta(days=i))
+        db.session.add(article)
+        articles.append(article)
+    db.session.commit()
+    return articles
+
+
+def _walk(client, url):
+    ids, cursor = [], None
+    while True:
+        r = client.get(f'{url}&cursor={cursor}' if cursor else url)
+        assert r.status_code == 200
+        data = r.get_json()
+        ids.extend(a['article_id'] for a in data['articles'])
+        cursor = data['next_cursor']
+        if cursor is None:
+            return ids
+
+
+class TestGetNews:
+
+    def test_returns_published_newest_first(self, client, db):
+        published = _seed_articles(db, 3)
+        _seed_articles(db, 2, published=False)
+
+        data = client.get('/v1/articles/get_news').get_json()
+        assert data['success'] is True
+        assert [a['article_id'] for a in data['articles']] == [a.article_id for a in reversed(published)]
+        assert data['next_cursor'] is None
+
+    def test_pages_cover_everything_in_order(self, client, db):
+        articles = _seed_articles(db, 7)
+        expected = [a.article_id for a in reversed(articles)]
+
+        first = client.get('/v1/articles/get_news?limit=3').get_json()
+        assert [a['article_id'] for a in first['articles']] == expected[:3]
+
+        assert _walk(client, '/v1/articles/get_news?limit=3') == expected
+
+    def test_same_creation_date_breaks_ties_on_id(self, client, db):
+        articles = _seed_articles(db, 4, creation_date=datetime(2024, 9, 1))
+        expected = sorted((a.article_id for a in articles), reverse=True)
+        assert _walk(client, '/v1/articles/get_news?limit=3') == expected
+
+    def test_invalid_cursor_returns_400(self, client, db):
+        r = client.get('/v1/articles/get_news?cursor=%%%')
+        assert r.status_code == 400
+        assert r.get_json()['success'] is False
+
+
+def _article(db, title, content, published=True):
+    from app.models.articles import Articles
+    article = Articles(title=title, content=content, thumbnail='', published=published,
+                       creation_date=datetime(2024, 9, 1))
+    db.session.add(article)
+    db.session.commit()
+    return article
+
+
+class TestSearch:
+
+    def test_ranks_title_and_frequency_matches_first(self, client, db):
+        body = _article(db, 'Week 3 recap', 'A quiet week. The **trade** market stayed calm.')
+        title = _article(db, 'Trade deadline winners', 'Three teams made moves before the deadline.')
+        heavy = _article(db, 'Power rankings', 'Trades, trades and more trades reshaped the league. ' * 3)
+        _article(db, 'Unpublished trade rumor', 'trade trade trade', published=False)
+
+        results = client.get('/v1/articles/search?q=trade').get_json()['results']
+
+        assert {r['article_id'] for r in results} == {body.article_id, title.article_id, heavy.article_id}
+        assert results[-1]['article_id'] == body.article_id
+        assert results[0]['score'] >= results[1]['score'] >= results[2]['score']
+        assert '**' not in results[-1]['snippet']
+
+    def test_snippet_centers_on_the_match(self, client, db):
+        filler = ' '.join(['filler'] * 60)
+        _article(db, 'Long read', f'{filler} the waiver wire produced a breakout running back {filler}')
+
+        [result] = client.get('/v1/articles/search?q=waiver').get_json()['results']
+        assert 'waiver wire produced' in result['snippet']
+        assert result['snippet'].startswith('…') and result['snippet'].endswith('…')
+
+    def test_publish_adds_to_index(self, app, client, db):
+        _article(db, 'Existing', 'Nothing about special teams here.')
+        draft = _article(db, 'Kicker controversy', 'A missed field goal.', published=False)
+        assert client.get('/v1/articles/search?q=kicker').get_json()['results'] == []  # index built
+
+        admin = make_user(db, user_name='admin', email='admin@example.com', google_id='gid-admin', admin=True)
+        db.session.commit()
+        with app.app_context():
+            token = create_access_token(identity=str(admin.user_id), additional_claims={'admin': True})
+        client.post(f'/v1/admin/articles/{draft.article_id}/publish', headers={'Authorization': f'Bearer {token}'})
+
+        results = client.get('/v1/articles/search?q=kicker').get_json()['results']
+        assert [r['article_id'] for r in results] == [draft.article_id]
+
+    def test_invalidate_rebuilds_index(self, client, db):
+        from app.memo import invalidate
+        article = _article(db, 'Draft recap', 'Rookies everywhere.')
+        assert client.get('/v1/articles/search?q=punter').get_json()['results'] == []
+
+        article.content = 'Rookies everywhere, and a punter in round one.'
+        db.session.commit()
+        invalidate('articles')
+        results = client.get('/v1/articles/search?q=punter').get_json()['results']
+        assert [r['article_id'] for r in results] == [article.article_id]
+
+    def test_query_required(self, client, db):
+        assert client.get('/v1/articles/search?q=%20').status_code == 400
+
@@ -0,0 +1,113 @@
+"""
+Tests for the asset-lineage graph (app/logic/asset_lineage.py) and the
+full trade tree built from it.
+
+Scenarios
+─────────
+1. The full trade tree follows the stored edges through trades, waivers and picks
+2. Incremental apply_lineage() batches produce the same edges as a full rebuild
+3. Transactions linked out of order need rebuild_asset_lineage(), which the
+   transaction backfills run when they finish
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from tests.conftest import with_trade, with_waiver
+
+
+PICK = {'season': 2025, 'round': 1, 'roster_id': 2}
+
+
+def _branch_ids(teams):
+    return {rid: [t['transaction_id'] for t in team['transactions']] for rid, team in teams.items()}
+
+
+def _edges():
+    from app.models.asset_lineage import AssetLineage
+    return sorted(
+        (e.acquired_transaction_id, e.sleeper_roster_id, e.asset, e.released_transaction_id)
+        for e in AssetLineage.query
+    )
+
+
+class TestLineageTree:
+
+    @with_trade(name='origin', roster_ids=[1, 2], adds={1: [101], 2: [102]}, drops={1: [102], 2: [101]},
+                picks=[{**PICK, 'owner_id': 1, 'previous_owner_id': 2}], created_at=datetime(2024, 9, 1))
+    @with_trade(name='t2', roster_ids=[1, 3], adds={1: [103], 3: [101]}, drops={1: [101], 3: [103]},
+                created_at=datetime(2024, 9, 8))
+    @with_trade(name='t3', roster_ids=[1, 4], adds={1: [104]}, drops={4: [104]},
+                picks=[{**PICK, 'owner_id': 4, 'previous_owner_id': 1}], created_at=datetime(2024, 9, 15))
+    @with_waiver(name='t4', roster_id=1, add=105, drop=103, created_at=datetime(2024, 9, 20))
+    @with_waiver(name='t5', roster_id=2, add=106, created_at=datetime(2024, 9, 21))
+    @with_trade(name='t6', roster_ids=[3, 4], adds={4: [101]}, drops={3: [101]}, created_at=datetime(2024, 9, 25))
+    @with_waiver(name='t7', roster_id=2, add=107, drop=102, created_at=datetime(2024, 9, 30))
+    def test_tree_follows_lineage(self, client, db, league, origin, t2, t3, t4, t5, t6, t7):
+        teams = client.get(f'/v1/transactions/{origin.transaction_id}/full_trade_tree').get_json()['teams']
+
+        # t5 touched roster 2 but moved nothing it got in the origin; t6 is roster 3's business.
+        assert _branch_ids(teams) == {'1': [t2.transaction_id, t3.transaction_id, t4.transaction_id],
+                                      '2': [t7.transaction_id]}
+
+    @with_trade(name='origin', roster_ids=[1, 2], adds={1: [101], 2: [102]}, drops={1: [102], 2: [101]},
+                picks=[{**PICK, 'owner_id': 1, 'previous_owner_id': 2}], created_at=datetime(2024, 9, 1))
+    @with_trade(name='t2', roster_ids=[1, 3], adds={1: [103], 3: [101]}, drops={1: [101], 3: [103]},
+                created_at=datetime(2024, 9, 8))
+    @with_trade(name='t3', roster_ids=[1, 4], adds={1: [104]}, drops={4: [104]},
+                picks=[{**PICK, 'owner_id': 4, 'previous_owner_id': 1}], created_at=datetime(2024, 9, 15))
+    @with_waiver(name='t4', roster_id=1, add=105, drop=103, created_at=datetime(2024, 9, 20))
+    @with_trade(name='pending', roster_ids=[1, 2], adds={2: [105]}, drops={1: [105]},
+                status='pending', created_at=datetime(2024, 9, 22))
+    def test_incremental_batches_match_rebuild(self, client, db, league, origin, t2, t3, t4, pending):
+        from app.logic.asset_lineage import apply_lineage, rebuild_asset_lineage
+        from app.models.asset_lineage import AssetLineage
+
+        AssetLineage.query.delete()
+        apply_lineage([origin.transaction_id])
+        apply_lineage([t2.transaction_id, t3.transaction_id])
+        apply_lineage([t4.transaction_id, pending.transaction_id])
+        db.session.commit()
+        incremental = _edges()
+
+        rebuild_asset_lineage()
+        assert _edges() == incremental
+        # 105 is still held by roster 1: the pending trade released nothing.
+        assert (t4.transaction_id, 1, ('player', 105), None) in incremental
+
+    @with_trade(name='origin', roster_ids=[1, 2], adds={1: [101]}, drops={2: [101]}, created_at=datetime(2024, 9, 1))
+    @with_waiver(name='release', roster_id=1, drop=101, created_at=datetime(2024, 9, 8))
+    def test_out_of_order_links_need_a_rebuild(self, client, db, league, origin, release):
+        from app.logic.asset_lineage import apply_lineage, rebuild_asset_lineage
+        from app.models.asset_lineage import AssetLineage
+
+        def branches():
+            url = f'/v1/transactions/{origin.transaction_id}/full_trade_tree'
+            return _branch_ids(client.get(url).get_json()['teams'])
+
+        # The release arrives first (a week-0 backfill after later weeks): nothing is open for it to close.
+        AssetLineage.query.delete()
+        apply_lineage([release.transaction_id])
+        apply_lineage([origin.transaction_id])
+        db.session.commit()
+        assert branches()['1'] == []
+
+        rebuild_asset_lineage()
+        assert branches()['1'] == [release.transaction_id]
+
+    @with_trade(name='origin', roster_ids=[1, 2], adds={1: [101]}, drops={2: [101]}, created_at=datetime(2024, 9, 1))
+    @with_waiver(name='release', roster_id=1, drop=101, created_at=datetime(2024, 9, 8))
+    def test_backfill_relinks_lineage(self, client, db, league, origin, release):
+        from app.logic.transactions import backfill_week_zero
+        from app.models.asset_lineage import AssetLineage
+
+        AssetLineage.query.delete()
+        db.session.commit()
+
+        response = MagicMock()
+        response.json.return_value = []
+        with patch('app.logic.transactions.requests.get', return_value=response), \
+                patch('app.logic.transactions.time.sleep'):
+            backfill_week_zero()
+
+        assert (origin.transaction_id, 1, ('player', 101), release.transaction_id) in _edges()
@@ -0,0 +1,54 @@
+"""
+Tests for GET /v1/batch (app/endpoints/batch.py).
+
+Scenarios
+─────────
+1. Sub-responses come back in request order with their own status and body
+2. Identical paths are dispatched once
+3. Unknown, non-local and nested batch paths fail per item, not the whole batch
+4. Missing or too many paths are rejected
+"""
+
+from urllib.parse import urlencode
+from unittest.mock import patch
+
+from tests.conftest import count_queries
+
+
+def _batch(client, *paths):
+    # Pin the season so /teams/<id> doesn't load (and cache) league state.
+    with patch('app.league_state_manager.get_current_year', return_value=2024):
+        return client.get('/v1/batch?' + urlencode([('path', p) for p in paths]))
+
+
+class TestBatch:
+
+    def test_responses_in_order(self, client, db, league):
+        resp = _batch(client, '/teams/1', '/transactions?limit=1', '/v1/teams/999')
+        assert resp.status_code == 200
+        items = resp.get_json()['responses']
+
+        assert [i['path'] for i in items] == ['/teams/1', '/transactions?limit=1', '/v1/teams/999']
+        assert [i['status'] for i in items] == [200, 200, 404]
+        assert items[0]['body']['team']['team_id'] == 1
+        assert items[1]['body']['transactions'] == []
+        assert items[2]['body']['success'] is False
+
+    def test_identical_paths_run_once(self, client, db, league):
+        with count_queries(db) as single:
+            _batch(client, '/teams/1')
+        with count_queries(db) as doubled:
+            resp = _batch(client, '/teams/1', '/v1/teams/1', '/teams/1')
+        items = resp.get_json()['responses']
+        assert len(items) == 3
+        assert items[0]['body'] == items[1]['body'] == items[2]['body']
+        assert len(doubled) == len(single)
+
+    def test_bad_paths_fail_per_item(self, client, db, league):
+        items = _batch(client, '/no/such/route', 'https://example.com/teams', '/batch?path=/teams',
+                       '/teams/1').get_json()['responses']
+        assert [i['status'] for i in items] == [404, 400, 400, 200]
+
+    def test_rejects_empty_and_oversized_batches(self, client, db):
+        assert client.get('/v1/batch').status_code == 400
+        assert _batch(client, *[f'/teams/{i}' for i in range(21)]).status_code == 400
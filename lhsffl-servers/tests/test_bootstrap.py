@@ -0,0 +1,109 @@
+"""
+Tests for GET /v1/bootstrap (app/logic/bootstrap.py, app/endpoints/bootstrap.py).
+
+Scenarios
+─────────
+1. The document carries standings, current matchups, playoff odds, league state and
+   latest articles
+2. Once built it is served with zero DB queries, gzipped on request, with an ETag
+3. Publishing an article regenerates it
+4. A newer document written to disk by another process is picked up
+"""
+
+import gzip
+import json
+import os
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from flask_jwt_extended import create_access_token
+
+from tests.conftest import count_queries, make_matchup, make_user
+
+
+@pytest.fixture
+def bootstrap_path(bootstrap_file):
+    # Pin the season both here and for Teams.serialize_list, so league state isn't loaded (and cached).
+    with patch('app.logic.bootstrap.get_current_year', return_value=2024), \
+            patch('app.logic.bootstrap.get_current_week', return_value=1), \
+            patch('app.league_state_manager.get_current_year', return_value=2024):
+        yield bootstrap_file
+
+
+def _seed(db):
+    from app.models.team_records import TeamRecords
+    from app.models.articles import Articles
+    from app.models.playoff_odds import PlayoffOdds
+
+    for team_id, wins in [(1, 1), (2, 3)]:
+        db.session.add(TeamRecords(team_id=team_id, year=2024, wins=wins, losses=4 - wins,
+                                   points_for=400.0, points_against=400.0))
+    make_matchup(db, 2024, 1, 1, 2, 100.0, 90.0, completed=False)
+    db.session.add(Articles(title='Recap', content='...', thumbnail='', published=True,
+                            creation_date=datetime(2024, 9, 1)))
+    db.session.add(Articles(title='Draft', content='...', thumbnail='', published=False,
+                            creation_date=datetime(2024, 9, 2)))
+    for week, odds in [(1, 0.5), (2, 0.75)]:
+        db.session.add(PlayoffOdds(year=2024, week=week, sleeper_roster_id=1, simulations=100, playoff_odds=odds))
+    db.session.commit()
+
+
+class TestBootstrap:
+
+    def test_document_contents(self, client, db, league, bootstrap_path):
+        _seed(db)
+        data = client.get('/v1/bootstrap').get_json()
+
+        assert data['success'] is True
+        assert data['league_state'] == {'current_year': 2024, 'current_week': 1}
+        assert [t['team_id'] for t in data['teams']] == [2, 1]
+        assert len(data['matchups']) == 1
+        assert [a['title'] for a in data['articles']] == ['Recap']
+        assert [(o['week'], o['playoff_odds']) for o in data['playoff_odds']] == [(2, 0.75)]
+        assert json.loads(bootstrap_path.read_bytes()) == data
+        assert json.loads(gzip.decompress(bootstrap_path.with_suffix('.json.gz').read_bytes())) == data
+
+    def test_served_without_queries(self, client, db, league, bootstrap_path):
+        _seed(db)
+        first = client.get('/v1/bootstrap')
+
+        with count_queries(db) as queries:
+            plain = client.get('/v1/bootstrap')
+            zipped = client.get('/v1/bootstrap', headers={'Accept-Encoding': 'gzip'})
+            cached = client.get('/v1/bootstrap', headers={'If-None-Match': first.headers['ETag']})
+        assert queries == []
+
+        assert plain.get_data() == first.get_data()
+        assert zipped.headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(zipped.get_data()) == first.get_data()
+        assert cached.status_code == 304
+
+    def test_publish_regenerates(self, app, client, db, league, bootstrap_path):
+        from app.models.articles import Articles
+
+        _seed(db)
+        etag = client.get('/v1/bootstrap').headers['ETag']
+        draft = Articles.query.filter_by(title='Draft').one()
+        admin = make_user(db, user_name='admin', email='admin@example.com', google_id='gid-admin', admin=True)
+        db.session.commit()
+
+        with app.app_context():
+            token = create_access_token(identity=str(admin.user_id), additional_claims={'admin': True})
+        client.post(f'/v1/admin/articles/{draft.article_id}/publish', headers={'Authorization': f'Bearer {token}'})
+
+        r = client.get('/v1/bootstrap', headers={'If-None-Match': etag})
+        assert r.status_code == 200
+        assert [a['title'] for a in r.get_json()['articles']] == ['Draft', 'Recap']
+
+    def test_reloads_newer_document_from_disk(self, client, db, league, bootstrap_path):
+        _seed(db)
+        client.get('/v1/bootstrap')
+        bootstrap_path.write_text('{"success":true,"teams":[]}')
+        stat = bootstrap_path.stat()
+        os.utime(bootstrap_path, (stat.st_atime, stat.st_mtime + 10))
+
+        with count_queries(db) as queries:
+            data = client.get('/v1/bootstrap').get_json()
+        assert queries == []
+        assert data == {'success': True, 'teams': []}
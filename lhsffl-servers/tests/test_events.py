@@ -0,0 +1,129 @@
+"""
+Tests for the server-sent events stream (app/events.py, app/endpoints/events.py).
+
+Scenarios
+─────────
+1. Published events reach every subscriber; a reconnect replays what it missed
+2. A subscriber that stops draining loses its oldest events, not new ones
+3. The stream frames events as text/event-stream and filters by topic; a worker at its
+   stream limit answers 503
+4. The matchup sync publishes only the scores that changed; sync steps are announced
+"""
+
+from unittest.mock import patch, MagicMock
+
+from tests.conftest import make_matchup
+
+
+def _drain(q):
+    items = []
+    while not q.empty():
+        items.append(q.get_nowait())
+    return items
+
+
+class TestBroker:
+
+    def test_fanout_and_replay(self):
+        from app.events import publish, subscribe, unsubscribe
+
+        first, second = subscribe(), subscribe()
+        event_id = publish('sync', {'item': 'teams', 'success': True})
+        publish('scores', {'week': 1})
+        try:
+            assert [m.event for m in _drain(first)] == ['sync', 'scores']
+            assert [m.event for m in _drain(second)] == ['sync', 'scores']
+
+            replayed = subscribe(last_event_id=event_id)
+            assert [(m.event, m.data['week']) for m in _drain(replayed)] == [('scores', 1)]
+        finally:
+            for q in (first, second, replayed):
+                unsubscribe(q)
+
+    def test_slow_subscriber_drops_oldest(self):
+        from app.events import QUEUE_SIZE, publish, subscribe, unsubscribe
+
+        q = subscribe()
+        ids = [publish('scores', {'n': n}) for n in range(QUEUE_SIZE + 5)]
+        unsubscribe(q)
+        assert [m.id for m in _drain(q)] == ids[5:]
+
+
+class TestStream:
+
+    def test_stream_filters_topics(self, client):
+        from app.events import publish, subscriber_count
+
+        before = publish('sync', {'item': 'teams', 'success': True})
+        publish('scores', {'week': 3})
+
+        resp = client.get('/v1/events/stream?topics=scores', headers={'Last-Event-ID': str(before - 1)},
+                          buffered=False)
+        assert resp.status_code == 200
+        assert resp.mimetype == 'text/event-stream'
+
+        chunks = iter(resp.response)
+        assert next(chunks) == b'retry: 5000\n\n'
+        message = next(chunks).decode()
+        assert message.startswith(f'id: {before + 1}\nevent: scores\ndata: ')
+        assert '"week": 3' in message
+
+        resp.close()
+        assert subscriber_count() == 0
+
+    def test_stream_limit(self, client):
+        from app.events import subscribe, unsubscribe
+
+        held = subscribe()
+        try:
+            with patch.dict('os.environ', {'EVENT_STREAM_LIMIT': '1'}):
+                assert client.get('/v1/events/stream').status_code == 503
+        finally:
+            unsubscribe(held)
+
+    def test_rejects_unknown_topic(self, client):
+        assert client.get('/v1/events/stream?topics=scores,gossip').status_code == 400
+
+
+class TestPublishers:
+
+    def test_matchup_sync_publishes_changed_scores(self, app, db, league):
+        from app.events import subscribe, unsubscribe
+        from app.logic.league import synchronize_matchups
+
+        week = league.league_state.week
+        make_matchup(db, 2024, week, 1, 2, 100.0, 90.0, completed=False)
+        make_matchup(db, 2024, week, 3, 4, 0.0, 0.0, completed=False, matchup_id=2)
+        db.session.commit()
+
+        response = MagicMock()
+        response.json.return_value = [
+            {'matchup_id': 1, 'roster_id': 1, 'points': 100.0},
+            {'matchup_id': 1, 'roster_id': 2, 'points': 90.0},
+            {'matchup_id': 2, 'roster_id': 3, 'points': 12.5},
+            {'matchup_id': 2, 'roster_id': 4, 'points': 8.0},
+        ]
+        q = subscribe()
+        try:
+            with patch('app.logic.league.requests.get', return_value=response):
+                synchronize_matchups()
+        finally:
+            unsubscribe(q)
+
+        [message] = _drain(q)
+        assert message.event == 'scores'
+        assert (message.data['year'], message.data['week']) == (2024, week)
+        assert sorted((m['sleeper_roster_id'], m['points_for']) for m in message.data['matchups']) == [(3, 12.5), (4, 8.0)]
+
+    def test_sync_status_is_announced(self, app, db):
+        from app.events import subscribe, unsubscribe
+        from app.services.sync_service import SyncService
+
+        q = subscribe()
+        SyncService.record_sync_status('teams', success=False, error='boom')
+        unsubscribe(q)
+
+        [message] = _drain(q)
+        assert message.event == 'sync'
+        assert message.data['item'] == 'teams' and message.data['success'] is False
+        assert 'error' not in message.data
@@ -0,0 +1,66 @@
+"""
+Tests for the league state snapshot (app/league_state_manager.py).
+
+Scenarios
+─────────
+1. Reads within the check interval are served from the snapshot without queries
+2. A new current LeagueState row (written by any process) is picked up at the next check
+3. The snapshot is immutable
+4. set_league_state switches the process that ran it immediately
+"""
+
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from tests.conftest import count_queries
+
+
+def _advance_week(db, week):
+    """What set_league_state does, as another worker would: retire the current row, insert a new one."""
+    from app.models.league_state import LeagueState
+    LeagueState.query.filter_by(current=True).update({LeagueState.current: False})
+    db.session.add(LeagueState(year=2024, week=week, current=True))
+    db.session.commit()
+
+
+class TestLeagueStateSnapshot:
+
+    def test_reads_within_interval_do_not_query(self, db, league):
+        from app.league_state_manager import league_state_manager, get_current_week
+
+        first = league_state_manager.snapshot()
+        with count_queries(db) as queries:
+            for _ in range(10):
+                assert get_current_week() == first.week
+        assert queries == []
+
+    def test_new_version_is_picked_up_at_next_check(self, db, league):
+        from app.league_state_manager import league_state_manager
+
+        before = league_state_manager.snapshot()
+        _advance_week(db, before.week + 1)
+        assert league_state_manager.snapshot() == before  # still inside the interval
+
+        with patch('app.league_state_manager.time.monotonic', return_value=league_state_manager._next_check):
+            after = league_state_manager.snapshot()
+        assert after.week == before.week + 1
+        assert after.version > before.version
+
+    def test_snapshot_is_immutable(self, db, league):
+        from app.league_state_manager import league_state_manager
+
+        with pytest.raises(AttributeError):
+            league_state_manager.snapshot().week = 9
+
+    def test_set_league_state_switches_immediately(self, db, league):
+        from app.league_state_manager import league_state_manager
+        from app.logic.league import set_league_state
+
+        week = league_state_manager.snapshot().week
+        response = MagicMock()
+        response.json.return_value = {'week': week + 1, 'season': '2024'}
+        with patch('app.logic.league.requests.get', return_value=response):
+            set_league_state()
+
+        assert league_state_manager.snapshot().week == week + 1
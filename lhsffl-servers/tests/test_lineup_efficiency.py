@@ -0,0 +1,142 @@
+"""
+Tests for lineup efficiency (app/logic/lineup_efficiency.py) and its /v1/teams endpoints.
+
+Scenarios
+─────────
+1. Fixed slots take the top scorers per position, FLEX the best of the rest
+2. SUPER_FLEX slots (LINEUP_SLOTS) fill after the more restrictive FLEX; flex slots
+   that don't nest (WRRB_FLEX with REC_FLEX) are filled exactly
+3. A started player with no known position counts toward actual points only
+4. The current-week refresh touches one week; the rebuild matches it
+5. Weekly and season-total endpoints
+"""
+
+import os
+from unittest.mock import patch
+
+from app.logic.lineup_efficiency import refresh_lineup_efficiency, rebuild_lineup_efficiency
+from app.models.lineup_efficiency import LineupEfficiency
+from tests.conftest import make_player, make_weekly_stat
+
+# sleeper_id -> position for the test roster
+_POSITIONS = {
+    1001: 'QB', 1002: 'QB',
+    1011: 'RB', 1012: 'RB', 1013: 'RB',
+    1021: 'WR', 1022: 'WR', 1023: 'WR', 1024: 'WR',
+    1031: 'TE', 1041: 'K',
+}
+
+
+def _players(db):
+    for sleeper_id, position in _POSITIONS.items():
+        make_player(db, sleeper_id, sleeper_id, 'Player', str(sleeper_id), position=position)
+    db.session.commit()
+
+
+def _week(db, week, roster, lineup, year=2024):
+    """lineup: {sleeper_id: (points, is_starter)}"""
+    for player_id, (points, starter) in lineup.items():
+        make_weekly_stat(db, year, week, roster, player_id, points, is_starter=starter)
+
+
+# Started 78; the bench QB (+5) and WR (+7 over a 5-point WR) make the optimal 90.
+_LINEUP = {
+    1001: (20.0, True), 1002: (25.0, False),
+    1011: (15.0, True), 1012: (10.0, True), 1013: (8.0, True),
+    1021: (5.0, True), 1022: (5.0, True), 1023: (5.0, True), 1024: (12.0, False),
+    1031: (3.0, True), 1041: (7.0, True),
+}
+
+
+def _get(year, week, roster):
+    return LineupEfficiency.query.filter_by(year=year, week=week, sleeper_roster_id=roster).one()
+
+
+class TestOptimalLineup:
+
+    def test_fixed_slots_then_flex(self, db, league):
+        _players(db)
+        _week(db, 1, 1, _LINEUP)
+        _week(db, 1, 2, {player: (points, True) for player, (points, _) in _LINEUP.items() if player != 1002})
+        db.session.commit()
+        rebuild_lineup_efficiency()
+
+        row = _get(2024, 1, 1)
+        assert (row.actual_points, row.optimal_points, row.points_left) == (78.0, 90.0, 12.0)
+        assert row.efficiency == round(78 / 90, 4)
+        # Roster 2 started its best nine: a perfect week
+        assert (_get(2024, 1, 2).points_left, _get(2024, 1, 2).efficiency) == (0.0, 1.0)
+
+    def test_super_flex(self, db, league):
+        _players(db)
+        _week(db, 1, 1, {1001: (30.0, True), 1002: (20.0, False), 1011: (5.0, True),
+                         1012: (9.0, False), 1021: (4.0, True), 1022: (1.0, True)})
+        db.session.commit()
+
+        with patch.dict(os.environ, {'LINEUP_SLOTS': 'QB,RB,WR,FLEX,SUPER_FLEX'}):
+            rebuild_lineup_efficiency()
+        # QB 30, RB 9, WR 4, FLEX RB 5, SUPER_FLEX QB 20
+        assert _get(2024, 1, 1).optimal_points == 68.0
+        assert _get(2024, 1, 1).actual_points == 40.0
+
+    def test_flex_slots_that_dont_nest(self, db, league):
+        _players(db)
+        _week(db, 1, 1, {1001: (20.0, True), 1021: (10.0, True), 1011: (5.0, False), 1031: (1.0, True)})
+        _week(db, 1, 2, {1001: (20.0, True), 1021: (10.0, True), 1022: (9.0, True), 1031: (30.0, False)})
+        db.session.commit()
+
+        with patch.dict(os.environ, {'LINEUP_SLOTS': 'QB,WRRB_FLEX,REC_FLEX'}):
+            rebuild_lineup_efficiency()
+        # WR 10 in WRRB_FLEX would leave REC_FLEX the TE's 1; the RB in WRRB_FLEX frees it for the WR
+        assert _get(2024, 1, 1).optimal_points == 35.0
+        # TE 30 in REC_FLEX, the better WR in WRRB_FLEX
+        assert _get(2024, 1, 2).optimal_points == 60.0
+
+    def test_unknown_position_counts_as_started(self, db, league):
+        _players(db)
+        _week(db, 1, 1, {1001: (10.0, True), 9999: (30.0, True)})
+        db.session.commit()
+        rebuild_lineup_efficiency()
+
+        row = _get(2024, 1, 1)
+        assert (row.actual_points, row.optimal_points, row.efficiency) == (40.0, 40.0, 1.0)
+
+
+class TestRefresh:
+
+    def test_current_week_refresh_matches_rebuild(self, db, league):
+        _players(db)
+        _week(db, 1, 1, _LINEUP)
+        db.session.commit()
+        rebuild_lineup_efficiency()
+
+        _week(db, 2, 1, {1001: (18.0, False), 1002: (22.0, True)})
+        assert refresh_lineup_efficiency(2024, 2) == 1
+        db.session.commit()
+        assert (_get(2024, 2, 1).actual_points, _get(2024, 2, 1).optimal_points) == (22.0, 22.0)
+        assert _get(2024, 1, 1).optimal_points == 90.0
+
+        incremental = sorted((r.week, r.actual_points, r.optimal_points) for r in LineupEfficiency.query)
+        assert rebuild_lineup_efficiency() == {'success': True, 'roster_weeks': 2}
+        assert sorted((r.week, r.actual_points, r.optimal_points) for r in LineupEfficiency.query) == incremental
+
+
+class TestEndpoints:
+
+    def test_team_weeks_and_league_totals(self, client, db, league):
+        _players(db)
+        _week(db, 1, 1, _LINEUP)
+        _week(db, 2, 1, {1001: (18.0, False), 1002: (22.0, True)})
+        _week(db, 1, 2, {1001: (10.0, True)})
+        db.session.commit()
+        rebuild_lineup_efficiency()
+
+        data = client.get('/v1/teams/1/lineup_efficiency', query_string={'year': 2024}).get_json()
+        assert [w['week'] for w in data['weeks']] == [1, 2]
+        assert data['season'] == {'weeks': 2, 'actual_points': 100.0, 'optimal_points': 112.0,
+                                  'points_left': 12.0, 'efficiency': round(100 / 112, 4)}
+
+        teams = client.get('/v1/teams/lineup_efficiency', query_string={'year': 2024}).get_json()['teams']
+        assert [t['team_name'] for t in teams] == ['Team 2', 'Team 1']
+
+        assert client.get('/v1/teams/99/lineup_efficiency').status_code == 404
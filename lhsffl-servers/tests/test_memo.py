@@ -0,0 +1,181 @@
+"""
+Tests for app.memo (keyed, invalidatable memoization).
+
+Scenarios
+─────────
+1. Results are cached per argument tuple; list arguments are usable as keys
+2. Entries expire after ttl
+3. LRU bound evicts the least recently used key
+4. Concurrent misses on one key run the function once (single-flight)
+5. Stale entries are served while exactly one caller refreshes
+6. invalidate(tag) drops only caches registered under that tag
+7. A computation that straddles an invalidation is not cached
+8. Single-flight locks don't outlive their computation, even when it fails or is discarded
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+from app.memo import memoize, invalidate
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _counting(**memo_kwargs):
+    calls = []
+
+    @memoize(**memo_kwargs)
+    def fn(*args):
+        calls.append(args)
+        return len(calls)
+
+    return fn, calls
+
+
+def test_cached_per_arguments():
+    fn, calls = _counting(ttl=60)
+    assert fn(1) == fn(1) == 1
+    assert fn(2) == 2
+    assert fn([3, 4]) == fn([3, 4]) == 3
+    assert len(calls) == 3
+
+
+def test_entries_expire_after_ttl():
+    clock = _Clock()
+    fn, calls = _counting(ttl=60)
+    with patch('app.memo.time.monotonic', clock):
+        fn('a')
+        clock.now += 59
+        fn('a')
+        assert len(calls) == 1
+        clock.now += 2
+        fn('a')
+        assert len(calls) == 2
+
+
+def test_lru_evicts_least_recently_used():
+    fn, calls = _counting(ttl=60, maxsize=2)
+    fn('a')
+    fn('b')
+    fn('a')  # 'b' is now least recently used
+    fn('c')
+    assert len(fn.memo) == 2
+    fn('a')
+    assert len(calls) == 3
+    fn('b')
+    assert len(calls) == 4
+
+
+def test_concurrent_misses_compute_once():
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    @memoize(ttl=60)
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return 'value'
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(slow())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    started.wait(5)
+    time.sleep(0.05)
+    release.set()
+    for t in threads:
+        t.join(5)
+
+    assert calls == [1]
+    assert results == ['value'] * 8
+
+
+def test_stale_value_served_while_one_caller_refreshes():
+    clock = _Clock()
+    in_refresh = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    @memoize(ttl=60, stale_ttl=60)
+    def fn():
+        calls.append(1)
+        if len(calls) == 2:
+            in_refresh.set()
+            release.wait(5)
+        return len(calls)
+
+    with patch('app.memo.time.monotonic', clock):
+        assert fn() == 1
+        clock.now += 90  # past ttl, inside the stale window
+
+        refreshed = []
+        refresher = threading.Thread(target=lambda: refreshed.append(fn()))
+        refresher.start()
+        in_refresh.wait(5)
+
+        assert fn() == 1  # doesn't wait on, or duplicate, the refresh
+        release.set()
+        refresher.join(5)
+
+        assert refreshed == [2]
+        assert fn() == 2
+        assert len(calls) == 2
+
+
+def test_invalidate_by_tag():
+    tx, tx_calls = _counting(ttl=60, tags=('test_transactions',))
+    other, other_calls = _counting(ttl=60, tags=('test_players',))
+    tx()
+    other()
+
+    invalidate('test_transactions')
+    tx()
+    other()
+
+    assert len(tx_calls) == 2
+    assert len(other_calls) == 1
+
+
+def test_result_computed_across_invalidation_is_not_kept():
+    calls = []
+
+    @memoize(ttl=60, tags=('test_race',))
+    def fn():
+        calls.append(1)
+        if len(calls) == 1:
+            invalidate('test_race')  # data changed while we were reading it
+        return len(calls)
+
+    assert fn() == 1
+    assert fn() == 2
+    assert fn() == 2
+
+
+def test_flight_locks_are_dropped():
+    calls = []
+
+    @memoize(ttl=60, tags=('test_flights',))
+    def fn(key):
+        calls.append(key)
+        if key == 'fails':
+            raise ValueError(key)
+        if key == 'raced':
+            invalidate('test_flights')
+        return key
+
+    fn('kept')
+    fn('raced')
+    try:
+        fn('fails')
+    except ValueError:
+        pass
+    assert fn.memo._flights == {}
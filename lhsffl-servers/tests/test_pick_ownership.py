@@ -0,0 +1,82 @@
+"""
+Tests for the draft-pick ownership ledger (app/logic/pick_ownership.py).
+
+Scenarios
+─────────
+1. current_pick_owners overlays ledger owners on the untraded defaults
+2. Ownership as of a past date comes from the history, also through
+   GET /v1/transactions/pick_ownership
+3. Trades applied out of order converge to the same ledger as a rebuild
+4. Pending trades don't move a pick
+"""
+
+from datetime import datetime
+
+from tests.conftest import with_trade
+
+
+PICK = {'season': 2026, 'round': 1, 'roster_id': 2}
+
+
+def _ledger():
+    from app.models.pick_ownership import PickOwnership
+    from app.models.pick_ownership_history import PickOwnershipHistory
+    current = sorted((r.season, r.round, r.original_roster_id, r.owner_roster_id, r.transaction_id)
+                     for r in PickOwnership.query)
+    history = sorted((r.transaction_id, r.season, r.round, r.original_roster_id, r.owner_roster_id)
+                     for r in PickOwnershipHistory.query)
+    return current, history
+
+
+class TestPickOwnership:
+
+    @with_trade(name='first', roster_ids=[1, 2], picks=[{**PICK, 'owner_id': 1, 'previous_owner_id': 2}],
+                created_at=datetime(2024, 9, 1))
+    @with_trade(name='second', roster_ids=[1, 3], picks=[{**PICK, 'owner_id': 3, 'previous_owner_id': 1}],
+                created_at=datetime(2024, 10, 1))
+    @with_trade(name='pending', roster_ids=[3, 4], picks=[{**PICK, 'owner_id': 4, 'previous_owner_id': 3}],
+                status='pending', created_at=datetime(2024, 11, 1))
+    def test_current_and_as_of(self, client, db, league, first, second, pending):
+        from app.logic.pick_ownership import apply_pick_trades, pick_owner
+        from app.logic.history import current_pick_owners
+
+        apply_pick_trades([first.transaction_id, second.transaction_id, pending.transaction_id])
+        db.session.commit()
+
+        owners = {(o['season'], o['round'], o['original_roster_id']): o['current_owner_roster_id']
+                  for o in current_pick_owners(seasons=[2026])}
+        assert owners[(2026, 1, 2)] == 3
+        assert owners[(2026, 1, 1)] == 1
+        assert owners[(2026, 2, 2)] == 2
+
+        assert pick_owner(2026, 1, 2) == 3
+        assert pick_owner(2026, 1, 2, as_of=datetime(2024, 8, 1)) == 2
+        assert pick_owner(2026, 1, 2, as_of=datetime(2024, 9, 15)) == 1
+        assert pick_owner(2026, 1, 2, as_of=datetime(2024, 10, 1)) == 3
+
+        past = {(o['season'], o['round'], o['original_roster_id']): o['current_owner_roster_id']
+                for o in current_pick_owners(seasons=[2026], as_of=datetime(2024, 9, 15))}
+        assert past[(2026, 1, 2)] == 1
+
+        resp = client.get('/v1/transactions/pick_ownership?season=2026&as_of=2024-09-15T00:00:00Z')
+        served = {(o['season'], o['round'], o['original_roster_id']): o['current_owner_roster_id']
+                  for o in resp.get_json()['picks']}
+        assert served == past
+        assert client.get('/v1/transactions/pick_ownership?as_of=soon').status_code == 400
+
+    @with_trade(name='first', roster_ids=[1, 2], picks=[{**PICK, 'owner_id': 1, 'previous_owner_id': 2}],
+                created_at=datetime(2024, 9, 1))
+    @with_trade(name='second', roster_ids=[1, 3], picks=[{**PICK, 'owner_id': 3, 'previous_owner_id': 1}],
+                created_at=datetime(2024, 10, 1))
+    def test_out_of_order_matches_rebuild(self, client, db, league, first, second):
+        from app.logic.pick_ownership import apply_pick_trades, rebuild_pick_ownership
+
+        apply_pick_trades([second.transaction_id])
+        db.session.commit()
+        apply_pick_trades([first.transaction_id])
+        db.session.commit()
+        incremental = _ledger()
+
+        rebuild_pick_ownership()
+        assert _ledger() == incremental
+        assert incremental[0] == [(2026, 1, 2, 3, second.transaction_id)]
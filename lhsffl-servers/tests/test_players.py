@@ -0,0 +1,183 @@
+"""
+Tests for GET /v1/players/search (app/logic/player_search.py) and
+GET /v1/players/<id>/stats (app/logic/player_stats.py).
+
+Scenarios
+─────────
+1. Prefixes of first and last names match; every query token must match
+2. Exact tokens outrank prefixes, rostered players outrank free agents
+3. Punctuation, accents and multi-word last names are normalized
+4. A one-letter typo still finds the player when nothing matches as a prefix
+5. NFL team abbreviations match whole; warm searches run no queries; a failed
+   index rebuild doesn't fail the players sync
+6. Season rollups split by roster, with mean, std dev and best week
+7. Incremental refresh matches a full rebuild; stats endpoints 200 / 404
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.logic.player_stats import refresh_player_stats, rebuild_player_stats, get_player_stats
+from app.models.player_season_stats import PlayerSeasonStats
+from app.models.player_career_stats import PlayerCareerStats
+from tests.conftest import make_player, make_weekly_stat, count_queries
+
+
+def _seed(db):
+    players = [
+        make_player(db, 1, 4046, 'Patrick', 'Mahomes', position='QB'),
+        make_player(db, 2, 4881, 'Lamar', 'Jackson', position='QB'),
+        make_player(db, 3, 7564, "Ja'Marr", 'Chase'),
+        make_player(db, 4, 7547, 'Amon-Ra', 'St. Brown'),
+        make_player(db, 5, 1466, 'Travis', 'Kelce', position='TE'),
+        make_player(db, 6, 9999, 'Pat', 'Freiermuth', position='TE'),
+        make_player(db, 7, 8888, 'Jackson', 'Mahon'),
+    ]
+    players[0].nfl_team = players[4].nfl_team = 'KC'
+    players[1].nfl_team = 'BAL'
+    db.session.commit()
+    return players
+
+
+def _search(client, q, **params):
+    r = client.get('/v1/players/search', query_string={'q': q, **params})
+    assert r.status_code == 200
+    return [p['sleeper_id'] for p in r.get_json()['players']]
+
+
+class TestPlayerSearch:
+
+    def test_prefix_and_all_tokens(self, client, db):
+        _seed(db)
+        assert _search(client, 'mah') == [4046, 8888]
+        assert _search(client, 'pat mah') == [4046]
+        assert _search(client, 'zzz') == []
+
+    def test_exact_and_rostered_rank_first(self, client, db, league):
+        _seed(db)
+        assert _search(client, 'pat')[0] == 9999          # exact first name beats "Patrick"
+        assert _search(client, 'jackson')[:2] == [4881, 8888]  # last name beats first name
+
+        from app.models.players import Players
+        Players.query.filter_by(sleeper_id=8888).one().team_id = 1
+        db.session.commit()
+        from app.logic.player_search import get_player_index
+        get_player_index.invalidate()
+        assert _search(client, 'mah') == [8888, 4046]
+        assert _search(client, 'mahomes') == [4046]
+
+    def test_normalization(self, client, db):
+        _seed(db)
+        assert _search(client, 'jamarr') == [7564]
+        assert _search(client, 'amon ra st brown') == [7547]
+        assert _search(client, 'stbrown') == [7547]
+
+    def test_typo_fallback(self, client, db):
+        _seed(db)
+        assert _search(client, 'mahomse') == [4046]
+        assert _search(client, 'kelse') == [1466]
+
+    def test_team_and_limit(self, client, db):
+        _seed(db)
+        assert sorted(_search(client, 'kc')) == [1466, 4046]
+        assert _search(client, 'kc trav') == [1466]
+        assert len(_search(client, 'j', limit=2)) == 2
+
+        with count_queries(db) as queries:
+            _search(client, 'jackson')
+        assert queries == []
+
+    def test_query_required(self, client, db):
+        assert client.get('/v1/players/search?q=').status_code == 400
+
+    def test_failed_index_rebuild_does_not_fail_sync(self, db):
+        from app.models.sync_status import SyncStatus
+        from app.services.sync_service import SyncService
+        with patch('app.services.sync_service.synchronize_players', return_value={}), \
+                patch('app.logic.player_search.PlayerIndex.build', side_effect=RuntimeError('boom')):
+            assert SyncService.sync_players()['success'] is True
+        assert SyncStatus.query.filter_by(sync_item='players').one().success is True
+
+
+def _weekly(db, player, year, roster, scores, first_week=1, starter=True):
+    for offset, points in enumerate(scores):
+        make_weekly_stat(db, year, first_week + offset, roster, player, points, is_starter=starter)
+
+
+class TestPlayerStats:
+
+    @pytest.fixture
+    def weekly(self, db):
+        # 4046: traded from roster 1 to roster 2 after week 3 of 2024; one bench week
+        _weekly(db, 4046, 2024, 1, [10.0, 20.0, 30.0])
+        _weekly(db, 4046, 2024, 2, [40.0], first_week=4)
+        _weekly(db, 4046, 2024, 2, [2.0], first_week=5, starter=False)
+        _weekly(db, 4046, 2023, 1, [12.0, 8.0])
+        _weekly(db, 7564, 2024, 3, [5.0, 5.0])
+        db.session.commit()
+
+    def test_season_rollup_by_roster(self, db, weekly):
+        refresh_player_stats(2024, [4046, 7564])
+        db.session.commit()
+
+        rows = {r.sleeper_roster_id: r for r in PlayerSeasonStats.query.filter_by(player_sleeper_id=4046, year=2024)}
+        assert set(rows) == {1, 2}
+        assert (rows[1].games, rows[1].starts, rows[1].total_points) == (3, 3, 60.0)
+        assert rows[1].mean_points == 20.0
+        assert rows[1].std_dev_points == pytest.approx(8.16, abs=0.01)
+        assert (rows[1].best_points, rows[1].best_week) == (30.0, 3)
+        assert (rows[2].games, rows[2].starts, rows[2].starter_points, rows[2].total_points) == (2, 1, 40.0, 42.0)
+
+        stats = get_player_stats(4046, year=2024)
+        season = stats['seasons'][0]
+        assert (season['games'], season['total_points'], season['best_week']) == (5, 102.0, 4)
+        assert [r['sleeper_roster_id'] for r in season['rosters']] == [1, 2]
+
+    def test_career_rollup(self, db, weekly):
+        refresh_player_stats(2024, [4046])
+        refresh_player_stats(2023, [4046])
+        db.session.commit()
+
+        career = db.session.get(PlayerCareerStats, 4046)
+        assert (career.seasons, career.first_year, career.last_year) == (2, 2023, 2024)
+        assert (career.games, career.total_points) == (7, 122.0)
+        assert (career.best_points, career.best_year, career.best_week) == (40.0, 2024, 4)
+        assert [s['year'] for s in get_player_stats(4046)['seasons']] == [2024, 2023]
+
+    def test_refresh_matches_rebuild(self, db, weekly):
+        refresh_player_stats(2024, [4046, 7564])
+        refresh_player_stats(2023, [4046])
+        db.session.commit()
+        incremental = {pid: get_player_stats(pid) for pid in (4046, 7564)}
+
+        # A new week for one player only touches that player's rows
+        _weekly(db, 7564, 2024, 3, [9.0], first_week=3)
+        refresh_player_stats(2024, [7564])
+        db.session.commit()
+        assert get_player_stats(4046) == incremental[4046]
+        assert get_player_stats(7564)['career']['games'] == 3
+
+        result = rebuild_player_stats()
+        assert result == {'success': True, 'season_rows': 4, 'players': 2}
+        assert get_player_stats(4046) == incremental[4046]
+        assert get_player_stats(7564)['career']['total_points'] == 19.0
+
+    def test_stats_endpoints(self, client, db, weekly):
+        rebuild_player_stats()
+
+        r = client.get('/v1/players/4046/stats')
+        assert r.status_code == 200
+        body = r.get_json()
+        assert body['success'] is True
+        assert body['career']['games'] == 7
+        assert len(body['seasons']) == 2
+
+        r = client.get('/v1/players/4046/stats/2023')
+        assert r.status_code == 200
+        assert [s['year'] for s in r.get_json()['seasons']] == [2023]
+
+        assert client.get('/v1/players/4046/stats/2019').status_code == 404
+        r = client.get('/v1/players/1/stats')
+        assert r.status_code == 404
+        assert r.get_json()['success'] is False
@@ -0,0 +1,106 @@
+"""
+Tests for the Monte Carlo playoff odds (app/logic/playoff_odds.py) and
+GET /v1/league/playoff_odds.
+
+Scenarios
+─────────
+1. Clinched and eliminated teams come out at 100% / 0%; odds add up to the playoff spots
+2. A seed gives the same odds in-process and spread over a process pool
+3. Completed and playoff-week games are not simulated
+4. The matchups sync stores the week's odds; the endpoint serves them, 404 before
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from app.logic.playoff_odds import simulate_playoff_odds
+from app.models.team_records import TeamRecords
+from tests.conftest import make_matchup
+
+
+@pytest.fixture(autouse=True)
+def two_playoff_teams():
+    with patch.dict(os.environ, {'PLAYOFF_TEAMS': '2', 'PLAYOFF_WEEK_START': '8',
+                                 'PLAYOFF_ODDS_SIMULATIONS': '5000'}):
+        yield
+
+
+def _seed(db, records=((5, 0), (3, 2), (2, 3), (0, 5))):
+    for team_id, (wins, losses) in enumerate(records, start=1):
+        db.session.add(TeamRecords(team_id=team_id, year=2024, wins=wins, losses=losses,
+                                   points_for=100.0 * wins, points_against=100.0 * losses))
+    make_matchup(db, 2024, 5, 1, 2, 130.0, 90.0)
+    make_matchup(db, 2024, 5, 3, 4, 110.0, 100.0)
+    make_matchup(db, 2024, 6, 1, 3, 0.0, 0.0, completed=False)
+    make_matchup(db, 2024, 6, 2, 4, 0.0, 0.0, completed=False)
+    make_matchup(db, 2024, 7, 1, 4, 0.0, 0.0, completed=False)
+    make_matchup(db, 2024, 7, 2, 3, 0.0, 0.0, completed=False)
+    db.session.commit()
+
+
+class TestSimulation:
+
+    def test_clinched_and_eliminated(self, db, league):
+        _seed(db)
+        odds = {o['sleeper_roster_id']: o for o in simulate_playoff_odds(2024, seed=7)}
+
+        assert odds[1]['playoff_odds'] == 1.0       # 5 wins; 3 and 4 can reach 4 at most
+        assert odds[4]['playoff_odds'] == 0.0       # 0-5 with two games left
+        assert 0 < odds[3]['playoff_odds'] < odds[2]['playoff_odds'] < 1
+        assert sum(o['playoff_odds'] for o in odds.values()) == pytest.approx(2)
+        assert sum(o['top_seed_odds'] for o in odds.values()) == pytest.approx(1)
+        assert 5 <= odds[1]['projected_wins'] <= 7
+        assert odds[1]['simulations'] == 5000
+
+    def test_seeded_runs_match_across_workers(self, db, league):
+        _seed(db)
+        with patch('app.logic.playoff_odds.CHUNK_SIZE', 1000):
+            in_process = simulate_playoff_odds(2024, seed=42)
+            pooled = simulate_playoff_odds(2024, seed=42, workers=2)
+        assert pooled == in_process
+        assert simulate_playoff_odds(2024, seed=43) != in_process
+
+    def test_only_remaining_regular_season_games(self, db, league):
+        _seed(db, records=((4, 1), (4, 1), (1, 4), (1, 4)))
+        make_matchup(db, 2024, 8, 3, 4, 0.0, 0.0, completed=False)      # playoff week
+        db.session.commit()
+
+        odds = {o['sleeper_roster_id']: o for o in simulate_playoff_odds(2024, seed=1)}
+        # Two games left each: 3 and 4 top out at 3 wins, behind 1 and 2
+        assert odds[3]['playoff_odds'] == odds[4]['playoff_odds'] == 0.0
+        assert odds[3]['projected_wins'] + odds[4]['projected_wins'] <= 6
+
+    def test_no_records(self, db, league):
+        assert simulate_playoff_odds(2024) == []
+
+
+class TestPlayoffOddsEndpoint:
+
+    def test_stored_by_matchups_sync(self, client, db, league):
+        from app.services.sync_service import SyncService
+        _seed(db)
+        assert client.get('/v1/league/playoff_odds').status_code == 404
+
+        with patch('app.services.sync_service.synchronize_matchups', return_value={}):
+            assert SyncService.sync_matchups()['success'] is True
+
+        r = client.get('/v1/league/playoff_odds')
+        assert r.status_code == 200
+        data = r.get_json()
+        assert (data['year'], data['week']) == (2024, 5)
+        assert [t['sleeper_roster_id'] for t in data['teams']][0] == 1
+        assert data['teams'][0]['team_name'] == 'Team 1'
+        assert data['teams'][-1]['playoff_odds'] == 0.0
+
+        assert client.get('/v1/league/playoff_odds', query_string={'week': 4}).status_code == 404
+
+    def test_rerun_replaces_the_week(self, client, db, league):
+        from app.logic.playoff_odds import refresh_playoff_odds
+        from app.models.playoff_odds import PlayoffOdds
+        _seed(db)
+
+        assert refresh_playoff_odds(seed=1) == {'success': True, 'rows': 4}
+        assert refresh_playoff_odds(seed=2) == {'success': True, 'rows': 4}
+        assert PlayoffOdds.query.count() == 4
@@ -0,0 +1,155 @@
+"""
+Tests for the league record book (app/logic/record_book.py) and GET /v1/league/records.
+
+Scenarios
+─────────
+1. Each category ranks the right rows: byes, unfinished games and short seasons don't count
+2. Week-by-week refreshes (new weeks and score corrections) agree with a full rebuild,
+   including when a correction pushes entries out of a trimmed list
+3. The matchups sync refreshes the book; the endpoint names teams and players and honours limit
+"""
+
+import random
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.logic.record_book import (CATEGORIES, get_record_book, rebuild_record_book,
+                                   refresh_matchup_records, refresh_player_records)
+from app.memo import invalidate
+from app.models.league_records import LeagueRecords
+from app.models.matchups import Matchups
+from app.models.player_weekly_stats import PlayerWeeklyStats
+from tests.conftest import make_matchup, make_weekly_stat
+
+
+@pytest.fixture(autouse=True)
+def short_seasons():
+    with patch('app.logic.record_book.MIN_SEASON_GAMES', 2):
+        yield
+
+
+def _book():
+    return {category: [(r.value, r.year, r.week, r.sleeper_roster_id, r.player_sleeper_id)
+                       for r in LeagueRecords.query.filter_by(category=category).order_by(LeagueRecords.rank)]
+            for category in CATEGORIES}
+
+
+class TestCategories:
+
+    def test_rebuild_ranks_each_category(self, db, league):
+        make_matchup(db, 2024, 1, 1, 2, 150.0, 80.0)
+        make_matchup(db, 2024, 1, 3, 4, 101.0, 100.5)
+        make_matchup(db, 2024, 2, 1, 3, 120.0, 110.0)
+        make_matchup(db, 2024, 2, 2, 4, 95.0, 95.0)
+        make_matchup(db, 2024, 3, 1, 4, 200.0, 0.0, completed=False)     # still in progress
+        db.session.add(Matchups(year=2024, week=3, sleeper_matchup_id=9, sleeper_roster_id=2,
+                                opponent_sleeper_roster_id=2, points_for=0.0, completed=True))  # bye
+        make_weekly_stat(db, 2024, 1, 1, 101, 45.5)
+        make_weekly_stat(db, 2024, 2, 3, 102, 30.0)
+        db.session.commit()
+
+        assert rebuild_record_book() == {'success': True, 'records': 8 + 8 + 3 + 4 + 4 + 4 + 2}
+        book = _book()
+        assert book['highest_score'][0] == (150.0, 2024, 1, 1, None)
+        assert book['lowest_score'][0] == (80.0, 2024, 1, 2, None)
+        assert [e[0] for e in book['biggest_blowout']] == [70.0, 10.0, 0.5]
+        assert book['closest_game'][0] == (0.0, 2024, 2, 2, None)    # the tie, once
+        assert book['closest_game'][1] == (0.5, 2024, 1, 3, None)
+        assert book['best_player_week'][0] == (45.5, 2024, 1, 1, 101)
+
+        best = LeagueRecords.query.filter_by(category='best_season', rank=1).one()
+        assert (best.sleeper_roster_id, best.wins, best.losses, best.value) == (1, 2, 0, 1.0)
+        worst = LeagueRecords.query.filter_by(category='worst_season', rank=1).one()
+        assert (worst.sleeper_roster_id, worst.wins, worst.losses, worst.ties) == (2, 0, 1, 1)
+
+    def test_short_seasons_dont_qualify(self, db, league):
+        make_matchup(db, 2024, 1, 1, 2, 150.0, 80.0)
+        db.session.commit()
+        with patch('app.logic.record_book.MIN_SEASON_GAMES', 10):
+            rebuild_record_book()
+        assert _book()['best_season'] == []
+        assert len(_book()['highest_score']) == 2
+
+
+class TestIncremental:
+
+    @pytest.fixture
+    def small_book(self):
+        with patch('app.logic.record_book.TOP_K', 3), patch('app.logic.record_book.KEEP', 5):
+            yield
+
+    def test_weekly_refresh_matches_rebuild(self, db, league, small_book):
+        rng = random.Random(4)
+        for year in (2023, 2024):
+            for week in range(1, 7):
+                pairs = ((1, 2), (3, 4)) if week % 2 else ((1, 3), (2, 4))
+                for roster, opponent in pairs:
+                    make_matchup(db, year, week, roster, opponent, round(rng.uniform(60, 160), 2),
+                          round(rng.uniform(60, 160), 2))
+                for player in range(101, 105):
+                    make_weekly_stat(db, year, week, player - 100, player, round(rng.uniform(0, 40), 2))
+                refresh_matchup_records(year, week)
+                refresh_player_records(year, week)
+                db.session.commit()
+
+        # Correct the best score and best player week down to nothing special
+        top = Matchups.query.order_by(Matchups.points_for.desc()).first()
+        top.points_for = 61.0
+        Matchups.query.filter_by(year=top.year, week=top.week, sleeper_roster_id=top.opponent_sleeper_roster_id) \
+            .one().points_against = 61.0
+        best = PlayerWeeklyStats.query.order_by(PlayerWeeklyStats.points.desc()).first()
+        best.points = 1.0
+        refresh_matchup_records(top.year, top.week)
+        refresh_player_records(best.year, best.week)
+        db.session.commit()
+
+        incremental = _book()
+        rebuild_record_book()
+        rebuilt = _book()
+        for category in CATEGORIES:
+            assert len(incremental[category]) >= 3
+            assert incremental[category] == rebuilt[category][:len(incremental[category])], category
+
+
+class TestEndpoint:
+
+    def test_matchup_sync_updates_the_book(self, client, db, league):
+        from app.logic.league import synchronize_matchups
+        week = league.league_state.week
+        make_matchup(db, 2024, week, 1, 2, 0.0, 0.0)
+        make_matchup(db, 2024, week - 1, 3, 4, 110.0, 100.0)
+        make_weekly_stat(db, 2024, week - 1, 3, 101, 33.3)
+        db.session.commit()
+        rebuild_record_book()
+
+        response = MagicMock()
+        response.json.return_value = [{'matchup_id': 1, 'roster_id': 1, 'points': 140.0},
+                                      {'matchup_id': 1, 'roster_id': 2, 'points': 90.0}]
+        with patch('app.logic.league.requests.get', return_value=response):
+            synchronize_matchups()
+        invalidate('matchups')
+
+        data = client.get('/v1/league/records').get_json()['records']
+        assert set(data) == set(CATEGORIES)
+        high = data['highest_score'][0]
+        assert (high['value'], high['week'], high['team_name'], high['opponent_team_name']) == \
+            (140.0, week, 'Team 1', 'Team 2')
+        assert data['biggest_blowout'][0]['value'] == 50.0
+
+        player = data['best_player_week'][0]
+        assert (player['value'], player['team_name']) == (33.3, 'Team 3')
+        assert player['player_name'] is not None
+
+        assert len(client.get('/v1/league/records', query_string={'limit': 1})
+                   .get_json()['records']['highest_score']) == 1
+
+    def test_book_is_served_from_memory(self, db, league):
+        from tests.conftest import count_queries
+        make_matchup(db, 2024, 1, 1, 2, 150.0, 80.0)
+        db.session.commit()
+        rebuild_record_book()
+        get_record_book()
+        with count_queries(db) as queries:
+            assert get_record_book()['highest_score'][0]['value'] == 150.0
+        assert queries == []
@@ -0,0 +1,80 @@
+"""
+Tests for the static JSON export (app/logic/static_export.py).
+
+Scenarios
+─────────
+1. Public routes are exported per team/transaction/player with a manifest; live and admin routes are not
+2. Exported files hold the same JSON the API serves, plus a gzipped copy
+3. A re-export only writes files whose content changed, and prunes files two versions old
+"""
+
+import gzip
+import json
+from unittest.mock import PropertyMock, patch
+
+import pytest
+
+from tests.conftest import make_weekly_stat, with_trade
+
+
+@pytest.fixture
+def export(app, tmp_path):
+    from app.logic.static_export import export_static
+    from app.league_state_manager import LeagueStateManager
+
+    def run():
+        # Pin the season so league state isn't loaded (and cached) by the rendered views.
+        with patch.object(LeagueStateManager, 'current_year', new_callable=PropertyMock, return_value=2024), \
+                patch.object(LeagueStateManager, 'current_week', new_callable=PropertyMock, return_value=1):
+            result = export_static(app, str(tmp_path), workers=1)
+        manifest = json.loads((tmp_path / 'manifest.json').read_text())
+        return result, manifest
+
+    return run
+
+
+class TestStaticExport:
+
+    @with_trade(roster_ids=[1, 2], adds={1: [101], 2: [102]}, drops={1: [102], 2: [101]})
+    def test_manifest_covers_public_routes(self, client, db, league, trade, export, tmp_path):
+        from app.logic.player_stats import rebuild_player_stats
+        make_weekly_stat(db, 2024, 1, 1, 101, 12.5)
+        db.session.commit()
+        rebuild_player_stats()
+
+        result, manifest = export()
+        files = manifest['files']
+
+        assert result['success'] is True and manifest['version'] == 1
+        for path in ['/v1/teams', '/v1/teams/1', '/v1/teams/all_time', '/v1/transactions/team/4',
+                     f'/v1/transactions/{trade.transaction_id}', '/v1/transactions/trade-tree/101',
+                     '/v1/players/101/stats/2024', '/v1/superlatives/teams']:
+            assert path in files
+        for path in ['/v1/league/state', '/v1/matchups/current_matchups', '/v1/transactions/trades/random',
+                     '/v1/admin/team-owners', '/v1/udfa/players', '/v1/bootstrap', '/v1/events/stream']:
+            assert path not in files
+
+        entry = files['/v1/teams/2']
+        with patch('app.league_state_manager.get_current_year', return_value=2024):
+            served = client.get('/v1/teams/2').get_json()
+        assert json.loads((tmp_path / entry['file']).read_bytes()) == served
+        assert json.loads(gzip.decompress((tmp_path / f"{entry['file']}.gz").read_bytes())) == served
+
+    def test_reexport_is_incremental(self, db, league, export, tmp_path):
+        from app.models.teams import Teams
+
+        first, v1 = export()
+        second, v2 = export()
+        assert second['written'] == 0 and second['unchanged'] == first['files']
+        assert v2['version'] == 2 and v2['files'] == v1['files']
+
+        db.session.get(Teams, 1).team_name = 'Renamed'
+        db.session.commit()
+        third, v3 = export()
+        changed = {path for path in v3['files'] if v3['files'][path] != v2['files'][path]}
+        assert third['written'] == len(changed) > 0
+        assert '/v1/teams/1' in changed and '/v1/teams/2' not in changed
+        assert (tmp_path / v2['files']['/v1/teams/1']['file']).exists()  # kept for clients on v2
+
+        export()
+        assert not (tmp_path / v2['files']['/v1/teams/1']['file']).exists()
@@ -0,0 +1,115 @@
+"""
+Tests for /v1/superlatives and the materialized totals behind them.
+
+Coverage:
+  GET /v1/superlatives/players   – read from PlayerTransactionTotals / PlayerRosterAdds
+  GET /v1/superlatives/teams     – read from TeamTransactionTotals / TradePartners
+  apply_transactions()           – incremental updates match a full rebuild
+  synchronize_transactions()     – folds newly ingested transactions into the totals
+"""
+
+from unittest.mock import patch, MagicMock
+
+from tests.conftest import with_trade, with_waiver
+
+
+def _snapshot():
+    from app.models.player_transaction_totals import PlayerTransactionTotals
+    from app.models.player_roster_adds import PlayerRosterAdds
+    from app.models.team_transaction_totals import TeamTransactionTotals
+    from app.models.trade_partners import TradePartners
+    return (
+        sorted((r.player_sleeper_id, r.trade_count, r.team_count, r.drop_count) for r in PlayerTransactionTotals.query),
+        sorted((r.player_sleeper_id, r.sleeper_roster_id, r.times_added) for r in PlayerRosterAdds.query),
+        sorted((r.sleeper_roster_id, r.trade_count, r.pickup_count, r.picks_traded) for r in TeamTransactionTotals.query),
+        sorted((r.roster_id_1, r.roster_id_2, r.trade_count) for r in TradePartners.query),
+    )
+
+
+class TestSuperlativesEndpoints:
+
+    @with_trade(name='t1', roster_ids=[1, 2], adds={1: [101], 2: [102]}, drops={1: [102], 2: [101]},
+                picks=[{'season': 2025, 'round': 1, 'roster_id': 2, 'owner_id': 1, 'previous_owner_id': 2}])
+    @with_trade(name='t2', roster_ids=[1, 3], adds={3: [101]}, drops={1: [101]})
+    @with_trade(name='t3', roster_ids=[2, 1], adds={2: [101]}, drops={3: [101]})
+    @with_waiver(name='w1', roster_id=2, add=101, drop=105)
+    @with_trade(name='pending', roster_ids=[3, 4], adds={4: [110]}, status='pending')
+    def test_player_and_team_superlatives(self, client, db, league, t1, t2, t3, w1, pending):
+        from app.logic.superlatives import rebuild_superlative_totals
+        rebuild_superlative_totals()
+
+        players = client.get('/v1/superlatives/players').get_json()['superlatives']
+        assert players['most_traded'][0]['player_sleeper_id'] == 101
+        assert players['most_traded'][0]['trade_count'] == 3
+        # 101 was added by rosters 2 (twice), 3 and 1
+        assert players['most_teams'][0] == {**players['most_teams'][0], 'player_sleeper_id': 101, 'team_count': 3}
+        assert players['boomerang'] == [{**players['boomerang'][0], 'player_sleeper_id': 101, 'times_added': 2}]
+        assert not any(p['player_sleeper_id'] == 110 for p in players['most_teams'])
+
+        teams = client.get('/v1/superlatives/teams').get_json()['superlatives']
+        assert [(t['sleeper_roster_id'], t['trade_count']) for t in teams['most_trades']] == [(1, 3), (2, 2), (3, 1)]
+        assert teams['frequent_trade_partners'][0]['trade_count'] == 2
+        assert [(t['sleeper_roster_id'], t['pickup_count']) for t in teams['waiver_warriors']] == [(2, 1)]
+        assert [(t['sleeper_roster_id'], t['picks_traded']) for t in teams['draft_capital_movers']] == [(2, 1)]
+
+
+class TestIncrementalTotals:
+
+    @with_trade(name='t1', roster_ids=[1, 2], adds={1: [101], 2: [102]}, drops={1: [102], 2: [101]})
+    @with_trade(name='t2', roster_ids=[1, 2, 3], adds={3: [101], 2: [103]}, drops={1: [101], 3: [103]},
+                picks=[{'season': 2025, 'round': 2, 'roster_id': 3, 'owner_id': 1, 'previous_owner_id': 3}])
+    @with_waiver(name='w1', roster_id=1, add=101, drop=104)
+    @with_waiver(name='w2', roster_id=1, add=101)
+    def test_batches_match_full_rebuild(self, client, db, league, t1, t2, w1, w2):
+        from app.logic.superlatives import apply_transactions, rebuild_superlative_totals
+
+        apply_transactions([t1.transaction_id, w1.transaction_id])
+        apply_transactions([t2.transaction_id])
+        apply_transactions([w2.transaction_id])
+        db.session.commit()
+        incremental = _snapshot()
+
+        rebuild_superlative_totals()
+        assert _snapshot() == incremental
+
+
+class TestSynchronizeTransactionsUpdatesTotals:
+
+    def test_new_trade_is_counted_once(self, app, db, league):
+        from app.logic.transactions import synchronize_transactions
+        from app.models.team_transaction_totals import TeamTransactionTotals
+
+        payload = [{
+            'transaction_id': '900001', 'type': 'trade', 'status': 'complete', 'created': 1725000000000,
+            'roster_ids': [1, 2], 'adds': {'101': 2, '102': 1}, 'drops': {'101': 1, '102': 2},
+        }]
+        response = MagicMock()
+        response.raise_for_status.return_value = None
+        response.json.return_value = payload
+
+        with patch('app.logic.transactions.requests.get', return_value=response), \
+             patch.dict('os.environ', {'LEAGUE_ID': '123456'}):
+            synchronize_transactions()
+            # Re-syncing the same week skips the existing transaction and leaves totals alone.
+            synchronize_transactions()
+
+        totals = {r.sleeper_roster_id: r.trade_count for r in TeamTransactionTotals.query}
+        assert totals == {1: 1, 2: 1}
+
+
+class TestSuperlativesCache:
+
+    @with_trade(name='t1', roster_ids=[1, 2], adds={1: [101]}, drops={2: [101]})
+    def test_cached_until_transactions_sync_is_recorded(self, client, db, league, t1):
+        from app.logic.superlatives import apply_transactions
+        from app.services.sync_service import SyncService
+
+        assert client.get('/v1/superlatives/teams').get_json()['superlatives']['most_trades'] == []
+
+        apply_transactions([t1.transaction_id])
+        db.session.commit()
+        assert client.get('/v1/superlatives/teams').get_json()['superlatives']['most_trades'] == []
+
+        SyncService.record_sync_status('transactions', success=True)
+        most_trades = client.get('/v1/superlatives/teams').get_json()['superlatives']['most_trades']
+        assert [t['sleeper_roster_id'] for t in most_trades] == [1, 2]
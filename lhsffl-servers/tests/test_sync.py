@@ -21,6 +21,7 @@ Scenarios – synchronize_teams
  8. Team with no metadata.team_name preserves its existing DB name (gizmart case)
  9. User whose metadata object is absent entirely also preserves DB name
 10. Team records (wins / losses / points) are updated from roster settings
+11. Each roster is snapshotted for the current week; a re-sync overwrites it
 """
 
 import os
@@ -351,3 +352,33 @@ class TestSynchronizeTeams:
             t2 = Teams.query.filter_by(sleeper_roster_id=2).first()
             assert t1.team_name == 'Watson My Towel'
             assert t2.team_name == 'CeeDeez Nuts'
+
+    # 11. Weekly roster snapshot ──────────────────────────────────────────────
+
+    def test_roster_snapshot_recorded_for_current_week(self, app, db):
+        from app.models.roster_snapshots import RosterSnapshots
+
+        with app.app_context():
+            make_team(db, team_id=1, sleeper_roster_id=1, team_name='Team 1')
+            db.session.commit()
+
+        roster = _roster_payload(roster_id=1, owner_id='uid-1')
+        roster.update(players=['10', '11', '12'], starters=['10', '0'], taxi=['12'])
+        users = [_user_payload('uid-1', team_name='Team 1')]
+        self._run(db, app, [roster], users)
+
+        roster['players'] = ['10', '13']
+        roster['taxi'] = []
+        with app.app_context():
+            from app.logic.league import synchronize_teams
+            with patch('app.logic.league.requests.get',
+                       side_effect=[_mock_response([roster]), _mock_response(users)]):
+                synchronize_teams()
+
+            snapshots = RosterSnapshots.query.all()
+            assert len(snapshots) == 1
+            snapshot = snapshots[0]
+            assert (snapshot.year, snapshot.week, snapshot.sleeper_roster_id) == (2024, 5, 1)
+            assert snapshot.player_sleeper_ids == [10, 13]
+            assert snapshot.starter_sleeper_ids == [10]
+            assert snapshot.taxi_sleeper_ids == []
@@ -0,0 +1,366 @@
+"""
+Tests for /v1/teams endpoints.
+
+Coverage:
+  GET /v1/teams/<id>   – team detail, including the fixed-query loading profile
+  GET /v1/teams/<id>/roster/<year>/<week> – weekly roster snapshots, incl. the
+                         PlayerWeeklyStats backfill
+  GET /v1/teams/head_to_head, /v1/teams/<id>/rivals – all-time head-to-head
+                         matrices, cached by matchup generation
+  GET /v1/teams/all_play, /v1/teams/<id>/all_play – all-play records, expected
+                         wins and luck, precomputed by the matchups sync
+  GET /v1/teams/all_time – slices of the (team, season, week) rollup cube, cached
+                         until the matchups sync or a playoff backfill
+"""
+
+import os
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tests.conftest import create_league, make_user, count_queries, make_matchup, make_weekly_stat
+
+
+def _seed_team_detail(db, league, owners=1, articles=1):
+    """Put every player on team 1 and attach owners, a current-season record and articles."""
+    from app.models.team_owners import TeamOwners
+    from app.models.team_records import TeamRecords
+    from app.models.articles import Articles
+    from app.models.article_teams import ArticleTeams
+
+    for player in league.players:
+        player.team_id = 1
+
+    for i in range(owners):
+        user = make_user(db, user_name=f'owner{i}', email=f'owner{i}@example.com',
+                         google_id=f'gid-owner{i}', team_owner=True)
+        db.session.add(TeamOwners(user_id=user.user_id, team_id=1, primary_owner=i == 0))
+
+    db.session.add(TeamRecords(team_id=1, year=2024, wins=3, losses=1,
+                               points_for=480.5, points_against=410.0))
+
+    for i in range(articles):
+        article = Articles(title=f'Article {i}', content='...', thumbnail='',
+                           published=True, creation_date=datetime(2024, 9, 1) + timedelta(days=i))
+        db.session.add(article)
+        db.session.flush()
+        db.session.add(ArticleTeams(article_id=article.article_id, team_id=1))
+        db.session.add(ArticleTeams(article_id=article.article_id, team_id=2))
+
+    db.session.commit()
+
+
+class TestGetTeam:
+
+    def test_returns_full_team_payload(self, client, db, league):
+        _seed_team_detail(db, league, owners=2, articles=2)
+
+        with patch('app.league_state_manager.get_current_year', return_value=2024):
+            r = client.get('/v1/teams/1')
+        data = r.get_json()
+
+        assert r.status_code == 200
+        team = data['team']
+        assert team['team_id'] == 1
+        assert len(team['players']) == 20
+        assert len(team['owners']) == 2
+        assert team['current_team_record']['wins'] == 3
+        assert [a['title'] for a in team['articles']] == ['Article 1', 'Article 0']
+        assert {at['team']['team_name'] for at in team['articles'][0]['article_teams']} == {'Team 1', 'Team 2'}
+
+    def test_unknown_team_returns_404(self, client, db, league):
+        r = client.get('/v1/teams/999')
+        assert r.status_code == 404
+        assert r.get_json()['success'] is False
+
+    def test_unpublished_articles_are_excluded(self, client, db, league):
+        from app.models.articles import Articles
+        from app.models.article_teams import ArticleTeams
+
+        draft = Articles(title='Draft', content='...', thumbnail='', published=False)
+        db.session.add(draft)
+        db.session.flush()
+        db.session.add(ArticleTeams(article_id=draft.article_id, team_id=1))
+        db.session.commit()
+
+        with patch('app.league_state_manager.get_current_year', return_value=2024):
+            r = client.get('/v1/teams/1')
+        assert r.get_json()['team']['articles'] == []
+
+    def test_query_count_is_independent_of_team_size(self, app, db):
+        """The detail profile must not lazy-load per player, owner or article."""
+        from app.models.teams import Teams
+
+        def run():
+            with app.test_request_context(), \
+                 patch('app.league_state_manager.get_current_year', return_value=2024):
+                db.session.expunge_all()
+                with count_queries(db) as statements:
+                    Teams.get_for_detail(1).serialize()
+            return len(statements)
+
+        league = create_league(db, num_teams=2, players_per_team=2)
+        _seed_team_detail(db, league, owners=1, articles=1)
+        small = run()
+
+        db.session.remove()
+        db.drop_all()
+        db.create_all()
+
+        league = create_league(db, num_teams=2, players_per_team=15)
+        _seed_team_detail(db, league, owners=3, articles=6)
+        large = run()
+
+        # team, players, team_owners, users, users.owner_groups, current record,
+        # articles, article_teams, article_teams.team
+        assert small == large == 9
+
+
+class TestRosterSnapshots:
+
+    def test_backfill_and_read(self, client, db, league):
+        from app.logic.roster_snapshots import backfill_roster_snapshots, record_roster_snapshot
+
+        make_weekly_stat(db, 2023, 1, 1, 101, 1.0, is_starter=True)
+        make_weekly_stat(db, 2023, 1, 1, 102, 1.0, is_starter=False)
+        make_weekly_stat(db, 2023, 1, 2, 103, 1.0, is_starter=True)
+        make_weekly_stat(db, 2023, 2, 1, 104, 1.0, is_starter=True)
+        # Week 2 was captured live; the backfill must not replace it
+        record_roster_snapshot(2023, 2, 1, [105, 106], starter_ids=[105], taxi_ids=[106])
+        db.session.commit()
+
+        assert backfill_roster_snapshots(year=2023)['snapshots_written'] == 2
+
+        resp = client.get('/v1/teams/1/roster/2023/1')
+        assert resp.status_code == 200
+        body = resp.get_json()
+        assert body['snapshot']['player_sleeper_ids'] == [101, 102]
+        assert body['snapshot']['source'] == 'backfill'
+        assert [(p['sleeper_id'], p['starter'], p['taxi']) for p in body['roster']] == \
+            [(101, True, False), (102, False, False)]
+        assert body['roster'][0]['last_name'] is not None
+
+        live = client.get('/v1/teams/1/roster/2023/2').get_json()['snapshot']
+        assert live['player_sleeper_ids'] == [105, 106]
+        assert live['starter_sleeper_ids'] == [105]
+        assert live['taxi_sleeper_ids'] == [106]
+
+    def test_missing_snapshot_returns_404(self, client, db, league):
+        assert client.get('/v1/teams/1/roster/2023/9').status_code == 404
+        assert client.get('/v1/teams/99/roster/2023/1').status_code == 404
+
+
+class TestHeadToHead:
+
+    @staticmethod
+    def _seed(db):
+        make_matchup(db, 2023, 1, 1, 2, 120.0, 100.0)
+        make_matchup(db, 2023, 1, 3, 4, 90.0, 95.5, matchup_id=2)
+        make_matchup(db, 2024, 1, 2, 1, 110.0, 105.0)
+        make_matchup(db, 2024, 2, 1, 2, 99.0, 99.0)
+        make_matchup(db, 2024, 3, 1, 3, 130.0, 80.0)
+        make_matchup(db, 2024, 5, 1, 4, 50.0, 0.0, completed=False)
+        db.session.commit()
+
+    def test_matrix(self, client, db, league):
+        self._seed(db)
+        data = client.get('/v1/teams/head_to_head').get_json()
+
+        assert [t['team_name'] for t in data['teams']] == ['Team 1', 'Team 2', 'Team 3', 'Team 4']
+        assert data['wins'][0] == [0, 1, 1, 0]
+        assert data['losses'][0] == [0, 1, 0, 0]
+        assert data['ties'][0][1] == data['ties'][1][0] == 1
+        assert data['points_for'][0][1] == data['points_against'][1][0] == 324.0
+        assert data['wins'][3][2] == 1
+        # The unplayed week 5 game doesn't count
+        assert data['points_for'][0][3] == 0
+
+    def test_rivals(self, client, db, league):
+        self._seed(db)
+        rivals = client.get('/v1/teams/1/rivals').get_json()['rivals']
+
+        assert [r['opponent_team_id'] for r in rivals] == [2, 3]
+        assert rivals[0] == {
+            'opponent_sleeper_roster_id': 2, 'opponent_team_id': 2, 'opponent_team_name': 'Team 2',
+            'games': 3, 'wins': 1, 'losses': 1, 'ties': 1, 'win_pct': 0.5,
+            'points_for': 324.0, 'points_against': 309.0, 'average_margin': 5.0,
+        }
+        assert client.get('/v1/teams/99/rivals').status_code == 404
+
+    def test_cached_until_matchups_change(self, client, db, league):
+        from app.models.matchups import Matchups
+        self._seed(db)
+        client.get('/v1/teams/head_to_head')
+
+        # Warm: only the generation check and the team names
+        with count_queries(db) as queries:
+            client.get('/v1/teams/head_to_head')
+        assert len(queries) == 2
+
+        # A score correction written elsewhere changes the generation
+        row = Matchups.query.filter_by(year=2023, week=1, sleeper_roster_id=3).one()
+        row.points_for = 100.0
+        db.session.commit()
+        assert client.get('/v1/teams/head_to_head').get_json()['wins'][2][3] == 1
+
+
+class TestAllPlay:
+
+    @staticmethod
+    def _seed(db):
+        make_matchup(db, 2024, 1, 1, 2, 120.0, 100.0)
+        make_matchup(db, 2024, 1, 3, 4, 90.0, 95.5, matchup_id=2)
+        make_matchup(db, 2024, 2, 1, 3, 80.0, 130.0)
+        make_matchup(db, 2024, 2, 2, 4, 110.0, 110.0)
+        make_matchup(db, 2024, 3, 1, 4, 200.0, 0.0, completed=False)
+        make_matchup(db, 2023, 1, 1, 2, 70.0, 75.0)
+        db.session.commit()
+
+    def test_all_play_expected_wins_and_luck(self, client, db, league):
+        self._seed(db)
+        records = client.get('/v1/teams/all_play', query_string={'year': 2024}).get_json()['records']
+        by_roster = {r['sleeper_roster_id']: r for r in records}
+
+        assert set(by_roster) == {1, 2, 3, 4}
+        assert (by_roster[1]['all_play_wins'], by_roster[1]['all_play_losses']) == (3, 3)
+        two = by_roster[2]
+        assert (two['all_play_wins'], two['all_play_losses'], two['all_play_ties']) == (3, 2, 1)
+        assert two['all_play_pct'] == 0.583
+        assert (two['wins'], two['losses'], two['ties']) == (0, 1, 1)
+        assert [by_roster[r]['expected_wins'] for r in (1, 2, 3, 4)] == [1.0, 1.17, 1.0, 0.83]
+        assert [by_roster[r]['luck'] for r in (1, 2, 3, 4)] == [0.0, -0.67, 0.0, 0.67]
+        assert by_roster[4]['team_name'] == 'Team 4'
+        # The unplayed week 3 game doesn't count
+        assert by_roster[1]['weeks'] == 2
+
+    def test_team_seasons(self, client, db, league):
+        self._seed(db)
+        seasons = client.get('/v1/teams/2/all_play').get_json()['seasons']
+        assert [s['year'] for s in seasons] == [2024, 2023]
+        assert (seasons[1]['wins'], seasons[1]['all_play_wins'], seasons[1]['expected_wins']) == (1, 1, 1.0)
+        assert client.get('/v1/teams/99/all_play').status_code == 404
+
+    def test_precomputed_by_matchups_sync(self, client, db, league):
+        from app.logic.all_play import _all_play
+        from app.services.sync_service import SyncService
+        self._seed(db)
+
+        with patch('app.services.sync_service.synchronize_matchups', return_value={}):
+            assert SyncService.sync_matchups()['success'] is True
+        assert len(_all_play.memo) == 1
+
+        # Served from the cache: the generation check and the team names only
+        with count_queries(db) as queries:
+            client.get('/v1/teams/all_play')
+        assert len(queries) == 2
+
+    def test_failed_precompute_does_not_fail_sync(self, db, league):
+        from app.models.sync_status import SyncStatus
+        from app.services.sync_service import SyncService
+        with patch('app.services.sync_service.synchronize_matchups', return_value={}), \
+                patch('app.logic.all_play._all_play', side_effect=RuntimeError('boom')):
+            assert SyncService.sync_matchups()['success'] is True
+        assert SyncStatus.query.filter_by(sync_item='matchups').one().success is True
+
+
+class TestAllTime:
+
+    @pytest.fixture(autouse=True)
+    def playoffs_from_week_3(self):
+        with patch.dict(os.environ, {'PLAYOFF_WEEK_START': '3'}):
+            yield
+
+    @staticmethod
+    def _seed(db):
+        from app.models.playoff_matchups import PlayoffMatchups
+        make_matchup(db, 2023, 1, 1, 2, 120.0, 100.0)
+        make_matchup(db, 2023, 1, 3, 4, 90.0, 95.5, matchup_id=2)
+        make_matchup(db, 2023, 3, 1, 4, 101.0, 99.0)         # 2023 final
+        make_matchup(db, 2024, 1, 2, 1, 110.0, 105.0)
+        make_matchup(db, 2024, 2, 1, 2, 99.0, 99.0)
+        make_matchup(db, 2024, 2, 3, 4, 80.0, 70.0, matchup_id=2)
+        make_matchup(db, 2024, 3, 1, 3, 130.0, 80.0, completed=False)
+        db.session.add(PlayoffMatchups(year=2023, round=1, bracket='winners', sleeper_matchup_id=1,
+                                       sleeper_roster_id=1, opponent_sleeper_roster_id=4,
+                                       winner_sleeper_roster_id=1, loser_sleeper_roster_id=4, placement=1))
+        db.session.commit()
+
+    @staticmethod
+    def _records(client, **params):
+        teams = client.get('/v1/teams/all_time', query_string=params).get_json()['teams']
+        return {t['team_id']: t['all_time_record'] for t in teams}
+
+    def test_regular_season_by_default(self, client, db, league):
+        self._seed(db)
+        teams = client.get('/v1/teams/all_time').get_json()['teams']
+        assert teams[0]['team_name'] == 'Team 1'
+        one = teams[0]['all_time_record']
+        assert (one['wins'], one['losses'], one['ties'], one['games']) == (1, 1, 1, 3)
+        assert (one['points_for'], one['points_against']) == (324.0, 309.0)
+        assert (one['playoff_appearances'], one['championships']) == (1, 1)
+        assert self._records(client)[4]['runner_ups'] == 1
+
+    def test_slices(self, client, db, league):
+        self._seed(db)
+        assert self._records(client, segment='playoffs')[1]['wins'] == 1
+        assert self._records(client, segment='all')[1]['games'] == 4
+        in_2024 = self._records(client, start_year=2024, segment='all')[1]
+        assert (in_2024['wins'], in_2024['losses'], in_2024['ties'], in_2024['championships']) == (0, 1, 1, 0)
+        versus_4 = self._records(client, segment='all', opponent=4)
+        assert (versus_4[1]['games'], versus_4[1]['points_for']) == (1, 101.0)
+        assert (versus_4[3]['wins'], versus_4[3]['losses']) == (1, 1)
+
+        assert client.get('/v1/teams/all_time', query_string={'segment': 'preseason'}).status_code == 400
+        assert client.get('/v1/teams/all_time', query_string={'opponent': 99}).status_code == 404
+
+    def test_playoff_start_per_season(self, client, db, league):
+        from app.models.league_seasons import LeagueSeasons
+        self._seed(db)
+        db.session.add(LeagueSeasons(year=2023, sleeper_league_id='2023', playoff_week_start=4))
+        db.session.commit()
+
+        one = self._records(client)[1]      # the 2023 week-3 game is regular season that year
+        assert (one['wins'], one['losses'], one['ties'], one['games']) == (2, 1, 1, 4)
+        assert self._records(client, segment='playoffs')[1]['games'] == 0
+
+    def test_cached_by_matchup_generation(self, client, db, league):
+        from app.logic.all_time import AllTimeCube
+        from app.models.matchups import Matchups
+        self._seed(db)
+        assert self._records(client)[3]['wins'] == 1
+        with patch.object(AllTimeCube, 'build') as build:
+            assert self._records(client)[3]['wins'] == 1     # unchanged data: the cached cube
+        assert build.call_count == 0
+
+        # A score correction synced by another worker changes the generation here too
+        row = Matchups.query.filter_by(year=2024, week=2, sleeper_roster_id=3).one()
+        row.points_for = 60.0
+        Matchups.query.filter_by(year=2024, week=2, sleeper_roster_id=4).one().points_against = 60.0
+        db.session.commit()
+        assert self._records(client)[3]['wins'] == 0
+
+    def test_playoff_backfill_drops_the_cube(self, client, db, league):
+        from app.logic.history import backfill_playoffs
+        from app.models.playoff_matchups import PlayoffMatchups
+        self._seed(db)
+        assert self._records(client)[3]['championships'] == 0
+
+        def bracket(season, league_id, kind):
+            if kind == 'winners':
+                db.session.add(PlayoffMatchups(year=season, round=1, bracket='winners', sleeper_matchup_id=1,
+                                               sleeper_roster_id=1, opponent_sleeper_roster_id=3,
+                                               winner_sleeper_roster_id=3, loser_sleeper_roster_id=1,
+                                               placement=1))
+            return 1
+
+        from app.models.league_seasons import LeagueSeasons
+        response = MagicMock()
+        response.json.return_value = {'settings': {'playoff_week_start': 3}}
+        with patch('app.logic.history.requests.get', return_value=response), \
+                patch('app.logic.history.time.sleep'), \
+                patch('app.logic.history._backfill_bracket', side_effect=bracket):
+            backfill_playoffs(2024)
+        records = self._records(client)
+        assert (records[3]['championships'], records[1]['runner_ups']) == (1, 1)
+        assert LeagueSeasons.playoff_week_starts() == {2024: 3}
@@ -0,0 +1,149 @@
+"""
+Tests for the in-memory transaction timeline index (app/logic/timeline_index.py).
+
+Scenarios
+─────────
+1. Player and full trade trees from the index (full trees walk the stored lineage)
+2. A warm index answers trees without any SQL
+3. A transaction sync drops the index so new history shows up
+4. Player ownership intervals answer point-in-time and range queries
+5. Ownership intervals ingested out of order match a full rebuild
+"""
+
+from datetime import datetime
+
+from tests.conftest import with_trade, with_waiver, with_draft_pick, count_queries
+
+
+PICK = {'season': 2025, 'round': 1, 'roster_id': 2}
+
+
+def _ids(txns):
+    return [t['transaction_id'] for t in txns]
+
+
+class TestTimelineIndex:
+
+    @with_trade(name='origin', roster_ids=[1, 2], adds={1: [101], 2: [102]}, drops={1: [102], 2: [101]},
+                picks=[{**PICK, 'owner_id': 1, 'previous_owner_id': 2}], created_at=datetime(2024, 9, 1))
+    @with_trade(name='t2', roster_ids=[1, 3], adds={1: [103], 3: [101]}, drops={1: [101], 3: [103]},
+                created_at=datetime(2024, 9, 8))
+    @with_trade(name='t3', roster_ids=[1, 4], adds={1: [104]}, drops={4: [104]},
+                picks=[{**PICK, 'owner_id': 4, 'previous_owner_id': 1}], created_at=datetime(2024, 9, 15))
+    @with_waiver(name='t4', roster_id=1, add=105, drop=103, created_at=datetime(2024, 9, 20))
+    @with_trade(name='pending', roster_ids=[2, 3], adds={2: [103]}, drops={3: [103]},
+                status='pending', created_at=datetime(2024, 9, 22))
+    @with_waiver(name='t5', roster_id=2, add=107, drop=102, created_at=datetime(2024, 9, 30))
+    @with_draft_pick(season=2025, round=1, original_roster_id=2, pick_no=4, player_sleeper_id=110)
+    def test_trees(self, client, db, league, origin, t2, t3, t4, pending, t5, draft_pick):
+        from app.logic.timeline_index import TimelineIndex
+
+        index = TimelineIndex.load()
+
+        tree = index.trade_tree_payload(101)
+        assert tree['player']['sleeper_id'] == 101
+        assert _ids(tree['trade_tree']) == [origin.transaction_id, t2.transaction_id]
+        assert _ids(index.trade_tree_payload(103)['trade_tree']) == [t2.transaction_id, t4.transaction_id]
+        assert index.trade_tree_payload(999) == {'player': None, 'trade_tree': []}
+
+        full = index.full_trade_tree_payload(origin.transaction_id)
+        assert full['origin'] == origin.serialize()
+        assert {rid: _ids(team['transactions']) for rid, team in full['teams'].items()} == {
+            1: [t2.transaction_id, t3.transaction_id, t4.transaction_id], 2: [t5.transaction_id],
+        }
+        assert full['teams'][1]['acquired_picks'][0]['drafted_player']['sleeper_id'] == 110
+        assert full['pick_metadata']['2025:1:2']['pick_no'] == 4
+
+        # A pending trade moved nothing, so it has no lineage to follow
+        assert all(team['transactions'] == []
+                   for team in index.full_trade_tree_payload(pending.transaction_id)['teams'].values())
+
+        assert index.full_trade_tree_payload(999999) is None
+        assert index.roster_timeline[1] == (origin.transaction_id, t2.transaction_id,
+                                            t3.transaction_id, t4.transaction_id)
+
+    @with_trade(name='origin', roster_ids=[1, 2], adds={1: [101]}, drops={2: [101]}, created_at=datetime(2024, 9, 1))
+    @with_waiver(name='release', roster_id=1, drop=101, created_at=datetime(2024, 9, 8))
+    def test_warm_index_runs_no_sql(self, client, db, league, origin, release):
+        from app.logic.timeline_index import get_timeline_index
+        from app.logic.trade_scores import get_trade_scores
+
+        origin_id, release_id = origin.transaction_id, release.transaction_id
+        get_timeline_index()
+        get_trade_scores([origin_id])
+        with count_queries(db) as statements:
+            resp = client.get(f'/v1/transactions/{origin_id}/full_trade_tree')
+            client.get('/v1/transactions/trade-tree/101')
+        assert resp.status_code == 200
+        assert [t['transaction_id'] for t in resp.get_json()['teams']['1']['transactions']] == [release_id]
+        assert statements == []
+
+    @with_trade(name='origin', roster_ids=[1, 2], adds={1: [101]}, drops={2: [101]}, created_at=datetime(2024, 9, 1))
+    def test_sync_invalidation_rebuilds(self, client, db, league, origin):
+        from app.memo import invalidate
+        from tests.conftest import make_transaction, make_roster, make_player_move
+
+        assert client.get('/v1/transactions/trade-tree/101').get_json()['trade_tree'][0]['transaction_id'] \
+            == origin.transaction_id
+
+        make_transaction(db, 5000, txn_type='waiver', created_at=datetime(2024, 9, 8))
+        make_roster(db, 5000, 1)
+        make_player_move(db, 5000, 101, 1, 'drop')
+        db.session.commit()
+        invalidate('transactions')
+
+        tree = client.get('/v1/transactions/trade-tree/101').get_json()['trade_tree']
+        assert [t['transaction_id'] for t in tree] == [origin.transaction_id, 5000]
+
+
+class TestOwnershipIntervals:
+
+    @with_trade(name='trade', roster_ids=[1, 2], adds={1: [101]}, drops={2: [101]}, created_at=datetime(2024, 9, 1))
+    @with_waiver(name='release', roster_id=1, drop=101, created_at=datetime(2024, 9, 8))
+    @with_waiver(name='pickup', roster_id=3, add=101, created_at=datetime(2024, 9, 20))
+    def test_point_and_range_queries(self, client, db, league, trade, release, pickup):
+        from app.logic.timeline_index import get_timeline_index
+
+        index = get_timeline_index()
+        assert index.owner_at(101, datetime(2024, 8, 1)) == 2       # held before recorded history
+        assert index.owner_at(101, datetime(2024, 9, 1)) == 1       # the trade itself hands it over
+        assert index.owner_at(101, datetime(2024, 9, 10)) is None   # on waivers
+        assert index.owner_at(101, datetime(2025, 1, 1)) == 3
+        assert index.owner_at(999, datetime(2025, 1, 1)) is None
+
+        spans = index.owners_between(101, datetime(2024, 9, 5), datetime(2024, 9, 21))
+        assert [(i.sleeper_roster_id, i.released_transaction_id) for i in spans] == \
+            [(1, release.transaction_id), (3, None)]
+
+        resp = client.get('/v1/transactions/ownership/101?at=2024-09-05T00:00:00Z')
+        assert resp.get_json()['sleeper_roster_id'] == 1
+        intervals = client.get('/v1/transactions/ownership/101').get_json()['intervals']
+        assert [i['sleeper_roster_id'] for i in intervals] == [2, 1, 3]
+        assert intervals[0]['start'] is None and intervals[2]['end'] is None
+
+    # Applied newest first, as a backfill would ingest them
+    @with_trade(name='trade', roster_ids=[1, 2], adds={1: [101]}, drops={2: [101]}, created_at=datetime(2024, 9, 1))
+    @with_waiver(name='release', roster_id=1, drop=101, created_at=datetime(2024, 9, 8))
+    @with_waiver(name='pickup', roster_id=3, add=101, created_at=datetime(2024, 9, 20))
+    def test_out_of_order_ingest_matches_rebuild(self, db, league, trade, release, pickup):
+        from app.models.player_ownership import PlayerOwnership
+        from app.logic.player_ownership import rebuild_player_ownership
+
+        def rows():
+            return sorted((r.sleeper_roster_id, r.started_at or datetime.min, r.ended_at,
+                           r.acquired_transaction_id, r.released_transaction_id)
+                          for r in PlayerOwnership.query.filter_by(player_sleeper_id=101))
+
+        incremental = rows()
+        rebuild_player_ownership()
+        assert rows() == incremental
+        assert incremental == [
+            (1, datetime(2024, 9, 1), datetime(2024, 9, 8), trade.transaction_id, release.transaction_id),
+            (2, datetime.min, datetime(2024, 9, 1), None, trade.transaction_id),
+            (3, datetime(2024, 9, 20), None, pickup.transaction_id, None),
+        ]
+
+    def test_invalid_datetime_returns_400(self, client, db):
+        resp = client.get('/v1/transactions/ownership/101?at=yesterday')
+        assert resp.status_code == 400
+        assert resp.get_json()['success'] is False
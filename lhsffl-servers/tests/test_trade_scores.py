@@ -0,0 +1,156 @@
+"""
+Tests for trade outcome scores (app/logic/trade_scores.py).
+
+Scenarios
+─────────
+1. A side is credited with its acquired players' points on its roster, from the
+   trade until it drops them; earlier and later stints don't count
+2. Acquired picks resolve through DraftPicks; flipped picks earn nothing, undrafted ones stay active,
+   and a pick traded back to its drafter earns only the trade back
+3. The weekly refresh re-scores active sides and new trades only; the rebuild agrees
+4. Scores are served on the transaction, team trades and trade-tree endpoints
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app.logic.trade_scores import rebuild_trade_scores, refresh_trade_scores
+from app.models.trade_scores import TradeScores
+from tests.conftest import make_transaction, make_roster, make_player_move, make_pick_move, make_draft_pick, \
+    make_weekly_stat
+
+
+def _trade(db, transaction_id, week, gets, year=2024):
+    """gets: {roster: ([player ids], [(season, round, original roster)])}"""
+    make_transaction(db, transaction_id, year=year, week=week, created_at=datetime(year, 9, 1 + week))
+    rosters = list(gets)
+    for roster, (players, picks) in gets.items():
+        make_roster(db, transaction_id, roster)
+        other = rosters[1 - rosters.index(roster)]
+        for player in players:
+            make_player_move(db, transaction_id, player, roster, 'add')
+            make_player_move(db, transaction_id, player, other, 'drop')
+        for season, round_, original in picks:
+            make_pick_move(db, transaction_id, season, round_, original, roster, previous_owner_id=other)
+
+
+def _drop(db, transaction_id, player, roster, week, year=2024):
+    make_transaction(db, transaction_id, txn_type='free_agent', year=year, week=week,
+                     created_at=datetime(year, 9, 2 + week))
+    make_roster(db, transaction_id, roster)
+    make_player_move(db, transaction_id, player, roster, 'drop')
+
+
+def _side(transaction_id, roster):
+    return TradeScores.query.filter_by(transaction_id=transaction_id, sleeper_roster_id=roster).one()
+
+
+@pytest.fixture
+def trade(db, league):
+    # Week 3: roster 1 gets 101; roster 2 gets 102 and roster 1's 2025 first
+    _trade(db, 10, 3, {1: ([101], []), 2: ([102], [(2025, 1, 1)])})
+    dp = make_draft_pick(db, 2025, 1, 1, pick_no=3, player_sleeper_id=103)
+    dp.drafting_roster_id = 2
+
+    for week, points in ((1, 10.0), (2, 10.0)):
+        make_weekly_stat(db, 2024, week, 2, 101, points)          # before the trade, on the other side
+    make_weekly_stat(db, 2024, 3, 1, 101, 12.0)
+    make_weekly_stat(db, 2024, 4, 1, 101, 8.0, is_starter=False)
+    make_weekly_stat(db, 2024, 5, 1, 101, 20.0)
+    _drop(db, 11, 101, 1, week=5)
+    make_weekly_stat(db, 2024, 7, 1, 101, 50.0)                   # picked back up later: a new stint
+
+    make_weekly_stat(db, 2024, 3, 2, 102, 15.0)
+    make_weekly_stat(db, 2024, 4, 2, 102, 15.0)
+    make_weekly_stat(db, 2025, 1, 2, 103, 30.0)
+    db.session.commit()
+
+
+class TestScoring:
+
+    def test_players_credited_while_on_roster(self, db, trade):
+        rebuild_trade_scores()
+
+        one = _side(10, 1)
+        assert (one.points, one.starter_points, one.weeks, one.players) == (40.0, 32.0, 3, 1)
+        assert one.active is False
+
+    def test_drafted_pick_is_credited(self, db, trade):
+        rebuild_trade_scores()
+
+        two = _side(10, 2)
+        assert (two.points, two.weeks, two.players, two.picks) == (60.0, 3, 1, 1)
+        assert two.active is True          # 102 is still on the roster
+
+    def test_flipped_and_undrafted_picks(self, db, league):
+        _trade(db, 20, 2, {3: ([], [(2026, 1, 4), (2027, 1, 4)]), 4: ([104], [])})
+        dp = make_draft_pick(db, 2026, 1, 4, pick_no=1, player_sleeper_id=105)
+        dp.drafting_roster_id = 4          # traded back before the draft
+        make_weekly_stat(db, 2026, 1, 4, 105, 25.0)
+        _drop(db, 21, 104, 4, week=2)
+        db.session.commit()
+        rebuild_trade_scores()
+
+        three = _side(20, 3)
+        assert (three.points, three.picks) == (0.0, 2)
+        assert three.active is True        # the 2027 pick is undrafted
+        assert _side(20, 4).active is False
+
+    def test_pick_traded_back_credits_the_last_trade(self, db, league):
+        _trade(db, 30, 2, {1: ([], [(2025, 2, 3)]), 3: ([106], [])})
+        _trade(db, 31, 4, {2: ([], [(2025, 2, 3)]), 1: ([107], [])})
+        _trade(db, 32, 6, {1: ([], [(2025, 2, 3)]), 2: ([108], [])})
+        dp = make_draft_pick(db, 2025, 2, 3, pick_no=15, player_sleeper_id=109)
+        dp.drafting_roster_id = 1
+        make_weekly_stat(db, 2025, 1, 1, 109, 40.0)
+        db.session.commit()
+        rebuild_trade_scores()
+
+        assert (_side(30, 1).points, _side(30, 1).picks) == (0.0, 1)
+        assert (_side(32, 1).points, _side(32, 1).weeks) == (40.0, 1)
+
+
+class TestRefresh:
+
+    def test_refresh_rescores_active_and_new_trades(self, db, trade):
+        rebuild_trade_scores()
+        before_inactive = _side(10, 1).points
+
+        make_weekly_stat(db, 2024, 5, 2, 102, 5.0)
+        _trade(db, 30, 6, {3: ([111], []), 4: ([116], [])})
+        make_weekly_stat(db, 2024, 6, 3, 111, 9.0)
+        assert refresh_trade_scores() == 2
+        db.session.commit()
+
+        assert _side(10, 2).points == 65.0
+        assert _side(10, 1).points == before_inactive
+        assert _side(30, 3).points == 9.0
+
+        incremental = sorted((s.transaction_id, s.sleeper_roster_id, s.points, s.active) for s in TradeScores.query)
+        rebuild_trade_scores()
+        assert sorted((s.transaction_id, s.sleeper_roster_id, s.points, s.active)
+                      for s in TradeScores.query) == incremental
+
+
+class TestEndpoints:
+
+    def test_scores_on_trade_endpoints(self, client, db, trade):
+        rebuild_trade_scores()
+
+        data = client.get('/v1/transactions/10').get_json()
+        assert data['trade_scores']['1']['points'] == 40.0
+        assert data['trade_scores']['2']['points'] == 60.0
+
+        trades = client.get('/v1/transactions/team/1/trades').get_json()
+        assert set(trades['trade_scores']) == {'10'}
+
+        tree = client.get('/v1/transactions/10/full_trade_tree').get_json()
+        assert tree['trade_scores']['10']['2']['active'] is True
+
+        player_tree = client.get('/v1/transactions/trade-tree/101').get_json()
+        assert list(player_tree['trade_scores']) == ['10']
+
+    def test_free_agent_move_has_no_scores(self, client, db, trade):
+        rebuild_trade_scores()
+        assert client.get('/v1/transactions/11').get_json()['trade_scores'] == {}
@@ -27,7 +27,7 @@ from tests.conftest import (
     create_league,
     make_team, make_player, make_transaction, make_roster,
     make_player_move, make_pick_move, make_draft_pick, make_league_state,
-    with_trade, with_waiver, with_draft_pick, create_resource,
+    with_trade, with_waiver, with_draft_pick, create_resource, count_queries,
 )
 
 
@@ -142,6 +142,58 @@ class TestGetTransactions:
         assert len(data['transactions']) == 2
 
 
+class TestTransactionsPagination:
+    """Keyset pagination on /v1/transactions via ?limit= and ?cursor=."""
+
+    def _seed(self, db, n, created_at=None):
+        for i in range(1, n + 1):
+            make_transaction(db, i, txn_type='free_agent', created_at=created_at)
+        db.session.commit()
+
+    def _walk(self, client, url):
+        ids, cursor = [], None
+        while True:
+            sep = '&' if '?' in url else '?'
+            r = client.get(f'{url}{sep}cursor={cursor}' if cursor else url)
+            assert r.status_code == 200
+            data = r.get_json()
+            ids.extend(t['transaction_id'] for t in data['transactions'])
+            cursor = data['next_cursor']
+            if cursor is None:
+                return ids
+
+    def test_pages_cover_everything_newest_first(self, client, db):
+        self._seed(db, 7)
+        r = client.get('/v1/transactions?limit=3')
+        data = r.get_json()
+        assert [t['transaction_id'] for t in data['transactions']] == [7, 6, 5]
+        assert data['next_cursor'] is not None
+
+        assert self._walk(client, '/v1/transactions?limit=3') == [7, 6, 5, 4, 3, 2, 1]
+
+    def test_identical_timestamps_break_ties_on_id(self, client, db):
+        self._seed(db, 5, created_at=datetime(2024, 9, 1))
+        assert self._walk(client, '/v1/transactions?limit=2') == [5, 4, 3, 2, 1]
+
+    def test_last_page_has_no_cursor(self, client, db):
+        self._seed(db, 3)
+        data = client.get('/v1/transactions?limit=3').get_json()
+        assert len(data['transactions']) == 3
+        assert data['next_cursor'] is None
+
+    @with_trade(name='t1', roster_ids=[1, 2], created_at=datetime(2024, 9, 10))
+    @with_waiver(name='w1', roster_id=1, created_at=datetime(2024, 9, 11))
+    @with_waiver(name='w2', roster_id=2, created_at=datetime(2024, 9, 12))
+    def test_cursor_respects_filters(self, client, db, league, t1, w1, w2):
+        ids = self._walk(client, '/v1/transactions?roster_id=1&limit=1')
+        assert ids == [w1.transaction_id, t1.transaction_id]
+
+    def test_invalid_cursor_returns_400(self, client, db):
+        r = client.get('/v1/transactions?cursor=not-a-cursor')
+        assert r.status_code == 400
+        assert r.get_json()['success'] is False
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # GET /v1/transactions/<id>  (single transaction)
 # ═══════════════════════════════════════════════════════════════════════════
@@ -340,6 +392,33 @@ class TestGetRandomTrades:
         assert len(data['transactions']) == 1
         assert data['transactions'][0]['status'] == 'complete'
 
+    def test_sample_is_distinct_and_query_count_is_constant(self, client, db, league):
+        for i in range(30):
+            make_transaction(db, i + 1, txn_type='trade')
+        db.session.commit()
+        client.get('/v1/transactions/trades/random')  # warm the trade-ID cache
+
+        with count_queries(db) as statements:
+            r = client.get('/v1/transactions/trades/random')
+        ids = [t['transaction_id'] for t in r.get_json()['transactions']]
+        assert len(set(ids)) == 5
+        # One IN query for the sampled trades plus one per eager-loaded relationship.
+        assert not any('count(' in s.lower() or 'offset' in s.lower() for s in statements)
+        assert len(statements) <= 7
+
+    def test_cached_ids_refresh_after_invalidation(self, client, db, league):
+        from app.memo import invalidate
+        make_transaction(db, 1, txn_type='trade')
+        db.session.commit()
+        assert len(client.get('/v1/transactions/trades/random').get_json()['transactions']) == 1
+
+        make_transaction(db, 2, txn_type='trade')
+        db.session.commit()
+        assert len(client.get('/v1/transactions/trades/random').get_json()['transactions']) == 1
+
+        invalidate('transactions')
+        assert len(client.get('/v1/transactions/trades/random').get_json()['transactions']) == 2
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # GET /v1/transactions/trade-tree/<player_sleeper_id>
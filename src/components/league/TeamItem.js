@@ -3,7 +3,7 @@ import { Link } from 'react-router-dom';
 
 const RANK_COLORS = ['var(--gold)', 'var(--silver)', 'var(--bronze)'];
 
-const TeamItem = React.memo(({ team, rank, record }) => {
+const TeamItem = React.memo(({ team, rank, record, playoffOdds }) => {
     const currentRecord = record ?? team.current_team_record;
     const rankColor = rank <= 3 ? RANK_COLORS[rank - 1] : 'var(--muted)';
 
@@ -43,6 +43,12 @@ const TeamItem = React.memo(({ team, rank, record }) => {
                                     <span className="value">{currentRecord.points_against?.toFixed(1) || '0.0'}</span>
                                 </div>
                             </div>
+                            {playoffOdds != null && (
+                                <div className="playoff-odds" title="Simulated playoff odds">
+                                    <span className="label">PO</span>
+                                    <span className="value">{Math.round(playoffOdds * 100)}%</span>
+                                </div>
+                            )}
                         </div>
                     )}
                 </div>
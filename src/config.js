@@ -4,6 +4,8 @@ const config = {
   API_BASE_URL: process.env.REACT_APP_API_URL 
     ? `${process.env.REACT_APP_API_URL}/v1`  // Add /v1 to local development URL
     : 'https://d34t1k2xpw6h8v.cloudfront.net/v1', // CloudFront already has /v1
+  // Static JSON export (lhsffl-servers/app/scripts/export_static.py), used when the API is down
+  STATIC_BASE_URL: process.env.REACT_APP_STATIC_URL || null,
 };
 
 export default config;
@@ -1,3 +1,5 @@
+import config from '../config';
+
 class APICache {
     constructor(ttl = 30000) { // 30 seconds default TTL
         this.cache = new Map();
@@ -50,6 +52,32 @@ class APICache {
 
 export const apiCache = new APICache(30000);
 
+// Static export of the read-only endpoints (see lhsffl-servers/app/logic/static_export.py).
+// manifest.json maps each '/v1/...' path to its content-addressed file.
+let staticManifest = null;
+
+const staticFallback = async (url) => {
+    if (!config.STATIC_BASE_URL || !url.startsWith(config.API_BASE_URL)) return null;
+    try {
+        if (!staticManifest) {
+            staticManifest = fetch(`${config.STATIC_BASE_URL}/manifest.json`)
+                .then(response => (response.ok ? response.json() : null));
+        }
+        const manifest = await staticManifest;
+        if (!manifest) {
+            staticManifest = null;
+            return null;
+        }
+        const entry = manifest.files[`/v1${url.slice(config.API_BASE_URL.length)}`];
+        if (!entry) return null;
+        const response = await fetch(`${config.STATIC_BASE_URL}/${entry.file}`);
+        return response.ok ? response : null;
+    } catch (error) {
+        staticManifest = null;
+        return null;
+    }
+};
+
 export const cachedFetch = async (url, options = {}) => {
     const method = options.method || 'GET';
     
@@ -67,7 +95,12 @@ export const cachedFetch = async (url, options = {}) => {
     }
     
     try {
-        const response = await fetch(url, options);
+        let response = await fetch(url, options);
+
+        // API unavailable: serve the last static export instead, when there is one.
+        if (response.status >= 500) {
+            response = (await staticFallback(url)) || response;
+        }
         
         if (response.ok) {
             const data = await response.json();
@@ -83,8 +116,48 @@ export const cachedFetch = async (url, options = {}) => {
         return response;
     } catch (error) {
         console.error('Fetch error:', error);
+        const fallback = await staticFallback(url);
+        if (fallback) {
+            const data = await fallback.json();
+            return { ok: true, json: () => Promise.resolve(data) };
+        }
         throw error;
     }
 };
 
+// Fetch several GET endpoints in one round trip through /batch.
+// `paths` are relative to API_BASE_URL (e.g. '/teams'). Resolves to one
+// response-like object per path, in order, so callers can treat the results
+// exactly like cachedFetch() responses. Cached paths are not re-requested.
+export const batchFetch = async (baseUrl, paths) => {
+    const results = paths.map(path => {
+        const cached = apiCache.get(`${baseUrl}${path}`);
+        return cached ? { ok: true, status: 200, json: () => Promise.resolve(cached) } : null;
+    });
+
+    const missing = [...new Set(paths.filter((path, i) => !results[i]))];
+    if (missing.length > 0) {
+        const query = missing.map(path => `path=${encodeURIComponent(path)}`).join('&');
+        const response = await fetch(`${baseUrl}/batch?${query}`);
+        if (!response.ok) {
+            // Batch endpoint unavailable: fall back to one request per path.
+            const fallback = await Promise.all(missing.map(path => cachedFetch(`${baseUrl}${path}`)));
+            return paths.map((path, i) => results[i] || fallback[missing.indexOf(path)]);
+        }
+
+        const data = await response.json();
+        const byPath = {};
+        data.responses.forEach(({ path, status, body }) => {
+            const ok = status >= 200 && status < 300;
+            if (ok) apiCache.set(`${baseUrl}${path}`, body);
+            byPath[path] = { ok, status, json: () => Promise.resolve(body) };
+        });
+        paths.forEach((path, i) => {
+            if (!results[i]) results[i] = byPath[path];
+        });
+    }
+
+    return results;
+};
+
 export default apiCache;
@@ -10,30 +10,42 @@ const News = React.memo(() => {
     const [fetchError, setFetchError] = useState(null);
     const [isLoading, setIsLoading] = useState(true);
 
+    const [nextCursor, setNextCursor] = useState(null);
+    const [isLoadingMore, setIsLoadingMore] = useState(false);
+
+    // The feed is keyset-paginated: each page carries the cursor for the next one.
+    const fetchPage = useCallback(async (cursor) => {
+        const url = cursor
+            ? `${config.API_BASE_URL}/articles/get_news?cursor=${encodeURIComponent(cursor)}`
+            : `${config.API_BASE_URL}/articles/get_news`;
+        const response = await cachedFetch(url);
+        const data = await response.json();
+
+        if (!data.success || !data.articles) {
+            return { page: [], cursor: null };
+        }
+        // Process articles with fallback values
+        const page = data.articles.map(article => ({
+            ...article,
+            title: article.title || 'Untitled Article',
+            author: article.author || 'Anonymous',
+            creation_date: article.creation_date || new Date().toISOString(),
+            thumbnail: article.thumbnail || '',
+            content: article.content || '',
+            article_type: article.article_type || 'general'
+        }));
+        return { page, cursor: data.next_cursor || null };
+    }, []);
+
     useEffect(() => {
         const fetchNews = async () => {
             try {
                 setIsLoading(true);
                 setFetchError(null);
-                
-                const response = await cachedFetch(`${config.API_BASE_URL}/articles/get_news`);
-                const data = await response.json();
-                
-                if (data.success && data.articles) {
-                    // Process articles with fallback values
-                    const processedArticles = data.articles.map(article => ({
-                        ...article,
-                        title: article.title || 'Untitled Article',
-                        author: article.author || 'Anonymous',
-                        creation_date: article.creation_date || new Date().toISOString(),
-                        thumbnail: article.thumbnail || '',
-                        content: article.content || '',
-                        article_type: article.article_type || 'general'
-                    }));
-                    setArticles(processedArticles);
-                } else {
-                    setArticles([]);
-                }
+
+                const { page, cursor } = await fetchPage(null);
+                setArticles(page);
+                setNextCursor(cursor);
                 setFetchError(null);
             } catch (error) {
                 console.error('Error fetching news:', error);
@@ -45,7 +57,21 @@ const News = React.memo(() => {
         };
     
         fetchNews();
-    }, []);
+    }, [fetchPage]);
+
+    const loadMore = useCallback(async () => {
+        if (!nextCursor) return;
+        try {
+            setIsLoadingMore(true);
+            const { page, cursor } = await fetchPage(nextCursor);
+            setArticles(prev => [...prev, ...page]);
+            setNextCursor(cursor);
+        } catch (error) {
+            console.error('Error fetching more news:', error);
+        } finally {
+            setIsLoadingMore(false);
+        }
+    }, [fetchPage, nextCursor]);
 
     const handleImageError = useCallback((e) => {
         e.target.src = fallbackImage;
@@ -209,6 +235,14 @@ const News = React.memo(() => {
                         ))}
                     </div>
                 </div>
+
+                {nextCursor && (
+                    <div className="load-more-container">
+                        <button className="load-more-button" onClick={loadMore} disabled={isLoadingMore}>
+                            {isLoadingMore ? 'Loading...' : 'Load more'}
+                        </button>
+                    </div>
+                )}
             </div>
         </div>
     );
@@ -3,11 +3,13 @@ import { useNavigate } from 'react-router-dom';
 import { useAuthFetch } from '../../hooks/useAuthFetch';
 import { useAuth } from '../../hooks/useAuth';
 import CompactArticleCard from '../../components/articles/CompactArticleCard';
+import config from '../../config';
 import './Admin.css';
 
 const currentYear = new Date().getFullYear();
 const today = new Date().toISOString().split('T')[0];
 const toMidnightISO = (dateStr) => new Date(dateStr).toISOString();
+const BACKFILL_POLL_MS = 15000;
 
 const Admin = () => {
     const authFetch = useAuthFetch();
@@ -155,12 +157,22 @@ const Admin = () => {
         fetchSyncStatus();
     }, [fetchSyncStatus]);
 
-    // Poll only while a backfill is running, so its progress advances live;
-    // the interval clears as soon as it finishes (running flips to false).
+    // While a backfill is running, poll slowly and refetch whenever the server
+    // pushes a sync step or backfill progress event. Events only come from the
+    // worker serving the stream, which may not be the one running the backfill,
+    // so the poll keeps progress moving; the stream just makes it arrive sooner.
+    // Both stop once it finishes.
     useEffect(() => {
         if (!syncStatus?.backfill?.running) return;
-        const id = setInterval(fetchSyncStatus, 5000);
-        return () => clearInterval(id);
+        const pollId = setInterval(fetchSyncStatus, BACKFILL_POLL_MS);
+        const source = new EventSource(`${config.API_BASE_URL}/events/stream?topics=sync,backfill`);
+        source.addEventListener('sync', fetchSyncStatus);
+        source.addEventListener('backfill', fetchSyncStatus);
+        source.onerror = () => source.close();
+        return () => {
+            source.close();
+            clearInterval(pollId);
+        };
     }, [syncStatus?.backfill?.running, fetchSyncStatus]);
 
     const handleManualSync = useCallback(async (type) => {
@@ -4,7 +4,56 @@ import ArticleHeader from './../../components/league/ArticleHeader';
 import '../../styles/League.css';
 import ScoreboardStrip from './../../components/league/ScoreboardStrip';
 import config from '../../config';
-import { cachedFetch } from '../../utils/apiCache';
+import { apiCache, batchFetch } from '../../utils/apiCache';
+
+// Fallback refresh of the scoreboard when the event stream is unavailable or quiet.
+const SCORES_POLL_MS = 2 * 60 * 1000;
+
+// Prefer the prebuilt /bootstrap document (one static response, regenerated
+// after every sync); fall back to the individual endpoints through /batch.
+const fetchLandingData = async () => {
+    try {
+        const response = await fetch(`${config.API_BASE_URL}/bootstrap`);
+        if (response.ok) {
+            const data = await response.json();
+            // ArticleHeader reads the latest articles through cachedFetch.
+            apiCache.set(`${config.API_BASE_URL}/articles/get_latest_articles`, { success: true, articles: data.articles });
+            return {
+                teams: data.teams,
+                matchups: data.matchups,
+                leagueState: { success: true, ...data.league_state },
+                playoffOdds: data.playoff_odds
+            };
+        }
+    } catch (error) {
+        console.error('Bootstrap fetch error:', error);
+    }
+
+    const [teamsResponse, matchupsResponse, leagueStateResponse, playoffOddsResponse] = await batchFetch(config.API_BASE_URL, [
+        '/teams',
+        '/matchups/current_matchups',
+        '/league/state',
+        '/league/playoff_odds'
+    ]);
+
+    if (!teamsResponse.ok) throw new Error(`Teams API error: ${teamsResponse.status}`);
+    if (!matchupsResponse.ok) throw new Error(`Matchups API error: ${matchupsResponse.status}`);
+
+    // Playoff odds are simulated after each matchup sync; the sidebar works without them.
+    const [teamsData, matchupsData, leagueStateData, playoffOddsData] = await Promise.all([
+        teamsResponse.json(),
+        matchupsResponse.json(),
+        leagueStateResponse.ok ? leagueStateResponse.json() : Promise.resolve(null),
+        playoffOddsResponse.ok ? playoffOddsResponse.json() : Promise.resolve(null)
+    ]);
+
+    return {
+        teams: teamsData.teams,
+        matchups: matchupsData.matchups,
+        leagueState: leagueStateData,
+        playoffOdds: playoffOddsData?.teams
+    };
+};
 
 const League = () => {
 
@@ -13,6 +62,7 @@ const League = () => {
     const [isLoading, setIsLoading] = useState(true);
     const [matchups, setMatchups] = useState([]);
     const [leagueState, setLeagueState] = useState(null);
+    const [playoffOdds, setPlayoffOdds] = useState({});
     
     useEffect(() => {
         const fetchData = async () => {
@@ -20,24 +70,12 @@ const League = () => {
                 setIsLoading(true);
                 setFetchError(null);
                 
-                const [teamsResponse, matchupsResponse, leagueStateResponse] = await Promise.all([
-                    cachedFetch(`${config.API_BASE_URL}/teams`),
-                    cachedFetch(`${config.API_BASE_URL}/matchups/current_matchups`),
-                    cachedFetch(`${config.API_BASE_URL}/league/state`)
-                ]);
-
-                if (!teamsResponse.ok) throw new Error(`Teams API error: ${teamsResponse.status}`);
-                if (!matchupsResponse.ok) throw new Error(`Matchups API error: ${matchupsResponse.status}`);
-
-                const [teamsData, matchupsData, leagueStateData] = await Promise.all([
-                    teamsResponse.json(),
-                    matchupsResponse.json(),
-                    leagueStateResponse.ok ? leagueStateResponse.json() : Promise.resolve(null)
-                ]);
-
-                setTeams(teamsData.teams || []);
-                setMatchups(matchupsData.matchups || []);
-                setLeagueState(leagueStateData?.success ? leagueStateData : null);
+                const { teams, matchups, leagueState, playoffOdds } = await fetchLandingData();
+
+                setTeams(teams || []);
+                setMatchups(matchups || []);
+                setLeagueState(leagueState?.success ? leagueState : null);
+                setPlayoffOdds(Object.fromEntries((playoffOdds || []).map(t => [t.sleeper_roster_id, t.playoff_odds])));
                 
             } catch (error) {
                 setFetchError(error.message);
@@ -51,11 +89,45 @@ const League = () => {
         fetchData();
     }, [])
 
+    // Live scores: the matchup sync pushes changed scores over the event stream. The
+    // stream only hears syncs run by the worker serving it, and a worker at its stream
+    // limit answers 503, so a slow poll of the current matchups backs it up.
+    const currentYear = leagueState?.current_year;
+    const currentWeek = leagueState?.current_week;
+    useEffect(() => {
+        if (!currentYear || !currentWeek) return;
+        const poll = setInterval(() => {
+            if (document.hidden) return;
+            fetch(`${config.API_BASE_URL}/matchups/current_matchups`)
+                .then(response => response.ok ? response.json() : null)
+                .then(data => { if (data?.matchups) setMatchups(data.matchups); })
+                .catch(error => console.error('Scores poll error:', error));
+        }, SCORES_POLL_MS);
+
+        const source = new EventSource(`${config.API_BASE_URL}/events/stream?topics=scores`);
+        source.addEventListener('scores', (event) => {
+            const update = JSON.parse(event.data);
+            if (update.year !== currentYear || update.week !== currentWeek) return;
+            const scores = new Map(update.matchups.map(m => [m.sleeper_roster_id, m]));
+            setMatchups(prev => prev.map(matchup => {
+                const score = scores.get(matchup.sleeper_roster_id);
+                return score
+                    ? { ...matchup, points_for: score.points_for, points_against: score.points_against }
+                    : matchup;
+            }));
+        });
+        return () => {
+            clearInterval(poll);
+            source.close();
+        };
+    }, [currentYear, currentWeek]);
+
     const memoizedTeams = useMemo(() => {
         return teams.map((team, index) => (
-            <TeamItem key={team.team_id} team={team} rank={index + 1} />
+            <TeamItem key={team.team_id} team={team} rank={index + 1}
+                      playoffOdds={playoffOdds[team.sleeper_roster_id]} />
         ));
-    }, [teams]);
+    }, [teams, playoffOdds]);
 
     const errorDisplay = useMemo(() => {
         if (!fetchError) return null;
@@ -5,7 +5,7 @@ import TeamHeader from './../../components/team/TeamHeader'
 import CurrentMatchups from './../../components/team/CurrentMatchups'
 import NewsBar from './../../components/team/NewsBar'
 import config from '../../config';
-import { cachedFetch } from '../../utils/apiCache';
+import { batchFetch } from '../../utils/apiCache';
 
 import '../../styles/Team.css'
 
@@ -28,10 +28,10 @@ const Team = React.memo(() => {
                 setIsLoading(true);
                 setFetchError(null);
                 
-                // Parallel API calls for better performance
-                const [teamResponse, matchupsResponse] = await Promise.all([
-                    cachedFetch(`${config.API_BASE_URL}/teams/${teamId}`),
-                    cachedFetch(`${config.API_BASE_URL}/teams/${teamId}/matchups`)
+                // Both reads in one round trip
+                const [teamResponse, matchupsResponse] = await batchFetch(config.API_BASE_URL, [
+                    `/teams/${teamId}`,
+                    `/teams/${teamId}/matchups`
                 ]);
                 
                 if (!teamResponse.ok) throw new Error(`Team API error: ${teamResponse.status}`);